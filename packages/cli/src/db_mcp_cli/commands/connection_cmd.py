@@ -16,6 +16,7 @@ from db_mcp_data.connectors import (
     get_connector_capabilities,
     get_connector_profile,
 )
+from db_mcp_data.db.streaming import result_row_limit
 from db_mcp_data.execution import ExecutionRequest, ExecutionState
 from db_mcp_data.execution.engine import get_execution_engine
 from rich.panel import Panel
@@ -611,7 +612,9 @@ def doctor(connection: str | None, as_json: bool, test_sql: str):
                     "metadata": {"doctor": True},
                 }
 
-            handle, result = execution_engine.submit_sync(request, _runner)
+            handle, result = execution_engine.submit_sync(
+                request, _runner, max_rows=result_row_limit(capabilities)
+            )
             execution_id = handle.execution_id
             exec_ok = result.state == ExecutionState.SUCCEEDED
             checks.append(
@@ -109,7 +109,12 @@ def traces_status():
         console.print(f"  Directory: {traces_dir}")
 
         if traces_dir.exists():
-            trace_files = sorted(traces_dir.glob("*.jsonl"), reverse=True)
+            from db_mcp.traces_reader import parse_trace_file_name
+
+            trace_files = sorted(
+                (f for f in traces_dir.iterdir() if parse_trace_file_name(f.name)),
+                reverse=True,
+            )
             if trace_files:
                 console.print(f"  Files: {len(trace_files)}")
                 # Show recent files
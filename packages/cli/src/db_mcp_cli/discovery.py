@@ -34,11 +34,21 @@ def _run_discovery_with_progress(
     Returns:
         Dict with discovered tables info, or None on failure
     """
-    from db_mcp_knowledge.onboarding.schema_store import create_initial_schema
+    from db_mcp_data.db.discovery import (
+        discover_tables,
+        known_columns_from_schema,
+        load_schema_fingerprints,
+        save_schema_fingerprints,
+    )
+    from db_mcp_knowledge.onboarding.schema_store import (
+        create_initial_schema,
+        load_schema_descriptions,
+    )
     from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 
     err_console = Console(stderr=True)
     all_tables: list[dict] = []
+    fingerprints: dict[str, str] = {}
     dialect: str | None = None
 
     # NOTE: SIGALRM cannot reliably interrupt blocking DBAPI calls (e.g., psycopg2),
@@ -110,51 +120,43 @@ def _run_discovery_with_progress(
                     total=1,
                 )
 
-                # Phase 4: Tables + columns (progress per table)
+                # Phase 4: Tables + columns, fanned out per schema. Schemas whose
+                # table list is unchanged since the last saved discovery reuse
+                # their stored columns.
                 progress.remove_task(task)
-                table_task = progress.add_task("Scanning tables...", total=1)
+                table_task = progress.add_task("Scanning tables...", total=len(all_schemas))
+
+                previous_fingerprints: dict[str, str] = {}
+                known_columns: dict[str, list[dict]] = {}
+                if save and connection_path is not None:
+                    previous_fingerprints = load_schema_fingerprints(connection_path)
+                    if previous_fingerprints:
+                        known_columns = known_columns_from_schema(
+                            load_schema_descriptions(conn_name, connection_path=connection_path)
+                        )
 
-                total_tables = 0
-                for schema_info in all_schemas:
-                    catalog = schema_info["catalog"]
-                    schema = schema_info["schema"]
-                    label = f"{catalog}.{schema}" if catalog else (schema or "default")
+                def on_progress(schemas_done: int, tables_found: int) -> None:
                     progress.update(
                         table_task,
-                        description=f"Listing tables in {label}...",
-                        total=None,
+                        description=f"Listed {tables_found} tables...",
+                        completed=schemas_done,
                     )
 
-                    try:
-                        tables = connector.get_tables(schema=schema, catalog=catalog)
-                    except Exception:
-                        tables = []
-
-                    # update total now that we know table count for this schema
-                    total_tables += len(tables)
-                    progress.update(table_task, total=max(total_tables, 1))
-
-                    for t in tables:
-                        progress.update(
-                            table_task,
-                            description=f"Scanning {t.get('full_name') or t.get('name')}...",
-                        )
-                        try:
-                            columns = connector.get_columns(
-                                t["name"], schema=schema, catalog=catalog
-                            )
-                        except Exception:
-                            columns = []
-                        all_tables.append(
-                            {
-                                "name": t["name"],
-                                "schema": schema,
-                                "catalog": catalog,
-                                "full_name": t.get("full_name") or t["name"],
-                                "columns": columns,
-                            }
-                        )
-                        progress.advance(table_task)
+                discovery = discover_tables(
+                    all_schemas,
+                    list_tables=lambda schema, catalog: connector.get_tables(
+                        schema=schema, catalog=catalog
+                    ),
+                    list_columns=lambda table, schema, catalog: connector.get_columns(
+                        table, schema=schema, catalog=catalog
+                    ),
+                    list_catalog_columns=getattr(connector, "get_catalog_columns", None),
+                    previous_fingerprints=previous_fingerprints,
+                    known_columns=known_columns,
+                    on_progress=on_progress,
+                )
+                all_tables.extend(discovery.tables)
+                fingerprints.update(discovery.fingerprints)
 
                 result[0] = {
                     "tables": all_tables,
@@ -211,6 +213,8 @@ def _run_discovery_with_progress(
         schema_obj.provider_id = conn_name
         save_result = save_schema_descriptions(schema_obj, connection_path=connection_path)
         if save_result.get("saved"):
+            if connection_path is not None:
+                save_schema_fingerprints(connection_path, fingerprints)
             err_console.print(f"[green]✓ Schema saved to {save_result.get('file_path')}[/green]")
 
     return {
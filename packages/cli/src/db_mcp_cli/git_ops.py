@@ -111,8 +111,12 @@ def git_sync(path: Path) -> bool:
     from datetime import datetime
 
     from db_mcp_knowledge.git_utils import git
+    from db_mcp_knowledge.vault.record_log import compact_connection_logs
 
     try:
+        # Fold pending record-log updates into the YAML snapshots being committed
+        compact_connection_logs(path)
+
         # Check for changes
         changes = git.status(path)
         has_changes = bool(changes)
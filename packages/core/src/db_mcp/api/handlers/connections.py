@@ -307,6 +307,7 @@ async def handle_connections_sync(params: dict[str, Any]) -> dict[str, Any]:
         name,
         connections_dir=_connections_dir(),
         endpoint=params.get("endpoint"),
+        full=bool(params.get("full", False)),
     )
     if not result.get("success"):
         logger.exception("API sync failed: %s", result.get("error"))
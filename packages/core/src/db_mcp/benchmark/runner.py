@@ -29,6 +29,7 @@ from db_mcp.benchmark.models import BenchmarkAnswer
 from db_mcp.benchmark.scoring import execute_gold_sql, score_case
 from db_mcp.code_runtime.native_adapter import CodeRuntimeNativeAdapter
 from db_mcp.traces import get_user_id_from_config
+from db_mcp.traces_reader import open_trace_file, parse_trace_file_name, trace_day_segments
 
 DB_MCP_SCENARIO = "db_mcp"
 ANSWER_INTENT_SCENARIO = "answer_intent"
@@ -899,6 +900,24 @@ def _tools_for_scenario(scenario: str) -> list[str]:
     return DEFAULT_TOOLS
 
 
+def _trace_segments(traces_dir: Path) -> list[Path]:
+    """Every trace segment in a user's traces directory, rotated and compressed included."""
+    if not traces_dir.is_dir():
+        return []
+    days = sorted(
+        {parsed[0] for f in traces_dir.iterdir() if (parsed := parse_trace_file_name(f.name))}
+    )
+    return [segment for day in days for segment in trace_day_segments(traces_dir, day)]
+
+
+def _trace_lines(path: Path) -> list[bytes]:
+    try:
+        with open_trace_file(path) as f:
+            return f.read().splitlines()
+    except (OSError, EOFError, RuntimeError):
+        return []
+
+
 def _collect_db_mcp_metrics(
     connection_path: Path,
     *,
@@ -911,9 +930,13 @@ def _collect_db_mcp_metrics(
         return {"exploratory_steps": 0, "failed_executions": 0, "db_executions": 0}
 
     user_id = get_user_id_from_config()
-    candidate_files = list((traces_root / user_id).glob("*.jsonl")) if user_id else []
+    candidate_files = _trace_segments(traces_root / user_id) if user_id else []
     if not candidate_files:
-        candidate_files = list(traces_root.glob("**/*.jsonl"))
+        candidate_files = [
+            segment
+            for traces_dir in sorted(traces_root.iterdir())
+            for segment in _trace_segments(traces_dir)
+        ]
 
     exploratory = 0
     failures = 0
@@ -927,7 +950,7 @@ def _collect_db_mcp_metrics(
         "answer_intent",
     }
     for path in candidate_files:
-        for line in path.read_text().splitlines():
+        for line in _trace_lines(path):
             if not line.strip():
                 continue
             try:
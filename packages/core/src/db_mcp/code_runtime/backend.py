@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import bisect
+import copy
 import json
+import os
 import re
 import shlex
 import uuid
@@ -11,14 +14,11 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any
 
-from db_mcp_knowledge.business_rules import extract_business_rule_texts
+from db_mcp_knowledge.retrieval import KIND_EXAMPLE, KIND_RULE, search_vault
 from db_mcp_knowledge.vault.paths import (
-    BUSINESS_RULES_FILE,
     CONNECTOR_FILE,
     DESCRIPTIONS_FILE,
     DOMAIN_MODEL_FILE,
-    EXAMPLES_DIR,
-    LEARNINGS_DIR,
     PROTOCOL_FILE,
     SQL_RULES_FILE,
 )
@@ -30,6 +30,8 @@ from db_mcp.tools.utils import require_connection, resolve_connection
 _CODE_RUNTIME_MODULE = """\
 from __future__ import annotations
 
+import bisect
+import copy
 import os
 import re
 from pathlib import Path
@@ -126,6 +128,149 @@ def _is_write_sql(sql: str) -> bool:
     return first not in {"", "SELECT", "WITH", "SHOW", "DESCRIBE", "EXPLAIN", "PRAGMA"}
 
 
+class _FieldIndex:
+    # Same per-item totals as _score_text_match, visiting only fields that
+    # share a token with the query or contain / are contained in it.
+    def __init__(self, entries):
+        self._fields = []
+        self._norms = []
+        self._offsets = []
+        self._postings = {}
+        self._by_norm = {}
+        offset = 0
+        for item, kind, value in entries:
+            value_norm = _normalize_text(value)
+            if not value_norm:
+                continue
+            field_id = len(self._fields)
+            self._fields.append((item, kind))
+            self._norms.append(value_norm)
+            self._offsets.append(offset)
+            offset += len(value_norm) + 1
+            self._by_norm.setdefault(value_norm, []).append(field_id)
+            for token in _tokenize(value_norm):
+                self._postings.setdefault(token, []).append(field_id)
+        self._haystack = "|".join(self._norms)
+        self._max_norm = max((len(norm) for norm in self._norms), default=0)
+
+    def score(self, query, kinds=None):
+        query_norm = _normalize_text(query)
+        if not query_norm:
+            return {}
+        field_scores = {}
+        for token in _tokenize(query_norm):
+            for field_id in self._postings.get(token, ()):
+                field_scores[field_id] = field_scores.get(field_id, 0) + 10
+        for field_id in self._fields_containing(query_norm):
+            field_scores[field_id] = field_scores.get(field_id, 0) + 15
+        for field_id in self._fields_within(query_norm):
+            field_scores[field_id] = field_scores.get(field_id, 0) + 8
+        scores = {}
+        for field_id, value in field_scores.items():
+            item, kind = self._fields[field_id]
+            if kinds is None or kind in kinds:
+                scores[item] = scores.get(item, 0) + value
+        return scores
+
+    def _fields_containing(self, query_norm):
+        found = set()
+        start = self._haystack.find(query_norm)
+        while start != -1:
+            field_id = bisect.bisect_right(self._offsets, start) - 1
+            found.add(field_id)
+            next_field = self._offsets[field_id] + len(self._norms[field_id]) + 1
+            start = self._haystack.find(query_norm, next_field)
+        return found
+
+    def _fields_within(self, query_norm):
+        found = set()
+        length = len(query_norm)
+        for begin in range(length):
+            for end in range(begin + 1, min(length, begin + self._max_norm) + 1):
+                found.update(self._by_norm.get(query_norm[begin:end], ()))
+        return found
+
+
+_TABLE_LOOKUP_FIELDS = frozenset({"name", "full_name"})
+
+
+class _SchemaIndex:
+    def __init__(self, tables):
+        self.tables = tables
+        self.table_names = []
+        self.column_names = []
+        self.columns = []
+        self.names_by_norm = {}
+        table_entries = []
+        column_entries = []
+        for position, table in enumerate(tables):
+            name = table.get("name") or table.get("table_name") or ""
+            column_names = [column.get("name", "") for column in table.get("columns", [])]
+            self.table_names.append(name)
+            self.column_names.append(column_names)
+            self.names_by_norm.setdefault(_normalize_text(name), []).append(position)
+            table_entries.extend(
+                [
+                    (position, "name", name),
+                    (position, "full_name", table.get("full_name")),
+                    (position, "description", table.get("description")),
+                    (position, "columns", " ".join(column_names)),
+                ]
+            )
+            for column in table.get("columns", []):
+                if not isinstance(column, dict):
+                    continue
+                column_position = len(self.columns)
+                self.columns.append((name, column))
+                column_entries.extend(
+                    [
+                        (column_position, "name", column.get("name")),
+                        (column_position, "description", column.get("description")),
+                        (column_position, "type", column.get("type")),
+                        (column_position, "table", name),
+                    ]
+                )
+        self.table_fields = _FieldIndex(table_entries)
+        self.column_fields = _FieldIndex(column_entries)
+
+
+def _schema_table_rows(schema):
+    if isinstance(schema, dict):
+        tables = schema.get("tables", {})
+        if isinstance(tables, list):
+            return [table for table in tables if isinstance(table, dict)]
+        if isinstance(tables, dict):
+            rows = []
+            for name, payload in tables.items():
+                if isinstance(payload, dict):
+                    row = dict(payload)
+                    row.setdefault("name", name)
+                    rows.append(row)
+                else:
+                    rows.append({"name": name})
+            return rows
+    return []
+
+
+# Rebuilt only when descriptions.yaml's (mtime_ns, size) changes; the warm
+# worker keeps this across snippets.
+_SCHEMA_INDEXES = {}
+
+
+def _load_schema_index(path: Path):
+    try:
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+    cached = _SCHEMA_INDEXES.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    index = _SchemaIndex(_schema_table_rows(_read_yaml(path) if stamp else {}))
+    _SCHEMA_INDEXES[path] = (stamp, index)
+    return index
+
+
 class DbMcpRuntime:
     def __init__(self, workspace: Path, *, confirmed: bool = False):
         self.workspace = workspace
@@ -156,54 +301,33 @@ class DbMcpRuntime:
     def schema_descriptions(self):
         return self.read_yaml("schema/descriptions.yaml")
 
+    def _schema_index(self):
+        return _load_schema_index(self.workspace / "schema" / "descriptions.yaml")
+
     def _schema_tables(self):
-        schema = self.schema_descriptions()
-        if isinstance(schema, dict):
-            tables = schema.get("tables", {})
-            if isinstance(tables, list):
-                return [table for table in tables if isinstance(table, dict)]
-            if isinstance(tables, dict):
-                rows = []
-                for name, payload in tables.items():
-                    if isinstance(payload, dict):
-                        row = dict(payload)
-                        row.setdefault("name", name)
-                        rows.append(row)
-                    else:
-                        rows.append({"name": name})
-                return rows
-        return []
+        return list(self._schema_index().tables)
 
     def table_names(self):
-        tables = self._schema_tables()
-        names = sorted(
-            str(table.get("name") or table.get("table_name"))
-            for table in tables
-            if table.get("name") or table.get("table_name")
-        )
+        names = sorted(str(name) for name in self._schema_index().table_names if name)
         if names:
             return names
         return sorted(inspect(self.engine()).get_table_names())
 
     def describe_table(self, name: str):
+        index = self._schema_index()
         query_norm = _normalize_text(name)
-        best_match = None
-        best_score = -1
-        for table in self._schema_tables():
-            table_name = table.get("name") or table.get("table_name") or ""
-            score = _score_text_match(query_norm, table_name, table.get("full_name"))
-            if query_norm == _normalize_text(table_name):
-                score += 100
-            if score > best_score:
-                best_score = score
-                best_match = table
-        if best_match is not None and best_score > 0:
-            payload = dict(best_match)
-            payload["name"] = payload.get("name") or payload.get("table_name")
-            payload["columns"] = [
-                dict(column) for column in payload.get("columns", []) if isinstance(column, dict)
-            ]
-            return payload
+        scores = index.table_fields.score(query_norm, _TABLE_LOOKUP_FIELDS)
+        for position in index.names_by_norm.get(query_norm, ()):
+            scores[position] = scores.get(position, 0) + 100
+        if scores:
+            best_position = min(scores, key=lambda position: (-scores[position], position))
+            if scores[best_position] > 0:
+                payload = copy.deepcopy(index.tables[best_position])
+                payload["name"] = payload.get("name") or payload.get("table_name")
+                payload["columns"] = [
+                    column for column in payload.get("columns", []) if isinstance(column, dict)
+                ]
+                return payload
 
         inspector = inspect(self.engine())
         for table_name in inspector.get_table_names():
@@ -227,25 +351,19 @@ class DbMcpRuntime:
         return None
 
     def find_tables(self, query: str, limit: int = 5):
+        index = self._schema_index()
         matches = []
-        for table in self._schema_tables():
-            name = table.get("name") or table.get("table_name") or ""
-            columns = [column.get("name", "") for column in table.get("columns", [])]
-            score = _score_text_match(
-                query,
-                name,
-                table.get("full_name"),
-                table.get("description"),
-                " ".join(columns),
-            )
+        for position, score in sorted(index.table_fields.score(query).items()):
             if score <= 0:
                 continue
+            table = index.tables[position]
+            name = index.table_names[position]
             matches.append(
                 {
                     "name": name,
                     "full_name": table.get("full_name") or name,
                     "description": table.get("description"),
-                    "columns": columns,
+                    "columns": list(index.column_names[position]),
                     "score": score,
                 }
             )
@@ -257,30 +375,21 @@ class DbMcpRuntime:
         return matches[0] if matches else None
 
     def find_columns(self, query: str, limit: int = 10):
+        index = self._schema_index()
         matches = []
-        for table in self._schema_tables():
-            table_name = table.get("name") or table.get("table_name") or ""
-            for column in table.get("columns", []):
-                if not isinstance(column, dict):
-                    continue
-                score = _score_text_match(
-                    query,
-                    column.get("name"),
-                    column.get("description"),
-                    column.get("type"),
-                    table_name,
-                )
-                if score <= 0:
-                    continue
-                matches.append(
-                    {
-                        "table": table_name,
-                        "name": column.get("name"),
-                        "type": column.get("type"),
-                        "description": column.get("description"),
-                        "score": score,
-                    }
-                )
+        for position, score in sorted(index.column_fields.score(query).items()):
+            if score <= 0:
+                continue
+            table_name, column = index.columns[position]
+            matches.append(
+                {
+                    "table": table_name,
+                    "name": column.get("name"),
+                    "type": column.get("type"),
+                    "description": column.get("description"),
+                    "score": score,
+                }
+            )
         matches.sort(key=lambda item: (-item["score"], item["table"], item["name"]))
         return matches[:limit]
 
@@ -493,6 +602,141 @@ def create_runtime(workspace: Path, *, confirmed: bool = False) -> DbMcpRuntime:
 
 _WRAPPER_SENTINEL = "db_mcp_code_mode_error"
 _CONFIRM_REQUIRED_EXIT_CODE = 40
+
+# Persistent interpreter for code mode: one process per (session, connection)
+# that keeps the ``dbmcp`` runtime (and its SQLAlchemy engine) warm between
+# snippets. Requests and responses are JSON lines on the original stdin/stdout;
+# user code sees /dev/null as stdin and has fds 1/2 captured per request.
+_CODE_WORKER_MODULE = f"""\
+from __future__ import annotations
+
+import bisect
+import copy
+import json
+import os
+import signal
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+WORKSPACE = Path.cwd()
+sys.path.insert(0, str(WORKSPACE / "state"))
+
+
+class _Timeout(BaseException):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise _Timeout()
+
+
+class _Worker:
+    def __init__(self):
+        self.requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+        self.responses = os.fdopen(os.dup(1), "w", encoding="utf-8")
+        self.devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(self.devnull, fd)
+        self.runtime = None
+        self.runtime_key = None
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+    def send(self, message):
+        self.responses.write(json.dumps(message, default=str) + "\\n")
+        self.responses.flush()
+
+    def _runtime(self, confirmed):
+        from db_mcp_code_runtime import create_runtime
+
+        try:
+            key = (WORKSPACE / "connector.yaml").stat().st_mtime_ns
+        except OSError:
+            key = None
+        if self.runtime is None or key != self.runtime_key:
+            if self.runtime is not None and self.runtime._engine is not None:
+                self.runtime._engine.dispose()
+            self.runtime = create_runtime(workspace=WORKSPACE, confirmed=confirmed)
+            self.runtime_key = key
+        self.runtime.confirmed = confirmed
+        return self.runtime
+
+    def _run(self, request):
+        from db_mcp_code_runtime import CodeModeConfirmationRequired
+
+        try:
+            dbmcp = self._runtime(bool(request.get("confirmed")))
+            globals_dict = {{"__name__": "__main__", "dbmcp": dbmcp}}
+            exec(compile(request["code"], "<db-mcp-code>", "exec"), globals_dict)
+        except CodeModeConfirmationRequired as exc:
+            payload = {{
+                "type": "{_WRAPPER_SENTINEL}",
+                "kind": "confirm_required",
+                "message": str(exc),
+            }}
+            print(json.dumps(payload), file=sys.stderr)
+            return {_CONFIRM_REQUIRED_EXIT_CODE}
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                return exc.code or 0
+            print(exc.code, file=sys.stderr)
+            return 1
+        except _Timeout:
+            raise
+        except BaseException as exc:
+            traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next)
+            return 1
+        return 0
+
+    def handle(self, request):
+        stdout = tempfile.TemporaryFile()
+        stderr = tempfile.TemporaryFile()
+        os.dup2(stdout.fileno(), 1)
+        os.dup2(stderr.fileno(), 2)
+        timed_out = False
+        signal.setitimer(signal.ITIMER_REAL, float(request.get("timeout_seconds") or 0))
+        try:
+            exit_code = self._run(request)
+        except _Timeout:
+            exit_code = 124
+            timed_out = True
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(self.devnull, 1)
+            os.dup2(self.devnull, 2)
+            os.chdir(WORKSPACE)
+        outputs = []
+        for handle in (stdout, stderr):
+            handle.seek(0)
+            outputs.append(handle.read().decode("utf-8", errors="replace"))
+            handle.close()
+        return {{
+            "stdout": outputs[0],
+            "stderr": outputs[1],
+            "exit_code": exit_code,
+            "timed_out": timed_out,
+        }}
+
+
+def main():
+    worker = _Worker()
+    try:
+        import db_mcp_code_runtime  # noqa: F401 - warm yaml/sqlalchemy before the first snippet
+    except Exception:
+        pass  # surfaces as a traceback on the first request
+    worker.send({{"type": "ready", "pid": os.getpid()}})
+    for line in worker.requests:
+        if line.strip():
+            worker.send(worker.handle(json.loads(line)))
+
+
+if __name__ == "__main__":
+    main()
+"""
+_CODE_WORKER_FILENAME = "db_mcp_code_worker.py"
 _PROTOCOL_CALL_RE = re.compile(r"dbmcp\.(?:read_protocol|ack_protocol)\s*\(")
 _DISCOVERY_CALL_RE = re.compile(
     r"dbmcp\.(?:"
@@ -608,6 +852,156 @@ def _score_text_match(query: str, *values: object) -> int:
     return score
 
 
+class _FieldIndex:
+    """Pre-tokenised text fields with an inverted index.
+
+    ``score`` returns the same per-item totals as calling ``_score_text_match``
+    with each item's fields, but only visits fields that share a token with the
+    query or contain / are contained in its normalised form.
+    """
+
+    def __init__(self, entries: list[tuple[int, str, object]]):
+        self._fields: list[tuple[int, str]] = []
+        self._norms: list[str] = []
+        self._offsets: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        self._by_norm: dict[str, list[int]] = {}
+        offset = 0
+        for item, kind, value in entries:
+            value_norm = _normalize_text(value)
+            if not value_norm:
+                continue
+            field_id = len(self._fields)
+            self._fields.append((item, kind))
+            self._norms.append(value_norm)
+            self._offsets.append(offset)
+            offset += len(value_norm) + 1
+            self._by_norm.setdefault(value_norm, []).append(field_id)
+            for token in _tokenize(value_norm):
+                self._postings.setdefault(token, []).append(field_id)
+        # Normalised text is [a-z0-9 ] only, so "|" never occurs inside a match.
+        self._haystack = "|".join(self._norms)
+        self._max_norm = max((len(norm) for norm in self._norms), default=0)
+
+    def score(self, query: str, kinds: frozenset[str] | None = None) -> dict[int, int]:
+        query_norm = _normalize_text(query)
+        if not query_norm:
+            return {}
+        field_scores: dict[int, int] = {}
+        for token in _tokenize(query_norm):
+            for field_id in self._postings.get(token, ()):
+                field_scores[field_id] = field_scores.get(field_id, 0) + 10
+        for field_id in self._fields_containing(query_norm):
+            field_scores[field_id] = field_scores.get(field_id, 0) + 15
+        for field_id in self._fields_within(query_norm):
+            field_scores[field_id] = field_scores.get(field_id, 0) + 8
+        scores: dict[int, int] = {}
+        for field_id, value in field_scores.items():
+            item, kind = self._fields[field_id]
+            if kinds is None or kind in kinds:
+                scores[item] = scores.get(item, 0) + value
+        return scores
+
+    def _fields_containing(self, query_norm: str) -> set[int]:
+        found: set[int] = set()
+        start = self._haystack.find(query_norm)
+        while start != -1:
+            field_id = bisect.bisect_right(self._offsets, start) - 1
+            found.add(field_id)
+            next_field = self._offsets[field_id] + len(self._norms[field_id]) + 1
+            start = self._haystack.find(query_norm, next_field)
+        return found
+
+    def _fields_within(self, query_norm: str) -> set[int]:
+        found: set[int] = set()
+        length = len(query_norm)
+        for begin in range(length):
+            for end in range(begin + 1, min(length, begin + self._max_norm) + 1):
+                found.update(self._by_norm.get(query_norm[begin:end], ()))
+        return found
+
+
+_TABLE_LOOKUP_FIELDS = frozenset({"name", "full_name"})
+
+
+class _SchemaIndex:
+    """Parsed ``schema/descriptions.yaml`` plus token indexes for table/column search."""
+
+    def __init__(self, tables: list[dict[str, Any]]):
+        self.tables = tables
+        self.table_names: list[str] = []
+        self.column_names: list[list[str]] = []
+        self.columns: list[tuple[str, dict[str, Any]]] = []
+        self.names_by_norm: dict[str, list[int]] = {}
+        table_entries: list[tuple[int, str, object]] = []
+        column_entries: list[tuple[int, str, object]] = []
+        for position, table in enumerate(tables):
+            name = table.get("name") or table.get("table_name") or ""
+            column_names = [column.get("name", "") for column in table.get("columns", [])]
+            self.table_names.append(name)
+            self.column_names.append(column_names)
+            self.names_by_norm.setdefault(_normalize_text(name), []).append(position)
+            table_entries.extend(
+                [
+                    (position, "name", name),
+                    (position, "full_name", table.get("full_name")),
+                    (position, "description", table.get("description")),
+                    (position, "columns", " ".join(column_names)),
+                ]
+            )
+            for column in table.get("columns", []):
+                if not isinstance(column, dict):
+                    continue
+                column_position = len(self.columns)
+                self.columns.append((name, column))
+                column_entries.extend(
+                    [
+                        (column_position, "name", column.get("name")),
+                        (column_position, "description", column.get("description")),
+                        (column_position, "type", column.get("type")),
+                        (column_position, "table", name),
+                    ]
+                )
+        self.table_fields = _FieldIndex(table_entries)
+        self.column_fields = _FieldIndex(column_entries)
+
+
+def _schema_table_rows(schema: object) -> list[dict[str, Any]]:
+    tables = schema.get("tables", {}) if isinstance(schema, dict) else {}
+    if isinstance(tables, list):
+        return [table for table in tables if isinstance(table, dict)]
+    if isinstance(tables, dict):
+        rows: list[dict[str, Any]] = []
+        for name, payload in tables.items():
+            if isinstance(payload, dict):
+                row = dict(payload)
+                row.setdefault("name", name)
+                rows.append(row)
+            else:
+                rows.append({"name": name})
+        return rows
+    return []
+
+
+# Schema indexes keyed by descriptions path; an entry is rebuilt only when the
+# file's (mtime_ns, size) stamp changes, so repeated lookups skip the YAML parse.
+_schema_indexes: dict[Path, tuple[tuple[int, int] | None, _SchemaIndex]] = {}
+
+
+def _load_schema_index(path: Path) -> _SchemaIndex:
+    try:
+        stat = path.stat()
+        stamp: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+    cached = _schema_indexes.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    index = _SchemaIndex(_schema_table_rows(_read_yaml_file(path) if stamp else {}))
+    _schema_indexes[path] = (stamp, index)
+    return index
+
+
 def _leading_keyword(sql: str) -> str:
     stripped = sql.lstrip()
     while stripped.startswith("--"):
@@ -663,71 +1057,47 @@ class HostDbMcpRuntime:
         payload = self.read_yaml(DESCRIPTIONS_FILE)
         return payload if isinstance(payload, dict) else {}
 
+    def _schema_index(self) -> _SchemaIndex:
+        return _load_schema_index(self.connection_path / DESCRIPTIONS_FILE)
+
     def _schema_tables(self) -> list[dict[str, Any]]:
-        schema = self.schema_descriptions()
-        tables = schema.get("tables", {}) if isinstance(schema, dict) else {}
-        if isinstance(tables, list):
-            return [table for table in tables if isinstance(table, dict)]
-        if isinstance(tables, dict):
-            rows: list[dict[str, Any]] = []
-            for name, payload in tables.items():
-                if isinstance(payload, dict):
-                    row = dict(payload)
-                    row.setdefault("name", name)
-                    rows.append(row)
-                else:
-                    rows.append({"name": name})
-            return rows
-        return []
+        return list(self._schema_index().tables)
 
     def table_names(self) -> list[str]:
-        return sorted(
-            str(table.get("name") or table.get("table_name"))
-            for table in self._schema_tables()
-            if table.get("name") or table.get("table_name")
-        )
+        return sorted(str(name) for name in self._schema_index().table_names if name)
 
     def describe_table(self, name: str) -> dict[str, object] | None:
+        index = self._schema_index()
         query_norm = _normalize_text(name)
-        best_match: dict[str, Any] | None = None
-        best_score = -1
-        for table in self._schema_tables():
-            table_name = table.get("name") or table.get("table_name") or ""
-            score = _score_text_match(query_norm, table_name, table.get("full_name"))
-            if query_norm == _normalize_text(table_name):
-                score += 100
-            if score > best_score:
-                best_score = score
-                best_match = table
-        if best_match is not None and best_score > 0:
-            payload = dict(best_match)
-            payload["name"] = payload.get("name") or payload.get("table_name")
-            payload["columns"] = [
-                dict(column) for column in payload.get("columns", []) if isinstance(column, dict)
-            ]
-            return payload
-        return None
+        scores = index.table_fields.score(query_norm, _TABLE_LOOKUP_FIELDS)
+        for position in index.names_by_norm.get(query_norm, ()):
+            scores[position] = scores.get(position, 0) + 100
+        if not scores:
+            return None
+        best_position = min(scores, key=lambda position: (-scores[position], position))
+        if scores[best_position] <= 0:
+            return None
+        payload = copy.deepcopy(index.tables[best_position])
+        payload["name"] = payload.get("name") or payload.get("table_name")
+        payload["columns"] = [
+            column for column in payload.get("columns", []) if isinstance(column, dict)
+        ]
+        return payload
 
     def find_tables(self, query: str, limit: int = 5) -> list[dict[str, object]]:
+        index = self._schema_index()
         matches = []
-        for table in self._schema_tables():
-            name = table.get("name") or table.get("table_name") or ""
-            columns = [column.get("name", "") for column in table.get("columns", [])]
-            score = _score_text_match(
-                query,
-                name,
-                table.get("full_name"),
-                table.get("description"),
-                " ".join(columns),
-            )
+        for position, score in sorted(index.table_fields.score(query).items()):
             if score <= 0:
                 continue
+            table = index.tables[position]
+            name = index.table_names[position]
             matches.append(
                 {
                     "name": name,
                     "full_name": table.get("full_name") or name,
                     "description": table.get("description"),
-                    "columns": columns,
+                    "columns": list(index.column_names[position]),
                     "score": score,
                 }
             )
@@ -739,110 +1109,31 @@ class HostDbMcpRuntime:
         return matches[0] if matches else None
 
     def find_columns(self, query: str, limit: int = 10) -> list[dict[str, object]]:
+        index = self._schema_index()
         matches = []
-        for table in self._schema_tables():
-            table_name = table.get("name") or table.get("table_name") or ""
-            for column in table.get("columns", []):
-                if not isinstance(column, dict):
-                    continue
-                score = _score_text_match(
-                    query,
-                    column.get("name"),
-                    column.get("description"),
-                    column.get("type"),
-                    table_name,
-                )
-                if score <= 0:
-                    continue
-                matches.append(
-                    {
-                        "table": table_name,
-                        "name": column.get("name"),
-                        "type": column.get("type"),
-                        "description": column.get("description"),
-                        "score": score,
-                    }
-                )
-        matches.sort(key=lambda item: (-int(item["score"]), str(item["table"]), str(item["name"])))
-        return matches[:limit]
-
-    def _load_examples(self) -> list[dict[str, object]]:
-        examples_dir = self.connection_path / EXAMPLES_DIR
-        if not examples_dir.exists():
-            return []
-        records: list[dict[str, object]] = []
-        for path in sorted(examples_dir.glob("*.yaml")):
-            payload = _read_yaml_file(path)
-            if isinstance(payload, dict):
-                row = dict(payload)
-                row.setdefault("id", path.stem)
-                records.append(row)
-        return records
-
-    def relevant_examples(self, query: str, limit: int = 5) -> list[dict[str, object]]:
-        matches = []
-        for example in self._load_examples():
-            score = _score_text_match(
-                query,
-                example.get("id"),
-                example.get("intent"),
-                example.get("notes"),
-                " ".join(str(value) for value in (example.get("tables", []) or [])),
-                " ".join(str(value) for value in (example.get("keywords", []) or [])),
-                example.get("sql"),
-            )
+        for position, score in sorted(index.column_fields.score(query).items()):
             if score <= 0:
                 continue
-            payload = dict(example)
-            payload["score"] = score
-            matches.append(payload)
-        matches.sort(key=lambda item: (-int(item["score"]), str(item.get("id", ""))))
+            table_name, column = index.columns[position]
+            matches.append(
+                {
+                    "table": table_name,
+                    "name": column.get("name"),
+                    "type": column.get("type"),
+                    "description": column.get("description"),
+                    "score": score,
+                }
+            )
+        matches.sort(key=lambda item: (-int(item["score"]), str(item["table"]), str(item["name"])))
         return matches[:limit]
 
-    def _load_rule_entries(self) -> list[dict[str, str]]:
-        entries: list[dict[str, str]] = []
-        rules_path = self.connection_path / BUSINESS_RULES_FILE
-        rules_payload = _read_yaml_file(rules_path)
-        source = str(rules_path.relative_to(self.connection_path))
-        for text_value in extract_business_rule_texts(rules_payload):
-            entries.append({"source": source, "text": str(text_value)})
-        if isinstance(rules_payload, dict):
-            candidate_texts = extract_business_rule_texts(
-                rules_payload.get("candidate_rules", [])
-            )
-            for text_value in candidate_texts:
-                entries.append({"source": source, "text": str(text_value)})
-        learnings_dir = self.connection_path / LEARNINGS_DIR
-        if learnings_dir.exists():
-            for path in sorted(learnings_dir.glob("*.md")):
-                for line in path.read_text().splitlines():
-                    stripped = line.strip()
-                    if stripped.startswith("- "):
-                        entries.append(
-                            {
-                                "source": str(path.relative_to(self.connection_path)),
-                                "text": stripped[2:].strip(),
-                            }
-                        )
-        return entries
+    def relevant_examples(self, query: str, limit: int = 5) -> list[dict[str, object]]:
+        hits = search_vault(self.connection_path, query, kinds=(KIND_EXAMPLE,), limit=limit)
+        return [{**hit.payload, "score": hit.score} for hit in hits]
 
     def relevant_rules(self, query: str, limit: int = 5) -> list[dict[str, object]]:
-        matches = []
-        for entry in self._load_rule_entries():
-            score = _score_text_match(query, entry.get("text"), entry.get("source"))
-            if score <= 0:
-                continue
-            payload = dict(entry)
-            payload["score"] = score
-            matches.append(payload)
-        matches.sort(
-            key=lambda item: (
-                -int(item["score"]),
-                str(item["source"]),
-                str(item["text"]),
-            )
-        )
-        return matches[:limit]
+        hits = search_vault(self.connection_path, query, kinds=(KIND_RULE,), limit=limit)
+        return [{**hit.payload, "score": hit.score} for hit in hits]
 
     def plan(self, question: str) -> dict[str, object]:
         table = self.find_table(question)
@@ -1196,6 +1487,9 @@ def _ensure_support_files(connection_path: Path) -> tuple[Path, Path]:
     runtime_module_path = state_dir / "db_mcp_code_runtime.py"
     if not runtime_module_path.exists() or runtime_module_path.read_text() != _CODE_RUNTIME_MODULE:
         runtime_module_path.write_text(_CODE_RUNTIME_MODULE)
+    worker_module_path = state_dir / _CODE_WORKER_FILENAME
+    if not worker_module_path.exists() or worker_module_path.read_text() != _CODE_WORKER_MODULE:
+        worker_module_path.write_text(_CODE_WORKER_MODULE)
     scripts_dir = state_dir / "code_mode_runs"
     scripts_dir.mkdir(parents=True, exist_ok=True)
     return runtime_module_path, scripts_dir
@@ -1270,6 +1564,55 @@ def _parse_wrapper_error(result: dict[str, object]) -> CodeResult | None:
     )
 
 
+def _use_code_worker(manager: ExecSessionManager) -> bool:
+    """Persistent workers are on unless ``DB_MCP_CODE_WORKERS=0`` or unsupported."""
+    enabled = os.environ.get("DB_MCP_CODE_WORKERS", "1").strip().lower()
+    if enabled in {"0", "false", "no", "off"}:
+        return False
+    return getattr(manager, "supports_workers", False) is True
+
+
+def _run_in_worker(
+    session: CodeSession,
+    code: str,
+    *,
+    timeout_seconds: int,
+    confirmed: bool,
+    manager: ExecSessionManager,
+) -> dict[str, object]:
+    """Run a snippet in the session's warm interpreter."""
+    _ensure_support_files(session.spec.connection_path)
+    return manager.request_worker(
+        session_id=session.session_id,
+        spec=session.spec,
+        command=["python3", "-u", f"state/{_CODE_WORKER_FILENAME}"],
+        payload={"code": code, "confirmed": confirmed, "timeout_seconds": timeout_seconds},
+        timeout_seconds=timeout_seconds,
+    )
+
+
+def _run_as_script(
+    session: CodeSession,
+    code: str,
+    *,
+    timeout_seconds: int,
+    confirmed: bool,
+    manager: ExecSessionManager,
+) -> dict[str, object]:
+    """Run a snippet as a one-off ``python3`` process (no warm worker)."""
+    script_path = _build_wrapper_script(session=session, code=code, confirmed=confirmed)
+    command = f"python3 {shlex.quote(str(script_path.relative_to(session.spec.connection_path)))}"
+    try:
+        return manager.execute(
+            session_id=session.session_id,
+            spec=session.spec,
+            command=command,
+            timeout_seconds=timeout_seconds,
+        )
+    finally:
+        script_path.unlink(missing_ok=True)
+
+
 def run_code(
     session: CodeSession,
     code: str,
@@ -1288,15 +1631,23 @@ def run_code(
     if gate_result := _gate_runtime_flow(session, code):
         return gate_result
 
-    script_path = _build_wrapper_script(session=session, code=code, confirmed=confirmed)
-    command = f"python3 {shlex.quote(str(script_path.relative_to(session.spec.connection_path)))}"
     try:
-        raw_result = manager.execute(
-            session_id=session.session_id,
-            spec=session.spec,
-            command=command,
-            timeout_seconds=timeout_seconds,
-        )
+        if _use_code_worker(manager):
+            raw_result = _run_in_worker(
+                session,
+                code,
+                timeout_seconds=timeout_seconds,
+                confirmed=confirmed,
+                manager=manager,
+            )
+        else:
+            raw_result = _run_as_script(
+                session,
+                code,
+                timeout_seconds=timeout_seconds,
+                confirmed=confirmed,
+                manager=manager,
+            )
     except ExecRuntimeError as exc:
         return CodeResult(
             stdout="",
@@ -1305,8 +1656,6 @@ def run_code(
             duration_ms=0.0,
             truncated=False,
         )
-    finally:
-        script_path.unlink(missing_ok=True)
 
     wrapped = _parse_wrapper_error(raw_result)
     if wrapped is not None:
@@ -267,6 +267,44 @@ class Settings(BaseSettings):
         description="Interval for background sync in seconds (0 to disable)",
     )
 
+    # ==========================================================================
+    # Execution history retention (state/executions.sqlite)
+    # ==========================================================================
+
+    execution_retention_days: float = Field(
+        default=7,
+        description="Delete finished executions older than this many days (0 to disable)",
+    )
+    execution_max_total_mb: int = Field(
+        default=512,
+        description="Cap on stored execution result size per connection in MB (0 to disable)",
+    )
+    execution_max_rows_per_connection: int = Field(
+        default=10_000,
+        description="Keep at most this many finished executions per connection (0 to disable)",
+    )
+
+    # ==========================================================================
+    # Daemon prepared tasks (state/tasks.sqlite)
+    # ==========================================================================
+
+    daemon_task_ttl_hours: float = Field(
+        default=24,
+        description="Forget prepared daemon tasks this many hours after their last update",
+    )
+    daemon_task_max_entries: int = Field(
+        default=500,
+        description="Keep at most this many prepared daemon tasks in memory",
+    )
+    daemon_task_max_mb: int = Field(
+        default=64,
+        description="Cap on in-memory prepared task payloads in MB (0 to disable)",
+    )
+    daemon_task_persist: bool = Field(
+        default=True,
+        description="Persist prepared daemon tasks to state/tasks.sqlite across restarts",
+    )
+
     # Migration settings
     auto_migrate: bool = Field(
         default=True,
@@ -1,10 +1,16 @@
 """In-memory span collector for local OTel console."""
 
+import os
 import threading
-from collections import deque
+from bisect import insort
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any
 
+DEFAULT_MAX_SPANS = 1000
+DEFAULT_MAX_TRACES = 100
+
 
 @dataclass
 class Span:
@@ -43,16 +49,61 @@ class Span:
         }
 
 
+class _TraceEntry:
+    """Incrementally maintained state for one trace."""
+
+    __slots__ = ("trace_id", "spans", "start_time", "end_time", "_summary")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: list[Span] = []
+        self.start_time = float("inf")
+        self.end_time = float("-inf")
+        self._summary: dict | None = None
+
+    def add(self, span: Span) -> None:
+        # Spans usually arrive close to start order, so insort is a short memmove.
+        insort(self.spans, span, key=_span_start)
+        self.start_time = min(self.start_time, span.start_time)
+        self.end_time = max(self.end_time, span.end_time or span.start_time)
+        self._summary = None
+
+    def summary(self) -> dict:
+        """Trace dict in the shape returned by SpanCollector.get_traces()."""
+        if self._summary is None:
+            self._summary = {
+                "trace_id": self.trace_id,
+                "start_time": self.start_time,
+                "end_time": self.end_time,
+                "duration_ms": (self.end_time - self.start_time) * 1000,
+                "span_count": len(self.spans),
+                "root_span": self.spans[0].name if self.spans else None,
+                "spans": [s.to_dict() for s in self.spans],
+            }
+        return self._summary
+
+
+def _span_start(span: Span) -> float:
+    return span.start_time
+
+
 class SpanCollector:
     """Collects and stores spans in memory.
 
-    Thread-safe collector with a maximum capacity.
+    Thread-safe collector with a maximum capacity. Traces are kept in an
+    ordered dict with the most recently active trace last, so eviction and
+    "most recent N" reads never scan or sort the whole store.
     """
 
-    def __init__(self, max_spans: int = 1000):
+    def __init__(
+        self,
+        max_spans: int = DEFAULT_MAX_SPANS,
+        max_traces: int = DEFAULT_MAX_TRACES,
+    ):
         self.max_spans = max_spans
+        self.max_traces = max_traces
         self._spans: deque[Span] = deque(maxlen=max_spans)
-        self._traces: dict[str, list[Span]] = {}
+        self._traces: OrderedDict[str, _TraceEntry] = OrderedDict()
         self._lock = threading.Lock()
 
     def add_span(self, span: Span) -> None:
@@ -60,58 +111,29 @@ class SpanCollector:
         with self._lock:
             self._spans.append(span)
 
-            # Group by trace
-            if span.trace_id not in self._traces:
-                self._traces[span.trace_id] = []
-            self._traces[span.trace_id].append(span)
+            entry = self._traces.get(span.trace_id)
+            if entry is None:
+                entry = self._traces[span.trace_id] = _TraceEntry(span.trace_id)
+            else:
+                self._traces.move_to_end(span.trace_id)
+            entry.add(span)
 
-            # Cleanup old traces if we have too many
-            if len(self._traces) > 100:
-                # Remove oldest traces
-                trace_ids = list(self._traces.keys())
-                for trace_id in trace_ids[:50]:
-                    del self._traces[trace_id]
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
 
     def get_spans(self, limit: int = 100) -> list[dict]:
         """Get recent spans as dicts."""
         with self._lock:
-            spans = list(self._spans)[-limit:]
-            return [s.to_dict() for s in reversed(spans)]
+            spans = list(islice(reversed(self._spans), limit))
+        return [s.to_dict() for s in spans]
 
     def get_traces(self, limit: int = 20) -> list[dict]:
-        """Get recent traces with their spans."""
+        """Get recent traces with their spans, most recently active first."""
         with self._lock:
-            # Get most recent traces by looking at latest span time
-            trace_times = []
-            for trace_id, spans in self._traces.items():
-                latest = max(s.start_time for s in spans)
-                trace_times.append((trace_id, latest, spans))
-
-            # Sort by latest time, descending
-            trace_times.sort(key=lambda x: x[1], reverse=True)
-
-            result = []
-            for trace_id, _, spans in trace_times[:limit]:
-                # Sort spans within trace by start time
-                sorted_spans = sorted(spans, key=lambda s: s.start_time)
-
-                # Calculate trace duration
-                start = min(s.start_time for s in spans)
-                end = max(s.end_time or s.start_time for s in spans)
-
-                result.append(
-                    {
-                        "trace_id": trace_id,
-                        "start_time": start,
-                        "end_time": end,
-                        "duration_ms": (end - start) * 1000,
-                        "span_count": len(spans),
-                        "root_span": sorted_spans[0].name if sorted_spans else None,
-                        "spans": [s.to_dict() for s in sorted_spans],
-                    }
-                )
-
-            return result
+            recent = islice(reversed(self._traces.values()), limit)
+            summaries = [entry.summary() for entry in recent]
+        # Shallow copies so callers can annotate traces without touching the cache.
+        return [{**summary, "spans": list(summary["spans"])} for summary in summaries]
 
     def clear(self) -> None:
         """Clear all collected spans."""
@@ -124,9 +146,20 @@ class SpanCollector:
 _collector: SpanCollector | None = None
 
 
+def _env_capacity(name: str, default: int) -> int:
+    try:
+        value = int(os.environ.get(name, "").strip() or default)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
 def get_collector() -> SpanCollector:
     """Get or create the global span collector."""
     global _collector
     if _collector is None:
-        _collector = SpanCollector()
+        _collector = SpanCollector(
+            max_spans=_env_capacity("DB_MCP_CONSOLE_MAX_SPANS", DEFAULT_MAX_SPANS),
+            max_traces=_env_capacity("DB_MCP_CONSOLE_MAX_TRACES", DEFAULT_MAX_TRACES),
+        )
     return _collector
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import json
 import os
 import re
+import select
 import shlex
 import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from shutil import which
-from typing import Protocol
+from typing import Any, Protocol
 from urllib.parse import urlparse
 
 from sqlalchemy.engine import make_url
@@ -23,6 +27,8 @@ DEFAULT_IDLE_TTL_SECONDS = 900
 DEFAULT_MAX_SESSIONS = 16
 DEFAULT_OUTPUT_CHARS = 64_000
 DEFAULT_RUNTIME_ORDER = ("podman", "nerdctl", "docker")
+# Grace period on top of a worker request's own timeout before the host kills it.
+WORKER_TIMEOUT_GRACE_SECONDS = 2
 _LEADING_PYTHON3_RE = re.compile(r"^(\s*)python3(?=\s|$)")
 
 DEFAULT_PORTS = {
@@ -98,11 +104,122 @@ class ExecSandboxBackend(Protocol):
     def close_session(self, container_id: str) -> None: ...
 
 
+class ExecWorker:
+    """Long-lived interpreter inside a sandbox that answers JSON-line requests.
+
+    The worker process writes one ``{"type": "ready", "pid": ...}`` line when it
+    starts and then one JSON response per request line. Backends that can host
+    workers expose ``open_worker(container_id, command)``.
+    """
+
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        *,
+        kill: Callable[[ExecWorker], None] | None = None,
+        output_chars: int = DEFAULT_OUTPUT_CHARS,
+        clock=time.monotonic,
+    ) -> None:
+        self._process = process
+        self._kill = kill
+        self.output_chars = output_chars
+        self._clock = clock
+        self._buffer = b""
+        self.pid: int | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def request(self, payload: dict[str, Any], timeout_seconds: int) -> ExecResult:
+        """Send one request and wait for its response.
+
+        The worker enforces ``timeout_seconds`` itself and reports
+        ``timed_out``; the host gives it a short grace period before killing
+        it. Either way the caller should discard the worker.
+        """
+        started = self._clock()
+        deadline = started + timeout_seconds + WORKER_TIMEOUT_GRACE_SECONDS
+        if self.pid is None:
+            ready = self._read_message(deadline, timeout_seconds)
+            self.pid = int(ready.get("pid") or 0) or None
+        try:
+            assert self._process.stdin is not None
+            self._process.stdin.write(json.dumps(payload).encode("utf-8") + b"\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError) as exc:
+            raise ExecRuntimeError("code worker exited unexpectedly") from exc
+        response = self._read_message(deadline, timeout_seconds)
+        if response.get("timed_out"):
+            raise ExecRuntimeError(f"code worker timeout after {timeout_seconds}s")
+        duration_ms = (self._clock() - started) * 1000
+        stdout, stdout_truncated = _truncate_text(
+            str(response.get("stdout") or ""), self.output_chars
+        )
+        stderr, stderr_truncated = _truncate_text(
+            str(response.get("stderr") or ""), self.output_chars
+        )
+        return ExecResult(
+            stdout=stdout,
+            stderr=stderr,
+            exit_code=int(response.get("exit_code", 1)),
+            duration_ms=duration_ms,
+            truncated=stdout_truncated or stderr_truncated,
+        )
+
+    def close(self) -> None:
+        if self._process.stdin is not None:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+        if self.alive and self._kill is not None:
+            self._kill(self)
+        if self.alive:
+            self._process.kill()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+
+    def _read_message(self, deadline: float, timeout_seconds: int) -> dict[str, Any]:
+        assert self._process.stdout is not None
+        fd = self._process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                raise ExecRuntimeError(f"code worker timeout after {timeout_seconds}s")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise ExecRuntimeError("code worker exited unexpectedly")
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ExecRuntimeError("code worker sent an invalid response") from exc
+        if not isinstance(message, dict):
+            raise ExecRuntimeError("code worker sent an invalid response")
+        return message
+
+
 @dataclass
 class _ActiveSession:
     container_id: str
     spec: ExecSandboxSpec
     last_used_at: float
+    worker: ExecWorker | None = None
+    # Requests currently using the sandbox; the reaper and eviction skip busy sessions.
+    in_flight: int = 0
+    # Worker requests share one stdin/stdout pipe, so they run one at a time.
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Set once the sandbox has started (``container_id`` filled) or failed to.
+    ready: threading.Event = field(default_factory=threading.Event)
 
 
 def derive_allowed_endpoint(
@@ -243,6 +360,31 @@ class OciExecSandboxBackend:
             truncated=stdout_truncated or stderr_truncated,
         )
 
+    def open_worker(self, container_id: str, command: list[str]) -> ExecWorker:
+        try:
+            process = subprocess.Popen(
+                [self.runtime, "exec", "-i", "-w", "/workspace", container_id, *command],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as exc:
+            raise ExecRuntimeError(
+                f"{self.runtime} is required for OCI exec mode but is not installed"
+            ) from exc
+
+        def kill(worker: ExecWorker) -> None:
+            # Stopping the exec client does not stop the process inside the container.
+            if worker.pid is not None:
+                self._runner(
+                    [self.runtime, "exec", container_id, "kill", "-KILL", str(worker.pid)],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+
+        return ExecWorker(process, kill=kill, output_chars=self.output_chars, clock=self._clock)
+
     def close_session(self, container_id: str) -> None:
         try:
             self._runner(
@@ -357,24 +499,8 @@ class ProcessExecSandboxBackend:
         return session_key
 
     def exec_command(self, container_id: str, command: str, timeout_seconds: int) -> ExecResult:
-        spec = self._sessions.get(container_id)
-        if spec is None:
-            raise ExecRuntimeError(f"unknown exec session: {container_id}")
-
-        current_python_bin = str(Path(sys.executable).parent)
-        default_exec_path = "/usr/local/bin:/opt/homebrew/bin:/usr/bin:/bin:/usr/sbin:/sbin"
-        configured_path = os.environ.get("DB_MCP_EXEC_PATH", default_exec_path)
-        path_entries = [entry for entry in configured_path.split(os.pathsep) if entry]
-        if current_python_bin not in path_entries:
-            path_entries.insert(0, current_python_bin)
-
-        env = {
-            "PATH": os.pathsep.join(path_entries),
-            "HOME": str(spec.connection_path),
-            "TMPDIR": os.environ.get("TMPDIR", "/tmp"),
-            "LANG": os.environ.get("LANG", "C.UTF-8"),
-        }
-        env.update(spec.environment)
+        spec = self._session_spec(container_id)
+        env = self._environment(spec)
         shell_command = self._rewrite_python_command(command)
 
         started = self._clock()
@@ -406,9 +532,53 @@ class ProcessExecSandboxBackend:
             truncated=stdout_truncated or stderr_truncated,
         )
 
+    def open_worker(self, container_id: str, command: list[str]) -> ExecWorker:
+        spec = self._session_spec(container_id)
+        argv = list(command)
+        if argv and argv[0] == "python3":
+            argv[0] = self._preferred_python_executable()
+        process = subprocess.Popen(
+            argv,
+            cwd=spec.connection_path,
+            env=self._environment(spec),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        return ExecWorker(
+            process,
+            kill=lambda worker: self._terminate_process_group(process.pid),
+            output_chars=self.output_chars,
+            clock=self._clock,
+        )
+
     def close_session(self, container_id: str) -> None:
         self._sessions.pop(container_id, None)
 
+    def _session_spec(self, container_id: str) -> ExecSandboxSpec:
+        spec = self._sessions.get(container_id)
+        if spec is None:
+            raise ExecRuntimeError(f"unknown exec session: {container_id}")
+        return spec
+
+    def _environment(self, spec: ExecSandboxSpec) -> dict[str, str]:
+        current_python_bin = str(Path(sys.executable).parent)
+        default_exec_path = "/usr/local/bin:/opt/homebrew/bin:/usr/bin:/bin:/usr/sbin:/sbin"
+        configured_path = os.environ.get("DB_MCP_EXEC_PATH", default_exec_path)
+        path_entries = [entry for entry in configured_path.split(os.pathsep) if entry]
+        if current_python_bin not in path_entries:
+            path_entries.insert(0, current_python_bin)
+
+        env = {
+            "PATH": os.pathsep.join(path_entries),
+            "HOME": str(spec.connection_path),
+            "TMPDIR": os.environ.get("TMPDIR", "/tmp"),
+            "LANG": os.environ.get("LANG", "C.UTF-8"),
+        }
+        env.update(spec.environment)
+        return env
+
     def _session_key(self, spec: ExecSandboxSpec) -> str:
         return f"process:{spec.session_id}:{spec.connection}"
 
@@ -470,6 +640,7 @@ class ExecSessionManager:
         self._max_sessions = max_sessions
         self._now = now
         self._sessions: dict[tuple[str, str], _ActiveSession] = {}
+        self._lock = threading.Lock()
 
     def execute(
         self,
@@ -479,52 +650,155 @@ class ExecSessionManager:
         command: str,
         timeout_seconds: int,
     ) -> dict[str, object]:
-        self.reap_idle_sessions()
+        active = self._checkout(session_id, spec)
+        try:
+            result = self._backend.exec_command(active.container_id, command, timeout_seconds)
+        finally:
+            self._checkin(active)
+        return result.to_dict()
 
-        key = (session_id, spec.connection)
-        active = self._sessions.get(key)
-        if active is None:
-            self._evict_if_needed()
-            active = _ActiveSession(
-                container_id=self._backend.create_session(spec),
-                spec=spec,
-                last_used_at=self._now(),
-            )
-            self._sessions[key] = active
+    @property
+    def supports_workers(self) -> bool:
+        """Whether the backend can host persistent ``ExecWorker`` processes."""
+        return callable(getattr(self._backend, "open_worker", None))
 
-        result = self._backend.exec_command(active.container_id, command, timeout_seconds)
-        active.last_used_at = self._now()
+    def request_worker(
+        self,
+        *,
+        session_id: str,
+        spec: ExecSandboxSpec,
+        command: list[str],
+        payload: dict[str, Any],
+        timeout_seconds: int,
+    ) -> dict[str, object]:
+        """Send ``payload`` to the session's persistent worker, starting it if needed.
+
+        The worker lives as long as its sandbox session and is closed with it by
+        the idle reaper. A worker that times out or dies is discarded and
+        restarted on the next request. Concurrent requests for the same session
+        (e.g. several ``stateless`` callers) are served one at a time.
+        """
+        if not self.supports_workers:
+            raise ExecRuntimeError("exec backend does not support persistent workers")
+        active = self._checkout(session_id, spec)
+        try:
+            with active.lock:
+                worker = active.worker
+                if worker is None or not worker.alive:
+                    if worker is not None:
+                        worker.close()
+                    open_worker = self._backend.open_worker  # type: ignore[attr-defined]
+                    worker = active.worker = open_worker(active.container_id, command)
+                try:
+                    result = worker.request(payload, timeout_seconds)
+                except ExecRuntimeError:
+                    worker.close()
+                    active.worker = None
+                    raise
+        finally:
+            self._checkin(active)
         return result.to_dict()
 
     def reap_idle_sessions(self) -> None:
-        cutoff = self._now() - self._idle_ttl_seconds
-        expired = [key for key, active in self._sessions.items() if active.last_used_at < cutoff]
-        for key in expired:
-            active = self._sessions.pop(key)
-            self._backend.close_session(active.container_id)
+        with self._lock:
+            expired = self._pop_expired()
+        for active in expired:
+            self._close_active(active)
 
     def close_all(self) -> None:
-        for active in self._sessions.values():
-            self._backend.close_session(active.container_id)
-        self._sessions.clear()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for active in sessions:
+            self._close_active(active)
 
     def close_session(self, *, session_id: str, connection: str) -> bool:
         key = (session_id, connection)
-        active = self._sessions.pop(key, None)
+        with self._lock:
+            active = self._sessions.pop(key, None)
         if active is None:
             return False
-        self._backend.close_session(active.container_id)
+        # Let a worker request in flight finish before its process is closed.
+        with active.lock:
+            self._close_active(active)
         return True
 
-    def _evict_if_needed(self) -> None:
+    def _checkout(self, session_id: str, spec: ExecSandboxSpec) -> _ActiveSession:
+        """Get or create the session and mark it busy until ``_checkin``.
+
+        A new session's slot is reserved under ``_lock`` and its sandbox is
+        started outside it, so other sessions are not held up by a container
+        start. Concurrent callers for the same session wait for that start.
+        """
+        key = (session_id, spec.connection)
+        with self._lock:
+            stale = self._pop_expired()
+            active = self._sessions.get(key)
+            creating = active is None
+            if creating:
+                stale.extend(self._pop_for_eviction())
+                active = _ActiveSession(container_id="", spec=spec, last_used_at=self._now())
+                self._sessions[key] = active
+            active.in_flight += 1
+        for session in stale:
+            self._close_active(session)
+
+        if creating:
+            try:
+                active.container_id = self._backend.create_session(spec)
+            except BaseException:
+                with self._lock:
+                    if self._sessions.get(key) is active:
+                        del self._sessions[key]
+                    active.in_flight -= 1
+                raise
+            finally:
+                active.ready.set()
+        else:
+            active.ready.wait()
+            if not active.container_id:
+                # The start failed in another caller; try again with a fresh slot.
+                with self._lock:
+                    active.in_flight -= 1
+                return self._checkout(session_id, spec)
+        return active
+
+    def _checkin(self, active: _ActiveSession) -> None:
+        with self._lock:
+            active.in_flight -= 1
+            active.last_used_at = self._now()
+
+    def _pop_expired(self) -> list[_ActiveSession]:
+        """Remove idle sessions past the TTL; caller holds ``_lock`` and closes them."""
+        cutoff = self._now() - self._idle_ttl_seconds
+        expired = [
+            key
+            for key, active in self._sessions.items()
+            if active.in_flight == 0 and active.last_used_at < cutoff
+        ]
+        return [self._sessions.pop(key) for key in expired]
+
+    def _close_active(self, active: _ActiveSession) -> None:
+        active.ready.wait()
+        if active.worker is not None:
+            active.worker.close()
+            active.worker = None
+        if active.container_id:
+            self._backend.close_session(active.container_id)
+
+    def _pop_for_eviction(self) -> list[_ActiveSession]:
+        """Remove the least recently used idle session when at capacity.
+
+        Caller holds ``_lock`` and closes the result. Busy sessions are never
+        evicted, so the limit can be exceeded while every session is in use.
+        """
         if len(self._sessions) < self._max_sessions:
-            return
-        oldest_key, oldest_session = min(
-            self._sessions.items(),
-            key=lambda item: item[1].last_used_at,
-        )
-        self._backend.close_session(oldest_session.container_id)
-        self._sessions.pop(oldest_key, None)
+            return []
+        idle = [item for item in self._sessions.items() if item[1].in_flight == 0]
+        if not idle:
+            return []
+        oldest_key, _ = min(idle, key=lambda item: item[1].last_used_at)
+        return [self._sessions.pop(oldest_key)]
 
 
 _manager: ExecSessionManager | None = None
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Callable
 
 import yaml
+from db_mcp_knowledge.gaps.store import load_gaps_from_path
 from db_mcp_knowledge.onboarding.schema_store import load_schema_descriptions
 from db_mcp_knowledge.onboarding.state import load_state
 from db_mcp_knowledge.vault.paths import (
@@ -17,6 +18,7 @@ from db_mcp_knowledge.vault.paths import (
     domain_model_path,
     examples_dir,
 )
+from db_mcp_knowledge.vault.record_log import segment_path
 
 from db_mcp.insider.config import InsiderConfig, get_insider_db_path, load_insider_config
 from db_mcp.insider.logging import log_event
@@ -208,7 +210,11 @@ class InsiderService:
             with open(path) as f:
                 examples.append(yaml.safe_load(f) or {})
         gaps_path = connection_path / KNOWLEDGE_GAPS_FILE
-        knowledge_gaps = yaml.safe_load(gaps_path.read_text()) if gaps_path.exists() else []
+        knowledge_gaps = (
+            load_gaps_from_path(connection_path).model_dump(mode="json")
+            if gaps_path.exists() or segment_path(gaps_path).exists()
+            else []
+        )
         dm_path = domain_model_path(connection_path)
         schema_path = descriptions_path(connection_path)
         return InsiderRunRequest(
@@ -12,6 +12,7 @@ from typing import Any
 
 import yaml
 from db_mcp_data.connectors import Connector, get_connector
+from db_mcp_data.connectors.cache import get_cached_connector, invalidate_connector_cache
 from db_mcp_knowledge.vault.paths import CONNECTOR_FILE, STATE_FILE
 
 from db_mcp.config import Settings, get_settings, load_config
@@ -91,7 +92,6 @@ class ConnectionRegistry:
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings = settings or get_settings()
         self._connections: dict[str, ConnectionInfo] = {}
-        self._connectors: dict[str, Connector] = {}
         self._discovered = False
 
     @classmethod
@@ -221,31 +221,25 @@ class ConnectionRegistry:
     def get_connector(self, name: str | None = None) -> Connector:
         """Get a connector by connection name, with lazy loading and caching.
 
+        Instances live in the process-wide connector cache shared with the
+        gateway dispatcher, and are rebuilt when connector.yaml or .env change.
+
         Args:
             name: Connection name. If None, uses the default.
         """
-        cache_key = name or self._settings.connection_name or "default"
-
-        cached = self._connectors.get(cache_key)
-        if cached is not None:
-            return cached
-
         path = self.get_connection_path(name)
-        connector = get_connector(str(path))
-        self._connectors[cache_key] = connector
-        return connector
+        return get_cached_connector(path, get_connector)
 
     def invalidate_connector(self, name: str | None = None) -> bool:
         """Invalidate a cached connector instance.
 
         Args:
-            name: Connection name. If None, invalidates the default connection cache key.
+            name: Connection name. If None, invalidates the default connection.
 
         Returns:
             True if a cached connector was removed, False otherwise.
         """
-        cache_key = name or self._settings.connection_name or "default"
-        return self._connectors.pop(cache_key, None) is not None
+        return invalidate_connector_cache(self.get_connection_path(name))
 
     def refresh_connector(self, name: str | None = None) -> Connector:
         """Force-reload a connector by invalidating cache then reloading."""
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from db_mcp_data.connectors.cache import invalidate_connector_cache
 from db_mcp_data.connectors.templates import get_connector_template
 from db_mcp_data.db.connection import detect_dialect_from_url
 from db_mcp_knowledge.onboarding.state import create_initial_state, load_state, save_state
@@ -571,6 +572,7 @@ def delete_connection(
             yaml.dump(config, f, default_flow_style=False)
 
     shutil.rmtree(conn_path)
+    invalidate_connector_cache(conn_path)
     return {"success": True, "name": name}
 
 
@@ -579,9 +581,12 @@ def sync_api_connection(
     *,
     connections_dir: Path,
     endpoint: str | None = None,
+    full: bool = False,
 ) -> dict[str, Any]:
     """Sync data from API endpoints for a named connection.
 
+    ``full`` drops incremental watermarks so every endpoint is refetched.
+
     Returns ``{"success": bool, "synced": [...], "rows_fetched": {...}, "errors": [...]}``.
     """
     conn_path = connections_dir / name
@@ -610,7 +615,9 @@ def sync_api_connection(
                 if v is not None:
                     os.environ[k] = v
 
-        result = connector.sync(endpoint_name=endpoint)
+        result = connector.sync(endpoint_name=endpoint, full=full)
+        # Live connectors built before the sync still hold views over the old files.
+        invalidate_connector_cache(conn_path)
         return {"success": True, **result}
     except Exception as exc:
         return {"success": False, "error": str(exc)}
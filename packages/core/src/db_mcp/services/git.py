@@ -12,6 +12,8 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from db_mcp_knowledge.vault.record_log import compact_connection_logs
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -62,6 +64,8 @@ def try_git_commit(conn_path: Path, message: str, files: list[str]) -> bool:
         return False
     git = _get_git()
     try:
+        # Committed snapshots should include updates still pending in record logs.
+        compact_connection_logs(conn_path)
         git.add(conn_path, files)
         result = git.commit(conn_path, message)
         return bool(result)
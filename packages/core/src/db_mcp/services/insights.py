@@ -47,12 +47,37 @@ def save_example(connection: str, sql: str, intent: str) -> dict:
     }
 
 
+def _window_totals(traces_dir: Path, connection_path: Path, days: list[str]) -> dict:
+    """Uncapped totals for the window, read from the trace index counters.
+
+    ``analyze_traces`` only sees the most recent traces of each day; these
+    counters cover every indexed span without loading any of them.
+    """
+    from db_mcp.trace_index import COUNTER_ERROR, COUNTER_SQL, COUNTER_TOOL, TraceIndex
+
+    index = TraceIndex(traces_dir, connection_path)
+    tools = index.counters(days, COUNTER_TOOL)
+    errors = index.counters(days, COUNTER_ERROR)
+    queries = index.counters(days, COUNTER_SQL)
+    top_tools = sorted(tools.items(), key=lambda item: item[1]["count"], reverse=True)[:20]
+    return {
+        "toolUsage": {name: stats["count"] for name, stats in top_tools},
+        "errorCount": sum(stats["count"] for stats in errors.values()),
+        "errorsByTool": {name: stats["count"] for name, stats in errors.items()},
+        "distinctQueries": len(queries),
+        "repeatedQueryCount": sum(1 for stats in queries.values() if stats["count"] >= 2),
+    }
+
+
 def analyze_insights(connection_path: Path | None, days: int = 7) -> dict:
     """Analyze live and historical traces and refresh derived insights."""
     from db_mcp.console.collector import get_collector
-    from db_mcp.traces_reader import analyze_traces, read_traces_from_jsonl
+    from db_mcp.trace_index import read_indexed_traces
+    from db_mcp.traces_reader import analyze_traces
 
     all_traces: list[dict] = []
+    history_dir: Path | None = None
+    history_days: list[str] = []
 
     try:
         live = get_collector().get_traces(limit=500)
@@ -63,6 +88,7 @@ def analyze_insights(connection_path: Path | None, days: int = 7) -> dict:
     if connection_path:
         try:
             from db_mcp.traces import get_traces_dir, get_user_id_from_config, is_traces_enabled
+            from db_mcp.traces_reader import trace_day_segments
 
             if is_traces_enabled():
                 user_id = get_user_id_from_config()
@@ -73,9 +99,11 @@ def analyze_insights(connection_path: Path | None, days: int = 7) -> dict:
                         date = today - timedelta(days=i)
                         date_str = date.strftime("%Y-%m-%d")
                         file_path = traces_dir / f"{date_str}.jsonl"
-                        if file_path.exists():
-                            day_traces = read_traces_from_jsonl(file_path, limit=500)
+                        if trace_day_segments(traces_dir, date_str):
+                            day_traces = read_indexed_traces(file_path, limit=500)
                             all_traces.extend(day_traces)
+                            history_days.append(date_str)
+                    history_dir = traces_dir
         except Exception as e:
             logger.warning("insights: failed to read historical traces: %s", e)
 
@@ -89,6 +117,12 @@ def analyze_insights(connection_path: Path | None, days: int = 7) -> dict:
 
     analysis = analyze_traces(unique_traces, connection_path, days=days)
 
+    if history_dir is not None and history_days:
+        try:
+            analysis["windowTotals"] = _window_totals(history_dir, connection_path, history_days)
+        except Exception as e:
+            logger.warning("insights: failed to read trace index counters: %s", e)
+
     if connection_path:
         try:
             from db_mcp_knowledge.insights.detector import scan_and_update
@@ -1,7 +1,21 @@
+import asyncio
+import logging
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from db_mcp_data.connectors import get_connector
+from db_mcp_data.db.discovery import (
+    discover_tables,
+    known_columns_from_schema,
+    load_schema_fingerprints,
+    save_schema_fingerprints,
+)
+from db_mcp_data.execution.result_cache import invalidate_result_cache
 from db_mcp_data.gateway import introspect as gateway_introspect
+from db_mcp_data.gateway import introspect_catalog_columns as gateway_catalog_columns
+from db_mcp_data.gateway import introspect_foreign_keys as gateway_foreign_keys
+from db_mcp_data.validation.explain_cache import invalidate_explain_cache
 from db_mcp_knowledge.onboarding.ignore import load_ignore_patterns
 from db_mcp_knowledge.onboarding.schema_store import (
     create_initial_schema,
@@ -10,10 +24,46 @@ from db_mcp_knowledge.onboarding.schema_store import (
     save_schema_descriptions,
 )
 from db_mcp_knowledge.onboarding.state import create_initial_state, load_state, save_state
+from db_mcp_knowledge.semantic.join_graph import get_join_graph
 from db_mcp_models import OnboardingPhase
 
 from db_mcp.insider import get_insider_supervisor
 
+logger = logging.getLogger(__name__)
+
+
+def build_join_graph(
+    conn_path: Path,
+    schemas: list[dict],
+    tables: list[dict],
+    list_foreign_keys: Callable[[str | None, str | None], dict[str, list[dict]] | None] | None,
+) -> None:
+    """Seed the connection's join graph from the saved schema and declared foreign keys.
+
+    Foreign keys are best-effort: schemas whose introspection fails keep the
+    keys recorded by an earlier discovery and rely on name inference.
+    """
+    identifiers: dict[tuple[str | None, str | None], dict[str, str]] = {}
+    for table in tables:
+        if table.get("full_name"):
+            key = (table.get("catalog"), table.get("schema"))
+            identifiers.setdefault(key, {})[table.get("name")] = table["full_name"]
+    foreign_keys: dict[str, list[dict[str, Any]]] = {}
+    for entry in schemas if list_foreign_keys is not None else []:
+        catalog, schema = entry.get("catalog"), entry.get("schema")
+        try:
+            by_table = list_foreign_keys(schema, catalog)
+        except Exception as exc:
+            logger.debug("Foreign key introspection failed for %s.%s: %s", catalog, schema, exc)
+            continue
+        if by_table is None:
+            continue
+        schema_tables = identifiers.get((catalog, schema), {})
+        for table_name, identifier in schema_tables.items():
+            foreign_keys[identifier] = by_table.get(table_name, [])
+    graph = get_join_graph(conn_path)
+    graph.record_foreign_keys(foreign_keys)
+
 
 def discover_structure(
     provider_id: str,
@@ -180,45 +230,71 @@ async def discover_tables_background(
         state.schemas_discovered = [s["schema"] or "(default)" for s in all_schemas_filtered]
         task["schemas_total"] = len(all_schemas_filtered)
 
-        all_tables = []
-        for schema_idx, schema_info in enumerate(all_schemas_filtered):
-            catalog = schema_info["catalog"]
-            schema = schema_info["schema"]
-            task["schemas_processed"] = schema_idx
-            task["tables_found_so_far"] = len(all_tables)
+        if _use_gateway:
 
-            if _use_gateway:
-                tables_raw = gateway_introspect(
+            def list_tables(schema, catalog):
+                raw = gateway_introspect(
                     provider_id, "tables", connection_path=conn_path,
                     schema=schema, catalog=catalog
                 )
-                tables = ignore.filter_tables(tables_raw.get("tables", []))
-            else:
-                tables = ignore.filter_tables(connector.get_tables(schema=schema, catalog=catalog))
-            for table in tables:
-                try:
-                    if _use_gateway:
-                        cols_raw = gateway_introspect(
-                            provider_id, "columns", connection_path=conn_path,
-                            table=table["name"], schema=schema, catalog=catalog
-                        )
-                        columns = cols_raw.get("columns", [])
-                    else:
-                        columns = connector.get_columns(
-                            table["name"], schema=schema, catalog=catalog
-                        )
-                except Exception:
-                    columns = []
-                all_tables.append(
-                    {
-                        "name": table["name"],
-                        "schema": schema,
-                        "catalog": catalog,
-                        "full_name": table["full_name"],
-                        "columns": columns,
-                    }
+                return raw.get("tables", [])
+
+            def list_columns(table, schema, catalog):
+                raw = gateway_introspect(
+                    provider_id, "columns", connection_path=conn_path,
+                    table=table, schema=schema, catalog=catalog
+                )
+                return raw.get("columns", [])
+
+            def list_catalog_columns(catalog, schemas):
+                return gateway_catalog_columns(
+                    connection_path=conn_path, catalog=catalog, schemas=schemas
                 )
 
+            def list_foreign_keys(schema, catalog):
+                return gateway_foreign_keys(
+                    connection_path=conn_path, schema=schema, catalog=catalog
+                )
+        else:
+
+            def list_tables(schema, catalog):
+                return connector.get_tables(schema=schema, catalog=catalog)
+
+            def list_columns(table, schema, catalog):
+                return connector.get_columns(table, schema=schema, catalog=catalog)
+
+            list_catalog_columns = getattr(connector, "get_catalog_columns", None)
+            list_foreign_keys = getattr(connector, "get_schema_foreign_keys", None)
+
+        # Schemas whose table list is unchanged since the last discovery reuse
+        # the columns already saved in schema/descriptions.yaml.
+        previous_fingerprints: dict[str, str] = {}
+        known_columns: dict[str, list[dict]] = {}
+        if conn_path is not None:
+            previous_fingerprints = load_schema_fingerprints(conn_path)
+            if previous_fingerprints:
+                known_columns = known_columns_from_schema(
+                    load_schema_descriptions(provider_id, connection_path=conn_path)
+                )
+
+        def on_progress(schemas_done: int, tables_found: int) -> None:
+            task["schemas_processed"] = schemas_done
+            task["tables_found_so_far"] = tables_found
+
+        # Listing and column fetches fan out on a thread pool; keep them off the loop.
+        discovery = await asyncio.to_thread(
+            discover_tables,
+            all_schemas_filtered,
+            list_tables=list_tables,
+            list_columns=list_columns,
+            list_catalog_columns=list_catalog_columns,
+            table_filter=ignore.filter_tables,
+            previous_fingerprints=previous_fingerprints,
+            known_columns=known_columns,
+            on_progress=on_progress,
+        )
+        all_tables = discovery.tables
+
         state.tables_discovered = [table["full_name"] for table in all_tables]
         state.tables_total = len(all_tables)
         task["schemas_processed"] = len(all_schemas_filtered)
@@ -234,6 +310,18 @@ async def discover_tables_background(
             task["status"] = "error"
             task["error"] = f"Failed to save schema descriptions: {schema_result['error']}"
             return
+        if conn_path is not None:
+            save_schema_fingerprints(conn_path, discovery.fingerprints)
+            try:
+                await asyncio.to_thread(
+                    build_join_graph,
+                    conn_path,
+                    all_schemas_filtered,
+                    all_tables,
+                    list_foreign_keys,
+                )
+            except Exception as exc:
+                logger.warning("Join graph build skipped for %s: %s", provider_id, exc)
 
         state.phase = OnboardingPhase.SCHEMA
         save_result = save_state_fn(state, connection_path=conn_path)
@@ -365,11 +453,16 @@ def persist_discovery(
         schema = create_initial_schema(name, dialect, tables)
 
     schema_result = save_schema_descriptions(schema, connection_path=conn_path)
+    # Cached query results and plans may reference tables or columns that just changed.
+    invalidate_result_cache(conn_path)
+    invalidate_explain_cache(conn_path)
     if not schema_result.get("saved"):
         return {
             "success": False,
             "error": schema_result.get("error") or "Failed to save schema descriptions",
         }
+    # Only the tables whose columns changed get their join edges recomputed.
+    get_join_graph(conn_path)
 
     state = load_state(connection_path=conn_path) or create_initial_state(name)
     state.provider_id = name
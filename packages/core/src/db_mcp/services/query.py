@@ -1,11 +1,19 @@
 """Query execution and validation services."""
 
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from db_mcp_data.connectors import get_connector, get_connector_capabilities
 from db_mcp_data.connectors.sql import SQLConnector
+from db_mcp_data.db.streaming import (
+    DEFAULT_BATCH_SIZE,
+    RowStream,
+    drain_stream,
+    result_byte_limit,
+    result_row_limit,
+)
 from db_mcp_data.execution import (
     ExecutionErrorCode,
     ExecutionRequest,
@@ -14,6 +22,11 @@ from db_mcp_data.execution import (
     evaluate_sql_execution_policy,
 )
 from db_mcp_data.execution.engine import get_execution_engine
+from db_mcp_data.execution.workers import (
+    ConnectionWorkerPool,
+    WorkerPoolFullError,
+    get_worker_pool,
+)
 from db_mcp_data.validation.explain import (
     CostTier,
     ExplainResult,
@@ -25,6 +38,7 @@ from db_mcp_data.validation.explain import (
 from sqlalchemy import text
 
 ASYNC_ROW_THRESHOLD = 50_000
+BICP_MAX_ROWS = 10_000
 
 
 def execute_bicp_query(
@@ -57,31 +71,34 @@ def execute_bicp_query(
                     columns = [{"name": name, "dataType": "VARCHAR"} for name in column_names]
                     rows = []
                     for i, row in enumerate(result):
-                        if i >= 10000:
+                        if i >= BICP_MAX_ROWS:
                             break
                         rows.append(list(row))
                 else:
                     columns = []
                     rows = []
         else:
+            # Server-side cursor: stop after BICP_MAX_ROWS without buffering the rest.
             with engine.connect() as conn:
-                result = conn.execute(text(sql))
+                result = conn.execution_options(
+                    stream_results=True, yield_per=DEFAULT_BATCH_SIZE
+                ).execute(text(sql))
                 column_names = list(result.keys())
                 columns = [{"name": name, "dataType": "VARCHAR"} for name in column_names]
                 rows = []
                 for i, row in enumerate(result):
-                    if i >= 10000:
+                    if i >= BICP_MAX_ROWS:
                         break
                     rows.append(list(row))
         return columns, rows
 
-    result_rows = connector.execute_sql(sql)
-    if result_rows:
-        columns = [{"name": k, "dataType": "VARCHAR"} for k in result_rows[0].keys()]
-        rows = [list(r.values()) for r in result_rows[:10000]]
+    if hasattr(connector, "stream_sql"):
+        stream = connector.stream_sql(sql)
     else:
-        columns = []
-        rows = []
+        stream = RowStream.from_rows(connector.execute_sql(sql))
+    dict_rows, _ = drain_stream(stream, max_rows=BICP_MAX_ROWS)
+    columns = [{"name": k, "dataType": "VARCHAR"} for k in stream.columns]
+    rows = [list(r.values()) for r in dict_rows]
     return columns, rows
 
 
@@ -102,7 +119,7 @@ def analyze_candidate_sql(
     if validate_permissions is None:
         validate_permissions = validate_sql_permissions
     if explain is None:
-        explain = explain_sql
+        explain = partial(explain_sql, connector=connector)
 
     warnings: list[str] = []
     cost: dict[str, Any] | None = None
@@ -139,6 +156,8 @@ def _gateway_runner(
     connection: str,
     connection_path: Path,
     query_id: str,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
 ) -> dict[str, Any]:
     """Execute SQL via gateway adapter dispatch (default when no callback injected).
 
@@ -146,6 +165,8 @@ def _gateway_runner(
     selected via get_adapter(connector).  When *connector* is None the gateway's
     resolve_and_dispatch() resolves the connector from connection_path internally,
     keeping all connector lifecycle management inside the gateway boundary.
+    With *max_rows*/*max_bytes* the adapter streams the result and stops at
+    the bound.
     """
     from db_mcp_models.gateway import DataRequest, SQLQuery
 
@@ -160,10 +181,18 @@ def _gateway_runner(
                 "data": [], "columns": [], "rows_returned": 0, "rows_affected": None,
                 "metadata": {"error": str(exc)},
             }
-        resp = adapter.execute(connector, request, connection_path=connection_path)
+        resp = adapter.execute(
+            connector,
+            request,
+            connection_path=connection_path,
+            max_rows=max_rows,
+            max_bytes=max_bytes,
+        )
     else:
         from db_mcp_data.gateway.dispatcher import resolve_and_dispatch
-        resp = resolve_and_dispatch(request, connection_path=connection_path)
+        resp = resolve_and_dispatch(
+            request, connection_path=connection_path, max_rows=max_rows, max_bytes=max_bytes
+        )
 
     if not resp.is_success:
         raise RuntimeError(resp.error or "Gateway execution failed")
@@ -176,10 +205,28 @@ def _gateway_runner(
             "provider_id": None,
             "statement_type": None,
             "is_write": False,
+            "truncated": resp.truncated,
         },
     }
 
 
+async def _run_on_pool(
+    pool: ConnectionWorkerPool,
+    fn: Any,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Run a blocking response builder on a connection worker pool."""
+    try:
+        return await pool.run(fn, **kwargs)
+    except WorkerPoolFullError as exc:
+        return {
+            "status": "error",
+            "error": str(exc),
+            "error_code": ExecutionErrorCode.ENGINE.value,
+            "sql": kwargs.get("sql"),
+        }
+
+
 def _make_query_id(sql: str) -> str:
     """Deterministic query ID from SQL content (SHA-256 prefix)."""
     import hashlib
@@ -200,6 +247,10 @@ def _build_direct_sync_response(
     generate_query_id: Any | None,
     direct_execute: Any | None,
     connector: Any | None = None,
+    cache_ttl_seconds: float | None = None,
+    timeout_seconds: float | None = None,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
 ) -> dict[str, Any]:
     if execution_engine is None:
         execution_engine = get_execution_engine(connection_path)
@@ -213,6 +264,8 @@ def _build_direct_sync_response(
         sql=sql,
         query_id=direct_query_id,
         idempotency_key=direct_query_id,
+        cache_ttl_seconds=cache_ttl_seconds,
+        timeout_seconds=timeout_seconds,
     )
 
     def _direct_runner(payload: dict[str, Any]) -> dict[str, Any]:
@@ -233,6 +286,8 @@ def _build_direct_sync_response(
                 connection=connection,
                 connection_path=connection_path,
                 query_id=direct_query_id,
+                max_rows=max_rows,
+                max_bytes=max_bytes,
             )
         return {
             "data": raw.get("data", []),
@@ -246,7 +301,9 @@ def _build_direct_sync_response(
             },
         }
 
-    handle, exec_result = execution_engine.submit_sync(request, _direct_runner)
+    handle, exec_result = execution_engine.submit_sync(
+        request, _direct_runner, max_rows=max_rows
+    )
     if exec_result.state != ExecutionState.SUCCEEDED:
         error_message = exec_result.error.message if exec_result.error else "Execution failed"
         return {
@@ -274,6 +331,7 @@ def _build_direct_sync_response(
         "statement_type": exec_result.metadata.get("statement_type"),
         "is_write": exec_result.metadata.get("is_write", False),
         "rows_affected": exec_result.rows_affected,
+        "truncated": bool(exec_result.metadata.get("truncated", False)),
     }
 
 
@@ -352,9 +410,13 @@ async def run_sql(
             return policy_error
 
         sql_mode = caps.get("sql_mode")
+        pool = get_worker_pool(connection_path, caps)
         if sql_mode in {None, "engine"}:
             # connector may be None here; _gateway_runner uses resolve_and_dispatch.
-            return _build_direct_sync_response(
+            # Blocking execution runs on the connection's worker pool, not the loop.
+            return await _run_on_pool(
+                pool,
+                _build_direct_sync_response,
                 connection=connection,
                 sql=sql,
                 connection_path=connection_path,
@@ -363,6 +425,10 @@ async def run_sql(
                 generate_query_id=generate_query_id,
                 direct_execute=direct_execute,
                 connector=connector,
+                cache_ttl_seconds=caps.get("result_cache_ttl_seconds"),
+                timeout_seconds=caps.get("statement_timeout_seconds"),
+                max_rows=result_row_limit(caps),
+                max_bytes=result_byte_limit(caps),
             )
 
         # SQL-API execution path: need the actual connector for submit_sql().
@@ -464,7 +530,9 @@ async def run_sql(
                 }
 
         if direct_execute is not None:
-            return _build_direct_sync_response(
+            return await _run_on_pool(
+                pool,
+                _build_direct_sync_response,
                 connection=connection,
                 sql=sql,
                 connection_path=connection_path,
@@ -473,6 +541,9 @@ async def run_sql(
                 generate_query_id=generate_query_id,
                 direct_execute=direct_execute,
                 connector=connector,
+                timeout_seconds=caps.get("statement_timeout_seconds"),
+                max_rows=result_row_limit(caps),
+                max_bytes=result_byte_limit(caps),
             )
 
         return {
@@ -561,6 +632,10 @@ async def run_sql(
         if policy_error is not None:
             return policy_error
 
+        # Size the connection's worker pool from its capabilities before any
+        # execution path (including gateway.execute) first uses it.
+        pool = get_worker_pool(connection_path, caps)
+
         if query.estimated_rows and query.estimated_rows > ASYNC_ROW_THRESHOLD:
             started = await _gateway_module.start_query_execution(query_id)
             if not started:
@@ -624,6 +699,8 @@ async def run_sql(
                 sql=query.sql,
                 query_id=query_id,
                 idempotency_key=query_id,
+                cache_ttl_seconds=caps.get("result_cache_ttl_seconds"),
+                timeout_seconds=caps.get("statement_timeout_seconds"),
             )
 
             def _validated_runner(payload: dict[str, Any]) -> dict[str, Any]:
@@ -641,7 +718,21 @@ async def run_sql(
                     },
                 }
 
-            handle, exec_result = execution_engine.submit_sync(request, _validated_runner)
+            try:
+                handle, exec_result = await pool.run(
+                    execution_engine.submit_sync,
+                    request,
+                    _validated_runner,
+                    max_rows=result_row_limit(caps),
+                )
+            except WorkerPoolFullError as exc:
+                await _gateway_module.mark_error(query_id, error=str(exc))
+                return {
+                    "status": "error",
+                    "error": str(exc),
+                    "query_id": query_id,
+                    "sql": query.sql,
+                }
             if exec_result.state != ExecutionState.SUCCEEDED:
                 err = exec_result.error.message if exec_result.error else "Execution failed"
                 await _gateway_module.mark_error(query_id, error=err)
@@ -663,6 +754,7 @@ async def run_sql(
                 "statement_type": exec_result.metadata.get("statement_type"),
                 "is_write": exec_result.metadata.get("is_write", False),
                 "rows_affected": exec_result.rows_affected,
+                "truncated": bool(exec_result.metadata.get("truncated", False)),
             }
             await _gateway_module.mark_complete(
                 query_id,
@@ -673,10 +765,18 @@ async def run_sql(
 
         else:
             # Primary path: dispatch through gateway.execute().
-            # The gateway resolves the connector internally; run_sql owns only
-            # the policy checks and lifecycle state transitions around it.
+            # The gateway resolves the connector and runs it through the
+            # connection's ExecutionEngine (result cache, cancel scope,
+            # statement timeout); run_sql owns only the policy checks and
+            # lifecycle state transitions around it.
             from db_mcp_models.gateway import RunOptions
-            _options = RunOptions(confirmed=confirmed) if confirmed else None
+            _options = RunOptions(
+                confirmed=confirmed,
+                max_rows=result_row_limit(caps),
+                max_bytes=result_byte_limit(caps),
+                timeout_seconds=caps.get("statement_timeout_seconds"),
+                cache_ttl_seconds=caps.get("result_cache_ttl_seconds"),
+            )
             response = await _gateway_module.execute(
                 query_id,
                 connection_path=connection_path,
@@ -689,8 +789,8 @@ async def run_sql(
                     "status": "error",
                     "error": f"Execution failed: {err}",
                     "query_id": query_id,
-                    "execution_id": query_id,
-                    "state": "failed",
+                    "execution_id": response.execution_id or query_id,
+                    "state": response.state or ExecutionState.FAILED.value,
                     "sql": query.sql,
                 }
 
@@ -698,18 +798,19 @@ async def run_sql(
                 "data": response.data,
                 "columns": [c.name for c in response.columns],
                 "rows_returned": response.rows_returned,
-                "duration_ms": None,
+                "duration_ms": response.duration_ms,
                 "provider_id": None,
                 "statement_type": None,
                 "is_write": False,
                 "rows_affected": None,
+                "truncated": response.truncated,
             }
             await _gateway_module.mark_complete(
                 query_id,
                 rows_returned=result["rows_returned"],
             )
-            _execution_id = query_id
-            _state = ExecutionState.SUCCEEDED.value
+            _execution_id = response.execution_id or query_id
+            _state = response.state or ExecutionState.SUCCEEDED.value
 
         rows_returned = result["rows_returned"]
         is_large = rows_returned > 100
@@ -728,6 +829,7 @@ async def run_sql(
             "statement_type": result.get("statement_type"),
             "is_write": result.get("is_write", False),
             "rows_affected": result.get("rows_affected"),
+            "truncated": result.get("truncated", False),
             "presentation_hints": {
                 "downloadable": True,
                 "suggested_filename": f"query_{query_id[:8]}_{datetime.now():%Y%m%d_%H%M%S}",
@@ -776,7 +878,8 @@ async def validate_sql(
     if should_explain is None:
         should_explain = should_explain_statement
     if explain is None:
-        explain = explain_sql
+        # Reuse the caller's connector; otherwise explain_sql resolves it on a cache miss.
+        explain = explain_sql if connector is None else partial(explain_sql, connector=connector)
     # Permission check runs regardless of whether EXPLAIN-based validation is supported.
     is_allowed, error, statement_type, is_write = validate_permissions(sql, capabilities=caps)
     if not is_allowed:
@@ -41,9 +41,9 @@ def _get_traces_dir(connection_path: Path, user_id: str) -> Path:
 
 
 def _read_traces_from_jsonl(file_path: Path, limit: int | None = 500) -> list[dict]:
-    from db_mcp.traces_reader import read_traces_from_jsonl
+    from db_mcp.trace_index import read_indexed_traces
 
-    return read_traces_from_jsonl(file_path, limit=limit)
+    return read_indexed_traces(file_path, limit=limit)
 
 
 def _list_trace_dates_from_dir(connection_path: Path, user_id: str) -> list[str]:
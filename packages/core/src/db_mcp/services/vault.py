@@ -25,6 +25,7 @@ from db_mcp_knowledge.vault.paths import (
     PROTOCOL_FILE,
     SQL_RULES_FILE,
 )
+from db_mcp_knowledge.vault.record_log import RecordLog, get_record_log
 from db_mcp_models import (
     DimensionsCatalog,
     FeedbackLog,
@@ -95,6 +96,13 @@ VAULT_SCHEMA_MODELS: dict[str, type] = {
     FEEDBACK_LOG_FILE: FeedbackLog,
 }
 
+# YAML snapshots whose recent records live in an append-only segment beside
+# them (see db_mcp_knowledge.vault.record_log), mapped to the record list key.
+RECORD_LOG_COLLECTIONS: dict[str, str] = {
+    KNOWLEDGE_GAPS_FILE: "gaps",
+    FEEDBACK_LOG_FILE: "feedback",
+}
+
 VAULT_SCHEMA_GLOB_MODELS: dict[str, type] = {
     f"{EXAMPLES_DIR}/*.yaml": QueryExample,
 }
@@ -413,6 +421,34 @@ def _atomic_write_text(target: Path, content: str) -> None:
             temp_target.unlink()
 
 
+def _record_log(connection_path: Path, path: str) -> RecordLog | None:
+    collection = RECORD_LOG_COLLECTIONS.get(path)
+    if collection is None:
+        return None
+    header = VAULT_SCHEMA_MODELS[path](provider_id=connection_path.name).model_dump(
+        mode="json", exclude={collection}
+    )
+    return get_record_log(connection_path / path, collection, header)
+
+
+def _compact_record_log(connection_path: Path, path: str) -> None:
+    """Fold appended records into the snapshot so readers see the whole file."""
+    log = _record_log(connection_path, path)
+    if log is None:
+        return
+    try:
+        log.compact()
+    except Exception as e:
+        logger.debug("Could not compact %s: %s", connection_path / path, e)
+
+
+def _discard_record_log(connection_path: Path, path: str) -> None:
+    """A wholesale rewrite of the snapshot supersedes its pending records."""
+    log = _record_log(connection_path, path)
+    if log is not None:
+        log.discard_segment()
+
+
 def vault_write(connection_path: Path, path: str, content: str) -> dict:
     """Write a whitelisted vault file."""
     normalized_path = _normalize_vault_path(path)
@@ -434,6 +470,7 @@ def vault_write(connection_path: Path, path: str, content: str) -> dict:
     target = connection_path / normalized_path
     target.parent.mkdir(parents=True, exist_ok=True)
     _atomic_write_text(target, content)
+    _discard_record_log(connection_path, normalized_path)
     return {
         "saved": True,
         "file_path": str(target),
@@ -548,6 +585,7 @@ def read_context_file(
         return {"success": False, "error": "Invalid path"}
 
     file_path = connection_path / path
+    _compact_record_log(connection_path, _normalize_vault_path(path))
 
     if file_path.is_dir():
         folder_name = path.split("/")[0] if "/" in path else path
@@ -608,6 +646,7 @@ def write_context_file(connection_path: Path, path: str, content: str) -> dict:
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         _atomic_write_text(file_path, content)
+        _discard_record_log(connection_path, normalized_path)
         git_committed = try_git_commit(
             connection_path, f"Update {normalized_path}", [normalized_path]
         )
@@ -869,13 +908,29 @@ def list_context_tree(
     return {"connections": connections}
 
 
+def _scan_context_usage(connection_path: Path, user_dir: Path, dates: list[str]) -> dict:
+    """Per-file usage read straight from JSONL, used when the trace index is unusable."""
+    from db_mcp.traces_reader import extract_context_files, read_traces_from_jsonl
+
+    usage: dict[str, dict] = {}
+    for date_str in dates:
+        for trace in read_traces_from_jsonl(user_dir / f"{date_str}.jsonl", limit=None):
+            for span in trace.get("spans", []):
+                timestamp = span.get("start_time", 0)
+                for file_key in extract_context_files(span.get("attributes", {}), connection_path):
+                    stats = usage.setdefault(file_key, {"count": 0, "last_seen": 0})
+                    stats["count"] += 1
+                    stats["last_seen"] = max(stats["last_seen"], timestamp)
+    return usage
+
+
 def get_context_usage(connection_path: Path, days: int = 7) -> dict:
     """Aggregate context file usage from trace files."""
-    import re as _re
+    import sqlite3
     import time
-    import urllib.parse
 
-    from db_mcp.traces_reader import list_trace_dates, read_traces_from_jsonl
+    from db_mcp.trace_index import COUNTER_FILE, TraceIndex
+    from db_mcp.traces_reader import list_trace_dates
 
     cutoff_time = time.time() - (days * 86400)
     traces_dir = connection_path / "traces"
@@ -884,99 +939,34 @@ def get_context_usage(connection_path: Path, days: int = 7) -> dict:
         user_ids = [
             d.name for d in traces_dir.iterdir() if d.is_dir() and not d.name.startswith(".")
         ]
-    if not user_ids:
-        user_ids = ["default"]
 
     file_counts = defaultdict(int)
     file_last_used: dict[str, float] = {}
-    ctx_dirs = (
-        "schema",
-        "examples",
-        "instructions",
-        "domain",
-        "data",
-        "learnings",
-        "metrics",
-    )
-    root_files = ("PROTOCOL.md", "connector.yaml", "knowledge_gaps.yaml")
-
-    def _normalize_context_path(raw_path: str | None) -> str | None:
-        if not raw_path or not isinstance(raw_path, str):
-            return None
-
-        cleaned = urllib.parse.unquote(raw_path.replace("file://", "")).strip().strip("\"'")
-        path_obj = Path(cleaned)
-
-        if path_obj.is_absolute() and connection_path not in path_obj.parents:
-            return None
-
-        if path_obj.name in root_files:
-            return path_obj.name
-
-        parts = path_obj.parts
-        for idx, part in enumerate(parts):
-            if part in ctx_dirs and idx + 1 < len(parts):
-                return "/".join(parts[idx:])
-
-        return None
 
     for user_id in user_ids:
-        available_dates = list_trace_dates(connection_path, user_id)
-
-        for date_str in available_dates:
+        window_dates = []
+        for date_str in list_trace_dates(connection_path, user_id):
             try:
                 date_obj = datetime.strptime(date_str, "%Y-%m-%d")
                 if date_obj.timestamp() < cutoff_time:
                     continue
             except ValueError:
                 continue
+            window_dates.append(date_str)
+        if not window_dates:
+            continue
 
-            trace_file = connection_path / "traces" / user_id / f"{date_str}.jsonl"
-            if not trace_file.exists():
-                continue
-
-            traces = read_traces_from_jsonl(trace_file, limit=None)
-
-            for trace in traces:
-                for span in trace.get("spans", []):
-                    attrs = span.get("attributes", {})
-                    span_timestamp = span.get("start_time", 0)
-
-                    def _track(file_key: str) -> None:
-                        file_counts[file_key] += 1
-                        prev = file_last_used.get(file_key, 0)
-                        file_last_used[file_key] = max(prev, span_timestamp)
-
-                    tool_name = attrs.get("tool.name")
-                    command = attrs.get("command")
-                    if tool_name == "shell" and command:
-                        for match in _re.finditer(
-                            r"(?:^|[\s/])(" + "|".join(ctx_dirs) + r")/([^\s;|>&]+)",
-                            command,
-                        ):
-                            _track(f"{match.group(1)}/{match.group(2)}")
-                        for root_file in _re.findall(
-                            r"(?:^|[\s/])("
-                            + "|".join(_re.escape(name) for name in root_files)
-                            + r")(?=$|[\s;|>&])",
-                            command,
-                        ):
-                            _track(root_file)
-
-                    if tool_name == "protocol_tool":
-                        _track("PROTOCOL.md")
-
-                    files_used = attrs.get("knowledge.files_used")
-                    if files_used:
-                        for file_path in files_used:
-                            normalized = _normalize_context_path(file_path)
-                            if normalized:
-                                _track(normalized)
-
-                    for attr_name in ("path", "file_path", "resource.uri"):
-                        normalized = _normalize_context_path(attrs.get(attr_name))
-                        if normalized:
-                            _track(normalized)
+        try:
+            index = TraceIndex(traces_dir / user_id, connection_path)
+            usage = index.counters(window_dates, COUNTER_FILE)
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Trace index unavailable for %s: %s", traces_dir / user_id, e)
+            usage = _scan_context_usage(connection_path, traces_dir / user_id, window_dates)
+
+        for file_key, stats in usage.items():
+            file_counts[file_key] += stats["count"]
+            prev = file_last_used.get(file_key, 0)
+            file_last_used[file_key] = max(prev, stats["last_seen"])
 
     folder_counts = defaultdict(int)
     folder_last_used: dict[str, float] = {}
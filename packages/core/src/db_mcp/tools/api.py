@@ -3,6 +3,7 @@
 from typing import Any
 
 from db_mcp_data.connectors import APIConnector, get_connector_capabilities
+from db_mcp_data.db.streaming import result_row_limit
 from db_mcp_data.execution import check_protocol_ack_gate, evaluate_sql_execution_policy
 from db_mcp_data.execution.engine import get_execution_engine
 from db_mcp_data.execution.models import ExecutionRequest, ExecutionState
@@ -38,7 +39,7 @@ def _is_auth_error(result: dict[str, Any]) -> bool:
     return "401" in lowered or "unauthorized" in lowered
 
 
-async def _api_sync(connection: str, endpoint: str | None = None) -> dict:
+async def _api_sync(connection: str, endpoint: str | None = None, full: bool = False) -> dict:
     """Sync data from API endpoints.
 
     Fetches latest data from configured API endpoints and stores
@@ -47,6 +48,7 @@ async def _api_sync(connection: str, endpoint: str | None = None) -> dict:
     Args:
         connection: Connection name for multi-connection support.
         endpoint: Optional endpoint name to sync. If not provided, syncs all endpoints.
+        full: Drop incremental watermarks and refetch everything.
 
     Returns:
         Sync results including rows fetched per endpoint and any errors.
@@ -54,7 +56,7 @@ async def _api_sync(connection: str, endpoint: str | None = None) -> dict:
     connector, err = _get_api_connector(connection)
     if err:
         return err
-    return connector.sync(endpoint_name=endpoint)
+    return connector.sync(endpoint_name=endpoint, full=full)
 
 
 async def _api_discover(connection: str) -> dict:
@@ -141,7 +143,9 @@ async def _api_query(
         return res
 
     engine = get_execution_engine(conn_path)
-    handle, exec_result = engine.submit_sync(request, _run)
+    handle, exec_result = engine.submit_sync(
+        request, _run, max_rows=result_row_limit(get_connector_capabilities(connector))
+    )
 
     if exec_result.state == ExecutionState.FAILED:
         err_msg = exec_result.error.message if exec_result.error else "Execution failed"
@@ -151,6 +155,7 @@ async def _api_query(
         "execution_id": handle.execution_id,
         "data": exec_result.data,
         "rows_returned": exec_result.rows_returned,
+        "truncated": bool(exec_result.metadata.get("truncated", False)),
     }
 
 
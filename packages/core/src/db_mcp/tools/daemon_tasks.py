@@ -6,22 +6,33 @@ import asyncio
 import threading
 import time
 import uuid
-from dataclasses import dataclass, field
+from collections.abc import Iterator
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
+from db_mcp_knowledge.retrieval import BM25Index
+from db_mcp_knowledge.semantic.join_graph import get_join_graph
 
 from db_mcp.code_runtime.backend import HostDbMcpRuntime, _normalize_text, _score_text_match
+from db_mcp.config import get_settings
 from db_mcp.orchestrator.engine import preview_answer_intent
 from db_mcp.registry import ConnectionRegistry
 from db_mcp.tools.generation import _get_result, _run_sql, _validate_sql
+from db_mcp.tools.task_store import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    PreparedTask,
+    TaskStore,
+)
 
 _INLINE_RESULT_TIMEOUT_SECONDS = 30.0
 _INLINE_RESULT_POLL_SECONDS = 1.0
 _PREPARE_TASK_TIMEOUT_SECONDS = 15.0
 _EXECUTE_TASK_TIMEOUT_SECONDS = 45.0
+_JOIN_PATH_TABLES = 3
+_JOIN_PATH_MAX_HOPS = 3
 
 
 def _utc_now() -> str:
@@ -157,14 +168,12 @@ def _select_relevant_items(
     if not items:
         return []
 
-    scored: list[tuple[int, str]] = []
-    for item in items:
-        score = _score_text_match(query, item)
-        if score <= 0:
-            continue
-        scored.append((score, item))
+    index = BM25Index()
+    for position, item in enumerate(items):
+        index.add(str(position), item, kind="text")
+    scored = [(hit.score, items[int(hit.doc_id)]) for hit in index.search(query, limit=None)]
     if not scored:
-        scored = [(1, items[0])]
+        scored = [(1.0, items[0])]
 
     scored.sort(key=lambda item: (-item[0], item[1]))
     selected: list[str] = []
@@ -456,78 +465,23 @@ def _candidate_tables(
     return matches[:limit]
 
 
-def _join_score(left_col: str, right_col: str, right_table: str) -> tuple[int, str] | None:
-    left_norm = _normalize_text(left_col)
-    right_norm = _normalize_text(right_col)
-    right_table_norm = _normalize_text(right_table.split(".")[-1])
-    if not left_norm or not right_norm:
-        return None
-    if left_norm == right_norm and (
-        left_norm.endswith("id") or left_norm in {"address", "mint", "symbol"}
-    ):
-        return 80, "matching identifier columns"
-    if right_table_norm and left_norm == f"{right_table_norm}id" and right_norm.endswith("id"):
-        return 90, "foreign-key style id match"
-    if left_norm.endswith("mint") and right_norm in {"mint", "address"}:
-        return 85, "token mint/address match"
-    if left_norm.endswith("address") and right_norm in {"address", "mint"}:
-        return 75, "address-style identifier match"
-    return None
-
-
-def _infer_join_paths(tables: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    join_paths: list[dict[str, Any]] = []
-    for index, left in enumerate(tables):
-        for right in tables[index + 1 :]:
-            best: tuple[int, dict[str, Any]] | None = None
-            for left_col in left.get("columns", []):
-                for right_col in right.get("columns", []):
-                    score_reason = _join_score(
-                        str(left_col.get("name", "")),
-                        str(right_col.get("name", "")),
-                        str(right.get("identifier", "")),
-                    )
-                    if score_reason is None:
-                        score_reason = _join_score(
-                            str(right_col.get("name", "")),
-                            str(left_col.get("name", "")),
-                            str(left.get("identifier", "")),
-                        )
-                        if score_reason is not None:
-                            score, reason = score_reason
-                            candidate = {
-                                "left_table": right["identifier"],
-                                "left_column": right_col.get("name"),
-                                "right_table": left["identifier"],
-                                "right_column": left_col.get("name"),
-                                "reason": reason,
-                                "score": score,
-                            }
-                            if best is None or score > best[0]:
-                                best = (score, candidate)
-                            continue
-                    if score_reason is not None:
-                        score, reason = score_reason
-                        candidate = {
-                            "left_table": left["identifier"],
-                            "left_column": left_col.get("name"),
-                            "right_table": right["identifier"],
-                            "right_column": right_col.get("name"),
-                            "reason": reason,
-                            "score": score,
-                        }
-                        if best is None or score > best[0]:
-                            best = (score, candidate)
-            if best is not None:
-                join_paths.append(best[1])
-    join_paths.sort(
-        key=lambda item: (
-            -int(item["score"]),
-            str(item["left_table"]),
-            str(item["right_table"]),
-        )
-    )
-    return join_paths[:5]
+def _candidate_joins(
+    connection_path: Path, tables: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Direct joins among candidate tables plus bridge paths between the top ones."""
+    graph = get_join_graph(connection_path)
+    identifiers = [str(table.get("identifier") or "") for table in tables]
+    joins = [edge.to_dict() for edge in graph.joins_among(identifiers, limit=5)]
+    bridges: list[dict[str, Any]] = []
+    top = identifiers[:_JOIN_PATH_TABLES]
+    for index, source in enumerate(top):
+        for target in top[index + 1 :]:
+            path = graph.shortest_path(source, target, max_hops=_JOIN_PATH_MAX_HOPS)
+            if path and len(path) > 1:
+                bridges.append(
+                    {"from": source, "to": target, "joins": [edge.to_dict() for edge in path]}
+                )
+    return joins, bridges
 
 
 def _example_payload(example: dict[str, Any]) -> dict[str, Any]:
@@ -590,6 +544,9 @@ def _build_prepare_context(
     block_limit = 5 if context_profile == "expanded" else 3
     candidate_tables = initial_candidate_tables[:table_limit]
     candidate_columns = runtime.find_columns(question, limit=column_limit)
+    candidate_joins, candidate_join_paths = _candidate_joins(
+        runtime.connection_path, candidate_tables
+    )
     relevant_domain_blocks = _select_relevant_items(
         _split_text_blocks(domain_text),
         question,
@@ -679,62 +636,80 @@ def _build_prepare_context(
             ),
             "candidate_tables": candidate_tables,
             "candidate_columns": candidate_columns,
-            "candidate_joins": _infer_join_paths(candidate_tables),
+            "candidate_joins": candidate_joins,
+            "candidate_join_paths": candidate_join_paths,
             "client_context": extra_context or {},
             "context_profile": context_profile,
         }
     )
 
 
-@dataclass
-class PreparedTask:
-    task_id: str
-    connection: str
-    question: str
-    context: dict[str, Any]
-    status: str = "context_ready"
-    sql: str | None = None
-    validation: dict[str, Any] | None = None
-    execution: dict[str, Any] | None = None
-    created_at: str = field(default_factory=_utc_now)
-    updated_at: str = field(default_factory=_utc_now)
-    canceled: bool = False
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "task_id": self.task_id,
-            "connection": self.connection,
-            "question": self.question,
-            "status": self.status,
-            "sql": self.sql,
-            "validation": self.validation,
-            "execution": self.execution,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "canceled": self.canceled,
-            "context": self.context,
-        }
+_TASK_STORE: TaskStore | None = None
+_TASK_STORE_LOCK = threading.Lock()
+
 
+def _build_task_store(persist: bool | None = None) -> TaskStore:
+    settings = get_settings()
+    ttl_hours = settings.daemon_task_ttl_hours
+    max_mb = settings.daemon_task_max_mb
+    return TaskStore(
+        ttl_seconds=ttl_hours * 3600 if ttl_hours > 0 else DEFAULT_TTL_SECONDS,
+        max_entries=settings.daemon_task_max_entries or DEFAULT_MAX_ENTRIES,
+        max_bytes=max_mb * 1024 * 1024 if max_mb > 0 else None,
+        persist=settings.daemon_task_persist if persist is None else persist,
+    )
 
-_TASKS: dict[str, PreparedTask] = {}
-_TASKS_LOCK = threading.Lock()
+
+def _get_task_store() -> TaskStore:
+    global _TASK_STORE
+    with _TASK_STORE_LOCK:
+        if _TASK_STORE is None:
+            _TASK_STORE = _build_task_store()
+        return _TASK_STORE
+
+
+def _reset_task_store(*, persist: bool | None = None) -> None:
+    """Drop the process task store so the next access rebuilds it (for tests).
+
+    With ``persist`` given, a fresh store overriding ``daemon_task_persist``
+    is installed instead; tests pass False so no ``state/tasks.sqlite`` is
+    written into connection directories.
+    """
+    global _TASK_STORE
+    with _TASK_STORE_LOCK:
+        _TASK_STORE = None if persist is None else _build_task_store(persist)
+
+
+def _task_connection_path(connection: str) -> Path | None:
+    try:
+        return ConnectionRegistry.get_instance().get_connection_path(connection)
+    except Exception:
+        return None
+
+
+def _iter_persisted_task_paths() -> Iterator[Path]:
+    # Lazy: the registry is only scanned when a task misses the in-memory store.
+    registry = ConnectionRegistry.get_instance()
+    try:
+        names = [connection["name"] for connection in registry.list_connections()]
+    except Exception:
+        return
+    for name in names:
+        yield registry.get_connection_path(name)
 
 
 def _register_task(task: PreparedTask) -> PreparedTask:
-    with _TASKS_LOCK:
-        _TASKS[task.task_id] = task
+    _get_task_store().put(task, _task_connection_path(task.connection))
     return task
 
 
 def _get_task_state(task_id: str) -> PreparedTask | None:
-    with _TASKS_LOCK:
-        return _TASKS.get(task_id)
+    return _get_task_store().get(task_id, _iter_persisted_task_paths())
 
 
 def _update_task(task: PreparedTask) -> None:
     task.updated_at = _utc_now()
-    with _TASKS_LOCK:
-        _TASKS[task.task_id] = task
+    _get_task_store().put(task, _task_connection_path(task.connection))
 
 
 def _is_async_read_execution(
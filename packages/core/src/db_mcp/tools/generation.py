@@ -30,6 +30,12 @@ from typing import (
 
 from db_mcp_data.connectors import get_connector, get_connector_capabilities
 from db_mcp_data.connectors.sql import SQLConnector
+from db_mcp_data.db.streaming import (
+    DEFAULT_BATCH_SIZE,
+    RowStream,
+    drain_stream,
+    push_down_limit,
+)
 from db_mcp_data.execution import (
     ExecutionErrorCode,
     ExecutionState,
@@ -38,6 +44,7 @@ from db_mcp_data.execution import (
 )
 from db_mcp_data.execution.engine import get_execution_engine
 from db_mcp_data.execution.query_store import QueryStatus, get_query_store
+from db_mcp_data.execution.workers import get_worker_pool
 from db_mcp_data.validation.explain import (
     CostTier,
     ExplainResult,
@@ -179,9 +186,8 @@ def _execute_sql_on_engine(
     limit: int | None = None,
 ) -> tuple[list[str], list[dict[str, Any]], int | None]:
     """Execute SQL on SQLAlchemy engine with write-safe transaction handling."""
-    engine = connector.get_engine()
-
     if is_write:
+        engine = connector.get_engine()
         with engine.begin() as conn:
             result = conn.execute(text(sql))
             rows_affected = result.rowcount if result.rowcount >= 0 else None
@@ -193,16 +199,15 @@ def _execute_sql_on_engine(
                 rows = []
         return columns, rows, rows_affected
 
-    with engine.connect() as conn:
-        result = conn.execute(text(sql))
-        columns = list(result.keys())
-        rows = []
-        for i, row in enumerate(result):
-            if limit and i >= limit:
-                break
-            rows.append(dict(zip(columns, row)))
-
-    return columns, rows, None
+    # Reads go through a server-side cursor so only ``limit`` rows are ever
+    # pulled into memory; closing the stream releases the cursor early. The
+    # limit is also pushed into the statement for drivers that buffer results.
+    batch_size = min(limit, DEFAULT_BATCH_SIZE) if limit else DEFAULT_BATCH_SIZE
+    if limit:
+        sql = push_down_limit(sql, limit + 1, connector.get_dialect())
+    stream = connector.stream_sql(sql, batch_size=batch_size)
+    rows, _ = drain_stream(stream, max_rows=limit or None)
+    return stream.columns, rows, None
 
 
 def _execute_query(
@@ -260,19 +265,17 @@ def _execute_query(
                 # FileConnector / APIConnector: use execute_sql (DuckDB)
                 rows_affected = None
                 with tracer.start_as_current_span("db_execute") as exec_span:
-                    all_rows = connector.execute_sql(sql)
-                    if all_rows:
-                        columns = list(all_rows[0].keys())
+                    if hasattr(connector, "stream_sql"):
+                        stream = connector.stream_sql(sql)
                     else:
-                        columns = []
+                        stream = RowStream.from_rows(connector.execute_sql(sql))
+                    columns = stream.columns
                     exec_span.set_attribute("columns.count", len(columns))
 
                     with tracer.start_as_current_span("fetch_rows") as fetch_span:
-                        if limit and len(all_rows) > limit:
-                            rows = all_rows[:limit]
+                        rows, limit_reached = drain_stream(stream, max_rows=limit or None)
+                        if limit_reached:
                             fetch_span.set_attribute("limit_reached", True)
-                        else:
-                            rows = all_rows
                         fetch_span.set_attribute("rows.fetched", len(rows))
 
             total_duration_ms = (time.time() - start_time) * 1000
@@ -321,33 +324,46 @@ async def _execute_query_background(
     from db_mcp.tools.utils import _resolve_connection_path
 
     store = get_query_store()
-    execution_engine = get_execution_engine(Path(_resolve_connection_path(connection)))
+    connection_path = Path(_resolve_connection_path(connection))
+    execution_engine = get_execution_engine(connection_path)
     started = time.time()
 
+    def _run_cancellable() -> dict[str, Any] | None:
+        # The cancel scope lives on the worker thread that runs the statement.
+        if not execution_id:
+            return _execute_query(sql, connection, limit=1000, query_id=query_id)
+        timeout = capabilities.get("statement_timeout_seconds")
+        with execution_engine.cancellable(execution_id, timeout_seconds=timeout) as scope:
+            try:
+                return _execute_query(sql, connection, limit=1000, query_id=query_id)
+            except Exception:
+                if scope.cancelled:
+                    return None
+                raise
+
     try:
         if execution_id:
             dispatched = await store.get(query_id)
             if dispatched:
                 dispatched.execution_id = execution_id
         await store.update_status(query_id, QueryStatus.RUNNING)
-        if execution_id:
-            execution_engine.mark_running(execution_id)
+        if execution_id and not execution_engine.mark_running(execution_id):
+            await store.update_status(query_id, QueryStatus.ERROR, error="Query cancelled")
+            return
         logger.info(f"Query {query_id}: Starting background execution")
 
-        # Run the blocking query in a thread pool
-        loop = asyncio.get_event_loop()
-        from functools import partial
-
-        result = await loop.run_in_executor(
-            None,
-            partial(
-                _execute_query,
-                sql,
-                connection,
-                limit=1000,
-                query_id=query_id,
-            ),
+        # Run the blocking query on the connection's bounded worker pool
+        capabilities = get_connector_capabilities(
+            get_connector(connection_path=str(connection_path))
         )
+        result = await get_worker_pool(connection_path, capabilities).run(_run_cancellable)
+        if result is None:
+            # Cancelled or timed out; the execution store holds the outcome.
+            stopped = execution_engine.get_result(execution_id, limit=0)
+            state = stopped.state.value if stopped else ExecutionState.CANCELLED.value
+            logger.info(f"Query {query_id}: Stopped ({state})")
+            await store.update_status(query_id, QueryStatus.ERROR, error=f"Query {state}")
+            return
 
         await store.update_status(
             query_id,
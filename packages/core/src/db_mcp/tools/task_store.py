@@ -0,0 +1,185 @@
+"""Bounded store for daemon-mode prepared tasks.
+
+Tasks live in a TTL + LRU cache whose byte budget is the serialized size of
+each task (the prepared context dominates), so a long-running daemon keeps a
+flat memory footprint. When a connection directory is given, every write is
+also persisted to ``state/tasks.sqlite`` next to ``executions.sqlite`` and a
+cache miss falls back to those files, so ``get_task`` survives restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from db_mcp_data.ttl_cache import TTLCache
+
+TASKS_FILENAME = "tasks.sqlite"
+DEFAULT_TTL_SECONDS = 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 500
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_BUSY_TIMEOUT_SECONDS = 5.0
+
+
+def _utc_now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+@dataclass
+class PreparedTask:
+    task_id: str
+    connection: str
+    question: str
+    context: dict[str, Any]
+    status: str = "context_ready"
+    sql: str | None = None
+    validation: dict[str, Any] | None = None
+    execution: dict[str, Any] | None = None
+    created_at: str = field(default_factory=_utc_now)
+    updated_at: str = field(default_factory=_utc_now)
+    canceled: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "connection": self.connection,
+            "question": self.question,
+            "status": self.status,
+            "sql": self.sql,
+            "validation": self.validation,
+            "execution": self.execution,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "canceled": self.canceled,
+            "context": self.context,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PreparedTask:
+        return cls(
+            task_id=data["task_id"],
+            connection=data["connection"],
+            question=data["question"],
+            context=data.get("context") or {},
+            status=data.get("status", "context_ready"),
+            sql=data.get("sql"),
+            validation=data.get("validation"),
+            execution=data.get("execution"),
+            created_at=data.get("created_at") or _utc_now(),
+            updated_at=data.get("updated_at") or _utc_now(),
+            canceled=bool(data.get("canceled")),
+        )
+
+
+def tasks_db_path(connection_path: Path) -> Path:
+    """Location of the persisted task table for a connection directory."""
+    return Path(connection_path) / "state" / TASKS_FILENAME
+
+
+class TaskStore(TTLCache[PreparedTask]):
+    """Thread-safe, size-bounded LRU of prepared tasks with optional SQLite backing."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        persist: bool = True,
+    ):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries, max_bytes=max_bytes)
+        self.persist = persist
+        self._initialized: set[Path] = set()
+
+    def put(self, task: PreparedTask, connection_path: Path | None = None) -> None:
+        """Cache ``task`` and, when persistence is on, write it through to disk.
+
+        A task larger than the byte budget is only persisted; it is reloaded
+        from disk on each ``get``.
+        """
+        payload = json.dumps(task.to_dict(), default=str)
+        self.store(task.task_id, task, group=task.connection, size=len(payload))
+        if self.persist and connection_path is not None and Path(connection_path).is_dir():
+            self._write(tasks_db_path(connection_path), task, payload)
+
+    def get(self, task_id: str, connection_paths: Iterable[Path] = ()) -> PreparedTask | None:
+        """Return a live task from memory, falling back to persisted task tables."""
+        task = self.lookup(task_id)
+        if task is not None or not self.persist:
+            return task
+        for connection_path in connection_paths:
+            db_path = tasks_db_path(connection_path)
+            if not db_path.exists():
+                continue
+            payload = self._read(db_path, task_id)
+            if payload is None:
+                continue
+            task = PreparedTask.from_dict(json.loads(payload))
+            self.store(task.task_id, task, group=task.connection, size=len(payload))
+            return task
+        return None
+
+    def clear(self) -> int:
+        """Drop every in-memory task; persisted rows are left to expire."""
+        return self.invalidate()
+
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path, timeout=_BUSY_TIMEOUT_SECONDS)
+        if db_path not in self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS prepared_tasks (
+                    task_id TEXT PRIMARY KEY,
+                    connection TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    payload_json TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_prepared_tasks_updated "
+                "ON prepared_tasks(updated_at)"
+            )
+            conn.commit()
+            self._initialized.add(db_path)
+        return conn
+
+    def _write(self, db_path: Path, task: PreparedTask, payload: str) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        with closing(self._connect(db_path)) as conn, conn:
+            conn.execute(
+                """
+                INSERT INTO prepared_tasks (task_id, connection, status, payload_json, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(task_id) DO UPDATE SET
+                    status = excluded.status,
+                    payload_json = excluded.payload_json,
+                    updated_at = excluded.updated_at
+                """,
+                (task.task_id, task.connection, task.status, payload, now),
+            )
+            conn.execute(
+                "DELETE FROM prepared_tasks WHERE updated_at < ?", (now - self.ttl_seconds,)
+            )
+
+    def _read(self, db_path: Path, task_id: str) -> str | None:
+        try:
+            with closing(self._connect(db_path)) as conn:
+                row = conn.execute(
+                    "SELECT payload_json FROM prepared_tasks "
+                    "WHERE task_id = ? AND updated_at >= ?",
+                    (task_id, time.time() - self.ttl_seconds),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
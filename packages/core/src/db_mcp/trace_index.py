@@ -0,0 +1,418 @@
+"""Incremental SQLite index over JSONL trace files.
+
+Each ``traces/<user_id>/`` directory gets a ``.trace_index.sqlite`` sidecar.
+For every segment of a day (see ``traces_reader.trace_day_segments``) the
+index keeps a byte-offset watermark, so a refresh only parses lines appended
+since the last one; closed, compressed segments are read once. Spans are
+stored already normalized (see ``traces_reader.normalize_span_record``) and
+per-segment counters (tool calls, failures, SQL fingerprints, context file
+usage) are updated as lines are ingested, so readers never walk raw JSONL.
+
+The sidecar is derived data: it is rebuilt from the JSONL files whenever it
+is missing, unreadable or from an older schema version.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+
+from db_mcp.traces_reader import (
+    _extract_sql,
+    _normalize_sql,
+    build_trace,
+    extract_context_files,
+    normalize_span_record,
+    open_trace_file,
+    parse_trace_file_name,
+    read_traces_from_jsonl,
+    span_failure_type,
+    trace_day_segments,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".trace_index.sqlite"
+SCHEMA_VERSION = 2
+
+COUNTER_TOOL = "tool"
+COUNTER_ERROR = "error"
+COUNTER_SQL = "sql"
+COUNTER_FILE = "file"
+
+_TABLES = ("trace_segments", "trace_spans", "trace_roots", "trace_counters")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trace_segments (
+    segment TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trace_spans (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    segment TEXT NOT NULL,
+    day TEXT NOT NULL,
+    trace_id TEXT NOT NULL,
+    span_id TEXT,
+    parent_span_id TEXT,
+    name TEXT,
+    start_time NOT NULL,
+    end_time,
+    duration_ms,
+    status TEXT,
+    attributes_json TEXT NOT NULL,
+    events_json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trace_roots (
+    segment TEXT NOT NULL,
+    day TEXT NOT NULL,
+    trace_id TEXT NOT NULL,
+    start_time NOT NULL,
+    first_seq INTEGER NOT NULL,
+    PRIMARY KEY (segment, trace_id)
+);
+CREATE TABLE IF NOT EXISTS trace_counters (
+    segment TEXT NOT NULL,
+    day TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (segment, kind, key)
+);
+CREATE INDEX IF NOT EXISTS idx_trace_segments_day ON trace_segments(day);
+CREATE INDEX IF NOT EXISTS idx_trace_spans_day_trace ON trace_spans(day, trace_id);
+CREATE INDEX IF NOT EXISTS idx_trace_spans_segment ON trace_spans(segment);
+CREATE INDEX IF NOT EXISTS idx_trace_roots_day ON trace_roots(day, trace_id);
+CREATE INDEX IF NOT EXISTS idx_trace_counters_day ON trace_counters(day, kind);
+"""
+
+
+def _segment_key(file_name: str) -> str:
+    """Logical segment id: the file name without the compression suffix."""
+    day, part, _ = parse_trace_file_name(file_name)
+    return day if part is None else f"{day}.{part}"
+
+
+class TraceIndex:
+    """SQLite sidecar index for one ``traces/<user_id>`` directory."""
+
+    def __init__(self, traces_dir: Path, connection_path: Path | None = None):
+        self.traces_dir = traces_dir
+        # traces/<user_id> lives directly under the connection directory
+        self.connection_path = connection_path or traces_dir.parent.parent
+        self.db_path = traces_dir / INDEX_FILENAME
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                for table in ("trace_files", *_TABLES):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def ingest(self, day: str) -> int:
+        """Index lines added to the day's segments since the last call.
+
+        The current segment is read from its byte-offset watermark; when it
+        shrank or was replaced (rotation gives it a new inode) it is re-read
+        from the start. A trailing line without a newline is still being
+        written and is left for the next call. Compressed segments are closed
+        and are read in full whenever their file changes.
+
+        Returns:
+            Number of spans added
+        """
+        segments = {
+            _segment_key(path.name): path for path in trace_day_segments(self.traces_dir, day)
+        }
+        with closing(self._connect()) as conn:
+            stats = {}
+            for segment, path in segments.items():
+                try:
+                    stats[segment] = path.stat()
+                except FileNotFoundError:
+                    continue
+            if self._is_current(self._watermarks(conn, day), segments, stats):
+                return 0
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                watermarks = self._watermarks(conn, day)
+                for segment in set(watermarks) - set(stats):
+                    self._drop_segment(conn, segment)
+
+                added = 0
+                for segment, stat in stats.items():
+                    path = segments[segment]
+                    compressed = path.suffix != ".jsonl"
+                    offset = 0
+                    watermark = watermarks.get(segment)
+                    if watermark is not None:
+                        file_name, inode, size, offset = watermark
+                        if (file_name, inode, size) == (path.name, stat.st_ino, stat.st_size):
+                            continue
+                        if compressed or file_name != path.name or inode != stat.st_ino or (
+                            offset > stat.st_size
+                        ):
+                            self._drop_segment(conn, segment)
+                            offset = 0
+                    offset, count = self._ingest_segment(
+                        conn, segment, day, path, offset, complete=compressed
+                    )
+                    added += count
+                    conn.execute(
+                        """
+                        INSERT INTO trace_segments (segment, day, file_name, inode, size, offset)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(segment) DO UPDATE SET
+                            file_name = excluded.file_name,
+                            inode = excluded.inode,
+                            size = excluded.size,
+                            offset = excluded.offset
+                        """,
+                        (segment, day, path.name, stat.st_ino, stat.st_size, offset),
+                    )
+                conn.commit()
+                return added
+            except BaseException:
+                conn.rollback()
+                raise
+
+    @staticmethod
+    def _watermarks(conn: sqlite3.Connection, day: str) -> dict[str, tuple[str, int, int, int]]:
+        rows = conn.execute(
+            "SELECT segment, file_name, inode, size, offset FROM trace_segments WHERE day = ?",
+            (day,),
+        ).fetchall()
+        return {
+            row["segment"]: (row["file_name"], row["inode"], row["size"], row["offset"])
+            for row in rows
+        }
+
+    @staticmethod
+    def _is_current(
+        watermarks: dict[str, tuple[str, int, int, int]],
+        segments: dict[str, Path],
+        stats: dict[str, os.stat_result],
+    ) -> bool:
+        if set(watermarks) != set(stats):
+            return False
+        return all(
+            watermarks[segment][:3] == (segments[segment].name, stat.st_ino, stat.st_size)
+            for segment, stat in stats.items()
+        )
+
+    def _ingest_segment(
+        self,
+        conn: sqlite3.Connection,
+        segment: str,
+        day: str,
+        path: Path,
+        offset: int,
+        *,
+        complete: bool,
+    ) -> tuple[int, int]:
+        """Ingest ``path`` from ``offset``; returns the new offset and span count."""
+        added = 0
+        with open_trace_file(path) as f:
+            if offset:
+                f.seek(offset)
+            for raw in f:
+                if not complete and not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                added += self._ingest_line(conn, segment, day, raw)
+        return offset, added
+
+    def _ingest_line(
+        self, conn: sqlite3.Connection, segment: str, day: str, raw: bytes
+    ) -> int:
+        line = raw.strip()
+        if not line:
+            return 0
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return 0
+        if not isinstance(record, dict):
+            return 0
+        try:
+            span = normalize_span_record(record)
+        except (AttributeError, TypeError):
+            return 0
+
+        cursor = conn.execute(
+            """
+            INSERT INTO trace_spans (
+                segment, day, trace_id, span_id, parent_span_id, name, start_time, end_time,
+                duration_ms, status, attributes_json, events_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                segment,
+                day,
+                span["trace_id"],
+                span["span_id"],
+                span["parent_span_id"],
+                span["name"],
+                span["start_time"],
+                span["end_time"],
+                span["duration_ms"],
+                span["status"],
+                json.dumps(span["attributes"], default=str),
+                json.dumps(span["events"], default=str),
+            ),
+        )
+        conn.execute(
+            """
+            INSERT INTO trace_roots (segment, day, trace_id, start_time, first_seq)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(segment, trace_id) DO UPDATE
+            SET start_time = MIN(start_time, excluded.start_time)
+            """,
+            (segment, day, span["trace_id"], span["start_time"], cursor.lastrowid),
+        )
+
+        timestamp = span["start_time"]
+        for kind, key in self._counter_keys(span):
+            conn.execute(
+                """
+                INSERT INTO trace_counters (segment, day, kind, key, count, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(segment, kind, key) DO UPDATE SET
+                    count = count + 1,
+                    first_seen = MIN(first_seen, excluded.first_seen),
+                    last_seen = MAX(last_seen, excluded.last_seen)
+                """,
+                (segment, day, kind, key, timestamp, timestamp),
+            )
+        return 1
+
+    def _counter_keys(self, span: dict) -> list[tuple[str, str]]:
+        attrs = span.get("attributes") or {}
+        if not isinstance(attrs, dict):
+            return []
+        keys: list[tuple[str, str]] = []
+        tool_name = attrs.get("tool.name", "")
+        if tool_name:
+            keys.append((COUNTER_TOOL, str(tool_name)))
+        if span_failure_type(span):
+            keys.append((COUNTER_ERROR, str(tool_name or span.get("name", ""))))
+        sql = _extract_sql(span)
+        if sql:
+            keys.append((COUNTER_SQL, _normalize_sql(str(sql))))
+        for file_key in extract_context_files(attrs, self.connection_path):
+            keys.append((COUNTER_FILE, file_key))
+        return keys
+
+    @staticmethod
+    def _drop_segment(conn: sqlite3.Connection, segment: str) -> None:
+        for table in _TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE segment = ?", (segment,))
+
+    def read_traces(self, day: str, limit: int | None = 50) -> list[dict]:
+        """Traces for one day, most recent first (same shape as read_traces_from_jsonl)."""
+        self.ingest(day)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT s.* FROM trace_spans s
+                JOIN (
+                    SELECT trace_id, MIN(start_time) AS start_time, MIN(first_seq) AS first_seq
+                    FROM trace_roots
+                    WHERE day = ?
+                    GROUP BY trace_id
+                    ORDER BY start_time DESC, first_seq
+                    LIMIT ?
+                ) r ON r.trace_id = s.trace_id
+                WHERE s.day = ?
+                ORDER BY r.start_time DESC, r.first_seq, s.start_time, s.seq
+                """,
+                (day, -1 if limit is None else limit, day),
+            ).fetchall()
+
+        traces: list[dict] = []
+        spans: list[dict] = []
+        for row in rows:
+            if spans and spans[-1]["trace_id"] != row["trace_id"]:
+                traces.append(build_trace(spans[-1]["trace_id"], spans))
+                spans = []
+            spans.append(
+                {
+                    "trace_id": row["trace_id"],
+                    "span_id": row["span_id"],
+                    "parent_span_id": row["parent_span_id"],
+                    "name": row["name"],
+                    "start_time": row["start_time"],
+                    "end_time": row["end_time"],
+                    "duration_ms": row["duration_ms"],
+                    "status": row["status"],
+                    "attributes": json.loads(row["attributes_json"]),
+                    "events": json.loads(row["events_json"]),
+                }
+            )
+        if spans:
+            traces.append(build_trace(spans[-1]["trace_id"], spans))
+        return traces
+
+    def counters(self, days: Iterable[str], kind: str) -> dict[str, dict]:
+        """Pre-aggregated ``{key: {count, first_seen, last_seen}}`` over ``days``."""
+        days = list(days)
+        for day in days:
+            self.ingest(day)
+        if not days:
+            return {}
+        placeholders = ", ".join("?" for _ in days)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT key, SUM(count) AS count, MIN(first_seen) AS first_seen,
+                       MAX(last_seen) AS last_seen
+                FROM trace_counters
+                WHERE kind = ? AND day IN ({placeholders})
+                GROUP BY key
+                """,
+                (kind, *days),
+            ).fetchall()
+        return {
+            row["key"]: {
+                "count": row["count"],
+                "first_seen": row["first_seen"],
+                "last_seen": row["last_seen"],
+            }
+            for row in rows
+        }
+
+
+def read_indexed_traces(file_path: Path, limit: int | None = 50) -> list[dict]:
+    """Read a day file through its directory's trace index.
+
+    Falls back to parsing the JSONL file directly when the index cannot be
+    used (for example a read-only traces directory).
+    """
+    day = file_path.name.removesuffix(".jsonl")
+    if not trace_day_segments(file_path.parent, day):
+        return []
+    try:
+        return TraceIndex(file_path.parent).read_traces(day, limit=limit)
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Trace index unavailable for %s: %s", file_path, e)
+        return read_traces_from_jsonl(file_path, limit=limit)
@@ -5,22 +5,45 @@ agent analysis and team knowledge sharing.
 
 Structure:
     connections/{name}/traces/{user_hash}/YYYY-MM-DD.jsonl
+    connections/{name}/traces/{user_hash}/YYYY-MM-DD.<n>.jsonl[.gz]  (opt-in rotation)
 
 Each line is a JSON object with span data:
     {"ts": ..., "name": ..., "trace_id": ..., "duration_ms": ..., "status": ..., "attrs": {...}}
 """
 
+import gzip
 import json
 import logging
+import os
+import queue
 import secrets
+import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
 
+from db_mcp.traces_reader import parse_trace_file_name
+
+try:
+    import orjson
+except ImportError:  # optional: faster serialization for the buffered writer
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional: zstd compression of closed segments
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_QUEUE_SIZE = 10_000
+_WRITE_BATCH_SIZE = 512
+_SHUTDOWN_TIMEOUT_SECONDS = 10
+_STOP = object()
+
 
 def generate_user_id() -> str:
     """Generate a random stable user ID."""
@@ -61,21 +84,121 @@ def get_traces_dir(connection_path: Path, user_id: str) -> Path:
     return connection_path / "traces" / user_id
 
 
+def _span_record(span: ReadableSpan) -> dict:
+    """Convert an OTel span to its JSONL record."""
+    record = {
+        "ts": span.start_time,
+        "name": span.name,
+        "trace_id": format(span.context.trace_id, "032x"),
+        "span_id": format(span.context.span_id, "016x"),
+        "parent_id": (format(span.parent.span_id, "016x") if span.parent else None),
+        "duration_ms": (span.end_time - span.start_time) / 1_000_000,
+        "status": span.status.status_code.name,
+        "attrs": dict(span.attributes) if span.attributes else {},
+    }
+
+    # Add events if any
+    if span.events:
+        record["events"] = [
+            {
+                "name": e.name,
+                "ts": e.timestamp,
+                "attrs": dict(e.attributes) if e.attributes else {},
+            }
+            for e in span.events
+        ]
+    return record
+
+
+def _dumps_line(record: dict) -> bytes:
+    """Serialize one record as a JSONL line, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    return (json.dumps(record, default=str) + "\n").encode()
+
+
+def compress_trace_file(path: Path, compression: str) -> Path:
+    """Compress a closed trace segment next to itself and remove the original.
+
+    The compressed copy is written under a temporary dot-name and renamed into
+    place, so readers never see a partial ``.gz``/``.zst`` file.
+    """
+    if compression == "zstd" and zstandard is None:
+        compression = "gzip"
+    suffix = ".zst" if compression == "zstd" else ".gz"
+    target = path.with_name(path.name + suffix)
+    tmp_path = path.with_name(f".{target.name}.tmp")
+    with open(path, "rb") as src, open(tmp_path, "wb") as raw:
+        if compression == "zstd":
+            with zstandard.ZstdCompressor().stream_writer(raw, closefd=False) as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            with gzip.GzipFile(filename=path.name, mode="wb", fileobj=raw) as dst:
+                shutil.copyfileobj(src, dst)
+    os.replace(tmp_path, target)
+    path.unlink()
+    return target
+
+
 class JSONLSpanExporter(SpanExporter):
-    """Export spans to JSONL files for agent analysis."""
+    """Export spans to JSONL files for agent analysis.
+
+    By default every ``export`` call serializes and writes synchronously.
+    With ``buffered=True`` the exporting thread only converts spans to record
+    dicts and queues them; JSON serialization and file appends happen on a
+    background writer thread, in batches. The queue is bounded: when it is
+    full, spans are dropped and counted in ``dropped_spans`` rather than
+    blocking the caller.
+
+    With ``rotate_bytes`` set, a day file that grows past that size is moved
+    to ``YYYY-MM-DD.<n>.jsonl`` and writing continues in a fresh
+    ``YYYY-MM-DD.jsonl``. Closed segments (rotated parts and previous days'
+    files) are compressed unless ``compression`` is ``"none"``. The readers in
+    ``traces_reader`` and ``trace_index`` read all segments of a day.
+    """
 
-    def __init__(self, connection_path: Path, user_id: str):
+    def __init__(
+        self,
+        connection_path: Path,
+        user_id: str,
+        *,
+        buffered: bool = False,
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
+        rotate_bytes: int = 0,
+        compression: str = "none",
+    ):
         """Initialize the exporter.
 
         Args:
             connection_path: Path to the connection directory
             user_id: User identifier for trace subdirectory
+            buffered: Write from a background thread instead of in ``export``
+            max_queue_size: Spans held in memory before new ones are dropped
+            rotate_bytes: Rotate a day file once it reaches this size (0 disables)
+            compression: ``"gzip"``, ``"zstd"`` or ``"none"`` for closed segments
         """
         self.connection_path = connection_path
         self.user_id = user_id
         self.traces_dir = get_traces_dir(connection_path, user_id)
+        self.buffered = buffered
+        self.rotate_bytes = rotate_bytes
+        self.compression = compression
+        self.dropped_spans = 0
         self._current_file: Path | None = None
         self._current_date: str | None = None
+        self._write_lock = threading.Lock()
+        self._drop_lock = threading.Lock()
+        self._queue: queue.Queue | None = None
+        self._writer: threading.Thread | None = None
+        if buffered:
+            self._queue = queue.Queue(maxsize=max_queue_size)
+            self._writer = threading.Thread(
+                target=self._run_writer, name="db-mcp-trace-writer", daemon=True
+            )
+            self._writer.start()
 
     def _get_trace_file(self) -> Path:
         """Get the current trace file, rotating daily."""
@@ -83,53 +206,111 @@ class JSONLSpanExporter(SpanExporter):
 
         if self._current_date != today:
             self.traces_dir.mkdir(parents=True, exist_ok=True)
+            previous = self._current_file
             self._current_file = self.traces_dir / f"{today}.jsonl"
             self._current_date = today
+            if previous is not None:
+                self._close_segment(previous)
 
         return self._current_file
 
+    def _close_segment(self, path: Path) -> None:
+        """Compress a segment that will not be written again (best-effort)."""
+        if self.compression == "none" or not path.exists():
+            return
+        try:
+            compress_trace_file(path, self.compression)
+        except OSError as e:
+            logger.warning(f"Failed to compress trace file {path}: {e}")
+
+    def _rotate_if_needed(self, trace_file: Path) -> None:
+        if not self.rotate_bytes:
+            return
+        try:
+            if trace_file.stat().st_size < self.rotate_bytes:
+                return
+        except FileNotFoundError:
+            return
+        day = trace_file.name.removesuffix(".jsonl")
+        part = 1 + max(
+            (
+                parsed[1]
+                for parsed in map(parse_trace_file_name, os.listdir(self.traces_dir))
+                if parsed is not None and parsed[0] == day and parsed[1] is not None
+            ),
+            default=0,
+        )
+        rotated = trace_file.with_name(f"{day}.{part}.jsonl")
+        os.replace(trace_file, rotated)
+        self._close_segment(rotated)
+
+    def _write_records(self, records: list[dict]) -> None:
+        payload = b"".join(_dumps_line(record) for record in records)
+        with self._write_lock:
+            trace_file = self._get_trace_file()
+            with open(trace_file, "ab") as f:
+                f.write(payload)
+            self._rotate_if_needed(trace_file)
+
     def export(self, spans: list[ReadableSpan]) -> SpanExportResult:
         """Export spans to JSONL file."""
         if not spans:
             return SpanExportResult.SUCCESS
 
         try:
-            trace_file = self._get_trace_file()
-
-            with open(trace_file, "a") as f:
-                for span in spans:
-                    record = {
-                        "ts": span.start_time,
-                        "name": span.name,
-                        "trace_id": format(span.context.trace_id, "032x"),
-                        "span_id": format(span.context.span_id, "016x"),
-                        "parent_id": (
-                            format(span.parent.span_id, "016x") if span.parent else None
-                        ),
-                        "duration_ms": (span.end_time - span.start_time) / 1_000_000,
-                        "status": span.status.status_code.name,
-                        "attrs": dict(span.attributes) if span.attributes else {},
-                    }
-
-                    # Add events if any
-                    if span.events:
-                        record["events"] = [
-                            {
-                                "name": e.name,
-                                "ts": e.timestamp,
-                                "attrs": dict(e.attributes) if e.attributes else {},
-                            }
-                            for e in span.events
-                        ]
-
-                    f.write(json.dumps(record, default=str) + "\n")
-
+            records = [_span_record(span) for span in spans]
+            if self._queue is None:
+                self._write_records(records)
+                return SpanExportResult.SUCCESS
+
+            for record in records:
+                try:
+                    self._queue.put_nowait(record)
+                except queue.Full:
+                    with self._drop_lock:
+                        if self.dropped_spans == 0:
+                            logger.warning("Trace export queue is full; dropping spans")
+                        self.dropped_spans += 1
             return SpanExportResult.SUCCESS
 
         except Exception as e:
             logger.error(f"Failed to export spans: {e}")
             return SpanExportResult.FAILURE
 
+    def _run_writer(self) -> None:
+        """Drain the queue in batches until the shutdown sentinel arrives."""
+        while True:
+            items = [self._queue.get()]
+            while len(items) < _WRITE_BATCH_SIZE:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [item for item in items if isinstance(item, dict)]
+            if records:
+                try:
+                    self._write_records(records)
+                except Exception as e:
+                    logger.error(f"Failed to write {len(records)} spans: {e}")
+
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if any(item is _STOP for item in items):
+                return
+
+    def _flush_queue(self, timeout_seconds: float) -> bool:
+        """Wait until everything queued so far has been written."""
+        if self._writer is None or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout_seconds)
+        except queue.Full:
+            return False
+        return done.wait(timeout_seconds)
+
     def _auto_commit(self) -> None:
         """Auto-commit trace files to git if repo exists."""
         try:
@@ -145,17 +326,27 @@ class JSONLSpanExporter(SpanExporter):
 
     def shutdown(self) -> None:
         """Shutdown the exporter."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
         self._auto_commit()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """Force flush any buffered spans."""
+        flushed = self._flush_queue(timeout_millis / 1000)
         self._auto_commit()
-        return True
+        return flushed
 
 
 def setup_trace_exporter(connection_path: Path) -> JSONLSpanExporter | None:
     """Set up the JSONL trace exporter if traces are enabled.
 
+    The exporter writes plain JSONL synchronously unless the global config
+    opts in: ``traces_buffered: true`` writes from a background thread,
+    ``traces_rotate_mb`` (default 0, off) rotates a day file past that size
+    and ``traces_compression`` (``gzip``, ``zstd`` or the default ``none``)
+    compresses closed segments.
+
     Args:
         connection_path: Path to the connection directory
 
@@ -174,4 +365,21 @@ def setup_trace_exporter(connection_path: Path) -> JSONLSpanExporter | None:
 
     logger.info(f"Setting up trace exporter: {connection_path}/traces/{user_id}/")
 
-    return JSONLSpanExporter(connection_path, user_id)
+    options = _get_exporter_options()
+    return JSONLSpanExporter(connection_path, user_id, **options)
+
+
+def _get_exporter_options() -> dict:
+    """Read the opt-in buffered-writer options from the global config."""
+    from db_mcp.config import CONFIG_FILE, load_config
+
+    config = load_config() if CONFIG_FILE.exists() else {}
+    compression = str(config.get("traces_compression", "none")).lower()
+    if compression not in ("gzip", "zstd", "none"):
+        logger.warning(f"Unknown traces_compression {compression!r}, not compressing")
+        compression = "none"
+    return {
+        "buffered": bool(config.get("traces_buffered", False)),
+        "rotate_bytes": int(float(config.get("traces_rotate_mb", 0)) * 1024**2),
+        "compression": compression,
+    }
@@ -5,16 +5,76 @@ into the same trace format used by SpanCollector.get_traces().
 Also provides trace analysis for semantic layer insights.
 """
 
+import gzip
+import io
 import json
 import logging
 import re
+import urllib.parse
 from collections import Counter, defaultdict
 from pathlib import Path
+from typing import IO
 
 from db_mcp_knowledge.business_rules import extract_business_rule_texts
 
+try:
+    import zstandard
+except ImportError:  # optional: only needed for .zst trace segments
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+# YYYY-MM-DD.jsonl is the day's current segment; rotation moves full segments
+# to YYYY-MM-DD.<n>.jsonl and compression appends .gz or .zst once closed.
+_TRACE_FILE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:\.(\d+))?\.jsonl(\.gz|\.zst)?$")
+
+
+def parse_trace_file_name(name: str) -> tuple[str, int | None, bool] | None:
+    """Split a trace file name into ``(day, part, compressed)``.
+
+    ``part`` is None for the day's current segment and the rotation number
+    for older ones. Returns None for files that are not trace segments.
+    """
+    match = _TRACE_FILE_RE.match(name)
+    if not match:
+        return None
+    part = int(match.group(2)) if match.group(2) is not None else None
+    return match.group(1), part, match.group(3) is not None
+
+
+def trace_day_segments(traces_dir: Path, day: str) -> list[Path]:
+    """All segment files for one day, oldest first.
+
+    Rotated parts come in rotation order followed by the current segment.
+    When both a plain and a compressed copy of a segment exist (compression
+    in progress), the compressed one is complete and wins.
+    """
+    if not traces_dir.is_dir():
+        return []
+    by_part: dict[int | None, Path] = {}
+    for f in traces_dir.glob(f"{day}*.jsonl*"):
+        parsed = parse_trace_file_name(f.name)
+        if parsed is None or parsed[0] != day:
+            continue
+        _, part, compressed = parsed
+        if part not in by_part or compressed:
+            by_part[part] = f
+    ordered = [by_part[part] for part in sorted(p for p in by_part if p is not None)]
+    if None in by_part:
+        ordered.append(by_part[None])
+    return ordered
+
+
+def open_trace_file(path: Path) -> IO[bytes]:
+    """Open a trace segment for binary line reading, decompressing if needed."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is not installed; cannot read {path.name}")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, "rb")))
+    return open(path, "rb")
+
 
 def list_trace_dates(connection_path: Path, user_id: str) -> list[str]:
     """List available YYYY-MM-DD dates from JSONL trace files.
@@ -30,13 +90,61 @@ def list_trace_dates(connection_path: Path, user_id: str) -> list[str]:
     if not traces_dir.exists():
         return []
 
-    dates = []
+    dates = set()
     for f in traces_dir.iterdir():
-        if f.suffix == ".jsonl" and f.stem.count("-") == 2:
-            dates.append(f.stem)
+        parsed = parse_trace_file_name(f.name)
+        if parsed is not None:
+            dates.add(parsed[0])
+
+    return sorted(dates, reverse=True)
 
-    dates.sort(reverse=True)
-    return dates
+
+def normalize_span_record(record: dict) -> dict:
+    """Convert one JSONL span record to the SpanCollector span shape.
+
+    - ts (nanoseconds) → start_time (seconds)
+    - attrs → attributes
+    - parent_id → parent_span_id
+    - duration_ms preserved as-is
+    """
+    start_time = record.get("ts", 0)
+    # ts is in nanoseconds from OTel, convert to seconds
+    if start_time > 1e15:
+        start_time = start_time / 1e9
+
+    duration_ms = record.get("duration_ms", 0)
+    end_time = start_time + (duration_ms / 1000) if duration_ms else None
+
+    return {
+        "trace_id": record.get("trace_id", ""),
+        "span_id": record.get("span_id", ""),
+        "parent_span_id": record.get("parent_id"),
+        "name": record.get("name", ""),
+        "start_time": start_time,
+        "end_time": end_time,
+        "duration_ms": duration_ms,
+        "status": record.get("status", "OK").lower(),
+        "attributes": record.get("attrs", {}),
+        "events": record.get("events", []),
+    }
+
+
+def build_trace(trace_id: str, spans: list[dict]) -> dict:
+    """Build a trace dict (same shape as SpanCollector.get_traces()) from its spans."""
+    spans.sort(key=lambda s: s["start_time"])
+
+    start = min(s["start_time"] for s in spans)
+    end = max(s["end_time"] or s["start_time"] for s in spans)
+
+    return {
+        "trace_id": trace_id,
+        "start_time": start,
+        "end_time": end,
+        "duration_ms": (end - start) * 1000,
+        "span_count": len(spans),
+        "root_span": spans[0]["name"] if spans else None,
+        "spans": spans,
+    }
 
 
 def read_traces_from_jsonl(file_path: Path, limit: int | None = 50) -> list[dict]:
@@ -48,6 +156,9 @@ def read_traces_from_jsonl(file_path: Path, limit: int | None = 50) -> list[dict
     - parent_id → parent_span_id
     - duration_ms preserved as-is
 
+    For a day file (``YYYY-MM-DD.jsonl``) every segment of that day is read,
+    including rotated and compressed ones.
+
     Args:
         file_path: Path to the JSONL file
         limit: Maximum number of traces to return. `None` returns all traces.
@@ -55,73 +166,37 @@ def read_traces_from_jsonl(file_path: Path, limit: int | None = 50) -> list[dict
     Returns:
         List of trace dicts matching SpanCollector.get_traces() format
     """
-    if not file_path.exists():
+    parsed = parse_trace_file_name(file_path.name)
+    if parsed is not None and parsed[1] is None and not parsed[2]:
+        segments = trace_day_segments(file_path.parent, parsed[0])
+    else:
+        segments = [file_path] if file_path.exists() else []
+    if not segments:
         return []
 
     # Read all spans from JSONL
     spans_by_trace: dict[str, list[dict]] = {}
 
     try:
-        with open(file_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                # Normalize JSONL format to collector format
-                start_time = record.get("ts", 0)
-                # ts is in nanoseconds from OTel, convert to seconds
-                if start_time > 1e15:
-                    start_time = start_time / 1e9
-
-                duration_ms = record.get("duration_ms", 0)
-                end_time = start_time + (duration_ms / 1000) if duration_ms else None
-
-                span = {
-                    "trace_id": record.get("trace_id", ""),
-                    "span_id": record.get("span_id", ""),
-                    "parent_span_id": record.get("parent_id"),
-                    "name": record.get("name", ""),
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "duration_ms": duration_ms,
-                    "status": record.get("status", "OK").lower(),
-                    "attributes": record.get("attrs", {}),
-                    "events": record.get("events", []),
-                }
+        for segment in segments:
+            with open_trace_file(segment) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
 
-                trace_id = span["trace_id"]
-                if trace_id not in spans_by_trace:
-                    spans_by_trace[trace_id] = []
-                spans_by_trace[trace_id].append(span)
+                    span = normalize_span_record(record)
+                    spans_by_trace.setdefault(span["trace_id"], []).append(span)
 
     except Exception as e:
         logger.error(f"Failed to read JSONL file {file_path}: {e}")
         return []
 
-    # Build trace objects (same shape as SpanCollector.get_traces())
-    traces = []
-    for trace_id, spans in spans_by_trace.items():
-        spans.sort(key=lambda s: s["start_time"])
-
-        start = min(s["start_time"] for s in spans)
-        end = max(s["end_time"] or s["start_time"] for s in spans)
-
-        traces.append(
-            {
-                "trace_id": trace_id,
-                "start_time": start,
-                "end_time": end,
-                "duration_ms": (end - start) * 1000,
-                "span_count": len(spans),
-                "root_span": spans[0]["name"] if spans else None,
-                "spans": spans,
-            }
-        )
+    traces = [build_trace(trace_id, spans) for trace_id, spans in spans_by_trace.items()]
 
     # Sort by start_time descending (most recent first)
     traces.sort(key=lambda t: t["start_time"], reverse=True)
@@ -177,6 +252,27 @@ def _extract_sql(span: dict) -> str | None:
     return None
 
 
+def span_failure_type(span: dict) -> str | None:
+    """Classify a span as a ``"hard"`` failure, a ``"soft"`` failure or neither.
+
+    Hard failures are exceptions or ``tool.success == false``; soft failures are
+    tool results flagged with ``tool.soft_failure``.
+    """
+    attrs = span.get("attributes", {})
+    if (
+        span.get("status") == "error"
+        or attrs.get("tool.success") is False
+        or str(attrs.get("tool.success", "")).lower() == "false"
+    ):
+        return "hard"
+    if (
+        attrs.get("tool.soft_failure") is True
+        or str(attrs.get("tool.soft_failure", "")).lower() == "true"
+    ):
+        return "soft"
+    return None
+
+
 def _normalize_sql(sql: str) -> str:
     """Normalize SQL for deduplication (strip whitespace, lowercase keywords)."""
     return " ".join(sql.split()).strip()
@@ -438,6 +534,84 @@ def extract_context_paths(command: str) -> list[str]:
     return terms
 
 
+_CONTEXT_DIRS = (
+    "schema",
+    "examples",
+    "instructions",
+    "domain",
+    "data",
+    "learnings",
+    "metrics",
+)
+_CONTEXT_ROOT_FILES = ("PROTOCOL.md", "connector.yaml", "knowledge_gaps.yaml")
+_CONTEXT_DIR_RE = re.compile(r"(?:^|[\s/])(" + "|".join(_CONTEXT_DIRS) + r")/([^\s;|>&]+)")
+_CONTEXT_ROOT_FILE_RE = re.compile(
+    r"(?:^|[\s/])("
+    + "|".join(re.escape(name) for name in _CONTEXT_ROOT_FILES)
+    + r")(?=$|[\s;|>&])"
+)
+
+
+def _normalize_context_path(raw_path: object, connection_path: Path) -> str | None:
+    if not raw_path or not isinstance(raw_path, str):
+        return None
+
+    cleaned = urllib.parse.unquote(raw_path.replace("file://", "")).strip().strip("\"'")
+    path_obj = Path(cleaned)
+
+    if path_obj.is_absolute() and connection_path not in path_obj.parents:
+        return None
+
+    if path_obj.name in _CONTEXT_ROOT_FILES:
+        return path_obj.name
+
+    parts = path_obj.parts
+    for idx, part in enumerate(parts):
+        if part in _CONTEXT_DIRS and idx + 1 < len(parts):
+            return "/".join(parts[idx:])
+
+    return None
+
+
+def extract_context_files(attrs: dict, connection_path: Path) -> list[str]:
+    """List the vault context files a span touched, one entry per access.
+
+    Looks at shell commands, the protocol tool, ``knowledge.files_used`` and
+    path-like attributes. Paths are relative to the connection directory.
+
+    Args:
+        attrs: Span attributes
+        connection_path: Path to the connection directory
+
+    Returns:
+        Context file paths (may repeat when a span touched a file twice)
+    """
+    files: list[str] = []
+    tool_name = attrs.get("tool.name")
+    command = attrs.get("command")
+    if tool_name == "shell" and command:
+        for match in _CONTEXT_DIR_RE.finditer(command):
+            files.append(f"{match.group(1)}/{match.group(2)}")
+        files.extend(_CONTEXT_ROOT_FILE_RE.findall(command))
+
+    if tool_name == "protocol_tool":
+        files.append("PROTOCOL.md")
+
+    files_used = attrs.get("knowledge.files_used")
+    if files_used:
+        for file_path in files_used:
+            normalized = _normalize_context_path(file_path, connection_path)
+            if normalized:
+                files.append(normalized)
+
+    for attr_name in ("path", "file_path", "resource.uri"):
+        normalized = _normalize_context_path(attrs.get(attr_name), connection_path)
+        if normalized:
+            files.append(normalized)
+
+    return files
+
+
 def _are_similar(a: str, b: str) -> bool:
     """Check if two terms are similar enough to group together.
 
@@ -790,11 +964,8 @@ def analyze_traces(traces: list[dict], connection_path: Path | None = None, days
                 tool_counts[tool_name] += 1
 
             # Track errors (hard failures: exceptions, and soft failures: error results)
-            is_error = (
-                span.get("status") == "error"
-                or attrs.get("tool.success") is False
-                or str(attrs.get("tool.success", "")).lower() == "false"
-            )
+            failure_type = span_failure_type(span)
+            is_error = failure_type == "hard"
             is_soft_failure = (
                 attrs.get("tool.soft_failure") is True
                 or str(attrs.get("tool.soft_failure", "")).lower() == "true"
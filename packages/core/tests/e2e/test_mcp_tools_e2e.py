@@ -152,6 +152,10 @@ async def test_all_tools_exposed_and_happy_path_invoked(mcp_env):
         calls["get_result"] = await _call(
             client, "get_result", {"query_id": query_id, "connection": connection}
         )
+        # The query has already finished, so this reports it is not running.
+        calls["cancel_query"] = await _call(
+            client, "cancel_query", {"query_id": query_id, "connection": connection}
+        )
         calls["export_results"] = await _call(
             client,
             "export_results",
@@ -307,7 +307,7 @@ class TestAPIConnectorTestConnection:
         mock_response.json.return_value = {"data": []}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_response
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_response
         ):
             result = api_connector.test_connection()
         assert result["connected"] is True
@@ -321,7 +321,7 @@ class TestAPIConnectorTestConnection:
         mock_response.raise_for_status.side_effect = Exception("401 Unauthorized")
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_response
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_response
         ):
             result = api_connector.test_connection()
         assert result["connected"] is False
@@ -354,7 +354,7 @@ class TestAPIConnectorTestConnection:
         mock_response.json.return_value = {"result": {"rows": [{"db_mcp_doctor": 1}]}}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_response
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_response
         ) as req:
             result = conn.test_connection()
 
@@ -379,7 +379,7 @@ class TestAPIConnectorTestConnection:
         mock_response.json.return_value = {"ok": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_response
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_response
         ) as req:
             result = conn.test_connection()
 
@@ -404,7 +404,7 @@ class TestAPIConnectorTestConnection:
         mock_response.json.return_value = {"id": 1}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_response
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_response
         ) as req:
             result = conn.test_connection()
 
@@ -508,7 +508,7 @@ class TestAPIConnectorSync:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_response
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_response
         ):
             result = api_connector.sync()
 
@@ -526,7 +526,7 @@ class TestAPIConnectorSync:
         mock_response.json.return_value = {"data": [{"id": 1}]}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_response
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_response
         ):
             result = api_connector.sync(endpoint_name="users")
 
@@ -540,7 +540,7 @@ class TestAPIConnectorSync:
         mock_response.json.return_value = {"data": [{"id": 1}, {"id": 2}, {"id": 3}]}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_response
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_response
         ):
             result = api_connector.sync(endpoint_name="users")
 
@@ -549,7 +549,7 @@ class TestAPIConnectorSync:
     def test_sync_error_reported(self, api_connector):
         """Sync should report errors per endpoint without crashing."""
         with patch(
-            "db_mcp_data.connectors.api.requests.get",
+            "db_mcp_data.connectors.api.requests.Session.get",
             side_effect=Exception("Connection refused"),
         ):
             result = api_connector.sync(endpoint_name="users")
@@ -649,7 +649,7 @@ class TestAPIConnectorPagination:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", side_effect=[page1, page2]
+            "db_mcp_data.connectors.api.requests.Session.get", side_effect=[page1, page2]
         ):
             result = conn.sync(endpoint_name="items")
 
@@ -689,13 +689,18 @@ class TestAPIConnectorPagination:
         page3 = MagicMock()
         page3.status_code = 200
         page3.json.return_value = {"results": []}
+        pages = {"0": page1, "2": page2, "4": page3}
 
+        # Later pages are prefetched concurrently, so answer by offset, not call order.
         with patch(
-            "db_mcp_data.connectors.api.requests.get", side_effect=[page1, page2, page3]
+            "db_mcp_data.connectors.api.requests.Session.get",
+            side_effect=lambda url, **kwargs: pages[kwargs["params"]["offset"]],
         ):
             result = conn.sync(endpoint_name="items")
 
         assert result["rows_fetched"]["items"] == 3
+        lines = (data_dir / "items.jsonl").read_text().strip().split("\n")
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
 
 
 # ---------------------------------------------------------------------------
@@ -730,7 +735,7 @@ class TestAPIConnectorAdHocQuery:
         ]
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ):
             result = conn.query_endpoint("users")
 
@@ -764,7 +769,7 @@ class TestAPIConnectorAdHocQuery:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ):
             result = conn.query_endpoint("dashboards")
 
@@ -792,7 +797,7 @@ class TestAPIConnectorAdHocQuery:
         mock_resp.json.return_value = [{"id": 1}]
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ) as mock_get:
             conn.query_endpoint("events", params={"active": "true", "order": "startDate"})
 
@@ -822,7 +827,7 @@ class TestAPIConnectorAdHocQuery:
         mock_resp.json.return_value = [{"id": 1}]
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ) as mock_get:
             conn.query_endpoint("items", params={"color": "red"})
 
@@ -858,7 +863,7 @@ class TestAPIConnectorAdHocQuery:
         ]
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ):
             result = conn.query_endpoint("users")
 
@@ -889,7 +894,7 @@ class TestAPIConnectorAdHocQuery:
         mock_resp.json.return_value = {"id": "42", "title": "Event 42", "details": {"foo": 1}}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ) as mock_get:
             result = conn.query_endpoint("events", id="42")
 
@@ -925,7 +930,7 @@ class TestAPIConnectorAdHocQuery:
         resp2.json.return_value = {"id": "2", "title": "Second"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", side_effect=[resp1, resp2]
+            "db_mcp_data.connectors.api.requests.Session.get", side_effect=[resp1, resp2]
         ) as mock_get:
             result = conn.query_endpoint("events", id=["1", "2"])
 
@@ -961,7 +966,7 @@ class TestAPIConnectorAdHocQuery:
         mock_resp.json.return_value = {"data": [{"id": 1}, {"id": 2}], "has_more": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ) as mock_get:
             result = conn.query_endpoint("items")
 
@@ -1000,7 +1005,7 @@ class TestAPIConnectorAdHocQuery:
         page2.json.return_value = {"data": [{"id": "c"}], "has_more": False}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", side_effect=[page1, page2]
+            "db_mcp_data.connectors.api.requests.Session.get", side_effect=[page1, page2]
         ):
             result = conn.query_endpoint("items", max_pages=3)
 
@@ -1029,7 +1034,7 @@ class TestAPIConnectorAdHocQuery:
         mock_resp.json.return_value = {"results": [{"id": 1}, {"id": 2}], "total": 2}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ):
             result = conn.query_endpoint("items")
 
@@ -1062,7 +1067,7 @@ class TestAPIConnectorAdHocQuery:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ):
             result = conn.query_endpoint("search_issues")
 
@@ -1095,7 +1100,7 @@ class TestAPIConnectorAdHocQuery:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ):
             result = conn.query_endpoint("projects")
 
@@ -1145,7 +1150,7 @@ class TestAPIConnectorAdHocQuery:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", side_effect=[page1, page2]
+            "db_mcp_data.connectors.api.requests.Session.get", side_effect=[page1, page2]
         ) as mock_get:
             result = conn.query_endpoint("projects", max_pages=2)
 
@@ -1195,7 +1200,7 @@ class TestAPIConnectorAdHocQuery:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", side_effect=[page1, page2]
+            "db_mcp_data.connectors.api.requests.Session.get", side_effect=[page1, page2]
         ) as mock_get:
             result = conn.query_endpoint("search_issues", max_pages=2)
 
@@ -1228,7 +1233,7 @@ class TestAPIConnectorPathParams:
         mock_resp.json.return_value = {"data": []}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=mock_resp
         ) as mock_get:
             conn.query_endpoint("query_results", params={"query_id": "123", "limit": "1"})
 
@@ -1267,7 +1272,7 @@ class TestAPIConnectorPathParams:
         mock_resp.json.return_value = {"id": 4, "updated": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             conn.query_endpoint(
                 "update_dashboard",
@@ -1332,7 +1337,7 @@ class TestAPIConnectorPostBody:
         mock_resp.json.return_value = {"data": []}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             conn.query_endpoint("execute_sql", params={"query": "SELECT 1", "limit": "1"})
 
@@ -1372,7 +1377,7 @@ class TestAPIConnectorResponseMode:
         mock_resp.json.return_value = {"execution_id": "abc", "state": "PENDING"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ):
             result = conn.query_endpoint("execute_sql", params={"query": "SELECT 1"})
 
@@ -1583,7 +1588,7 @@ class TestAPIConnectorSQLExecution:
         mock_resp.json.return_value = {"result": {"rows": [{"token": "SOL", "volume": 1000000}]}}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=mock_resp
         ) as mock_post:
             result = conn.execute_sql("SELECT token, volume FROM dex_solana.trades LIMIT 1")
 
@@ -1661,8 +1666,8 @@ class TestAPIConnectorSQLExecution:
             raise ValueError(f"Unexpected URL: {url}")
 
         with (
-            patch("db_mcp_data.connectors.api.requests.post", return_value=execute_resp),
-            patch("db_mcp_data.connectors.api.requests.get", side_effect=mock_get),
+            patch("db_mcp_data.connectors.api.requests.Session.post", return_value=execute_resp),
+            patch("db_mcp_data.connectors.api.requests.Session.get", side_effect=mock_get),
             patch("time.sleep"),  # Skip actual sleeping
         ):
             result = conn.execute_sql("SELECT * FROM test")
@@ -1722,8 +1727,8 @@ class TestAPIConnectorSQLExecution:
             raise ValueError(f"Unexpected GET {url}")
 
         with (
-            patch("db_mcp_data.connectors.api.requests.post", return_value=execute_resp),
-            patch("db_mcp_data.connectors.api.requests.get", side_effect=_get),
+            patch("db_mcp_data.connectors.api.requests.Session.post", return_value=execute_resp),
+            patch("db_mcp_data.connectors.api.requests.Session.get", side_effect=_get),
         ):
             submission = conn.submit_sql("SELECT 1")
             assert submission["mode"] == "async"
@@ -1786,7 +1791,7 @@ class TestAPIConnectorSQLExecution:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=status_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=status_resp
         ):
             result = conn.query_endpoint(
                 "get_execution_status",
@@ -1829,7 +1834,7 @@ class TestAPIConnectorSQLExecution:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=failed_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=failed_resp
         ):
             result = conn.query_endpoint(
                 "get_execution_results",
@@ -1885,7 +1890,7 @@ class TestSendRequest:
         mock_resp.json.return_value = {"data": []}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             result = api_connector._send_request(
                 "GET",
@@ -1908,7 +1913,7 @@ class TestSendRequest:
         mock_resp.json.return_value = {"id": 1, "name": "New Item"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             api_connector._send_request(
                 "POST",
@@ -1930,7 +1935,7 @@ class TestSendRequest:
         mock_resp.json.return_value = {"updated": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             api_connector._send_request(
                 "PUT",
@@ -1950,7 +1955,7 @@ class TestSendRequest:
         mock_resp.json.return_value = {"patched": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             api_connector._send_request(
                 "PATCH",
@@ -1970,7 +1975,7 @@ class TestSendRequest:
         mock_resp.json.return_value = {"deleted": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             result = api_connector._send_request(
                 "DELETE",
@@ -1989,7 +1994,7 @@ class TestSendRequest:
         mock_resp.json.return_value = {"triggered": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             api_connector._send_request(
                 "POST",
@@ -2032,7 +2037,7 @@ class TestQueryEndpointWriteSupport:
         mock_resp.json.return_value = {"id": 99, "name": "Widget"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             conn.query_endpoint("create_item", body={"name": "Widget", "price": 9.99})
 
@@ -2061,7 +2066,7 @@ class TestQueryEndpointWriteSupport:
         mock_resp.json.return_value = {"id": 100}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             conn.query_endpoint("create_item", params={"name": "Widget"})
 
@@ -2101,7 +2106,7 @@ class TestQueryEndpointWriteSupport:
         mock_resp.json.return_value = {"ok": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             conn.query_endpoint("create_item", params={"dry_run": "true"})
 
@@ -2131,7 +2136,7 @@ class TestQueryEndpointWriteSupport:
         mock_resp.json.return_value = {"id": 1, "created": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             conn.query_endpoint("items", body={"name": "New"}, method_override="POST")
 
@@ -2159,7 +2164,7 @@ class TestQueryEndpointWriteSupport:
         mock_resp.json.return_value = {"updated": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             conn.query_endpoint("items", params={"version": "2"}, body={"name": "Updated"})
 
@@ -2195,7 +2200,7 @@ class TestQueryEndpointWriteSupport:
         mock_resp.json.return_value = {"id": 42, "status": "created", "meta": {"v": 1}}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ):
             result = conn.query_endpoint("create", body={"name": "test"})
 
@@ -2222,7 +2227,7 @@ class TestQueryEndpointWriteSupport:
         mock_resp.json.return_value = {"deleted": True}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ) as mock_req:
             conn.query_endpoint("items", params={"item_id": "42"}, method_override="DELETE")
 
@@ -2270,7 +2275,7 @@ class TestJWTLoginAuth:
         login_resp.json.return_value = {"access_token": "jwt-token-abc"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             headers = conn._resolve_auth_headers()
 
@@ -2311,7 +2316,7 @@ class TestJWTLoginAuth:
         login_resp.json.return_value = {"id": "sess_123"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ):
             headers = conn._resolve_auth_headers()
 
@@ -2326,7 +2331,7 @@ class TestJWTLoginAuth:
         login_resp.json.return_value = {"access_token": "jwt-token-abc"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             headers1 = conn._resolve_auth_headers()
             headers2 = conn._resolve_auth_headers()
@@ -2363,7 +2368,7 @@ class TestJWTLoginAuth:
         login_resp.json.return_value = {"token": "my-custom-token"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ):
             headers = conn._resolve_auth_headers()
 
@@ -2413,11 +2418,11 @@ class TestJWTLoginAuth:
 
         with (
             patch(
-                "db_mcp_data.connectors.api.requests.post",
+                "db_mcp_data.connectors.api.requests.Session.post",
                 side_effect=[login_resp1, login_resp2],
             ),
             patch(
-                "db_mcp_data.connectors.api.requests.request",
+                "db_mcp_data.connectors.api.requests.Session.request",
                 side_effect=[api_resp_401, api_resp_ok],
             ),
         ):
@@ -2536,7 +2541,7 @@ class TestJWTLoginAuth:
         login_resp.json.return_value = {"access_token": "tok-xyz"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             headers = conn._resolve_auth_headers()
 
@@ -2651,7 +2656,7 @@ class TestJWTLoginLiteralValues:
         login_resp.json.return_value = {"access_token": "tok-lit"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             headers = conn._resolve_auth_headers()
 
@@ -2689,7 +2694,7 @@ class TestJWTLoginLiteralValues:
         login_resp.json.return_value = {"access_token": "tok-mixed"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             conn._resolve_auth_headers()
 
@@ -2725,7 +2730,7 @@ class TestJWTLoginLiteralValues:
         login_resp.json.return_value = {"access_token": "tok-env"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             conn._resolve_auth_headers()
 
@@ -2830,7 +2835,7 @@ class TestRawResponseModeGET:
         mock_resp.json.return_value = {"version": "2.1", "healthy": True, "uptime_seconds": 86400}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=mock_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=mock_resp
         ):
             result = conn.query_endpoint("status")
 
@@ -3034,7 +3039,7 @@ class TestJWTLoginBody:
         login_resp.json.return_value = {"access_token": "jwt-token-xyz"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             conn._resolve_auth_headers()
 
@@ -3058,7 +3063,7 @@ class TestJWTLoginBody:
         login_resp.json.return_value = {"access_token": "jwt-token-xyz"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             conn._resolve_auth_headers()
 
@@ -3079,7 +3084,7 @@ class TestJWTLoginBody:
         login_resp.json.return_value = {"access_token": "jwt-token-abc"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             conn._resolve_auth_headers()
 
@@ -3117,7 +3122,7 @@ class TestJWTLoginBody:
         login_resp.json.return_value = {"access_token": "superset-jwt-token"}
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=login_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp
         ) as mock_post:
             headers = conn._resolve_auth_headers()
 
@@ -3175,7 +3180,7 @@ class TestGenericSQLAPIConfig:
         }
 
         with patch(
-            "db_mcp_data.connectors.api.requests.post", return_value=dataset_resp
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=dataset_resp
         ) as mock_post:
             rows = conn.execute_sql("SELECT 1")
 
@@ -3225,7 +3230,7 @@ class TestGenericSQLAPIConfig:
         ]
 
         with patch(
-            "db_mcp_data.connectors.api.requests.request", return_value=schema_resp
+            "db_mcp_data.connectors.api.requests.Session.request", return_value=schema_resp
         ):
             assert conn.get_schemas() == ["analytics", "public"]
             tables = conn.get_tables(schema="public")
@@ -3322,14 +3327,14 @@ class TestGenericSQLAPIConfig:
             raise AssertionError(f"Unexpected GET url: {url}")
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", side_effect=get_side_effect
+            "db_mcp_data.connectors.api.requests.Session.get", side_effect=get_side_effect
         ) as mock_get:
             assert conn.get_schemas() == ["public"]
 
         with (
-            patch("db_mcp_data.connectors.api.requests.get", return_value=db_list_resp),
+            patch("db_mcp_data.connectors.api.requests.Session.get", return_value=db_list_resp),
             patch(
-                "db_mcp_data.connectors.api.requests.post",
+                "db_mcp_data.connectors.api.requests.Session.post",
                 return_value=dataset_resp,
             ) as mock_post,
         ):
@@ -3408,7 +3413,7 @@ class TestGenericSQLAPIConfig:
             raise AssertionError(f"Unexpected GET url: {url}")
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", side_effect=get_side_effect
+            "db_mcp_data.connectors.api.requests.Session.get", side_effect=get_side_effect
         ):
             assert conn.get_catalogs() == ["finance", "primary_warehouse"]
             assert conn.get_schemas(catalog="primary_warehouse") == ["public"]
@@ -3436,9 +3441,9 @@ class TestGenericSQLAPIConfig:
         ]
 
         with (
-            patch("db_mcp_data.connectors.api.requests.get", side_effect=get_side_effect),
+            patch("db_mcp_data.connectors.api.requests.Session.get", side_effect=get_side_effect),
             patch(
-                "db_mcp_data.connectors.api.requests.post",
+                "db_mcp_data.connectors.api.requests.Session.post",
                 return_value=dataset_resp,
             ) as mock_post,
         ):
@@ -3488,7 +3493,7 @@ class TestGenericSQLAPIConfig:
         ]
 
         with patch(
-            "db_mcp_data.connectors.api.requests.get", return_value=db_list_resp
+            "db_mcp_data.connectors.api.requests.Session.get", return_value=db_list_resp
         ):
             with pytest.raises(ValueError, match="catalog"):
                 conn.execute_sql("SELECT * FROM public.users LIMIT 1")
@@ -3587,8 +3592,8 @@ class TestGenericSQLAPIConfig:
             raise AssertionError(f"Unexpected GET url: {url}")
 
         with (
-            patch("db_mcp_data.connectors.api.requests.post", return_value=login_resp),
-            patch("db_mcp_data.connectors.api.requests.get", side_effect=get_side_effect),
+            patch("db_mcp_data.connectors.api.requests.Session.post", return_value=login_resp),
+            patch("db_mcp_data.connectors.api.requests.Session.get", side_effect=get_side_effect),
         ):
             assert conn.get_catalogs() == ["analytics__hive", "analytics__iceberg"]
             assert conn.get_schemas(catalog="analytics__hive") == ["public"]
@@ -3624,8 +3629,10 @@ class TestGenericSQLAPIConfig:
         ]
 
         with (
-            patch("db_mcp_data.connectors.api.requests.post", return_value=sql_resp) as post,
-            patch("db_mcp_data.connectors.api.requests.get", side_effect=get_side_effect),
+            patch(
+                "db_mcp_data.connectors.api.requests.Session.post", return_value=sql_resp
+            ) as post,
+            patch("db_mcp_data.connectors.api.requests.Session.get", side_effect=get_side_effect),
         ):
             rows = conn.execute_sql("SELECT * FROM analytics__hive.public.orders LIMIT 1")
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import json
 import signal
 import sqlite3
@@ -29,6 +30,7 @@ from db_mcp.benchmark.runner import (
     RUNTIME_NATIVE_SCENARIO,
     SCENARIOS,
     _build_prompt,
+    _collect_db_mcp_metrics,
     _enrich_answer_payload,
     _extract_answer_payload,
     _extract_answer_payload_with_recovery,
@@ -2219,3 +2221,21 @@ def test_run_benchmark_suite_recovers_runtime_answer_after_structured_output_fai
     assert answer["status"] == "answered"
     assert answer["answer_value"] == 3
     assert score["correct"] is True
+
+
+def test_collect_db_mcp_metrics_reads_rotated_and_compressed_segments(tmp_path, monkeypatch):
+    traces_dir = tmp_path / "traces" / "u1"
+    traces_dir.mkdir(parents=True)
+
+    def line(tool: str, status: str = "OK") -> str:
+        record = {"ts": 5, "status": status, "attrs": {"tool.name": tool, "session.id": "s"}}
+        return json.dumps(record) + "\n"
+
+    (traces_dir / "2026-01-20.1.jsonl.gz").write_bytes(gzip.compress(line("run_sql").encode()))
+    (traces_dir / "2026-01-20.jsonl").write_text(line("list_tables", status="ERROR"))
+    (traces_dir / "2026-01-19.jsonl.gz").write_bytes(gzip.compress(line("get_result").encode()))
+    monkeypatch.setattr("db_mcp.benchmark.runner.get_user_id_from_config", lambda: "u1")
+
+    metrics = _collect_db_mcp_metrics(tmp_path, session_id="s", started_ns=0, ended_ns=10)
+
+    assert metrics == {"exploratory_steps": 3, "failed_executions": 1, "db_executions": 2}
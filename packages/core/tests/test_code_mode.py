@@ -878,3 +878,63 @@ def test_code_runtime_client_uses_session_http_api(monkeypatch):
             None,
         ),
     ]
+
+
+def test_code_mode_reuses_warm_worker_across_snippets(code_mode_connection):
+    connection_name, _ = code_mode_connection
+    manager = ExecSessionManager(backend=ProcessExecSandboxBackend())
+    runtime = CodeModeRuntime(connection=connection_name, session_id="warm-1", manager=manager)
+    try:
+        runtime.run("print(dbmcp.read_protocol())", timeout_seconds=10)
+        runtime.run("print(dbmcp.find_tables('item'))", timeout_seconds=10)
+        first = runtime.run("import os; print(os.getpid())", timeout_seconds=10)
+        second = runtime.run("import os; print(os.getpid())", timeout_seconds=10)
+        query = runtime.run(
+            "print(dbmcp.scalar('SELECT COUNT(*) FROM items'))", timeout_seconds=10
+        )
+    finally:
+        manager.close_all()
+
+    assert first.exit_code == 0
+    assert first.stdout == second.stdout
+    assert query.stdout.strip() == "3"
+
+
+def test_code_mode_worker_recovers_after_timeout_and_crash(code_mode_connection):
+    connection_name, _ = code_mode_connection
+    manager = ExecSessionManager(backend=ProcessExecSandboxBackend())
+    runtime = CodeModeRuntime(connection=connection_name, session_id="warm-2", manager=manager)
+    try:
+        runtime.run("print(dbmcp.read_protocol())", timeout_seconds=10)
+        before = runtime.run("import os; print(os.getpid())", timeout_seconds=10)
+        timed_out = runtime.run("import time; time.sleep(30)", timeout_seconds=1)
+        after_timeout = runtime.run("import os; print(os.getpid())", timeout_seconds=10)
+        crashed = runtime.run("import os; os._exit(3)", timeout_seconds=10)
+        after_crash = runtime.run("print('still here')", timeout_seconds=10)
+    finally:
+        manager.close_all()
+
+    assert timed_out.exit_code != 0
+    assert "timeout" in timed_out.stderr
+    assert after_timeout.exit_code == 0
+    assert after_timeout.stdout != before.stdout
+    assert crashed.exit_code != 0
+    assert after_crash.exit_code == 0
+    assert after_crash.stdout.strip() == "still here"
+
+
+def test_code_mode_workers_can_be_disabled(code_mode_connection, monkeypatch):
+    connection_name, _ = code_mode_connection
+    monkeypatch.setenv("DB_MCP_CODE_WORKERS", "0")
+    manager = ExecSessionManager(backend=ProcessExecSandboxBackend())
+    runtime = CodeModeRuntime(connection=connection_name, session_id="cold-1", manager=manager)
+
+    runtime.run("print(dbmcp.read_protocol())", timeout_seconds=10)
+    runtime.run("print(dbmcp.find_tables('item'))", timeout_seconds=10)
+    first = runtime.run("import os; print(os.getpid())", timeout_seconds=10)
+    second = runtime.run("import os; print(os.getpid())", timeout_seconds=10)
+    query = runtime.run("print(dbmcp.scalar('SELECT COUNT(*) FROM items'))", timeout_seconds=10)
+
+    assert first.stdout != second.stdout
+    assert query.stdout.strip() == "3"
+    assert all(active.worker is None for active in manager._sessions.values())
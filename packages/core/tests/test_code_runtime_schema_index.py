@@ -0,0 +1,184 @@
+"""Tests for the cached schema index behind code-mode table/column lookups."""
+
+from __future__ import annotations
+
+import os
+import types
+from pathlib import Path
+
+import pytest
+import yaml
+
+from db_mcp.code_runtime import backend
+from db_mcp.code_runtime.backend import _CODE_RUNTIME_MODULE
+
+_TABLES = [
+    {
+        "name": "orders",
+        "full_name": "sales.orders",
+        "description": "Customer orders placed through the web shop.",
+        "columns": [
+            {"name": "order_id", "type": "INTEGER", "description": "Primary key."},
+            {"name": "customerId", "type": "INTEGER", "description": "Buyer reference."},
+            {"name": "total_amount", "type": "NUMERIC", "description": "Order value."},
+        ],
+    },
+    {
+        "name": "customers",
+        "full_name": "sales.customers",
+        "description": "People who bought something.",
+        "columns": [
+            {"name": "id", "type": "INTEGER", "description": "Customer key."},
+            {"name": "region", "type": "TEXT", "description": "Sales region of the buyer."},
+        ],
+    },
+    {"name": "order_items", "columns": [{"name": "amount", "type": "NUMERIC"}]},
+    {"table_name": "ord", "description": "Legacy ord table"},
+]
+
+_QUERIES = [
+    "orders",
+    "ord",
+    "Customer",
+    "customer orders by region",
+    "amount",
+    "total amount of orders",
+    "sales.customers",
+    "id",
+    "buyer",
+    "nothing matches here",
+    "",
+]
+
+
+def _write_schema(connection_path: Path, tables: list[dict]) -> Path:
+    path = connection_path / "schema" / "descriptions.yaml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump({"tables": tables}, sort_keys=False))
+    return path
+
+
+def _reference_find_tables(score, tables, query):
+    matches = []
+    for table in tables:
+        name = table.get("name") or table.get("table_name") or ""
+        columns = [column.get("name", "") for column in table.get("columns", [])]
+        value = score(
+            query, name, table.get("full_name"), table.get("description"), " ".join(columns)
+        )
+        if value > 0:
+            matches.append((name, value))
+    return sorted(matches, key=lambda item: (-item[1], item[0]))
+
+
+def _reference_find_columns(score, tables, query):
+    matches = []
+    for table in tables:
+        table_name = table.get("name") or table.get("table_name") or ""
+        for column in table.get("columns", []):
+            value = score(
+                query,
+                column.get("name"),
+                column.get("description"),
+                column.get("type"),
+                table_name,
+            )
+            if value > 0:
+                matches.append((table_name, column.get("name"), value))
+    return sorted(matches, key=lambda item: (-item[2], item[0], item[1]))
+
+
+@pytest.fixture()
+def sandbox_module() -> types.ModuleType:
+    module = types.ModuleType("dbmcp_under_test")
+    exec(compile(_CODE_RUNTIME_MODULE, "dbmcp.py", "exec"), module.__dict__)
+    return module
+
+
+@pytest.mark.parametrize("query", _QUERIES)
+def test_host_index_scores_match_linear_scan(tmp_path, query):
+    path = _write_schema(tmp_path, _TABLES)
+    index = backend._load_schema_index(path)
+
+    tables = [
+        (index.table_names[position], score)
+        for position, score in index.table_fields.score(query).items()
+        if score > 0
+    ]
+    columns = [
+        (index.columns[position][0], index.columns[position][1].get("name"), score)
+        for position, score in index.column_fields.score(query).items()
+        if score > 0
+    ]
+
+    assert sorted(tables, key=lambda item: (-item[1], item[0])) == _reference_find_tables(
+        backend._score_text_match, _TABLES, query
+    )
+    assert sorted(columns, key=lambda item: (-item[2], item[0], item[1])) == (
+        _reference_find_columns(backend._score_text_match, _TABLES, query)
+    )
+
+
+@pytest.mark.parametrize("query", _QUERIES)
+def test_sandbox_runtime_lookups_match_linear_scan(tmp_path, sandbox_module, query):
+    _write_schema(tmp_path, _TABLES)
+    runtime = sandbox_module.DbMcpRuntime(workspace=tmp_path)
+    score = sandbox_module._score_text_match
+
+    found_tables = [(row["name"], row["score"]) for row in runtime.find_tables(query, limit=50)]
+    found_columns = [
+        (row["table"], row["name"], row["score"]) for row in runtime.find_columns(query, limit=50)
+    ]
+
+    assert found_tables == _reference_find_tables(score, _TABLES, query)
+    assert found_columns == _reference_find_columns(score, _TABLES, query)
+
+
+def test_index_is_reused_until_descriptions_change(tmp_path, monkeypatch):
+    path = _write_schema(tmp_path, _TABLES)
+    parses: list[Path] = []
+    original = backend._read_yaml_file
+
+    def counting_read(target: Path) -> object:
+        parses.append(target)
+        return original(target)
+
+    monkeypatch.setattr(backend, "_read_yaml_file", counting_read)
+
+    first = backend._load_schema_index(path)
+    assert backend._load_schema_index(path) is first
+    assert parses == [path]
+
+    _write_schema(tmp_path, _TABLES[:1])
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = backend._load_schema_index(path)
+
+    assert second is not first
+    assert second.table_names == ["orders"]
+    assert len(parses) == 2
+
+
+def test_missing_descriptions_yield_empty_index(tmp_path):
+    index = backend._load_schema_index(tmp_path / "schema" / "descriptions.yaml")
+
+    assert index.tables == []
+    assert index.table_fields.score("orders") == {}
+
+
+def test_describe_table_prefers_exact_name_and_returns_a_copy(tmp_path, sandbox_module):
+    _write_schema(tmp_path, _TABLES)
+    runtime = sandbox_module.DbMcpRuntime(workspace=tmp_path)
+
+    described = runtime.describe_table("Orders")
+    assert described["name"] == "orders"
+    assert [column["name"] for column in described["columns"]] == [
+        "order_id",
+        "customerId",
+        "total_amount",
+    ]
+    assert runtime.describe_table("ord")["name"] == "ord"
+
+    described["columns"][0]["name"] = "mutated"
+    assert runtime.describe_table("orders")["columns"][0]["name"] == "order_id"
+    assert runtime.table_names() == ["customers", "ord", "order_items", "orders"]
@@ -0,0 +1,80 @@
+"""Tests for the in-memory console span collector."""
+
+from db_mcp.console.collector import Span, SpanCollector
+
+
+def _span(trace_id, span_id, start, end=None, name=None):
+    return Span(
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_span_id=None,
+        name=name or span_id,
+        start_time=start,
+        end_time=end,
+    )
+
+
+class TestGetTraces:
+    def test_spans_sorted_and_bounds_tracked(self):
+        collector = SpanCollector()
+        collector.add_span(_span("t1", "child", 10.5, 11.0))
+        collector.add_span(_span("t1", "root", 10.0, 12.0))
+        collector.add_span(_span("t1", "open", 11.5))
+
+        (trace,) = collector.get_traces()
+
+        assert [s["span_id"] for s in trace["spans"]] == ["root", "child", "open"]
+        assert trace["root_span"] == "root"
+        assert trace["start_time"] == 10.0
+        assert trace["end_time"] == 12.0
+        assert trace["duration_ms"] == 2000.0
+        assert trace["span_count"] == 3
+
+    def test_most_recently_active_trace_first(self):
+        collector = SpanCollector()
+        collector.add_span(_span("t1", "a", 1.0, 2.0))
+        collector.add_span(_span("t2", "b", 3.0, 4.0))
+        collector.add_span(_span("t1", "c", 5.0, 6.0))
+
+        assert [t["trace_id"] for t in collector.get_traces()] == ["t1", "t2"]
+        assert [t["trace_id"] for t in collector.get_traces(limit=1)] == ["t1"]
+
+    def test_summary_refreshes_after_new_span(self):
+        collector = SpanCollector()
+        collector.add_span(_span("t1", "a", 1.0, 2.0))
+        first = collector.get_traces()[0]
+        first["spans"].append("caller mutation")
+
+        collector.add_span(_span("t1", "b", 1.5, 3.0))
+        trace = collector.get_traces()[0]
+
+        assert trace["span_count"] == 2
+        assert [s["span_id"] for s in trace["spans"]] == ["a", "b"]
+        assert trace["end_time"] == 3.0
+
+
+class TestCapacity:
+    def test_evicts_least_recently_active_traces(self):
+        collector = SpanCollector(max_traces=2)
+        collector.add_span(_span("t1", "a", 1.0))
+        collector.add_span(_span("t2", "b", 2.0))
+        collector.add_span(_span("t1", "c", 3.0))
+        collector.add_span(_span("t3", "d", 4.0))
+
+        assert [t["trace_id"] for t in collector.get_traces()] == ["t3", "t1"]
+
+    def test_span_buffer_is_bounded(self):
+        collector = SpanCollector(max_spans=2)
+        for i in range(5):
+            collector.add_span(_span(f"t{i}", f"s{i}", float(i)))
+
+        assert [s["span_id"] for s in collector.get_spans()] == ["s4", "s3"]
+        assert [s["span_id"] for s in collector.get_spans(limit=1)] == ["s4"]
+
+    def test_clear(self):
+        collector = SpanCollector()
+        collector.add_span(_span("t1", "a", 1.0))
+        collector.clear()
+
+        assert collector.get_traces() == []
+        assert collector.get_spans() == []
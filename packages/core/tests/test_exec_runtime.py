@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import io
+import json
+import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 from db_mcp.exec_runtime import (
     AllowedEndpoint,
     ExecResult,
+    ExecRuntimeError,
     ExecSandboxSpec,
     ExecSessionManager,
+    ExecWorker,
     OciExecSandboxBackend,
     ProcessExecSandboxBackend,
     auto_detect_exec_backend,
@@ -304,3 +314,351 @@ def test_process_backend_reports_timeout(tmp_path: Path):
         assert "timeout" in str(exc).lower()
     else:
         raise AssertionError("expected timeout error")
+
+
+class FakeWorkerProcess:
+    """Popen stand-in whose stdout is a real pipe preloaded with JSON lines."""
+
+    def __init__(self, lines: list[dict], *, pid: int = 4242) -> None:
+        read_fd, self._write_fd = os.pipe()
+        self.stdout = os.fdopen(read_fd, "rb")
+        self.stdin = io.BytesIO()
+        self.stdin.close = lambda: None  # keep written requests inspectable
+        self.pid = pid
+        self.returncode: int | None = None
+        self.killed = False
+        for line in lines:
+            self.emit(line)
+
+    def emit(self, message: dict) -> None:
+        os.write(self._write_fd, json.dumps(message).encode("utf-8") + b"\n")
+
+    def requests(self) -> list[dict]:
+        return [json.loads(line) for line in self.stdin.getvalue().splitlines()]
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def kill(self) -> None:
+        self.killed = True
+        self.returncode = -9
+
+    def wait(self, timeout: float | None = None) -> int | None:
+        return self.returncode
+
+
+class FakeWorkerBackend(FakeBackend):
+    def __init__(self, responses: list[list[dict]]) -> None:
+        super().__init__()
+        self._responses = list(responses)
+        self.workers: list[ExecWorker] = []
+        self.processes: list[FakeWorkerProcess] = []
+
+    def open_worker(self, container_id: str, command: list[str]) -> ExecWorker:
+        process = FakeWorkerProcess(
+            [{"type": "ready", "pid": 100 + len(self.workers)}, *self._responses.pop(0)]
+        )
+        worker = ExecWorker(process)  # type: ignore[arg-type]
+        self.processes.append(process)
+        self.workers.append(worker)
+        return worker
+
+
+def _worker_spec(tmp_path: Path, connection: str = "demo") -> ExecSandboxSpec:
+    return ExecSandboxSpec(
+        session_id="sess-1",
+        connection=connection,
+        connection_path=tmp_path,
+        allowed_endpoint=None,
+        environment={},
+    )
+
+
+def _ok(stdout: str) -> dict:
+    return {"stdout": stdout, "stderr": "", "exit_code": 0, "timed_out": False}
+
+
+def test_exec_worker_reads_ready_handshake_then_response():
+    process = FakeWorkerProcess([{"type": "ready", "pid": 77}, _ok("hi\n")])
+    worker = ExecWorker(process, output_chars=2)  # type: ignore[arg-type]
+
+    result = worker.request({"code": "print('hi')"}, timeout_seconds=5)
+
+    assert worker.pid == 77
+    assert process.requests() == [{"code": "print('hi')"}]
+    assert result.exit_code == 0
+    assert "truncated 1 chars" in result.stdout
+    assert result.truncated is True
+
+
+def test_exec_worker_reports_timeout_and_eof():
+    ticks = iter([0.0, 0.0, 100.0])
+    process = FakeWorkerProcess([{"type": "ready", "pid": 1}])
+    worker = ExecWorker(process, clock=lambda: next(ticks))  # type: ignore[arg-type]
+    with pytest.raises(ExecRuntimeError, match="timeout after 1s"):
+        worker.request({"code": "while True: pass"}, timeout_seconds=1)
+
+    reported = FakeWorkerProcess(
+        [{"type": "ready", "pid": 1}, {"timed_out": True, "exit_code": 124}]
+    )
+    with pytest.raises(ExecRuntimeError, match="timeout after 3s"):
+        ExecWorker(reported).request({}, timeout_seconds=3)  # type: ignore[arg-type]
+
+    crashed = FakeWorkerProcess([{"type": "ready", "pid": 1}])
+    os.close(crashed._write_fd)
+    with pytest.raises(ExecRuntimeError, match="exited unexpectedly"):
+        ExecWorker(crashed).request({}, timeout_seconds=3)  # type: ignore[arg-type]
+
+
+def test_exec_worker_close_uses_backend_kill():
+    process = FakeWorkerProcess([])
+    killed: list[ExecWorker] = []
+
+    def kill(worker: ExecWorker) -> None:
+        killed.append(worker)
+        process.returncode = -15
+
+    worker = ExecWorker(process, kill=kill)  # type: ignore[arg-type]
+    worker.close()
+
+    assert killed == [worker]
+    assert process.killed is False
+    assert worker.alive is False
+
+
+def test_request_worker_reuses_worker_for_session(tmp_path: Path):
+    backend = FakeWorkerBackend([[_ok("one"), _ok("two")]])
+    manager = ExecSessionManager(backend=backend)
+
+    first = manager.request_worker(
+        session_id="sess-1",
+        spec=_worker_spec(tmp_path),
+        command=["python3", "worker.py"],
+        payload={"code": "1"},
+        timeout_seconds=5,
+    )
+    second = manager.request_worker(
+        session_id="sess-1",
+        spec=_worker_spec(tmp_path),
+        command=["python3", "worker.py"],
+        payload={"code": "2"},
+        timeout_seconds=5,
+    )
+
+    assert manager.supports_workers is True
+    assert (first["stdout"], second["stdout"]) == ("one", "two")
+    assert len(backend.workers) == 1
+    assert len(backend.created) == 1
+    assert backend.processes[0].requests() == [{"code": "1"}, {"code": "2"}]
+
+
+def test_request_worker_discards_failed_and_dead_workers(tmp_path: Path):
+    backend = FakeWorkerBackend(
+        [[{"timed_out": True, "exit_code": 124}], [_ok("after-timeout")], [_ok("after-crash")]]
+    )
+    manager = ExecSessionManager(backend=backend)
+
+    def send() -> dict[str, object]:
+        return manager.request_worker(
+            session_id="sess-1",
+            spec=_worker_spec(tmp_path),
+            command=["python3", "worker.py"],
+            payload={"code": "x"},
+            timeout_seconds=5,
+        )
+
+    with pytest.raises(ExecRuntimeError, match="timeout"):
+        send()
+    assert backend.processes[0].killed is True
+
+    assert send()["stdout"] == "after-timeout"
+    backend.processes[1].returncode = 1  # worker crashed between requests
+    assert send()["stdout"] == "after-crash"
+    assert len(backend.workers) == 3
+    assert len(backend.created) == 1
+
+
+def test_workers_are_closed_with_their_sessions(tmp_path: Path):
+    now = [1000.0]
+    backend = FakeWorkerBackend([[_ok("a")], [_ok("b")], [_ok("c")]])
+    manager = ExecSessionManager(
+        backend=backend, idle_ttl_seconds=60, max_sessions=1, now=lambda: now[0]
+    )
+
+    for connection in ("one", "two"):
+        manager.request_worker(
+            session_id="sess-1",
+            spec=_worker_spec(tmp_path, connection),
+            command=["python3", "worker.py"],
+            payload={},
+            timeout_seconds=5,
+        )
+    assert backend.processes[0].killed is True  # evicted with session "one"
+    assert backend.closed == ["ctr-1"]
+
+    now[0] += 120
+    manager.reap_idle_sessions()
+    assert backend.processes[1].killed is True
+    assert backend.closed == ["ctr-1", "ctr-2"]
+
+
+class EchoWorkerProcess(FakeWorkerProcess):
+    """Answers each request line with its own ``code`` once ``release`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__([{"type": "ready", "pid": 1}])
+        self.release = threading.Event()
+        self.release.set()
+        self.pending = self.max_pending = 0
+        self._lock = threading.Lock()
+        process = self
+
+        class _Stdin(io.BytesIO):
+            def write(self, data: bytes) -> int:
+                with process._lock:
+                    process.pending += 1
+                    process.max_pending = max(process.max_pending, process.pending)
+                request = json.loads(data)
+                threading.Thread(target=process._answer, args=(request,)).start()
+                return super().write(data)
+
+            def close(self) -> None:
+                pass
+
+        self.stdin = _Stdin()
+
+    def _answer(self, request: dict) -> None:
+        self.release.wait(5)
+        time.sleep(0.05)
+        with self._lock:
+            self.pending -= 1
+            self.emit(_ok(request["code"]))
+
+
+class EchoWorkerBackend(FakeBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.processes: list[EchoWorkerProcess] = []
+
+    def open_worker(self, container_id: str, command: list[str]) -> ExecWorker:
+        process = EchoWorkerProcess()
+        self.processes.append(process)
+        return ExecWorker(process)  # type: ignore[arg-type]
+
+
+def _request_code(manager: ExecSessionManager, tmp_path: Path, code: str) -> dict[str, object]:
+    return manager.request_worker(
+        session_id="stateless",
+        spec=_worker_spec(tmp_path),
+        command=["python3", "worker.py"],
+        payload={"code": code},
+        timeout_seconds=5,
+    )
+
+
+def test_concurrent_requests_to_one_session_are_serialized(tmp_path: Path):
+    backend = EchoWorkerBackend()
+    manager = ExecSessionManager(backend=backend)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        codes = [f"snippet-{i}" for i in range(4)]
+        results = list(pool.map(lambda code: _request_code(manager, tmp_path, code), codes))
+
+    assert [result["stdout"] for result in results] == codes
+    assert len(backend.processes) == 1
+    assert backend.processes[0].max_pending == 1
+
+
+def test_reaper_skips_session_with_request_in_flight(tmp_path: Path):
+    now = [1000.0]
+    backend = EchoWorkerBackend()
+    manager = ExecSessionManager(backend=backend, idle_ttl_seconds=60, now=lambda: now[0])
+    _request_code(manager, tmp_path, "warm")
+    backend.processes[0].release.clear()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(_request_code, manager, tmp_path, "slow")
+        while backend.processes[0].pending == 0:
+            time.sleep(0.01)
+        now[0] += 120
+        manager.reap_idle_sessions()
+        assert backend.closed == []
+        backend.processes[0].release.set()
+        assert future.result()["stdout"] == "slow"
+
+    now[0] += 120
+    manager.reap_idle_sessions()
+    assert backend.closed == ["ctr-1"]
+
+
+class SlowStartBackend(FakeBackend):
+    """Blocks ``create_session`` for the ``slow`` connection until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.starting = threading.Event()
+        self.fail_next = False
+
+    def create_session(self, spec: ExecSandboxSpec) -> str:
+        if spec.connection == "slow":
+            self.starting.set()
+            self.release.wait(5)
+            if self.fail_next:
+                self.fail_next = False
+                raise ExecRuntimeError("container failed to start")
+        return super().create_session(spec)
+
+
+def _execute(manager: ExecSessionManager, tmp_path: Path, connection: str, session_id: str):
+    spec = ExecSandboxSpec(
+        session_id=session_id,
+        connection=connection,
+        connection_path=tmp_path,
+        allowed_endpoint=None,
+        environment={},
+    )
+    return manager.execute(session_id=session_id, spec=spec, command="echo", timeout_seconds=5)
+
+
+def test_session_start_does_not_block_other_sessions(tmp_path: Path):
+    backend = SlowStartBackend()
+    manager = ExecSessionManager(backend=backend)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        slow = [pool.submit(_execute, manager, tmp_path, "slow", "sess-1") for _ in range(2)]
+        assert backend.starting.wait(5)
+        fast = pool.submit(_execute, manager, tmp_path, "fast", "sess-2")
+        assert fast.result(timeout=5)["exit_code"] == 0
+        backend.release.set()
+        assert [future.result(timeout=5)["exit_code"] for future in slow] == [0, 0]
+
+    assert [spec.connection for spec in backend.created] == ["fast", "slow"]
+
+
+def test_failed_session_start_is_retried_by_the_next_caller(tmp_path: Path):
+    backend = SlowStartBackend()
+    backend.fail_next = True
+    backend.release.set()
+    manager = ExecSessionManager(backend=backend)
+
+    with pytest.raises(ExecRuntimeError, match="failed to start"):
+        _execute(manager, tmp_path, "slow", "sess-1")
+
+    assert _execute(manager, tmp_path, "slow", "sess-1")["exit_code"] == 0
+    manager.close_all()
+    assert backend.closed == ["ctr-1"]
+
+
+def test_request_worker_requires_worker_capable_backend(tmp_path: Path):
+    manager = ExecSessionManager(backend=FakeBackend())
+
+    assert manager.supports_workers is False
+    with pytest.raises(ExecRuntimeError, match="persistent workers"):
+        manager.request_worker(
+            session_id="sess-1",
+            spec=_worker_spec(tmp_path),
+            command=["python3", "worker.py"],
+            payload={},
+            timeout_seconds=5,
+        )
@@ -1,7 +1,13 @@
 """Tests for deterministic semantic planning."""
 
+import yaml
 from db_mcp_knowledge.planner.meta_query import compile_metric_intent, resolve_metric
-from db_mcp_knowledge.semantic.core_loader import ConnectionSemanticCore
+from db_mcp_knowledge.retrieval import KIND_DIMENSION
+from db_mcp_knowledge.semantic.core_loader import (
+    ConnectionSemanticCore,
+    clear_semantic_cores,
+    load_connection_semantic_core,
+)
 from db_mcp_models import Dimension, DimensionType, ExpectedCardinality, Metric
 
 
@@ -55,3 +61,37 @@ def test_compile_metric_intent_marks_dimension_requests_as_many():
     assert [dimension.name for dimension in plan.dimensions] == ["region"]
     assert plan.expected_cardinality == ExpectedCardinality.MANY
     assert plan.warnings == []
+
+
+def test_semantic_core_lookups_are_precomputed():
+    core = _semantic_core()
+
+    assert core.get_metric("dau").display_name == "Daily Active Users"
+    assert core.get_metric("missing") is None
+    assert core.get_dimension("region").column == "customers.region"
+    assert core.aliases(KIND_DIMENSION, "region") == ["region", "Region"]
+
+
+def _write_catalog(connection_path, *names):
+    catalog = connection_path / "metrics" / "catalog.yaml"
+    catalog.parent.mkdir(parents=True, exist_ok=True)
+    catalog.write_text(
+        yaml.safe_dump(
+            {"metrics": [{"name": name, "description": name, "sql": "SELECT 1"} for name in names]}
+        )
+    )
+
+
+def test_loaded_semantic_core_is_cached_until_files_change(tmp_path):
+    clear_semantic_cores()
+    _write_catalog(tmp_path, "revenue")
+
+    first = load_connection_semantic_core("demo", connection_path=tmp_path)
+    assert load_connection_semantic_core("demo", connection_path=tmp_path) is first
+
+    _write_catalog(tmp_path, "revenue", "orders_count")
+    reloaded = load_connection_semantic_core("demo", connection_path=tmp_path)
+
+    assert reloaded is not first
+    assert reloaded.get_metric("orders_count") is not None
+    clear_semantic_cores()
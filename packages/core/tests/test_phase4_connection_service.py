@@ -472,9 +472,10 @@ def test_sync_api_connection_calls_api_connector_sync(tmp_path: Path) -> None:
         patch("db_mcp_data.connectors.api.APIConnector", return_value=mock_connector),
     ):
         mock_cc.from_yaml.return_value = mock_config
-        result = sync_api_connection("feeds", connections_dir=connections_dir)
+        result = sync_api_connection("feeds", connections_dir=connections_dir, full=True)
 
     assert result["success"] is True
+    mock_connector.sync.assert_called_once_with(endpoint_name=None, full=True)
 
 
 # ---------------------------------------------------------------------------
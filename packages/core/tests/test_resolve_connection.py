@@ -24,6 +24,7 @@ def _make_mock_api_connector():
     from db_mcp_data.connectors import APIConnector
 
     mock = MagicMock(spec=APIConnector)
+    mock.api_config = MagicMock(capabilities={}, profile="")
     return mock
 
 
@@ -561,7 +562,7 @@ class TestAPIToolConnectionDispatch:
                 ExecutionState,
             )
 
-            def _submit_sync(request, runner):
+            def _submit_sync(request, runner, max_rows=None):
                 runner_result = runner("")
                 h = ExecutionHandle(
                     execution_id="exec-auth-retry",
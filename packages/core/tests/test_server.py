@@ -17,6 +17,14 @@ from db_mcp.registry import ConnectionInfo, ConnectionRegistry
 from db_mcp.tools import daemon_tasks
 
 
+@pytest.fixture(autouse=True)
+def _in_memory_task_store():
+    # Daemon tasks must not persist into real connection directories.
+    daemon_tasks._reset_task_store(persist=False)
+    yield
+    daemon_tasks._reset_task_store()
+
+
 def _get_tool_names(server):
     """Extract registered tool names from a FastMCP server."""
     return set(server._tool_manager._tools.keys())
@@ -676,10 +684,23 @@ async def test_daemon_mode_prepare_and_execute_task(tmp_path, monkeypatch):
         assert executed_payload["observability"]["inline_resolution_attempts"] == 0
 
 
+def test_reset_task_store_can_disable_persistence(tmp_path, monkeypatch):
+    from db_mcp.tools.task_store import tasks_db_path
+
+    monkeypatch.setattr(daemon_tasks, "_task_connection_path", lambda connection: tmp_path)
+    daemon_tasks._register_task(
+        daemon_tasks.PreparedTask(
+            task_id="task-memory", connection="demo", question="q", context={}
+        )
+    )
+
+    assert daemon_tasks._get_task_state("task-memory") is not None
+    assert not tasks_db_path(tmp_path).exists()
+
+
 @pytest.mark.asyncio
 async def test_daemon_execute_task_resolves_async_read_inline(monkeypatch):
     """execute_task should inline-poll async read executions to a final result."""
-    daemon_tasks._TASKS.clear()
     daemon_tasks._register_task(
         daemon_tasks.PreparedTask(
             task_id="task-123",
@@ -1311,7 +1332,6 @@ async def test_daemon_prepare_task_returns_timeout_observability(monkeypatch):
 @pytest.mark.asyncio
 async def test_daemon_execute_task_returns_timeout_observability(monkeypatch):
     """execute_task should fail cleanly when execution exceeds its deadline."""
-    daemon_tasks._TASKS.clear()
     daemon_tasks._register_task(
         daemon_tasks.PreparedTask(
             task_id="task-timeout",
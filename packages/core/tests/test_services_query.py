@@ -512,7 +512,7 @@ async def test_run_sql_executes_validated_query_synchronously(monkeypatch):
         rows_affected = None
 
     class _Engine:
-        def submit_sync(self, request, runner):
+        def submit_sync(self, request, runner, max_rows=None):
             assert request.connection == "prod"
             assert request.sql == "SELECT 1 AS answer"
             assert request.query_id == "q-sync"
@@ -609,7 +609,7 @@ async def test_run_sql_returns_error_for_failed_sync_execution(monkeypatch):
         error = _Error()
 
     class _Engine:
-        def submit_sync(self, request, runner):
+        def submit_sync(self, request, runner, max_rows=None):
             assert request.connection == "prod"
             assert request.sql == "SELECT broken()"
             assert request.query_id == "q-fail"
@@ -758,7 +758,7 @@ async def test_run_sql_executes_direct_sql_synchronously_when_validate_is_disabl
         rows_affected = None
 
     class _Engine:
-        def submit_sync(self, request, runner):
+        def submit_sync(self, request, runner, max_rows=None):
             assert request.connection == "prod"
             assert request.sql == "SELECT 1 AS answer"
             assert request.query_id == "q-direct"
@@ -812,6 +812,7 @@ async def test_run_sql_executes_direct_sql_synchronously_when_validate_is_disabl
         "statement_type": "SELECT",
         "is_write": False,
         "rows_affected": None,
+        "truncated": False,
     }
 
 
@@ -9,8 +9,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 import db_mcp_data.gateway as gw
 import pytest
+from db_mcp_data.db.streaming import DEFAULT_MAX_RESULT_BYTES, DEFAULT_MAX_RESULT_ROWS, RowStream
 from db_mcp_data.execution.query_store import Query, QueryStatus
-from db_mcp_models.gateway import ColumnMeta, DataResponse
+from db_mcp_models.gateway import ColumnMeta, DataResponse, RunOptions
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -21,6 +22,10 @@ def _make_sql_connector(rows=None):
 
     c = MagicMock(spec=SQLConnector)
     c.execute_sql.return_value = rows if rows is not None else [{"answer": 1}]
+    # run_sql bounds results, so the adapter streams instead of calling execute_sql.
+    c.stream_sql.side_effect = lambda sql, params=None: RowStream.from_rows(
+        c.execute_sql(sql, params)
+    )
     return c
 
 
@@ -125,6 +130,35 @@ async def test_run_sql_direct_gateway_connector_error(monkeypatch, tmp_path):
     assert "table not found" in result["error"]
 
 
+@pytest.mark.asyncio
+async def test_run_sql_direct_gateway_streams_up_to_max_result_rows(monkeypatch, tmp_path):
+    from db_mcp.services.query import run_sql
+
+    connector = _make_sql_connector(rows=[{"n": i} for i in range(5)])
+    _patch_connector(connector, monkeypatch)
+
+    monkeypatch.setattr(
+        "db_mcp.services.query.check_protocol_ack_gate",
+        lambda *, connection, connection_path: None,
+    )
+    monkeypatch.setattr(
+        "db_mcp.services.query.evaluate_sql_execution_policy",
+        lambda *, sql, capabilities, confirmed, require_validate_first: (None, "SELECT", False),
+    )
+
+    result = await run_sql(
+        connection="prod",
+        sql="SELECT n FROM numbers",
+        connection_path=tmp_path,
+        capabilities={"supports_sql": True, "max_result_rows": 2},
+    )
+
+    assert result["status"] == "success"
+    assert result["data"] == [{"n": 0}, {"n": 1}]
+    assert result["truncated"] is True
+    connector.stream_sql.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Validated query path via gateway (no execute_query kwarg)
 # ---------------------------------------------------------------------------
@@ -178,7 +212,15 @@ async def test_run_sql_validated_query_via_gateway(monkeypatch, tmp_path):
     assert result["status"] == "success"
     assert result["data"] == [{"val": 99}]
     assert result["query_id"] == "q-gw"
-    gw.execute.assert_awaited_once_with("q-gw", connection_path=tmp_path, options=None)
+    gw.execute.assert_awaited_once_with(
+        "q-gw",
+        connection_path=tmp_path,
+        options=RunOptions(
+            confirmed=False,
+            max_rows=DEFAULT_MAX_RESULT_ROWS,
+            max_bytes=DEFAULT_MAX_RESULT_BYTES,
+        ),
+    )
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,107 @@
+"""Tests for the bounded daemon task store."""
+
+import json
+import sqlite3
+import time
+
+from db_mcp.tools.task_store import PreparedTask, TaskStore, tasks_db_path
+
+
+def _task(task_id, connection="demo", context=None):
+    return PreparedTask(
+        task_id=task_id,
+        connection=connection,
+        question="How many users?",
+        context=context if context is not None else {"candidate_tables": ["users"]},
+    )
+
+
+class TestInMemory:
+    def test_put_and_get(self):
+        store = TaskStore(persist=False)
+        task = _task("t1")
+
+        store.put(task)
+
+        assert store.get("t1") is task
+        assert store.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        store = TaskStore(max_entries=2, persist=False)
+        store.put(_task("t1"))
+        store.put(_task("t2"))
+        store.get("t1")
+        store.put(_task("t3"))
+
+        assert store.get("t2") is None
+        assert store.get("t1") is not None
+        assert store.get("t3") is not None
+
+    def test_byte_budget_counts_context_payloads(self):
+        big = {"schema": "x" * 4000}
+        store = TaskStore(max_bytes=10_000, persist=False)
+        store.put(_task("t1", context=big))
+        store.put(_task("t2", context=big))
+        store.put(_task("t3", context=big))
+
+        assert store.get("t1") is None
+        assert store.stats()["bytes"] <= 10_000
+
+    def test_expired_tasks_are_dropped(self, monkeypatch):
+        store = TaskStore(ttl_seconds=60, persist=False)
+        store.put(_task("t1"))
+        later = time.monotonic() + 120
+        monkeypatch.setattr("db_mcp_data.ttl_cache.time.monotonic", lambda: later)
+
+        assert store.get("t1") is None
+
+
+class TestPersistence:
+    def test_survives_a_new_store(self, tmp_path):
+        task = _task("t1")
+        TaskStore().put(task, tmp_path)
+        task.status = "completed"
+        task.sql = "SELECT 1"
+        TaskStore().put(task, tmp_path)
+
+        restored = TaskStore().get("t1", [tmp_path / "other", tmp_path])
+
+        assert restored is not None
+        assert restored.to_dict() == task.to_dict()
+
+    def test_update_past_byte_budget_is_reloaded_from_disk(self, tmp_path):
+        store = TaskStore(max_bytes=2_000)
+        store.put(_task("t1"), tmp_path)
+        grown = {"schema": "x" * 4000}
+        store.put(_task("t1", context=grown), tmp_path)
+
+        restored = store.get("t1", [tmp_path])
+
+        assert restored is not None
+        assert restored.context == grown
+        assert store.stats()["entries"] == 0
+
+    def test_missing_connection_dir_is_not_created(self, tmp_path):
+        TaskStore().put(_task("t1"), tmp_path / "missing")
+
+        assert not (tmp_path / "missing").exists()
+
+    def test_persist_disabled_skips_disk(self, tmp_path):
+        TaskStore(persist=False).put(_task("t1"), tmp_path)
+
+        assert not tasks_db_path(tmp_path).exists()
+        assert TaskStore(persist=False).get("t1", [tmp_path]) is None
+
+    def test_expired_rows_are_ignored_and_pruned(self, tmp_path):
+        store = TaskStore(ttl_seconds=60)
+        store.put(_task("old"), tmp_path)
+        with sqlite3.connect(tasks_db_path(tmp_path)) as conn:
+            conn.execute("UPDATE prepared_tasks SET updated_at = updated_at - 3600")
+
+        assert TaskStore(ttl_seconds=60).get("old", [tmp_path]) is None
+
+        store.put(_task("new"), tmp_path)
+        with sqlite3.connect(tasks_db_path(tmp_path)) as conn:
+            rows = conn.execute("SELECT task_id, payload_json FROM prepared_tasks").fetchall()
+        assert [task_id for task_id, _ in rows] == ["new"]
+        assert json.loads(rows[0][1])["question"] == "How many users?"
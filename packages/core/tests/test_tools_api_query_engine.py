@@ -163,7 +163,7 @@ async def test_api_query_runner_calls_connector_endpoint():
 
     captured_runner = None
 
-    def capture_submit(request, runner):
+    def capture_submit(request, runner, max_rows=None):
         nonlocal captured_runner
         captured_runner = runner
         # Call the runner to verify it hits the connector
@@ -222,7 +222,7 @@ async def test_api_query_execution_request_metadata():
 
     captured_request = None
 
-    def capture_submit(request, runner):
+    def capture_submit(request, runner, max_rows=None):
         nonlocal captured_request
         captured_request = request
         return handle, result
@@ -0,0 +1,197 @@
+"""Tests for the incremental SQLite trace index."""
+
+import gzip
+import json
+from datetime import datetime
+
+from db_mcp.services.vault import get_context_usage
+from db_mcp.trace_index import (
+    COUNTER_ERROR,
+    COUNTER_FILE,
+    COUNTER_SQL,
+    COUNTER_TOOL,
+    INDEX_FILENAME,
+    TraceIndex,
+    read_indexed_traces,
+)
+from db_mcp.traces_reader import read_traces_from_jsonl
+
+DAY = "2026-01-20"
+
+
+def _span(trace_id, span_id, ts_seconds, name="span", status="OK", attrs=None):
+    return json.dumps(
+        {
+            "ts": ts_seconds * 1_000_000_000,
+            "name": name,
+            "trace_id": trace_id,
+            "span_id": span_id,
+            "parent_id": None,
+            "duration_ms": 10.0,
+            "status": status,
+            "attrs": attrs or {},
+        }
+    )
+
+
+def _write(path, *lines, trailing_newline=True):
+    text = "\n".join(lines)
+    path.write_text(text + ("\n" if trailing_newline else ""))
+
+
+def _append(path, *lines):
+    with open(path, "a") as f:
+        for line in lines:
+            f.write(line + "\n")
+
+
+class TestReadIndexedTraces:
+    def test_matches_direct_jsonl_reader(self, tmp_path):
+        f = tmp_path / f"{DAY}.jsonl"
+        _write(
+            f,
+            _span("t1", "s1", 1706400000, name="root"),
+            _span("t2", "s2", 1706400005),
+            "not json",
+            _span("t1", "s3", 1706399999, name="earlier"),
+            _span("t3", "s4", 1706400005),
+        )
+
+        assert read_indexed_traces(f, limit=None) == read_traces_from_jsonl(f, limit=None)
+        assert read_indexed_traces(f, limit=2) == read_traces_from_jsonl(f, limit=2)
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+    def test_only_new_lines_are_ingested(self, tmp_path):
+        f = tmp_path / f"{DAY}.jsonl"
+        _write(f, _span("t1", "s1", 1706400000))
+        index = TraceIndex(tmp_path)
+
+        assert index.ingest(DAY) == 1
+        assert index.ingest(DAY) == 0
+
+        _append(f, _span("t2", "s2", 1706400010), _span("t1", "s3", 1706400001))
+        assert index.ingest(DAY) == 2
+        traces = index.read_traces(DAY, limit=None)
+        assert [t["trace_id"] for t in traces] == ["t2", "t1"]
+        assert traces[1]["span_count"] == 2
+
+    def test_partial_trailing_line_waits_for_newline(self, tmp_path):
+        f = tmp_path / f"{DAY}.jsonl"
+        _write(
+            f,
+            _span("t1", "s1", 1706400000),
+            _span("t2", "s2", 1706400001),
+            trailing_newline=False,
+        )
+        index = TraceIndex(tmp_path)
+
+        assert [t["trace_id"] for t in index.read_traces(DAY)] == ["t1"]
+
+        _append(f, "")
+        assert [t["trace_id"] for t in index.read_traces(DAY)] == ["t2", "t1"]
+
+    def test_rewritten_file_is_reindexed(self, tmp_path):
+        f = tmp_path / f"{DAY}.jsonl"
+        _write(f, _span("t1", "s1", 1706400000), _span("t2", "s2", 1706400001))
+        index = TraceIndex(tmp_path)
+        index.ingest(DAY)
+
+        _write(f, _span("t9", "s9", 1706400000))
+        assert [t["trace_id"] for t in index.read_traces(DAY)] == ["t9"]
+
+        f.unlink()
+        assert index.read_traces(DAY) == []
+
+    def test_rotated_and_compressed_segments(self, tmp_path):
+        f = tmp_path / f"{DAY}.jsonl"
+        _write(f, _span("t1", "s1", 1706400000), _span("t2", "s2", 1706400001))
+        index = TraceIndex(tmp_path)
+        index.ingest(DAY)
+
+        with open(f, "rb") as src:
+            (tmp_path / f"{DAY}.1.jsonl.gz").write_bytes(gzip.compress(src.read()))
+        f.unlink()
+        _write(f, _span("t1", "s3", 1706400002))
+
+        traces = index.read_traces(DAY, limit=None)
+        assert traces == read_traces_from_jsonl(f, limit=None)
+        assert {t["trace_id"]: t["span_count"] for t in traces} == {"t1": 2, "t2": 1}
+        assert index.ingest(DAY) == 0
+
+
+class TestCounters:
+    def test_tool_error_and_sql_counters(self, tmp_path):
+        f = tmp_path / f"{DAY}.jsonl"
+        _write(
+            f,
+            _span("t1", "s1", 1706400000, attrs={"tool.name": "run_sql", "sql": "SELECT  1"}),
+            _span(
+                "t2",
+                "s2",
+                1706400010,
+                status="ERROR",
+                attrs={"tool.name": "run_sql", "sql": "SELECT 1"},
+            ),
+            _span("t3", "s3", 1706400020, attrs={"tool.name": "shell", "tool.success": False}),
+        )
+        index = TraceIndex(tmp_path)
+
+        tools = index.counters([DAY], COUNTER_TOOL)
+        assert {name: stats["count"] for name, stats in tools.items()} == {
+            "run_sql": 2,
+            "shell": 1,
+        }
+        errors = index.counters([DAY], COUNTER_ERROR)
+        assert {name: stats["count"] for name, stats in errors.items()} == {
+            "run_sql": 1,
+            "shell": 1,
+        }
+        sql = index.counters([DAY], COUNTER_SQL)
+        assert sql["SELECT 1"]["count"] == 2
+        assert sql["SELECT 1"]["first_seen"] == 1706400000
+        assert sql["SELECT 1"]["last_seen"] == 1706400010
+
+    def test_file_counters_span_several_days(self, tmp_path):
+        _write(
+            tmp_path / "2026-01-19.jsonl",
+            _span("t1", "s1", 1706300000, attrs={"tool.name": "protocol_tool"}),
+        )
+        _write(
+            tmp_path / f"{DAY}.jsonl",
+            _span(
+                "t2",
+                "s2",
+                1706400000,
+                attrs={"tool.name": "shell", "command": "cat PROTOCOL.md examples/a.yaml"},
+            ),
+        )
+        index = TraceIndex(tmp_path, connection_path=tmp_path)
+
+        usage = index.counters(["2026-01-19", DAY], COUNTER_FILE)
+
+        assert usage["PROTOCOL.md"]["count"] == 2
+        assert usage["PROTOCOL.md"]["last_seen"] == 1706400000
+        assert usage["examples/a.yaml"]["count"] == 1
+        assert index.counters(["2026-01-19"], COUNTER_FILE).keys() == {"PROTOCOL.md"}
+
+
+def test_context_usage_reads_index_counters(tmp_path):
+    today = datetime.now().strftime("%Y-%m-%d")
+    user_dir = tmp_path / "traces" / "u1"
+    user_dir.mkdir(parents=True)
+    now = int(datetime.now().timestamp())
+    _write(
+        user_dir / f"{today}.jsonl",
+        _span("t1", "s1", now, attrs={"tool.name": "shell", "command": "cat schema/a.yaml"}),
+        _span("t2", "s2", now, attrs={"knowledge.files_used": [str(tmp_path / "schema/a.yaml")]}),
+    )
+
+    usage = get_context_usage(tmp_path, days=1)
+    assert usage["files"]["schema/a.yaml"] == {"count": 2, "lastUsed": now}
+    assert usage["folders"]["schema"]["count"] == 2
+
+    _append(
+        user_dir / f"{today}.jsonl", _span("t3", "s3", now, attrs={"path": "domain/model.md"})
+    )
+    usage = get_context_usage(tmp_path, days=1)
+    assert usage["files"]["domain/model.md"]["count"] == 1
@@ -4,10 +4,13 @@ Tests the JSONL reader, date listing, active connection path resolution,
 and SQL extraction from span attributes.
 """
 
+import gzip
 import json
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
+from opentelemetry.sdk.trace.export import SpanExportResult
 
 import db_mcp.traces as trace_capture
 from db_mcp.traces_reader import (
@@ -15,6 +18,7 @@ from db_mcp.traces_reader import (
     analyze_traces,
     list_trace_dates,
     read_traces_from_jsonl,
+    trace_day_segments,
 )
 
 # ========== list_trace_dates ==========
@@ -342,6 +346,116 @@ class TestTraceCaptureDefaults:
         assert exporter.user_id == "abcd1234"
         set_user_id.assert_called_once_with("abcd1234")
 
+    def test_setup_trace_exporter_defaults_to_plain_synchronous_jsonl(self, tmp_path):
+        with (
+            patch("db_mcp.traces.is_traces_enabled", return_value=True),
+            patch("db_mcp.traces.get_user_id_from_config", return_value="abcd1234"),
+            patch("db_mcp.config.CONFIG_FILE", tmp_path / "missing.yaml"),
+        ):
+            exporter = trace_capture.setup_trace_exporter(tmp_path)
+
+        assert exporter.buffered is False
+        assert exporter.rotate_bytes == 0
+        assert exporter.compression == "none"
+
+
+# ========== buffered exporter, rotation and compressed segments ==========
+
+
+def _otel_span(index, trace_id=1):
+    start = 1706400000_000_000_000 + index * 1_000_000
+    return SimpleNamespace(
+        start_time=start,
+        end_time=start + 5_000_000,
+        name=f"span-{index}",
+        context=SimpleNamespace(trace_id=trace_id, span_id=index + 1),
+        parent=None,
+        status=SimpleNamespace(status_code=SimpleNamespace(name="OK")),
+        attributes={"tool.name": "run_sql", "index": index},
+        events=[],
+    )
+
+
+class TestTraceSegments:
+    def test_list_trace_dates_includes_rotated_segments(self, tmp_path):
+        traces_dir = tmp_path / "traces" / "abc123"
+        traces_dir.mkdir(parents=True)
+
+        (traces_dir / "2026-01-20.1.jsonl.gz").write_bytes(gzip.compress(b""))
+        (traces_dir / "2026-01-21.jsonl.gz").write_bytes(gzip.compress(b""))
+        (traces_dir / "2026-01-21.2.jsonl").write_text("")
+
+        assert list_trace_dates(tmp_path, "abc123") == ["2026-01-21", "2026-01-20"]
+
+    def test_day_file_reads_every_segment(self, tmp_path):
+        (tmp_path / "2026-01-20.1.jsonl.gz").write_bytes(
+            gzip.compress((_make_span(trace_id="t1", span_id="s1") + "\n").encode())
+        )
+        (tmp_path / "2026-01-20.2.jsonl").write_text(
+            _make_span(trace_id="t2", span_id="s2") + "\n"
+        )
+        (tmp_path / "2026-01-20.jsonl").write_text(
+            _make_span(trace_id="t1", span_id="s3", parent_id="s1") + "\n"
+        )
+
+        traces = read_traces_from_jsonl(tmp_path / "2026-01-20.jsonl", limit=None)
+
+        assert {t["trace_id"]: t["span_count"] for t in traces} == {"t1": 2, "t2": 1}
+
+    def test_prefers_compressed_copy_of_a_segment(self, tmp_path):
+        line = (_make_span(trace_id="t1", span_id="s1") + "\n").encode()
+        (tmp_path / "2026-01-20.1.jsonl").write_bytes(line)
+        (tmp_path / "2026-01-20.1.jsonl.gz").write_bytes(gzip.compress(line))
+
+        assert [p.name for p in trace_day_segments(tmp_path, "2026-01-20")] == [
+            "2026-01-20.1.jsonl.gz"
+        ]
+        assert read_traces_from_jsonl(tmp_path / "2026-01-20.jsonl")[0]["span_count"] == 1
+
+
+class TestBufferedExporter:
+    def test_buffered_writes_rotate_and_compress(self, tmp_path):
+        exporter = trace_capture.JSONLSpanExporter(
+            tmp_path, "u1", buffered=True, rotate_bytes=1500, compression="gzip"
+        )
+        for index in range(30):
+            assert exporter.export([_otel_span(index)]) is SpanExportResult.SUCCESS
+        assert exporter.force_flush() is True
+        exporter.shutdown()
+
+        traces_dir = tmp_path / "traces" / "u1"
+        names = sorted(p.name for p in traces_dir.iterdir())
+        assert any(name.endswith(".1.jsonl.gz") for name in names)
+        assert not any(name.endswith(".1.jsonl") for name in names)
+
+        day = list_trace_dates(tmp_path, "u1")[0]
+        traces = read_traces_from_jsonl(traces_dir / f"{day}.jsonl", limit=None)
+        assert sum(t["span_count"] for t in traces) == 30
+        assert exporter.dropped_spans == 0
+
+    def test_full_queue_drops_and_counts(self, tmp_path):
+        exporter = trace_capture.JSONLSpanExporter(tmp_path, "u1", buffered=True, max_queue_size=2)
+        with exporter._write_lock:  # stall the writer thread
+            for index in range(20):
+                exporter.export([_otel_span(index)])
+            dropped = exporter.dropped_spans
+        exporter.shutdown()
+
+        assert dropped > 0
+        day = list_trace_dates(tmp_path, "u1")[0]
+        traces = read_traces_from_jsonl(tmp_path / "traces" / "u1" / f"{day}.jsonl")
+        assert sum(t["span_count"] for t in traces) == 20 - dropped
+
+    def test_unbuffered_export_writes_synchronously(self, tmp_path):
+        exporter = trace_capture.JSONLSpanExporter(tmp_path, "u1")
+
+        exporter.export([_otel_span(0), _otel_span(1)])
+
+        (trace_file,) = (tmp_path / "traces" / "u1").glob("*.jsonl")
+        records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+        assert [r["name"] for r in records] == ["span-0", "span-1"]
+        assert records[0]["trace_id"] == format(1, "032x")
+
 
 # ========== _extract_sql ==========
 
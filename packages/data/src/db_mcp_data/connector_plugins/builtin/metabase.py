@@ -36,7 +36,7 @@ class MetabasePluginConnector(CatalogRoutingAPIConnector):
         try:
             headers = self._resolve_auth_headers()
             params = self._resolve_auth_params()
-            resp = self._requests().request(
+            resp = self.session.request(
                 method="GET",
                 url=self.api_config.base_url.rstrip("/") + "/api/user/current",
                 headers=headers,
@@ -114,7 +114,7 @@ class MetabasePluginConnector(CatalogRoutingAPIConnector):
         headers = self._resolve_auth_headers()
         params = self._resolve_auth_params()
         url = self.api_config.base_url.rstrip("/") + "/api/database"
-        resp = self._requests().get(url, headers=headers, params=params, timeout=30)
+        resp = self.session.get(url, headers=headers, params=params, timeout=self._timeout())
         resp.raise_for_status()
         payload = resp.json()
 
@@ -189,14 +189,18 @@ class MetabasePluginConnector(CatalogRoutingAPIConnector):
         primary_url = f"{base_url}/api/database/{route.database_id}/schema"
 
         try:
-            resp = self._requests().get(primary_url, headers=headers, params=params, timeout=30)
+            resp = self.session.get(
+                primary_url, headers=headers, params=params, timeout=self._timeout()
+            )
             resp.raise_for_status()
             rows = self._normalize_schema_rows(resp.json())
         except self._requests().exceptions.HTTPError as exc:
             if exc.response is None or exc.response.status_code != 404:
                 raise
             fallback_url = f"{base_url}/api/database/{route.database_id}/metadata"
-            resp = self._requests().get(fallback_url, headers=headers, params=params, timeout=30)
+            resp = self.session.get(
+                fallback_url, headers=headers, params=params, timeout=self._timeout()
+            )
             resp.raise_for_status()
             rows = self._normalize_schema_rows(resp.json())
 
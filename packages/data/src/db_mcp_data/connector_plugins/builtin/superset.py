@@ -46,7 +46,9 @@ class SupersetPluginConnector(CatalogRoutingAPIConnector):
         headers = self._resolve_auth_headers()
         base_url = self.api_config.base_url.rstrip("/")
 
-        db_resp = self._requests().get(f"{base_url}/api/v1/database/", headers=headers, timeout=30)
+        db_resp = self.session.get(
+            f"{base_url}/api/v1/database/", headers=headers, timeout=self._timeout()
+        )
         db_resp.raise_for_status()
         databases = [
             item for item in self._extract_list_payload(db_resp.json()) if isinstance(item, dict)
@@ -72,10 +74,10 @@ class SupersetPluginConnector(CatalogRoutingAPIConnector):
             if item.get("allow_multi_catalog"):
                 catalogs_url = f"{base_url}/api/v1/database/{database_id}/catalogs/"
                 try:
-                    catalogs_resp = self._requests().get(
+                    catalogs_resp = self.session.get(
                         catalogs_url,
                         headers=headers,
-                        timeout=30,
+                        timeout=self._timeout(),
                     )
                     catalogs_resp.raise_for_status()
                     sql_catalogs = self._extract_catalog_strings(catalogs_resp.json())
@@ -132,7 +134,7 @@ class SupersetPluginConnector(CatalogRoutingAPIConnector):
             f"{self.api_config.base_url.rstrip('/')}/api/v1/database/"
             f"{route.database_id}/schemas/"
         )
-        resp = self._requests().get(url, headers=headers, params=params, timeout=30)
+        resp = self.session.get(url, headers=headers, params=params, timeout=self._timeout())
         resp.raise_for_status()
         schemas = sorted(self._extract_catalog_strings(resp.json())) or [None]
         self._schemas_by_catalog[route.alias] = schemas
@@ -155,7 +157,7 @@ class SupersetPluginConnector(CatalogRoutingAPIConnector):
             params["catalog"] = route.sql_catalog
 
         url = f"{self.api_config.base_url.rstrip('/')}/api/v1/database/{route.database_id}/tables/"
-        resp = self._requests().get(url, headers=headers, params=params, timeout=30)
+        resp = self.session.get(url, headers=headers, params=params, timeout=self._timeout())
         resp.raise_for_status()
 
         rows: list[dict[str, Any]] = []
@@ -201,7 +203,7 @@ class SupersetPluginConnector(CatalogRoutingAPIConnector):
             f"{self.api_config.base_url.rstrip('/')}/api/v1/database/"
             f"{route.database_id}/table_metadata/"
         )
-        resp = self._requests().get(url, headers=headers, params=params, timeout=30)
+        resp = self.session.get(url, headers=headers, params=params, timeout=self._timeout())
         resp.raise_for_status()
         payload = resp.json()
 
@@ -21,6 +21,11 @@ from db_mcp_data.connectors.api import (
     APIQueryParamConfig,
     build_api_connector_config,
 )
+from db_mcp_data.connectors.cache import (
+    ConnectorCache,
+    get_cached_connector,
+    invalidate_connector_cache,
+)
 from db_mcp_data.connectors.file import FileConnector, FileConnectorConfig, FileSourceConfig
 from db_mcp_data.connectors.sql import SQLConnector, SQLConnectorConfig
 from db_mcp_data.contracts.connector_contracts import (
@@ -294,14 +299,17 @@ __all__ = [
     "APIPaginationConfig",
     "APIQueryParamConfig",
     "Connector",
+    "ConnectorCache",
     "ConnectorConfig",
     "FileConnector",
     "FileConnectorConfig",
     "FileSourceConfig",
+    "get_cached_connector",
     "get_connector_capabilities",
     "get_connector_profile",
     "normalize_capabilities",
     "SQLConnector",
     "SQLConnectorConfig",
     "get_connector",
+    "invalidate_connector_cache",
 ]
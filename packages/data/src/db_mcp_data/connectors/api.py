@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
@@ -13,18 +16,21 @@ import yaml
 
 from db_mcp_data.connector_plugins.compat import normalize_connector_payload
 from db_mcp_data.connectors import api_auth as _api_auth
+from db_mcp_data.connectors import api_http as _api_http
+from db_mcp_data.connectors import api_incremental as _api_inc
 from db_mcp_data.connectors import api_pagination as _api_pg
 from db_mcp_data.connectors.api_config import (
     APIAuthConfig,
     APIConnectorConfig,
     APIEndpointConfig,
+    APIHTTPConfig,
     APIPaginationConfig,
     APIQueryParamConfig,
     build_api_connector_config,
 )
 from db_mcp_data.connectors.api_discovery import discover_api, discover_openapi_spec
 from db_mcp_data.connectors.api_schema import map_schema_type as _schema_map_type
-from db_mcp_data.connectors.file import FileConnector, FileConnectorConfig
+from db_mcp_data.connectors.file import FileConnector, FileConnectorConfig, FileSourceConfig
 from db_mcp_data.contracts.connector_contracts import CONNECTOR_SPEC_VERSION
 
 # Re-export config types so existing callers importing from this module continue to work.
@@ -32,6 +38,7 @@ __all__ = [
     "APIAuthConfig",
     "APIConnectorConfig",
     "APIEndpointConfig",
+    "APIHTTPConfig",
     "APIPaginationConfig",
     "APIQueryParamConfig",
     "build_api_connector_config",
@@ -63,11 +70,68 @@ class APIConnector:
         self._jwt_token: str | None = None
         self._jwt_expires: float = 0.0
         self._schema_cache: list[dict[str, Any]] | None = None
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+        self._rate_limiter = _api_http.TokenBucket(
+            api_config.rate_limit_rps, api_config.rate_limit_burst
+        )
+        self._inflight = threading.BoundedSemaphore(self._max_concurrency())
+        self._auth_lock = threading.RLock()
+        self._sync_state = _api_inc.SyncState(self._data_dir)
 
         # Delegate DuckDB query capabilities to an internal FileConnector
-        file_config = FileConnectorConfig(directory=str(self._data_dir))
+        file_config = FileConnectorConfig(
+            sources=self._dataset_sources(), directory=str(self._data_dir)
+        )
         self._file_connector = FileConnector(file_config)
 
+    @property
+    def data_dir(self) -> Path:
+        """Directory holding the synced JSONL files queried through DuckDB."""
+        return self._data_dir
+
+    def invalidate_cache(self) -> None:
+        """Re-discover synced files and rebuild DuckDB views on the next query."""
+        self._file_connector.config.sources = self._dataset_sources()
+        self._file_connector.invalidate_cache()
+
+    def _dataset_sources(self) -> list[FileSourceConfig]:
+        """Parquet part-file sources for incremental endpoints that have been synced."""
+        sources = []
+        for ep in self.api_config.endpoints:
+            if ep.incremental_field:
+                source = _api_inc.dataset_source(self._data_dir, ep.name, ep.primary_key)
+                if source is not None:
+                    sources.append(source)
+        return sources
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive HTTP session shared by every request this connector makes."""
+        session = self._session
+        if session is None:
+            # Sync workers may all reach here first; only one session is built.
+            with self._session_lock:
+                if self._session is None:
+                    self._session = _api_http.build_session(self.api_config.http)
+                session = self._session
+        return session
+
+    def close(self) -> None:
+        """Close pooled HTTP connections (a new session is opened on next use)."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def _max_concurrency(self) -> int:
+        return max(1, self.api_config.http.max_concurrency)
+
+    def _timeout(self, *, execution: bool = False) -> tuple[float, float]:
+        """``(connect, read)`` timeout; *execution* selects the SQL execution read timeout."""
+        http = self.api_config.http
+        return _api_http.request_timeout(http, http.execution_timeout if execution else None)
+
     @staticmethod
     def _format_api_error(error: Any, default: str) -> str:
         """Convert structured API error payloads into readable messages."""
@@ -105,9 +169,11 @@ class APIConnector:
             self._jwt_login()
             return self._jwt_token  # type: ignore[return-value]
 
-        return _api_auth.resolve_auth_headers(
-            self.api_config, self._env_path, self._data_dir, self._jwt_token, _login_fn
-        )
+        # Serialized so parallel sync workers share one login instead of racing.
+        with self._auth_lock:
+            return _api_auth.resolve_auth_headers(
+                self.api_config, self._env_path, self._data_dir, self._jwt_token, _login_fn
+            )
 
     def _resolve_basic_credentials(self) -> tuple[str, str]:
         """Resolve username/password for basic auth from env or literal aliases."""
@@ -117,7 +183,9 @@ class APIConnector:
 
     def _jwt_login(self) -> None:
         """Perform JWT login: POST creds to login endpoint, cache token."""
-        token, expires_at = _api_auth.jwt_login(self.api_config, self._env_path, self._data_dir)
+        token, expires_at = _api_auth.jwt_login(
+            self.api_config, self._env_path, self._data_dir, session=self.session
+        )
         self._jwt_token = token
         self._jwt_expires = expires_at
 
@@ -147,7 +215,7 @@ class APIConnector:
         query_params: dict[str, str] | None = None,
         body: dict | None = None,
     ) -> Any:
-        """Send an HTTP request using requests.request.
+        """Send an HTTP request through the connector's pooled session.
 
         GET: params as query string, no body.
         POST/PUT/PATCH/DELETE: body as JSON, params as query string.
@@ -157,11 +225,11 @@ class APIConnector:
             "url": url,
             "headers": headers,
             "params": query_params or {},
-            "timeout": 30,
+            "timeout": self._timeout(),
         }
         if body is not None:
             kwargs["json"] = body
-        resp = requests.request(**kwargs)
+        resp = self.session.request(**kwargs)
         resp.raise_for_status()
         return resp.json()
 
@@ -212,12 +280,14 @@ class APIConnector:
                 "url": url,
                 "headers": headers,
                 "params": params,
-                "timeout": 10,
+                "timeout": _api_http.request_timeout(
+                    self.api_config.http, min(10.0, self.api_config.http.timeout)
+                ),
             }
             if body is not None:
                 request_kwargs["json"] = body
 
-            resp = requests.request(**request_kwargs)
+            resp = self.session.request(**request_kwargs)
             resp.raise_for_status()
 
             return {
@@ -239,6 +309,7 @@ class APIConnector:
                     headers,
                     self.api_config.rate_limit_rps,
                     spec_url=self.api_config.spec_url or None,
+                    session=self.session,
                 )
                 if spec is not None and discovered_spec_url:
                     return {
@@ -259,14 +330,19 @@ class APIConnector:
 
     # -- Sync ---------------------------------------------------------------
 
-    def sync(self, endpoint_name: str | None = None) -> dict[str, Any]:
+    def sync(self, endpoint_name: str | None = None, *, full: bool = False) -> dict[str, Any]:
         """Fetch data from API endpoints and write JSONL files.
 
+        Endpoints with ``incremental_field`` set only fetch records past their
+        stored watermark and append them as Parquet parts (see ``api_incremental``).
+
         Args:
             endpoint_name: Sync specific endpoint, or all if None.
+            full: Drop incremental watermarks and refetch everything.
 
         Returns:
-            {"synced": [...], "rows_fetched": {...}, "errors": [...]}
+            {"synced": [...], "rows_fetched": {...}, "errors": [...]}, plus
+            "watermarks" when incremental endpoints were synced.
         """
         endpoints = self.api_config.endpoints
         if endpoint_name:
@@ -276,30 +352,109 @@ class APIConnector:
         rows_fetched: dict[str, int] = {}
         errors: list[str] = []
 
-        for ep in endpoints:
-            try:
-                rows = self._fetch_endpoint(ep)
-                self._write_jsonl(ep.name, rows)
-                synced.append(ep.name)
-                rows_fetched[ep.name] = len(rows)
-            except Exception as exc:
-                errors.append(f"{ep.name}: {exc}")
+        def sync_endpoint(ep: APIEndpointConfig) -> int:
+            if ep.incremental_field:
+                return self._sync_incremental(ep, full=full)
+            rows = self._fetch_endpoint(ep)
+            self._write_jsonl(ep.name, rows)
+            return len(rows)
+
+        # Endpoints sync in parallel; the shared rate limiter still paces requests.
+        workers = min(self._max_concurrency(), len(endpoints)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-mcp-api-sync") as pool:
+            futures = [(ep, pool.submit(sync_endpoint, ep)) for ep in endpoints]
+            for ep, future in futures:
+                try:
+                    rows_fetched[ep.name] = future.result()
+                    synced.append(ep.name)
+                except Exception as exc:
+                    errors.append(f"{ep.name}: {exc}")
 
         # Invalidate cached DuckDB connection so views refresh with new JSONL files
-        self._file_connector.invalidate_cache()
+        self.invalidate_cache()
+        if synced:
+            # Lazy import: the execution package imports connectors at load time.
+            from db_mcp_data.execution.result_cache import invalidate_result_cache
 
-        return {
+            # Connection layout is <connection>/data, so the parent keys the cache.
+            invalidate_result_cache(self._data_dir.parent)
+
+        result: dict[str, Any] = {
             "synced": synced,
             "rows_fetched": rows_fetched,
             "errors": errors,
         }
+        watermarks = {
+            ep.name: self._sync_state.get(ep.name).get("watermark")
+            for ep in endpoints
+            if ep.incremental_field and ep.name in synced
+        }
+        if watermarks:
+            result["watermarks"] = watermarks
+        return result
+
+    def _sync_incremental(self, ep: APIEndpointConfig, *, full: bool = False) -> int:
+        """Fetch records at or past the endpoint's watermark into a new Parquet part."""
+        field_name = ep.incremental_field
+        directory = _api_inc.dataset_dir(self._data_dir, ep.name)
+        state = self._sync_state.get(ep.name)
+        if full or state.get("field") != field_name:
+            # No usable watermark: parts from an earlier run would shadow the refetch.
+            for part in _api_inc.list_parts(directory):
+                part.unlink()
+            state = {}
+        watermark = state.get("watermark")
+
+        params: dict[str, str] = {}
+        if watermark is not None and ep.incremental_param:
+            params[ep.incremental_param] = str(watermark)
+        rows = self._fetch_endpoint(ep, params)
+        if watermark is not None:
+            # Records at the watermark are refetched on purpose: others may share
+            # its value. APIs without a server-side filter return everything.
+            # Records without the field were stored by the first sync and cannot
+            # be placed after the watermark, so they are not appended again.
+            rows = [
+                row
+                for row in rows
+                if row.get(field_name) is not None
+                and _api_inc.at_or_after(row[field_name], watermark)
+            ]
+
+        # Parts left by a sync that died before saving state must not be overwritten.
+        seq = max(int(state.get("seq", 0)), _api_inc.last_part_seq(directory))
+        columns = state.get("columns") or {}
+        if rows:
+            seq += 1
+            columns = _api_inc.write_part(directory, seq, rows, ep.primary_key, columns)
+            if len(_api_inc.list_parts(directory)) >= _api_inc.COMPACT_AFTER_PARTS:
+                seq += 1
+                _api_inc.compact(directory, seq, ep.primary_key)
+        # A full-refresh JSONL from before incremental mode would shadow the dataset.
+        (self._data_dir / f"{ep.name}.jsonl").unlink(missing_ok=True)
+        self._sync_state.update(
+            ep.name,
+            {
+                "field": field_name,
+                "watermark": _api_inc.next_watermark(rows, field_name, watermark),
+                "seq": seq,
+                "columns": columns,
+            },
+        )
+        return len(rows)
 
-    def _fetch_endpoint(self, endpoint: APIEndpointConfig) -> list[dict]:
-        """Fetch all data from an endpoint, handling pagination."""
+    def _fetch_endpoint(
+        self, endpoint: APIEndpointConfig, params: dict[str, str] | None = None
+    ) -> list[dict]:
+        """Fetch all data from an endpoint, handling pagination.
+
+        *params* are extra query parameters (e.g. an incremental watermark).
+        """
         if endpoint.method.upper() != "GET":
             raise ValueError("sync only supports GET endpoints")
         headers = self._resolve_auth_headers()
         base_params = self._resolve_auth_params()
+        base_params.update(params or {})
         base_params.update(self._runtime_path_params(endpoint.path))
         rendered_path, base_params = self._render_path(endpoint.path, base_params)
         url = self.api_config.base_url.rstrip("/") + rendered_path
@@ -310,13 +465,13 @@ class APIConnector:
         elif pg.type == "cursor":
             return self._fetch_cursor(url, headers, base_params, pg)
         elif pg.type == "offset":
-            return self._fetch_offset(url, headers, base_params, pg)
+            return self._fetch_offset_pages(url, headers, base_params, pg)
         else:
             return self._fetch_single(url, headers, base_params)
 
     def _fetch_single(self, url: str, headers: dict, params: dict) -> list[dict]:
         """Fetch a single page (no pagination)."""
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = self.session.get(url, headers=headers, params=params, timeout=self._timeout())
         resp.raise_for_status()
         body = resp.json()
         if isinstance(body, list):
@@ -349,10 +504,7 @@ class APIConnector:
             params[pg.page_size_param] = str(pg.page_size)
 
         while True:
-            self._rate_limit()
-            resp = requests.get(url, headers=headers, params=dict(params), timeout=30)
-            resp.raise_for_status()
-            body = resp.json()
+            body = self._get_json(url, headers, dict(params))
 
             data = self._extract_response_rows(body, pg)
             all_rows.extend(data)
@@ -369,37 +521,58 @@ class APIConnector:
 
         return all_rows
 
-    def _fetch_offset(
+    def _fetch_offset_pages(
         self,
         url: str,
         headers: dict,
         base_params: dict,
         pg: APIPaginationConfig,
+        max_pages: int | None = None,
     ) -> list[dict]:
-        """Fetch all pages using offset-based pagination."""
-        all_rows: list[dict] = []
-        offset = 0
+        """Fetch offset-paginated pages, prefetching later pages concurrently.
+
+        Page offsets are known up front (``offset + n * page_size``), so after a
+        full page the next window of pages is requested in parallel. The window
+        starts at one page and doubles up to ``http.max_concurrency``, so a result
+        that fits in one page costs no extra request; pages past the end are dropped.
+        """
         params = dict(base_params)
         if pg.page_size_param:
             params[pg.page_size_param] = str(pg.page_size)
+        page_size = max(pg.page_size, 1)
 
-        while True:
-            self._rate_limit()
-            params[pg.offset_param] = str(offset)
-            resp = requests.get(url, headers=headers, params=dict(params), timeout=30)
-            resp.raise_for_status()
-            body = resp.json()
-
-            data = self._extract_response_rows(body, pg)
-            if not data:
-                break
-
-            all_rows.extend(data)
-            offset += len(data)
-
-            if len(data) < pg.page_size:
-                break
+        def fetch(page_offset: int) -> list[dict]:
+            page_params = {**params, pg.offset_param: str(page_offset)}
+            return self._extract_response_rows(self._get_json(url, headers, page_params), pg)
 
+        all_rows: list[dict] = []
+        offset = 0
+        pages = 0
+        window = 1
+        concurrency = self._max_concurrency()
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="db-mcp-api-page"
+        ) as pool:
+            while max_pages is None or pages < max_pages:
+                size = window if max_pages is None else min(window, max_pages - pages)
+                futures = [pool.submit(fetch, offset + i * page_size) for i in range(size)]
+                try:
+                    for future in futures:
+                        data = future.result()
+                        pages += 1
+                        if not data:
+                            return all_rows
+                        all_rows.extend(data)
+                        offset += len(data)
+                        if len(data) < page_size:
+                            return all_rows
+                        if len(data) > page_size:
+                            # Server ignored the page size; later offsets are wrong.
+                            break
+                finally:
+                    for future in futures:
+                        future.cancel()
+                window = min(window * 2, concurrency)
         return all_rows
 
     @staticmethod
@@ -408,10 +581,16 @@ class APIConnector:
         return _api_pg.extract_cursor(data, cursor_field)
 
     def _rate_limit(self) -> None:
-        """Simple rate limiting between requests."""
-        if self.api_config.rate_limit_rps > 0:
-            delay = 1.0 / self.api_config.rate_limit_rps
-            time.sleep(delay)
+        """Wait for a slot in the connector-wide token bucket (``rate_limit`` config)."""
+        self._rate_limiter.acquire()
+
+    def _get_json(self, url: str, headers: dict, params: dict) -> Any:
+        """Rate-limited GET returning the decoded body; safe to call from worker threads."""
+        self._rate_limit()
+        with self._inflight:
+            resp = self.session.get(url, headers=headers, params=params, timeout=self._timeout())
+        resp.raise_for_status()
+        return resp.json()
 
     def _write_jsonl(self, name: str, rows: list[dict]) -> None:
         """Write rows as JSONL to the data directory."""
@@ -738,12 +917,15 @@ class APIConnector:
         if body:
             body = {key: value for key, value in body.items() if value is not None}
         try:
-            request_kwargs: dict[str, Any] = {"headers": headers, "timeout": 60}
+            request_kwargs: dict[str, Any] = {
+                "headers": headers,
+                "timeout": self._timeout(execution=True),
+            }
             if query_params:
                 request_kwargs["params"] = query_params
             if body:
                 request_kwargs["json"] = body
-            resp = requests.post(url, **request_kwargs)
+            resp = self.session.post(url, **request_kwargs)
             resp.raise_for_status()
             response = resp.json()
         except requests.exceptions.HTTPError as exc:
@@ -754,12 +936,12 @@ class APIConnector:
             ):
                 self._jwt_refresh()
                 headers = self._resolve_auth_headers()
-                request_kwargs = {"headers": headers, "timeout": 60}
+                request_kwargs = {"headers": headers, "timeout": self._timeout(execution=True)}
                 if query_params:
                     request_kwargs["params"] = query_params
                 if body:
                     request_kwargs["json"] = body
-                resp = requests.post(url, **request_kwargs)
+                resp = self.session.post(url, **request_kwargs)
                 resp.raise_for_status()
                 response = resp.json()
             else:
@@ -796,7 +978,7 @@ class APIConnector:
         status_path = status_endpoint.path.replace("{execution_id}", execution_id)
         status_url = self.api_config.base_url.rstrip("/") + status_path
         try:
-            status_resp = requests.get(status_url, headers=headers, timeout=30)
+            status_resp = self.session.get(status_url, headers=headers, timeout=self._timeout())
             status_resp.raise_for_status()
             status_data = status_resp.json()
         except requests.exceptions.HTTPError as exc:
@@ -807,7 +989,9 @@ class APIConnector:
             ):
                 self._jwt_refresh()
                 headers = self._resolve_auth_headers()
-                status_resp = requests.get(status_url, headers=headers, timeout=30)
+                status_resp = self.session.get(
+                    status_url, headers=headers, timeout=self._timeout()
+                )
                 status_resp.raise_for_status()
                 status_data = status_resp.json()
             else:
@@ -834,7 +1018,9 @@ class APIConnector:
         results_path = results_endpoint.path.replace("{execution_id}", execution_id)
         results_url = self.api_config.base_url.rstrip("/") + results_path
         try:
-            results_resp = requests.get(results_url, headers=headers, timeout=60)
+            results_resp = self.session.get(
+                results_url, headers=headers, timeout=self._timeout(execution=True)
+            )
             results_resp.raise_for_status()
             results_data = results_resp.json()
         except requests.exceptions.HTTPError as exc:
@@ -845,7 +1031,9 @@ class APIConnector:
             ):
                 self._jwt_refresh()
                 headers = self._resolve_auth_headers()
-                results_resp = requests.get(results_url, headers=headers, timeout=60)
+                results_resp = self.session.get(
+                    results_url, headers=headers, timeout=self._timeout(execution=True)
+                )
                 results_resp.raise_for_status()
                 results_data = results_resp.json()
             else:
@@ -1197,8 +1385,12 @@ class APIConnector:
             }
             # url_params carries auth query params (e.g. api-key) — must be in the URL,
             # not the JSON body.
-            resp = requests.post(
-                url, headers=headers, json=envelope, params=url_params or {}, timeout=30
+            resp = self.session.post(
+                url,
+                headers=headers,
+                json=envelope,
+                params=url_params or {},
+                timeout=self._timeout(),
             )
             resp.raise_for_status()
             body = resp.json()
@@ -1208,9 +1400,11 @@ class APIConnector:
                 raise RuntimeError(f"JSON-RPC error: {msg}")
             return body.get("result")
         if endpoint.body_mode == "json":
-            resp = requests.post(url, headers=headers, json=params, params={}, timeout=30)
+            resp = self.session.post(
+                url, headers=headers, json=params, params={}, timeout=self._timeout()
+            )
         else:
-            resp = requests.post(url, headers=headers, params=params, timeout=30)
+            resp = self.session.post(url, headers=headers, params=params, timeout=self._timeout())
         resp.raise_for_status()
         return resp.json()
 
@@ -1221,14 +1415,17 @@ class APIConnector:
         params: dict[str, str],
         ids: list[str],
     ) -> list[dict]:
-        """Fetch individual records by ID from detail endpoints."""
+        """Fetch individual records by ID from detail endpoints, several at a time."""
+
+        def fetch(record_id: str) -> Any:
+            return self._get_json(base_url.rstrip("/") + "/" + str(record_id), headers, params)
+
+        workers = min(self._max_concurrency(), len(ids)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-mcp-api-ids") as pool:
+            bodies = list(pool.map(fetch, ids))
+
         rows: list[dict] = []
-        for record_id in ids:
-            self._rate_limit()
-            url = base_url.rstrip("/") + "/" + str(record_id)
-            resp = requests.get(url, headers=headers, params=params, timeout=30)
-            resp.raise_for_status()
-            body = resp.json()
+        for body in bodies:
             if isinstance(body, dict):
                 rows.append(body)
             elif isinstance(body, list):
@@ -1252,7 +1449,7 @@ class APIConnector:
             return self._fetch_cursor_paged(url, headers, params, pg, max_pages)
 
         if pg.type == "offset":
-            return self._fetch_offset_paged(url, headers, params, pg, max_pages)
+            return self._fetch_offset_pages(url, headers, params, pg, max_pages)
 
         # Fallback: single fetch
         return self._fetch_single(url, headers, params)
@@ -1272,10 +1469,7 @@ class APIConnector:
             params[pg.page_size_param] = str(pg.page_size)
 
         for _ in range(max_pages):
-            self._rate_limit()
-            resp = requests.get(url, headers=headers, params=dict(params), timeout=30)
-            resp.raise_for_status()
-            body = resp.json()
+            body = self._get_json(url, headers, dict(params))
 
             data = self._extract_response_rows(body, pg)
             all_rows.extend(data)
@@ -1292,40 +1486,6 @@ class APIConnector:
 
         return all_rows
 
-    def _fetch_offset_paged(
-        self,
-        url: str,
-        headers: dict[str, str],
-        base_params: dict[str, str],
-        pg: APIPaginationConfig,
-        max_pages: int,
-    ) -> list[dict]:
-        """Fetch pages using offset pagination with a page cap."""
-        all_rows: list[dict] = []
-        offset = 0
-        params = dict(base_params)
-        if pg.page_size_param:
-            params[pg.page_size_param] = str(pg.page_size)
-
-        for _ in range(max_pages):
-            self._rate_limit()
-            params[pg.offset_param] = str(offset)
-            resp = requests.get(url, headers=headers, params=dict(params), timeout=30)
-            resp.raise_for_status()
-            body = resp.json()
-
-            data = self._extract_response_rows(body, pg)
-            if not data:
-                break
-
-            all_rows.extend(data)
-            offset += len(data)
-
-            if len(data) < pg.page_size:
-                break
-
-        return all_rows
-
     # -- Discovery ----------------------------------------------------------
 
     def discover(self) -> dict[str, Any]:
@@ -1349,6 +1509,7 @@ class APIConnector:
             auth_params=auth_params,
             rate_limit_rps=self.api_config.rate_limit_rps,
             spec_url=self.api_config.spec_url or None,
+            session=self.session,
         )
 
         existing_endpoints = list(self.api_config.endpoints)
@@ -1520,6 +1681,23 @@ class APIConnector:
                         "response_mode": ep.response_mode,
                         **({"body_template": ep.body_template} if ep.body_template else {}),
                         **({"sql_field": ep.sql_field} if ep.sql_field != "sql" else {}),
+                        **(
+                            {
+                                "incremental_field": ep.incremental_field,
+                                **(
+                                    {"incremental_param": ep.incremental_param}
+                                    if ep.incremental_param
+                                    else {}
+                                ),
+                                **(
+                                    {"primary_key": ep.primary_key}
+                                    if ep.primary_key != "id"
+                                    else {}
+                                ),
+                            }
+                            if ep.incremental_field
+                            else {}
+                        ),
                         **(
                             {
                                 "query_params": [
@@ -1555,9 +1733,16 @@ class APIConnector:
                 },
                 "rate_limit": {
                     "requests_per_second": self.api_config.rate_limit_rps,
+                    **(
+                        {"burst": self.api_config.rate_limit_burst}
+                        if self.api_config.rate_limit_burst != 1
+                        else {}
+                    ),
                 },
             }
         )
+        if self.api_config.http != APIHTTPConfig():
+            data["http"] = asdict(self.api_config.http)
 
         data = normalize_connector_payload(data)
 
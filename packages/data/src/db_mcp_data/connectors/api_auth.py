@@ -127,9 +127,11 @@ def jwt_login(
     api_config: APIConnectorConfig,
     env_path: str | None,
     data_dir: Path,
+    session: requests.Session | None = None,
 ) -> tuple[str, float]:
     """Perform JWT login: POST creds to login endpoint.
 
+    Posts through *session* when given, otherwise through module-level ``requests``.
     Returns ``(token, expires_at)`` tuple.
     """
     auth = api_config.auth
@@ -163,7 +165,8 @@ def jwt_login(
         payload.update(auth.login_body)
         payload["username"] = username
         payload["password"] = password
-    resp = requests.post(login_url, json=payload, timeout=30)
+    timeout = (api_config.http.connect_timeout, api_config.http.timeout)
+    resp = (session or requests).post(login_url, json=payload, timeout=timeout)
     resp.raise_for_status()
     data = resp.json()
 
@@ -76,6 +76,11 @@ class APIEndpointConfig:
     response_mode: str = "data"  # data | raw
     sql_field: str = "sql"  # Field name for SQL in execute_sql endpoints
     rpc_method: str = ""  # JSON-RPC method name (used when body_mode='jsonrpc')
+    # Incremental sync: record field used as the watermark (e.g. updated_at, id).
+    # Empty means every sync refetches the endpoint in full.
+    incremental_field: str = ""
+    incremental_param: str = ""  # query param that receives the watermark
+    primary_key: str = "id"  # de-duplicates re-fetched records across syncs
 
 
 @dataclass
@@ -150,6 +155,20 @@ class APIAuthConfig:
                 # else: plain literal — leave *_env empty, use alias field directly
 
 
+@dataclass
+class APIHTTPConfig:
+    """Connection pooling, retry and timeout settings (``http:`` in connector.yaml)."""
+
+    timeout: float = 30.0  # read timeout for regular requests (seconds)
+    connect_timeout: float = 10.0
+    execution_timeout: float = 60.0  # read timeout for SQL submit/result requests
+    pool_size: int = 10  # keep-alive connections kept per host
+    max_retries: int = 3  # retries on connection errors and retry_statuses
+    backoff_factor: float = 0.5  # exponential backoff base when no Retry-After is sent
+    retry_statuses: list[int] = field(default_factory=lambda: [429, 500, 502, 503, 504])
+    max_concurrency: int = 4  # parallel endpoints / prefetched pages / id lookups in sync
+
+
 @dataclass
 class APIConnectorConfig:
     """Configuration for the API connector."""
@@ -163,6 +182,8 @@ class APIConnectorConfig:
     endpoints: list[APIEndpointConfig] = field(default_factory=list)
     pagination: APIPaginationConfig = field(default_factory=APIPaginationConfig)
     rate_limit_rps: float = 10.0
+    rate_limit_burst: int = 1  # requests allowed back-to-back before pacing kicks in
+    http: APIHTTPConfig = field(default_factory=APIHTTPConfig)
     capabilities: dict[str, Any] = field(default_factory=dict)
     api_title: str = ""  # Display name from discovery
     api_description: str = ""  # Description from API spec
@@ -204,8 +225,16 @@ def build_api_connector_config(data: dict[str, Any]) -> APIConnectorConfig:
         else APIPaginationConfig()
     )
 
+    http_data = data.get("http", {})
+    http = (
+        APIHTTPConfig(**_filter_dataclass_kwargs(APIHTTPConfig, http_data))
+        if http_data
+        else APIHTTPConfig()
+    )
+
     rate_limit = data.get("rate_limit", {})
     rate_limit_rps = rate_limit.get("requests_per_second", 10.0) if rate_limit else 10.0
+    rate_limit_burst = rate_limit.get("burst", 1) if rate_limit else 1
 
     return APIConnectorConfig(
         profile=data.get("profile", ""),
@@ -216,6 +245,8 @@ def build_api_connector_config(data: dict[str, Any]) -> APIConnectorConfig:
         endpoints=endpoints,
         pagination=pagination,
         rate_limit_rps=rate_limit_rps,
+        rate_limit_burst=rate_limit_burst,
+        http=http,
         capabilities=data.get("capabilities", {}) or {},
         api_title=data.get("api_title", ""),
         api_description=data.get("api_description", ""),
@@ -167,9 +167,13 @@ def discover_openapi_spec(
     auth_headers: dict[str, str],
     rate_limit_rps: float,
     spec_url: str | None = None,
+    session: requests.Session | None = None,
 ) -> tuple[dict | None, str | None]:
     """Try well-known paths to find an OpenAPI/Swagger spec.
 
+    Requests go through *session* when given (the connector's pooled session),
+    otherwise through module-level ``requests``.
+
     Returns:
         (spec_dict, spec_url) or (None, None) if not found.
     """
@@ -189,7 +193,7 @@ def discover_openapi_spec(
         if not url or url in seen:
             continue
         seen.add(url)
-        spec = _fetch_spec_candidate(url, auth_headers, delay)
+        spec = _fetch_spec_candidate(url, auth_headers, delay, session)
         if spec is not None:
             return spec, url
 
@@ -206,13 +210,14 @@ def _fetch_spec_candidate(
     url: str,
     auth_headers: dict[str, str],
     delay: float,
+    session: requests.Session | None = None,
 ) -> dict[str, Any] | None:
     """Fetch and parse a candidate OpenAPI/Swagger document URL."""
     try:
         if delay > 0:
             time.sleep(delay)
 
-        resp = requests.get(url, headers=auth_headers, timeout=10)
+        resp = (session or requests).get(url, headers=auth_headers, timeout=10)
         if resp.status_code != 200:
             return None
 
@@ -611,6 +616,7 @@ def probe_endpoints(
     auth_headers: dict[str, str],
     auth_params: dict[str, str],
     rate_limit_rps: float,
+    session: requests.Session | None = None,
 ) -> tuple[list[DiscoveredEndpoint], DiscoveredPagination]:
     """Probe the API by hitting the base_url and common paths.
 
@@ -625,7 +631,7 @@ def probe_endpoints(
     pagination = DiscoveredPagination()
 
     # First, try the base URL itself
-    base_ep, base_pg = _probe_url(base, "/", auth_headers, auth_params, delay)
+    base_ep, base_pg = _probe_url(base, "/", auth_headers, auth_params, delay, session)
     if base_ep:
         endpoints.extend(base_ep)
         if base_pg and base_pg.type != "none":
@@ -634,7 +640,7 @@ def probe_endpoints(
     # Then try common REST paths
     for path in _PROBE_PATHS:
         url = base + path
-        discovered, pg = _probe_url(url, path, auth_headers, auth_params, delay)
+        discovered, pg = _probe_url(url, path, auth_headers, auth_params, delay, session)
         if discovered:
             endpoints.extend(discovered)
             if pg and pg.type != "none" and pagination.type == "none":
@@ -649,13 +655,16 @@ def _probe_url(
     auth_headers: dict[str, str],
     auth_params: dict[str, str],
     delay: float,
+    session: requests.Session | None = None,
 ) -> tuple[list[DiscoveredEndpoint], DiscoveredPagination | None]:
     """Probe a single URL and analyze the response."""
     if delay > 0:
         time.sleep(delay)
 
     try:
-        resp = requests.get(url, headers=auth_headers, params=auth_params, timeout=10)
+        resp = (session or requests).get(
+            url, headers=auth_headers, params=auth_params, timeout=10
+        )
         if resp.status_code != 200:
             return [], None
 
@@ -838,6 +847,7 @@ def discover_api(
     auth_params: dict[str, str],
     rate_limit_rps: float,
     spec_url: str | None = None,
+    session: requests.Session | None = None,
 ) -> DiscoveryResult:
     """Discover API endpoints, pagination, and schema.
 
@@ -853,6 +863,7 @@ def discover_api(
         auth_params: Authentication query params
         rate_limit_rps: Rate limit (requests per second)
         spec_url: Optional explicit OpenAPI document URL
+        session: Optional pooled HTTP session to send requests through
 
     Returns:
         DiscoveryResult with discovered endpoints and config
@@ -866,6 +877,7 @@ def discover_api(
             auth_headers,
             rate_limit_rps,
             spec_url=spec_url,
+            session=session,
         )
     except Exception as exc:
         spec, discovered_spec_url = None, None
@@ -891,7 +903,7 @@ def discover_api(
     # Stage 2b: Probe endpoints (fallback)
     try:
         endpoints, pagination = probe_endpoints(
-            base_url, auth_headers, auth_params, rate_limit_rps
+            base_url, auth_headers, auth_params, rate_limit_rps, session=session
         )
         if endpoints:
             return DiscoveryResult(
@@ -0,0 +1,100 @@
+"""Pooled HTTP session for the API connector.
+
+Every page fetch, status poll and login used to go through module-level
+``requests.get``/``post``, which opens a fresh TCP + TLS connection per call.
+``APIConnector`` now keeps one ``requests.Session`` per connector whose
+adapter holds a keep-alive pool sized from ``http.pool_size`` and retries
+connection errors and ``http.retry_statuses`` with exponential backoff,
+honouring ``Retry-After``.
+
+Requests issued concurrently (parallel endpoint sync, page prefetch) share
+one ``TokenBucket`` per connector, so ``rate_limit.requests_per_second``
+bounds the connector as a whole rather than each worker.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from db_mcp_data.connectors.api_config import APIHTTPConfig
+
+
+class _APIRetry(Retry):
+    """``Retry`` that also retries rate-limited POSTs.
+
+    Non-idempotent requests are normally only retried on connection errors,
+    since a 5xx may arrive after the server acted on them. A 429 means the
+    request was rejected outright, so it is safe to send again.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429 and self.total and 429 in (self.status_forcelist or ()):
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def build_session(config: APIHTTPConfig) -> requests.Session:
+    """Create a keep-alive session with a bounded pool and retry policy."""
+    retry = _APIRetry(
+        total=max(config.max_retries, 0),
+        backoff_factor=config.backoff_factor,
+        status_forcelist=frozenset(config.retry_statuses),
+        respect_retry_after_header=True,
+        # Hand the last response back so raise_for_status() reports it as before.
+        raise_on_status=False,
+    )
+    pool_size = max(config.pool_size, 1)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def request_timeout(config: APIHTTPConfig, read: float | None = None) -> tuple[float, float]:
+    """``(connect, read)`` timeout for a request; *read* overrides ``config.timeout``."""
+    return (config.connect_timeout, config.timeout if read is None else read)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` requests per second, bursts up to ``capacity``.
+
+    ``acquire`` reserves the caller's slot under the lock and sleeps outside it,
+    so concurrent callers are spaced out instead of all waking at once.
+    A non-positive rate disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            (self._sleep or time.sleep)(wait)
@@ -0,0 +1,288 @@
+"""Incremental (watermark-based) sync storage for the API connector.
+
+An endpoint with ``incremental_field`` set is stored as a dataset directory,
+``data/<endpoint>/``, of Parquet part files instead of one JSONL file that is
+rewritten on every sync. Each sync only asks the API for records at or past
+the endpoint's watermark (the largest ``incremental_field`` value seen so
+far, passed as ``incremental_param``) and appends them as a new part. The
+DuckDB view keeps the newest row per ``primary_key`` across parts, so updated
+records replace older versions without rewriting anything. Once a dataset
+has ``COMPACT_AFTER_PARTS`` parts they are folded into one de-duplicated
+part.
+
+Every part is written with the schema recorded for the endpoint in sync
+state: column types are inferred from the first values seen, and a column
+whose later values do not fit is widened to a common type (VARCHAR when
+there is none), with the existing parts rewritten to match. Inferring each
+part on its own would give a null-only column a JSON type in one part and
+a VARCHAR type in the next, which the view cannot combine.
+
+Watermarks, column types and part sequence numbers live in
+``data/.sync_state.json``; the leading dot keeps the file connector from
+treating it as a table.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from db_mcp_data.connectors.file import FileSourceConfig
+from db_mcp_data.db.duckdb import _deduplicated_parts
+
+SYNC_STATE_FILENAME = ".sync_state.json"
+COMPACT_AFTER_PARTS = 8
+_PART_GLOB = "part-*.parquet"
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _sql_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SyncState:
+    """Per-endpoint watermarks and part counters, persisted as JSON."""
+
+    def __init__(self, data_dir: Path) -> None:
+        self.path = Path(data_dir) / SYNC_STATE_FILENAME
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, endpoint: str) -> dict[str, Any]:
+        with self._lock:
+            entry = self._load().get(endpoint)
+        return dict(entry) if isinstance(entry, dict) else {}
+
+    def update(self, endpoint: str, entry: dict[str, Any] | None) -> None:
+        """Replace (or with ``None``, drop) one endpoint's entry."""
+        with self._lock:
+            data = self._load()
+            if entry is None:
+                data.pop(endpoint, None)
+            else:
+                data[endpoint] = entry
+            tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+
+def dataset_dir(data_dir: Path, endpoint: str) -> Path:
+    return Path(data_dir) / endpoint
+
+
+def list_parts(directory: Path) -> list[Path]:
+    return sorted(directory.glob(_PART_GLOB)) if directory.is_dir() else []
+
+
+def dataset_source(data_dir: Path, endpoint: str, primary_key: str) -> FileSourceConfig | None:
+    """File source for an endpoint's dataset, or None until it has a part file."""
+    directory = dataset_dir(data_dir, endpoint)
+    if not list_parts(directory):
+        return None
+    return FileSourceConfig(name=endpoint, path=str(directory / _PART_GLOB), key=primary_key)
+
+
+def _part_path(directory: Path, seq: int) -> Path:
+    return directory / f"part-{seq:06d}.parquet"
+
+
+def last_part_seq(directory: Path) -> int:
+    """Highest sequence number among the part files in *directory*, or 0."""
+    seqs = [0]
+    for part in list_parts(directory):
+        try:
+            seqs.append(int(part.stem.removeprefix("part-")))
+        except ValueError:
+            continue
+    return max(seqs)
+
+
+def _storable_type(type_: str) -> str:
+    # JSON is what DuckDB infers for mixed values; it cannot be cast back from text.
+    return "VARCHAR" if "JSON" in type_ else type_
+
+
+def _common_type(conn: duckdb.DuckDBPyConnection, known: str, inferred: str) -> str:
+    """Narrowest type both *known* and *inferred* values cast to, or VARCHAR."""
+    try:
+        (merged,) = conn.execute(
+            f"SELECT typeof(CASE WHEN random() < 0 THEN NULL::{known} ELSE NULL::{inferred} END)"
+        ).fetchone()
+    except duckdb.Error:
+        return "VARCHAR"
+    return _storable_type(merged)
+
+
+def _recast_part(conn: duckdb.DuckDBPyConnection, part: Path, changed: dict[str, str]) -> None:
+    """Rewrite *part* with the columns in *changed* cast to their new types."""
+    source = f"read_parquet({_sql_literal(str(part))})"
+    exprs = []
+    for name, type_, *_ in conn.execute(f"DESCRIBE SELECT * FROM {source}").fetchall():
+        ident = _sql_identifier(name)
+        target = changed.get(name)
+        if target is None:
+            exprs.append(ident)
+        elif target == "VARCHAR" and (type_.endswith("]") or type_.startswith(("STRUCT", "MAP"))):
+            # Match how read_json renders nested values into a VARCHAR column.
+            exprs.append(f"to_json({ident})::VARCHAR AS {ident}")
+        else:
+            exprs.append(f"CAST({ident} AS {target}) AS {ident}")
+    tmp_path = part.with_name(f".{part.name}.tmp")
+    try:
+        conn.execute(
+            f"COPY (SELECT {', '.join(exprs)} FROM {source}) "
+            f"TO {_sql_literal(str(tmp_path))} (FORMAT PARQUET, COMPRESSION ZSTD)"
+        )
+        os.replace(tmp_path, part)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def write_part(
+    directory: Path,
+    seq: int,
+    rows: list[dict[str, Any]],
+    primary_key: str,
+    schema: dict[str, str] | None = None,
+) -> dict[str, str]:
+    """Write *rows* as part ``seq`` (staged as JSONL, converted by DuckDB).
+
+    Columns are written with their types in *schema* (column name to DuckDB
+    type); columns that first have values in this part are added to it.
+    Returns the schema to record for the next part.
+    """
+    schema = dict(schema or {})
+    directory.mkdir(parents=True, exist_ok=True)
+    path = _part_path(directory, seq)
+    staging = directory / f".part-{seq:06d}.staging.jsonl"
+    tmp_path = directory / f".part-{seq:06d}.parquet.tmp"
+    # Columns that are null throughout stay untyped until a later part has values.
+    valued = {name for row in rows for name, value in row.items() if value is not None}
+    try:
+        with open(staging, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str) + "\n")
+        source = f"{_sql_literal(str(staging))}, format='newline_delimited'"
+        conn = duckdb.connect(":memory:")
+        try:
+            described = conn.execute(
+                f"DESCRIBE SELECT * FROM read_json({source}, sample_size=-1)"
+            ).fetchall()
+            changed: dict[str, str] = {}
+            for name, inferred, *_ in described:
+                if name not in valued:
+                    continue
+                inferred = _storable_type(inferred)
+                known = schema.get(name)
+                if known is None:
+                    schema[name] = inferred
+                elif known != inferred:
+                    merged = _common_type(conn, known, inferred)
+                    if merged != known:
+                        schema[name] = changed[name] = merged
+            for part in list_parts(directory) if changed else []:
+                _recast_part(conn, part, changed)
+            # The key column must exist in every part for the view's window.
+            types = {primary_key: "VARCHAR", **schema}
+            columns = ", ".join(
+                f"{_sql_literal(name)}: {_sql_literal(type_)}" for name, type_ in types.items()
+            )
+            conn.execute(
+                f"COPY (SELECT * FROM read_json({source}, columns={{{columns}}})) "
+                f"TO {_sql_literal(str(tmp_path))} (FORMAT PARQUET, COMPRESSION ZSTD)"
+            )
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+    finally:
+        staging.unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
+    return schema
+
+
+def compact(directory: Path, seq: int, primary_key: str) -> Path | None:
+    """Fold every part into one de-duplicated part ``seq``; returns it, or None if no parts.
+
+    The new part sorts after the old ones, so the view stays correct while the
+    old parts are being removed.
+    """
+    parts = list_parts(directory)
+    if not parts:
+        return None
+    source = FileSourceConfig(name="_compact", path=str(directory / _PART_GLOB), key=primary_key)
+    path = _part_path(directory, seq)
+    tmp_path = directory / f".part-{seq:06d}.parquet.tmp"
+    try:
+        conn = duckdb.connect(":memory:")
+        try:
+            conn.execute(
+                f"COPY ({_deduplicated_parts(source)}) "
+                f"TO {_sql_literal(str(tmp_path))} (FORMAT PARQUET, COMPRESSION ZSTD)"
+            )
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    for part in parts:
+        part.unlink(missing_ok=True)
+    return path
+
+
+def _watermark_key(value: Any) -> tuple[int, Any]:
+    """Sort key for watermark values.
+
+    Numbers and numeric strings compare numerically, ISO dates and datetimes
+    chronologically (naive ones taken as UTC), and anything else as text.
+    """
+    if isinstance(value, bool):
+        return (2, str(value))
+    if isinstance(value, (int, float)):
+        return (0, value)
+    text = value.isoformat() if isinstance(value, date) else str(value).strip()
+    try:
+        number = float(text)
+    except ValueError:
+        pass
+    else:
+        if math.isfinite(number):
+            return (0, int(text) if text.lstrip("+-").isdigit() else number)
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        return (2, text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return (1, moment)
+
+
+def at_or_after(value: Any, watermark: Any) -> bool:
+    return _watermark_key(value) >= _watermark_key(watermark)
+
+
+def next_watermark(rows: list[dict[str, Any]], field: str, current: Any = None) -> Any:
+    """Largest ``field`` value among *rows* and the *current* watermark."""
+    values = [row[field] for row in rows if row.get(field) is not None]
+    if current is not None:
+        values.append(current)
+    return max(values, key=_watermark_key) if values else None
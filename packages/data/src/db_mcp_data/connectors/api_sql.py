@@ -243,12 +243,15 @@ class CatalogRoutingAPIConnector(APIConnector):
             body = {key: value for key, value in body.items() if value is not None}
 
         try:
-            request_kwargs: dict[str, Any] = {"headers": headers, "timeout": 60}
+            request_kwargs: dict[str, Any] = {
+                "headers": headers,
+                "timeout": self._timeout(execution=True),
+            }
             if query_params:
                 request_kwargs["params"] = query_params
             if body:
                 request_kwargs["json"] = body
-            resp = self._requests().post(url, **request_kwargs)
+            resp = self.session.post(url, **request_kwargs)
             resp.raise_for_status()
             response = resp.json()
         except self._requests().exceptions.HTTPError as exc:
@@ -259,12 +262,12 @@ class CatalogRoutingAPIConnector(APIConnector):
             ):
                 self._jwt_refresh()
                 headers = self._resolve_auth_headers()
-                request_kwargs = {"headers": headers, "timeout": 60}
+                request_kwargs = {"headers": headers, "timeout": self._timeout(execution=True)}
                 if query_params:
                     request_kwargs["params"] = query_params
                 if body:
                     request_kwargs["json"] = body
-                resp = self._requests().post(url, **request_kwargs)
+                resp = self.session.post(url, **request_kwargs)
                 resp.raise_for_status()
                 response = resp.json()
             else:
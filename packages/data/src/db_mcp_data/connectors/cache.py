@@ -0,0 +1,185 @@
+"""Process-wide cache of live connector instances.
+
+Building a connector re-reads ``connector.yaml``/``.env`` and, for file and
+API connectors, starts from a cold in-memory DuckDB whose views have to be
+recreated on the next query. The gateway dispatcher and ``ConnectionRegistry``
+therefore share one cache keyed on the connection path, so steady-state
+requests reuse a warm connector (and its engine or DuckDB catalog).
+
+An entry is rebuilt when its *fingerprint* changes — the stamps of
+``connector.yaml`` and ``.env`` plus the process ``DATABASE_URL`` fallback —
+or when the factory that built it is no longer the one being asked for.
+When only the watched data directory changes (files added or removed), the
+connector is kept and told to re-discover its sources instead. Connectors
+that are replaced or invalidated are closed (``close()``), releasing HTTP
+sessions and SQLAlchemy pools; connectors reopen those on next use, so a
+caller still holding one keeps working.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from db_mcp_data.connectors.api import APIConnector
+from db_mcp_data.connectors.file import FileConnector
+
+# Called as ``factory(connection_path=str(path))``, like ``get_connector``.
+ConnectorFactory = Callable[..., Any]
+
+_Stamp = tuple[int, int] | None
+
+logger = logging.getLogger(__name__)
+
+
+def _stamp(path: Path) -> _Stamp:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def connector_fingerprint(connection_path: str | Path) -> tuple[Any, ...]:
+    """Everything ``get_connector`` reads when building a connector for the path."""
+    conn_path = Path(connection_path)
+    return (
+        _stamp(conn_path / "connector.yaml"),
+        _stamp(conn_path / ".env"),
+        os.environ.get("DATABASE_URL", ""),
+    )
+
+
+def _watched_directory(connector: Any) -> Path | None:
+    """Directory whose listing feeds the connector's DuckDB views, if any."""
+    try:
+        if isinstance(connector, APIConnector):
+            directory = connector.data_dir
+        elif isinstance(connector, FileConnector):
+            directory = connector.config.directory
+        else:
+            return None
+    except AttributeError:
+        return None
+    if isinstance(directory, (str, Path)) and str(directory):
+        return Path(directory).expanduser()
+    return None
+
+
+def _close_connector(connector: Any) -> None:
+    close = getattr(connector, "close", None)
+    if not callable(close):
+        return
+    try:
+        close()
+    except Exception as exc:
+        logger.warning("Closing connector %s failed: %s", type(connector).__name__, exc)
+
+
+class _Entry:
+    __slots__ = ("connector", "factory", "fingerprint", "directory", "directory_stamp")
+
+    def __init__(
+        self, connector: Any, factory: ConnectorFactory, fingerprint: tuple[Any, ...]
+    ):
+        self.connector = connector
+        self.factory = factory
+        self.fingerprint = fingerprint
+        self.directory = _watched_directory(connector)
+        self.directory_stamp = _stamp(self.directory) if self.directory else None
+
+
+def _default_factory(*, connection_path: str) -> Any:
+    # Lazy import: the connectors package re-exports this module.
+    from db_mcp_data.connectors import get_connector
+
+    return get_connector(connection_path=connection_path)
+
+
+class ConnectorCache:
+    """Live connectors keyed on resolved connection path."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, connection_path: str | Path, factory: ConnectorFactory | None = None
+    ) -> Any:
+        """Return the cached connector for *connection_path*, building it if stale.
+
+        *factory* (default ``get_connector``) receives ``connection_path`` as a string.
+        """
+        factory = factory or _default_factory
+        key = str(Path(connection_path).resolve())
+        fingerprint = connector_fingerprint(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.factory is factory
+                and entry.fingerprint == fingerprint
+            ):
+                self._refresh_sources(entry)
+                return entry.connector
+
+        # Build outside the lock: connector construction can do file I/O.
+        connector = factory(connection_path=str(connection_path))
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = _Entry(connector, factory, fingerprint)
+        if previous is not None and previous.connector is not connector:
+            _close_connector(previous.connector)
+        return connector
+
+    def invalidate(self, connection_path: str | Path | None = None) -> bool:
+        """Drop one connection's connector (or all of them when no path is given).
+
+        Returns True if anything was removed. Removed connectors are closed.
+        """
+        with self._lock:
+            if connection_path is None:
+                removed = list(self._entries.values())
+                self._entries.clear()
+            else:
+                entry = self._entries.pop(str(Path(connection_path).resolve()), None)
+                removed = [entry] if entry is not None else []
+        for entry in removed:
+            _close_connector(entry.connector)
+        return bool(removed)
+
+    def __contains__(self, connection_path: str | Path) -> bool:
+        with self._lock:
+            return str(Path(connection_path).resolve()) in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _refresh_sources(entry: _Entry) -> None:
+        if entry.directory is None:
+            return
+        stamp = _stamp(entry.directory)
+        if stamp != entry.directory_stamp:
+            entry.directory_stamp = stamp
+            entry.connector.invalidate_cache()
+
+
+_cache = ConnectorCache()
+
+
+def get_cached_connector(
+    connection_path: str | Path, factory: ConnectorFactory | None = None
+) -> Any:
+    """Shared live connector for *connection_path* (see ``ConnectorCache.get``)."""
+    return _cache.get(connection_path, factory)
+
+
+def invalidate_connector_cache(connection_path: str | Path | None = None) -> bool:
+    """Forget the cached connector for a connection, or every cached connector."""
+    return _cache.invalidate(connection_path)
@@ -11,6 +11,7 @@ from db_mcp_data.db.duckdb import (  # noqa: F401
     DuckDBExecutor,
     _read_function_for_path,
 )
+from db_mcp_data.db.streaming import DEFAULT_BATCH_SIZE, RowStream
 
 # ---------------------------------------------------------------------------
 # Config
@@ -23,6 +24,9 @@ class FileSourceConfig:
 
     name: str
     path: str
+    # Merge-on-read key for Parquet part-file globs: the view keeps only the row
+    # from the last file (by name) for each key value.
+    key: str = ""
 
 
 @dataclass
@@ -163,3 +167,12 @@ class FileConnector:
 
     def execute_sql(self, sql: str, params: dict | None = None) -> list[dict[str, Any]]:
         return self._duckdb.execute_sql(sql)
+
+    def stream_sql(
+        self,
+        sql: str,
+        params: dict | None = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> RowStream:
+        return self._duckdb.stream_sql(sql, batch_size=batch_size)
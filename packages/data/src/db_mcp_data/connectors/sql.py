@@ -3,22 +3,37 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+from opentelemetry import trace
 from sqlalchemy import Engine, text
 
+from db_mcp_data.db.cancellation import (
+    current_scope,
+    prepare_cancellable_statement,
+    result_canceller,
+)
 from db_mcp_data.db.connection import (
     DatabaseError,
+    checkout_connection,
     detect_dialect_from_url,
+    dispose_engine,
     get_engine,
+    resolve_pool_options,
 )
 from db_mcp_data.db.connection import (
     test_connection as db_test_connection,
 )
+from db_mcp_data.db.introspection import (
+    get_catalog_columns as db_get_catalog_columns,
+)
 from db_mcp_data.db.introspection import (
     get_catalogs as db_get_catalogs,
 )
 from db_mcp_data.db.introspection import (
     get_columns as db_get_columns,
 )
+from db_mcp_data.db.introspection import (
+    get_schema_foreign_keys as db_get_schema_foreign_keys,
+)
 from db_mcp_data.db.introspection import (
     get_schemas as db_get_schemas,
 )
@@ -28,6 +43,7 @@ from db_mcp_data.db.introspection import (
 from db_mcp_data.db.introspection import (
     get_tables as db_get_tables,
 )
+from db_mcp_data.db.streaming import DEFAULT_BATCH_SIZE, RowStream
 
 
 @dataclass
@@ -62,8 +78,30 @@ class SQLConnector:
 
         This is SQL-specific and not part of the Connector protocol.
         Used by validation/explain and generation for direct engine access.
+        Pool sizing comes from the connector capabilities.
         """
-        return get_engine(self.config.database_url, connect_args=self._get_connect_args())
+        return get_engine(
+            self.config.database_url,
+            connect_args=self._get_connect_args(),
+            pool_options=resolve_pool_options(self.config.capabilities),
+        )
+
+    def close(self) -> None:
+        """Dispose this connector's pooled engine (a new one is built on next use)."""
+        if self.config.database_url:
+            dispose_engine(
+                self.config.database_url,
+                connect_args=self._get_connect_args(),
+                pool_options=resolve_pool_options(self.config.capabilities),
+            )
+
+    def _connect(self):
+        """Check out a pooled connection and tag the active span with pool stats."""
+        conn, attributes = checkout_connection(self.get_engine())
+        span = trace.get_current_span()
+        if span.is_recording():
+            span.set_attributes(attributes)
+        return conn
 
     def test_connection(self) -> dict[str, Any]:
         """Test database connectivity."""
@@ -111,6 +149,28 @@ class SQLConnector:
             connect_args=self._get_connect_args(),
         )
 
+    def get_catalog_columns(
+        self, catalog: str | None = None, schemas: list[str] | None = None
+    ) -> dict[tuple[str, str], list[dict[str, Any]]] | None:
+        """Get columns of every table in a catalog in one pass (None if unsupported)."""
+        return db_get_catalog_columns(
+            catalog,
+            schemas,
+            self.config.database_url,
+            connect_args=self._get_connect_args(),
+        )
+
+    def get_schema_foreign_keys(
+        self, schema: str | None = None, catalog: str | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get declared foreign keys of every table in a schema, keyed by table name."""
+        return db_get_schema_foreign_keys(
+            schema,
+            self.config.database_url,
+            catalog=catalog,
+            connect_args=self._get_connect_args(),
+        )
+
     def get_table_sample(
         self,
         table_name: str,
@@ -128,13 +188,80 @@ class SQLConnector:
             connect_args=self._get_connect_args(),
         )
 
+    def _execute(self, conn, sql: str, params: dict | None, **options: Any):
+        """Execute ``sql`` on ``conn``; returns ``(result, release)``.
+
+        Inside a cancel scope (see ``db.cancellation``) a dialect-native
+        canceller is registered for the statement until ``release()``.
+        """
+        target = conn.execution_options(**options) if options else conn
+        scope = current_scope()
+        if scope is None:
+            return target.execute(text(sql), params or {}), lambda: None
+
+        sql, canceller = prepare_cancellable_statement(conn, sql)
+        removers = [scope.add_canceller(canceller)] if canceller is not None else []
+        try:
+            result = target.execute(text(sql), params or {})
+        except Exception:
+            for remove in removers:
+                remove()
+            raise
+        late_canceller = result_canceller(conn, result)
+        if late_canceller is not None:
+            removers.append(scope.add_canceller(late_canceller))
+
+        def _release() -> None:
+            for remove in removers:
+                remove()
+
+        return result, _release
+
     def execute_sql(self, sql: str, params: dict | None = None) -> list[dict[str, Any]]:
         """Execute SQL and return rows as dicts."""
         try:
-            engine = get_engine(self.config.database_url, connect_args=self._get_connect_args())
-            with engine.connect() as conn:
-                result = conn.execute(text(sql), params or {})
-                columns = result.keys()
-                return [dict(zip(columns, row)) for row in result]
+            with self._connect() as conn:
+                result, release = self._execute(conn, sql, params)
+                try:
+                    columns = result.keys()
+                    return [dict(zip(columns, row)) for row in result]
+                finally:
+                    release()
+        except Exception as e:
+            raise DatabaseError(f"Failed to execute SQL: {e}") from e
+
+    def stream_sql(
+        self,
+        sql: str,
+        params: dict | None = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> RowStream:
+        """Execute SQL with a server-side cursor and yield rows in batches.
+
+        The pooled connection stays checked out until the returned stream is
+        exhausted or closed, so callers that stop early must close it.
+        """
+        conn = self._connect()
+        try:
+            result, release = self._execute(
+                conn, sql, params, stream_results=True, yield_per=batch_size
+            )
+            columns = list(result.keys())
         except Exception as e:
+            conn.close()
             raise DatabaseError(f"Failed to execute SQL: {e}") from e
+
+        def _batches():
+            try:
+                for partition in result.partitions(batch_size):
+                    yield [dict(zip(columns, row)) for row in partition]
+            except Exception as e:
+                raise DatabaseError(f"Failed to fetch SQL results: {e}") from e
+
+        def _close() -> None:
+            release()
+            result.close()
+            conn.close()
+
+        return RowStream(columns, _batches(), on_close=_close)
@@ -2,6 +2,7 @@
 
 from db_mcp_data.db.connection import get_engine, test_connection
 from db_mcp_data.db.introspection import (
+    get_catalog_columns,
     get_columns,
     get_schemas,
     get_table_sample,
@@ -14,5 +15,6 @@ __all__ = [
     "get_schemas",
     "get_tables",
     "get_columns",
+    "get_catalog_columns",
     "get_table_sample",
 ]
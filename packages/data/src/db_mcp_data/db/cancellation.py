@@ -0,0 +1,263 @@
+"""Cancellation scopes and dialect-native statement cancellation.
+
+An execution that may need to be stopped runs inside ``cancel_scope()``,
+which registers it under its execution id for the duration of the call and
+optionally arms a timer that cancels it after ``timeout_seconds``. While
+the scope is active, connectors register a *canceller* for each statement
+they send (``CancelScope.add_canceller``); ``cancel_running()`` or the
+timer invokes those cancellers from another thread:
+
+- PostgreSQL: ``pg_cancel_backend(<backend pid>)`` on a second, unpooled connection
+- MySQL/MariaDB: ``KILL QUERY <connection id>``
+- ClickHouse: ``KILL QUERY`` for the statement, located by a tag comment
+- Trino: ``DELETE /v1/query/<query id>`` through the client's HTTP session
+- DuckDB: ``interrupt()`` on the executing cursor
+
+The interrupted driver call then raises, and the execution engine records
+the execution as ``cancelled`` or ``timed_out`` instead of ``failed``.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import uuid
+import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+logger = logging.getLogger(__name__)
+
+CANCELLED = "cancelled"
+TIMED_OUT = "timed_out"
+
+Canceller = Callable[[], None]
+
+
+class CancelScope:
+    """Cancellation state for one running execution."""
+
+    def __init__(
+        self,
+        execution_id: str,
+        *,
+        timeout_seconds: float | None = None,
+        on_cancel: Callable[[str], None] | None = None,
+    ):
+        self.execution_id = execution_id
+        self.timeout_seconds = timeout_seconds
+        self.reason: str | None = None
+        self._on_cancel = on_cancel
+        self._cancellers: list[Canceller] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def add_canceller(self, canceller: Canceller) -> Callable[[], None]:
+        """Register a canceller for the statement in flight; returns its remover.
+
+        If the scope was already cancelled the canceller runs immediately, so
+        a statement started just after ``cancel()`` is still stopped.
+        """
+        with self._lock:
+            already_cancelled = self.cancelled
+            if not already_cancelled:
+                self._cancellers.append(canceller)
+        if already_cancelled:
+            _invoke(canceller, self.execution_id)
+
+        def _remove() -> None:
+            with self._lock:
+                if canceller in self._cancellers:
+                    self._cancellers.remove(canceller)
+
+        return _remove
+
+    def cancel(self, reason: str = CANCELLED) -> bool:
+        """Mark the scope cancelled and run its cancellers; False if already cancelled.
+
+        ``on_cancel`` runs first, so the cancelled state is recorded before
+        the interrupted statement's error surfaces in the executing thread.
+        """
+        with self._lock:
+            if self.cancelled:
+                return False
+            self.reason = reason
+            cancellers = list(self._cancellers)
+        if self._on_cancel is not None:
+            _invoke(functools.partial(self._on_cancel, reason), self.execution_id)
+        for canceller in cancellers:
+            _invoke(canceller, self.execution_id)
+        return True
+
+
+def _invoke(canceller: Canceller, execution_id: str) -> None:
+    try:
+        canceller()
+    except Exception as exc:
+        # The statement may already have finished; cancellation is best effort.
+        logger.warning("Cancelling execution %s failed: %s", execution_id, exc)
+
+
+# Deadline cancellations run on one long-lived thread rather than on each
+# timer's own thread, so per-thread resources (store connections) are reused.
+_TIMEOUT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-mcp-cancel")
+
+_ACTIVE_SCOPES: dict[str, CancelScope] = {}
+_ACTIVE_SCOPES_LOCK = threading.Lock()
+_CURRENT_SCOPE: ContextVar[CancelScope | None] = ContextVar("db_mcp_cancel_scope", default=None)
+
+
+@contextmanager
+def cancel_scope(
+    execution_id: str,
+    *,
+    timeout_seconds: float | None = None,
+    on_cancel: Callable[[str], None] | None = None,
+) -> Iterator[CancelScope]:
+    """Run the enclosed block as a cancellable execution.
+
+    With ``timeout_seconds`` set, the scope cancels itself with reason
+    ``timed_out`` once the deadline passes. ``on_cancel(reason)`` lets the
+    caller record the outcome (e.g. in the execution store).
+    """
+    scope = CancelScope(execution_id, timeout_seconds=timeout_seconds, on_cancel=on_cancel)
+    timer: threading.Timer | None = None
+    with _ACTIVE_SCOPES_LOCK:
+        _ACTIVE_SCOPES[execution_id] = scope
+    token = _CURRENT_SCOPE.set(scope)
+    if timeout_seconds is not None and timeout_seconds > 0:
+        timer = threading.Timer(
+            timeout_seconds, _TIMEOUT_EXECUTOR.submit, args=(scope.cancel, TIMED_OUT)
+        )
+        timer.daemon = True
+        timer.start()
+    try:
+        yield scope
+    finally:
+        if timer is not None:
+            timer.cancel()
+        _CURRENT_SCOPE.reset(token)
+        with _ACTIVE_SCOPES_LOCK:
+            if _ACTIVE_SCOPES.get(execution_id) is scope:
+                del _ACTIVE_SCOPES[execution_id]
+
+
+def current_scope() -> CancelScope | None:
+    """The cancel scope of the execution running in this context, if any."""
+    return _CURRENT_SCOPE.get()
+
+
+def register_canceller(canceller: Canceller) -> Callable[[], None]:
+    """Attach ``canceller`` to the current scope; a no-op outside of one."""
+    scope = _CURRENT_SCOPE.get()
+    if scope is None:
+        return lambda: None
+    return scope.add_canceller(canceller)
+
+
+def cancel_running(execution_id: str, reason: str = CANCELLED) -> bool:
+    """Cancel an execution running in this process; False if it is not running."""
+    with _ACTIVE_SCOPES_LOCK:
+        scope = _ACTIVE_SCOPES.get(execution_id)
+    if scope is None:
+        return False
+    scope.cancel(reason)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Dialect-native cancellers for SQLAlchemy connections
+# ---------------------------------------------------------------------------
+
+
+# Cancels run on their own unpooled connection: a pooled one could be the
+# very connection whose statement is being cancelled, or be unavailable when
+# the pool is exhausted by the statements that need stopping.
+_CANCELLER_ENGINES: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
+_CANCELLER_ENGINES_LOCK = threading.Lock()
+
+# Key under which a DBAPI connection's server-side session id is cached.
+_BACKEND_ID_KEY = "db_mcp_backend_id"
+
+
+def _canceller_engine(engine: Any) -> Any:
+    """A NullPool clone of ``engine`` sharing its connect arguments."""
+    with _CANCELLER_ENGINES_LOCK:
+        side = _CANCELLER_ENGINES.get(engine)
+        if side is None:
+            # The pool's creator carries the engine's connect_args (auth, SSL).
+            side = create_engine(engine.url, pool=NullPool(engine.pool._creator))
+            _CANCELLER_ENGINES[engine] = side
+        return side
+
+
+def _side_statement(engine: Any, sql: str) -> Canceller:
+    """Canceller that runs ``sql`` on a dedicated, unpooled connection."""
+
+    def _run() -> None:
+        with _canceller_engine(engine).connect() as side:
+            side.execute(text(sql))
+
+    return _run
+
+
+def _backend_id(conn: Any, query: str) -> Any:
+    """Server session id of ``conn``, queried once per pooled DBAPI connection."""
+    info = conn.connection.info
+    if _BACKEND_ID_KEY not in info:
+        info[_BACKEND_ID_KEY] = conn.exec_driver_sql(query).scalar()
+    return info[_BACKEND_ID_KEY]
+
+
+def prepare_cancellable_statement(conn: Any, sql: str) -> tuple[str, Canceller | None]:
+    """Identify the session/statement about to run on ``conn``.
+
+    Returns the SQL to execute (ClickHouse statements gain a tag comment) and
+    a canceller, or None when the dialect is cancelled after execute starts
+    (Trino, see ``result_canceller``) or has no native cancellation.
+    """
+    dialect = conn.dialect.name
+    engine = conn.engine
+    if dialect == "postgresql":
+        pid = int(_backend_id(conn, "SELECT pg_backend_pid()"))
+        return sql, _side_statement(engine, f"SELECT pg_cancel_backend({pid})")
+    if dialect in ("mysql", "mariadb"):
+        connection_id = int(_backend_id(conn, "SELECT CONNECTION_ID()"))
+        return sql, _side_statement(engine, f"KILL QUERY {connection_id}")
+    if dialect == "clickhouse":
+        tag = f"db_mcp_cancel_{uuid.uuid4().hex}"
+        return f"/* {tag} */ {sql}", _side_statement(
+            engine,
+            f"KILL QUERY WHERE query LIKE '%{tag}%' AND query NOT LIKE 'KILL%' ASYNC",
+        )
+    return sql, None
+
+
+def result_canceller(conn: Any, result: Any) -> Canceller | None:
+    """Canceller for a statement whose DBAPI cursor already exists (Trino)."""
+    if conn.dialect.name != "trino":
+        return None
+    cursor = getattr(result, "cursor", None)
+    if cursor is None:
+        return None
+
+    def _cancel() -> None:
+        query = getattr(cursor, "_query", None)
+        request = getattr(query, "_request", None)
+        query_id = getattr(query, "query_id", None)
+        if request is not None and query_id:
+            request.delete(request.get_url(f"/v1/query/{query_id}"))
+        else:
+            cursor.cancel()
+
+    return _cancel
@@ -1,10 +1,17 @@
 """Database connection management."""
 
+import hashlib
+import json
+import threading
+import time
 import urllib.parse
-from functools import lru_cache
+from collections import OrderedDict
+from typing import Any
 
 import urllib3
-from sqlalchemy import Engine, create_engine, text
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import Pool
 from trino.auth import BasicAuthentication
 
 # Disable urllib3 SSL warnings for Trino connections with verify=False
@@ -77,18 +84,143 @@ def normalize_database_url(database_url: str) -> str:
     return database_url
 
 
-def _create_engine(database_url: str, *, connect_args: dict | None = None) -> Engine:
+# Pool defaults; each can be overridden per connection in connector.yaml
+# capabilities (pool_size, max_overflow, pool_recycle_seconds, pool_pre_ping),
+# as can pool_timeout_seconds (SQLAlchemy's default of 30s otherwise).
+DEFAULT_POOL_OPTIONS: dict[str, Any] = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 300,
+    "pool_pre_ping": True,
+}
+
+_ENGINE_CACHE_SIZE = 16
+
+
+class PoolStats:
+    """Checkout/wait/overflow counters for one engine's connection pool.
+
+    Checkouts, checkins and new DBAPI connections are counted from pool
+    events; wait time is recorded by ``checkout_connection``.
+    """
+
+    def __init__(self, engine: Engine, label: str):
+        self._engine = engine
+        self.label = label
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timed_checkouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.overflow_peak = 0
+
+    def attach(self) -> None:
+        pool = self._engine.pool
+        if not isinstance(pool, Pool):
+            return
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, *_args: Any) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, *_args: Any) -> None:
+        overflow = _pool_gauge(self._engine, "overflow")
+        with self._lock:
+            self.checkouts += 1
+            if overflow is not None and overflow > self.overflow_peak:
+                self.overflow_peak = overflow
+
+    def _on_checkin(self, *_args: Any) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    def _on_invalidate(self, *_args: Any) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self.timed_checkouts += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current pool gauges plus lifetime counters."""
+        with self._lock:
+            timed = self.timed_checkouts
+            return {
+                "url": self.label,
+                "size": _pool_gauge(self._engine, "size"),
+                "checked_out": _pool_gauge(self._engine, "checkedout"),
+                "overflow": _pool_gauge(self._engine, "overflow"),
+                "overflow_peak": self.overflow_peak,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "wait_ms_avg": round(self.wait_ms_total / timed, 3) if timed else 0.0,
+                "wait_ms_max": round(self.wait_ms_max, 3),
+            }
+
+
+def _pool_gauge(engine: Engine, name: str) -> int | None:
+    """Read a QueuePool gauge (size/checkedout/overflow); None for other pools.
+
+    QueuePool reports overflow as negative until ``pool_size`` connections
+    exist, so gauges are clamped at zero.
+    """
+    getter = getattr(engine.pool, name, None)
+    if getter is None:
+        return None
+    try:
+        return max(0, int(getter()))
+    except Exception:
+        return None
+
+
+def resolve_pool_options(capabilities: dict[str, Any] | None) -> dict[str, Any]:
+    """Extract engine pool options from connector capabilities.
+
+    Unset (None) or invalid values are skipped so the defaults apply.
+    """
+    caps = capabilities or {}
+    options: dict[str, Any] = {}
+    for cap_key, option, cast in (
+        ("pool_size", "pool_size", int),
+        ("max_overflow", "max_overflow", int),
+        ("pool_recycle_seconds", "pool_recycle", int),
+        ("pool_timeout_seconds", "pool_timeout", float),
+        ("pool_pre_ping", "pool_pre_ping", bool),
+    ):
+        value = caps.get(cap_key)
+        if value is None:
+            continue
+        try:
+            options[option] = cast(value)
+        except (TypeError, ValueError):
+            continue
+    return options
+
+
+def _create_engine(
+    database_url: str,
+    *,
+    connect_args: dict | None = None,
+    pool_options: dict[str, Any] | None = None,
+) -> Engine:
     """Create a SQLAlchemy engine without caching."""
     normalized_url = normalize_database_url(database_url)
     dialect = detect_dialect_from_url(normalized_url)
 
     # Configure engine based on dialect
-    engine_kwargs = {
-        "pool_size": 5,
-        "max_overflow": 10,
-        "pool_pre_ping": True,
-        "pool_recycle": 300,
-    }
+    engine_kwargs: dict[str, Any] = {**DEFAULT_POOL_OPTIONS, **(pool_options or {})}
 
     if connect_args:
         engine_kwargs["connect_args"] = connect_args
@@ -122,16 +254,56 @@ def _create_engine(database_url: str, *, connect_args: dict | None = None) -> En
         raise DatabaseError(f"Failed to create database engine: {e}") from e
 
 
-@lru_cache(maxsize=8)
-def _get_engine_cached(database_url: str) -> Engine:
-    return _create_engine(database_url)
+class _CachedEngine:
+    __slots__ = ("engine", "base_key", "pool_options", "stats")
+
+    def __init__(
+        self, engine: Engine, base_key: str, pool_options: dict[str, Any], stats: PoolStats
+    ):
+        self.engine = engine
+        self.base_key = base_key
+        self.pool_options = pool_options
+        self.stats = stats
+
+
+_ENGINES: OrderedDict[str, _CachedEngine] = OrderedDict()
+_ENGINE_STATS: dict[int, PoolStats] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def engine_fingerprint(
+    database_url: str,
+    connect_args: dict | None = None,
+    pool_options: dict[str, Any] | None = None,
+) -> str:
+    """Stable cache key for an engine: the URL, its connect args and pool options."""
+    payload = json.dumps(
+        {"url": database_url, "connect_args": connect_args or {}, "pool": pool_options or {}},
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
 
 
-def get_engine(database_url: str, *, connect_args: dict | None = None) -> Engine:
+def get_engine(
+    database_url: str,
+    *,
+    connect_args: dict | None = None,
+    pool_options: dict[str, Any] | None = None,
+) -> Engine:
     """Get or create a SQLAlchemy engine.
 
+    Engines are shared per ``(database_url, connect_args, pool_options)``
+    fingerprint, so callers that agree on pool sizing draw from one pool and
+    callers with different options get their own engine instead of disposing
+    each other's. Callers that pass no ``pool_options`` (e.g. one-off
+    introspection) reuse the most recently used engine for the URL, creating
+    one with ``DEFAULT_POOL_OPTIONS`` only if none exists.
+
     Args:
         database_url: Database URL (SQLAlchemy-compatible connection string).
+        connect_args: Optional SQLAlchemy connect args.
+        pool_options: Optional overrides for ``DEFAULT_POOL_OPTIONS``.
 
     Returns:
         SQLAlchemy Engine instance
@@ -142,10 +314,99 @@ def get_engine(database_url: str, *, connect_args: dict | None = None) -> Engine
     if not database_url:
         raise DatabaseError("No database URL configured")
 
-    if connect_args:
-        return _create_engine(database_url, connect_args=connect_args)
-
-    return _get_engine_cached(database_url)
+    base_key = engine_fingerprint(database_url, connect_args)
+    options = dict(pool_options or {})
+    key = engine_fingerprint(database_url, connect_args, options)
+    stale: list[Engine] = []
+    with _ENGINES_LOCK:
+        if pool_options is None:
+            for cached_key in reversed(_ENGINES):
+                if _ENGINES[cached_key].base_key == base_key:
+                    key = cached_key
+                    break
+        cached = _ENGINES.get(key)
+        if cached is not None:
+            _ENGINES.move_to_end(key)
+            return cached.engine
+
+        engine = _create_engine(database_url, connect_args=connect_args, pool_options=options)
+        stats = PoolStats(engine, engine.url.render_as_string(hide_password=True))
+        stats.attach()
+        _ENGINES[key] = _CachedEngine(engine, base_key, options, stats)
+        _ENGINE_STATS[id(engine)] = stats
+        while len(_ENGINES) > _ENGINE_CACHE_SIZE:
+            _, evicted = _ENGINES.popitem(last=False)
+            _ENGINE_STATS.pop(id(evicted.engine), None)
+            stale.append(evicted.engine)
+
+    # Checked-out connections stay usable; dispose only drops idle ones.
+    for old in stale:
+        old.dispose()
+    return engine
+
+
+def _stats_for(engine: Engine) -> PoolStats | None:
+    with _ENGINES_LOCK:
+        return _ENGINE_STATS.get(id(engine))
+
+
+def checkout_connection(engine: Engine) -> tuple[Connection, dict[str, Any]]:
+    """Check a connection out of ``engine``'s pool, timing the wait.
+
+    Returns the connection and span-ready pool attributes
+    (``db.pool.wait_ms``, ``db.pool.checked_out``, ``db.pool.overflow``).
+    """
+    started = time.perf_counter()
+    conn = engine.connect()
+    wait_ms = (time.perf_counter() - started) * 1000
+    stats = _stats_for(engine)
+    if stats is not None:
+        stats.record_wait(wait_ms)
+    attributes: dict[str, Any] = {"db.pool.wait_ms": round(wait_ms, 3)}
+    for name, gauge in (("checked_out", "checkedout"), ("overflow", "overflow")):
+        value = _pool_gauge(engine, gauge)
+        if value is not None:
+            attributes[f"db.pool.{name}"] = value
+    return conn, attributes
+
+
+def engine_pool_stats() -> dict[str, dict[str, Any]]:
+    """Pool stats for every cached engine, keyed by short fingerprint."""
+    with _ENGINES_LOCK:
+        cached = list(_ENGINES.items())
+    return {key[:12]: entry.stats.snapshot() for key, entry in cached}
+
+
+def dispose_engine(
+    database_url: str,
+    *,
+    connect_args: dict | None = None,
+    pool_options: dict[str, Any] | None = None,
+) -> bool:
+    """Dispose and forget the cached engine for exactly these options.
+
+    Returns True if one was cached. A later ``get_engine`` call builds a
+    fresh engine, and connections already checked out stay usable.
+    """
+    key = engine_fingerprint(database_url, connect_args, dict(pool_options or {}))
+    with _ENGINES_LOCK:
+        cached = _ENGINES.pop(key, None)
+        if cached is not None:
+            _ENGINE_STATS.pop(id(cached.engine), None)
+    if cached is None:
+        return False
+    cached.engine.dispose()
+    return True
+
+
+def dispose_engines() -> None:
+    """Dispose and forget every cached engine (server shutdown, tests)."""
+    with _ENGINES_LOCK:
+        engines = [entry.engine for entry in _ENGINES.values()]
+        _ENGINES.clear()
+        _ENGINE_STATS.clear()
+    for engine in engines:
+        engine.dispose()
 
 
 def test_connection(database_url: str, *, connect_args: dict | None = None) -> dict:
@@ -0,0 +1,219 @@
+"""Parallel, incremental table + column discovery for onboarding.
+
+Discovery lists the tables of every selected schema and then fetches their
+columns. On large catalogs both steps are dominated by round-trips, so:
+
+- Table listing runs per schema on a bounded thread pool.
+- Columns come from one catalog-table pass per catalog when the connector
+  offers ``get_catalog_columns`` (Trino, ClickHouse); tables it does not
+  cover fall back to ``get_columns`` one by one, again on the thread pool.
+- Each schema's table list is fingerprinted and the fingerprints are stored
+  in ``state/schema_fingerprints.json``. On rediscovery, a schema whose
+  fingerprint is unchanged reuses the columns already known for its tables
+  instead of fetching them again.
+
+The connector calls are passed in as callables so callers can route them
+through the gateway or call a connector directly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from db_mcp_data.db.introspection import DEFAULT_INTROSPECTION_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+_FINGERPRINTS_FILENAME = "schema_fingerprints.json"
+
+ListTables = Callable[[str | None, str | None], list[dict[str, Any]]]
+ListColumns = Callable[[str, str | None, str | None], list[dict[str, Any]]]
+ListCatalogColumns = Callable[
+    [str | None, list[str]], dict[tuple[str, str], list[dict[str, Any]]] | None
+]
+
+
+@dataclass
+class DiscoveryResult:
+    """Tables (with columns) found by ``discover_tables``."""
+
+    tables: list[dict[str, Any]] = field(default_factory=list)
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    changed_schemas: list[str] = field(default_factory=list)
+    reused_schemas: list[str] = field(default_factory=list)
+
+
+def schema_key(catalog: str | None, schema: str | None) -> str:
+    """Stable key for a (catalog, schema) pair in the fingerprint file."""
+    return f"{catalog or ''}.{schema or ''}"
+
+
+def schema_fingerprint(tables: list[dict[str, Any]]) -> str:
+    """Hash of a schema's table list (names and types, order-independent)."""
+    entries = sorted(f"{t.get('name')}:{t.get('type') or 'table'}" for t in tables)
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def _fingerprints_path(connection_path: Path) -> Path:
+    return Path(connection_path) / "state" / _FINGERPRINTS_FILENAME
+
+
+def load_schema_fingerprints(connection_path: Path) -> dict[str, str]:
+    """Load stored schema fingerprints ({} if none were saved or the file is bad)."""
+    path = _fingerprints_path(connection_path)
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+
+def save_schema_fingerprints(connection_path: Path, fingerprints: dict[str, str]) -> None:
+    """Persist schema fingerprints after the discovered schema has been saved.
+
+    Best effort: without the file the next discovery simply re-fetches everything.
+    """
+    path = _fingerprints_path(connection_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(fingerprints, indent=2, sort_keys=True))
+        tmp.replace(path)
+    except OSError as exc:
+        logger.warning("Could not save schema fingerprints to %s: %s", path, exc)
+
+
+def known_columns_from_schema(schema: Any) -> dict[str, list[dict[str, Any]]]:
+    """Columns per table full_name from saved ``SchemaDescriptions`` (for reuse)."""
+    if schema is None:
+        return {}
+    return {
+        table.full_name: [{"name": col.name, "type": col.type} for col in table.columns]
+        for table in schema.tables
+        if table.full_name
+    }
+
+
+def discover_tables(
+    schemas: list[dict[str, Any]],
+    *,
+    list_tables: ListTables,
+    list_columns: ListColumns,
+    list_catalog_columns: ListCatalogColumns | None = None,
+    table_filter: Callable[[list[dict[str, Any]]], list[dict[str, Any]]] | None = None,
+    previous_fingerprints: dict[str, str] | None = None,
+    known_columns: dict[str, list[dict[str, Any]]] | None = None,
+    max_workers: int = DEFAULT_INTROSPECTION_CONCURRENCY,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> DiscoveryResult:
+    """Discover the tables and columns of ``schemas`` ({"catalog", "schema"} dicts).
+
+    ``list_tables(schema, catalog)`` and ``list_columns(table, schema, catalog)``
+    mirror the connector methods; ``list_catalog_columns(catalog, schemas)``
+    returns ``{(schema, table): columns}`` or None when unsupported. Schemas
+    whose fingerprint matches ``previous_fingerprints`` reuse
+    ``known_columns`` (keyed by table full_name) for tables present there.
+    ``on_progress(schemas_done, tables_found)`` is called as table listing
+    completes. Returned tables keep the order of ``schemas``.
+    """
+    previous_fingerprints = previous_fingerprints or {}
+    known_columns = known_columns or {}
+    workers = max(1, int(max_workers))
+
+    progress_lock = threading.Lock()
+    progress = {"schemas": 0, "tables": 0}
+
+    def _list(schema_info: dict[str, Any]) -> list[dict[str, Any]]:
+        catalog, schema = schema_info.get("catalog"), schema_info.get("schema")
+        try:
+            tables = list_tables(schema, catalog)
+        except Exception as exc:
+            logger.warning("Listing tables in %s failed: %s", schema_key(catalog, schema), exc)
+            tables = []
+        if table_filter is not None:
+            tables = table_filter(tables)
+        if on_progress is not None:
+            with progress_lock:
+                progress["schemas"] += 1
+                progress["tables"] += len(tables)
+                on_progress(progress["schemas"], progress["tables"])
+        return tables
+
+    result = DiscoveryResult()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-mcp-discover") as pool:
+        listed = list(pool.map(_list, schemas))
+
+        # Decide per schema whether stored columns can be reused.
+        pending: list[dict[str, Any]] = []
+        for schema_info, tables in zip(schemas, listed):
+            catalog, schema = schema_info.get("catalog"), schema_info.get("schema")
+            key = schema_key(catalog, schema)
+            fingerprint = schema_fingerprint(tables)
+            result.fingerprints[key] = fingerprint
+            reuse = previous_fingerprints.get(key) == fingerprint and all(
+                _full_name(t) in known_columns for t in tables
+            )
+            (result.reused_schemas if reuse else result.changed_schemas).append(key)
+            for table in tables:
+                entry = {
+                    "name": table["name"],
+                    "schema": schema,
+                    "catalog": catalog,
+                    "full_name": _full_name(table),
+                    "columns": [],
+                }
+                result.tables.append(entry)
+                if reuse:
+                    entry["columns"] = known_columns[entry["full_name"]]
+                else:
+                    pending.append(entry)
+
+        # One bulk column pass per catalog that has changed schemas.
+        if list_catalog_columns is not None and pending:
+            by_catalog: dict[str | None, set[str]] = {}
+            for entry in pending:
+                by_catalog.setdefault(entry["catalog"], set()).add(entry["schema"])
+            bulk: dict[str | None, dict[tuple[str, str], list[dict[str, Any]]] | None] = {}
+            for catalog, schema_names in by_catalog.items():
+                try:
+                    columns = list_catalog_columns(catalog, sorted(s for s in schema_names if s))
+                except Exception as exc:
+                    logger.warning("Bulk column introspection for %s failed: %s", catalog, exc)
+                    columns = None
+                bulk[catalog] = columns if isinstance(columns, dict) else None
+            remaining, pending = pending, []
+            for entry in remaining:
+                catalog_columns = bulk.get(entry["catalog"])
+                cols = None
+                if catalog_columns is not None:
+                    cols = catalog_columns.get((entry["schema"], entry["name"]))
+                if cols is None:
+                    pending.append(entry)
+                else:
+                    entry["columns"] = cols
+
+        # Per-table fallback for whatever the bulk pass did not cover.
+        def _columns(entry: dict[str, Any]) -> None:
+            try:
+                entry["columns"] = list_columns(entry["name"], entry["schema"], entry["catalog"])
+            except Exception as exc:
+                logger.warning("Listing columns of %s failed: %s", entry["full_name"], exc)
+                entry["columns"] = []
+
+        list(pool.map(_columns, pending))
+
+    return result
+
+
+def _full_name(table: dict[str, Any]) -> str:
+    return table.get("full_name") or table["name"]
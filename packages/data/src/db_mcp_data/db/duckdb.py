@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import re
+import threading
 from typing import TYPE_CHECKING, Any, Callable
 
 import duckdb
 
+from db_mcp_data.db.cancellation import register_canceller
 from db_mcp_data.db.connection import DatabaseError
+from db_mcp_data.db.streaming import DEFAULT_BATCH_SIZE, RowStream
 
 if TYPE_CHECKING:
     from db_mcp_data.connectors.file import FileSourceConfig
@@ -35,6 +38,21 @@ def _read_function_for_path(path: str) -> str:
     return _FORMAT_MAP[ext]
 
 
+def _deduplicated_parts(source: FileSourceConfig) -> str:
+    """SELECT over Parquet part files keeping the newest row per ``source.key``.
+
+    Part files are named so that later writes sort last; rows without a key are
+    all kept.
+    """
+    key = source.key.replace('"', '""')
+    return (
+        "SELECT * EXCLUDE (filename) FROM "
+        f"read_parquet('{source.path}', union_by_name=true, filename=true) "
+        f'QUALIFY "{key}" IS NULL '
+        f'OR row_number() OVER (PARTITION BY "{key}" ORDER BY filename DESC) = 1'
+    )
+
+
 class DuckDBExecutor:
     """In-memory DuckDB engine that creates views from file sources and executes SQL.
 
@@ -46,20 +64,29 @@ class DuckDBExecutor:
     def __init__(self, get_sources: Callable[[], list[FileSourceConfig]]) -> None:
         self._get_sources = get_sources
         self._conn: duckdb.DuckDBPyConnection | None = None
+        self._conn_lock = threading.Lock()
 
     def invalidate(self) -> None:
         """Drop the in-memory connection so views are rebuilt on the next query."""
-        self._conn = None
+        with self._conn_lock:
+            self._conn = None
 
     def _ensure_connection(self) -> duckdb.DuckDBPyConnection:
-        if self._conn is None:
-            self._conn = duckdb.connect(":memory:")
-            self._create_views(self._conn)
-        return self._conn
+        with self._conn_lock:
+            if self._conn is None:
+                conn = duckdb.connect(":memory:")
+                self._create_views(conn)
+                self._conn = conn
+            return self._conn
 
     def _create_views(self, conn: duckdb.DuckDBPyConnection) -> None:
         for source in self._get_sources():
             func = _read_function_for_path(source.path)
+            if func == "read_parquet" and source.key:
+                conn.execute(
+                    f'CREATE OR REPLACE VIEW "{source.name}" AS {_deduplicated_parts(source)}'
+                )
+                continue
             if func == "read_parquet":
                 expr = f"read_parquet('{source.path}', hive_partitioning=true)"
             else:
@@ -67,13 +94,51 @@ class DuckDBExecutor:
             conn.execute(f'CREATE OR REPLACE VIEW "{source.name}" AS SELECT * FROM {expr}')
 
     def execute_sql(self, sql: str) -> list[dict[str, Any]]:
-        conn = self._ensure_connection()
+        # A cursor per call lets worker threads query the shared views concurrently.
+        with self._ensure_connection().cursor() as cursor:
+            release = register_canceller(cursor.interrupt)
+            try:
+                result = cursor.execute(sql)
+                columns = [desc[0] for desc in result.description]
+                return [dict(zip(columns, row)) for row in result.fetchall()]
+            except (
+                duckdb.CatalogException,
+                duckdb.BinderException,
+                duckdb.ParserException,
+            ) as exc:
+                raise DatabaseError(str(exc)) from exc
+            finally:
+                release()
+
+    def stream_sql(self, sql: str, *, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Execute SQL on a dedicated cursor and fetch rows ``batch_size`` at a time."""
+        cursor = self._ensure_connection().cursor()
+        release = register_canceller(cursor.interrupt)
         try:
-            result = conn.execute(sql)
-        except (duckdb.CatalogException, duckdb.BinderException, duckdb.ParserException) as exc:
-            raise DatabaseError(str(exc)) from exc
-        columns = [desc[0] for desc in result.description]
-        return [dict(zip(columns, row)) for row in result.fetchall()]
+            result = cursor.execute(sql)
+        except Exception as exc:
+            # Any failure (including an interrupt from cancel) ends the stream here.
+            release()
+            cursor.close()
+            if isinstance(
+                exc, (duckdb.CatalogException, duckdb.BinderException, duckdb.ParserException)
+            ):
+                raise DatabaseError(str(exc)) from exc
+            raise
+        columns = [desc[0] for desc in result.description] if result.description else []
+
+        def _batches():
+            while True:
+                chunk = result.fetchmany(batch_size)
+                if not chunk:
+                    return
+                yield [dict(zip(columns, row)) for row in chunk]
+
+        def _close() -> None:
+            release()
+            cursor.close()
+
+        return RowStream(columns, _batches(), on_close=_close)
 
     def get_columns(self, table_name: str) -> list[dict[str, Any]]:
         conn = self._ensure_connection()
@@ -1,5 +1,6 @@
 """Database schema introspection."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from sqlalchemy import inspect, text
@@ -7,6 +8,12 @@ from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from db_mcp_data.db.connection import DatabaseError, get_engine
 
+# Per-schema introspection calls in flight at once (kept below default pool size).
+DEFAULT_INTROSPECTION_CONCURRENCY = 4
+
+# information_schema.columns is standard on these dialects; others fall back
+# to per-table reflection.
+
 
 def _fallback_information_schema_columns(
     *, engine, schema: str | None, table_name: str
@@ -154,22 +161,77 @@ def get_schemas(
         raise DatabaseError(f"Failed to get schemas: {e}") from e
 
 
+def _get_trino_catalog_tables(engine, catalog: str, *, max_workers: int) -> list[dict[str, Any]]:
+    """List all tables of a Trino catalog.
+
+    Prefers a single ``information_schema.tables`` query; connectors that
+    reject it fall back to ``SHOW TABLES`` per schema on a bounded thread pool.
+    """
+
+    def make_table(schema_name: str, name: str, table_type: str = "table") -> dict[str, Any]:
+        return {
+            "name": name,
+            "schema": schema_name,
+            "catalog": catalog,
+            "type": table_type,
+            "full_name": f"{catalog}.{schema_name}.{name}",
+        }
+
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    f"SELECT table_schema, table_name, table_type "
+                    f"FROM {catalog}.information_schema.tables "
+                    f"WHERE table_schema <> 'information_schema' "
+                    f"ORDER BY table_schema, table_name"
+                )
+            ).fetchall()
+        return [
+            make_table(row[0], row[1], "view" if row[2] == "VIEW" else "table") for row in rows
+        ]
+    except (OperationalError, ProgrammingError):
+        pass
+
+    with engine.connect() as conn:
+        schema_result = conn.execute(text(f"SHOW SCHEMAS FROM {catalog}"))
+        schemas = [row[0] for row in schema_result.fetchall()]
+    schemas = [s for s in schemas if s not in ("information_schema",)]
+
+    def list_schema(schema_name: str) -> list[dict[str, Any]]:
+        try:
+            with engine.connect() as conn:
+                result = conn.execute(text(f"SHOW TABLES FROM {catalog}.{schema_name}"))
+                return [make_table(schema_name, row[0]) for row in result.fetchall()]
+        except (OperationalError, ProgrammingError):
+            # Skip schemas that error
+            return []
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        per_schema = list(pool.map(list_schema, schemas))
+    return [table for schema_tables in per_schema for table in schema_tables]
+
+
 def get_tables(
     schema: str | None = None,
     catalog: str | None = None,
     database_url: str | None = None,
     *,
     connect_args: dict | None = None,
+    max_workers: int = DEFAULT_INTROSPECTION_CONCURRENCY,
 ) -> list[dict[str, Any]]:
     """Get list of tables in a schema.
 
     For Trino with catalog: Executes SHOW TABLES FROM catalog.schema
+    For Trino with catalog only: one information_schema.tables query for the
+    whole catalog (per-schema SHOW TABLES, ``max_workers`` at a time, as fallback)
     For others: Uses SQLAlchemy inspector
 
     Args:
         schema: Schema name. If None, uses default schema.
         catalog: Optional catalog name (for Trino 3-level hierarchy)
         database_url: Optional database URL.
+        max_workers: Concurrent per-schema queries for the Trino fallback.
 
     Returns:
         List of table info dicts with 'name', 'schema', 'catalog', 'type' keys
@@ -205,33 +267,9 @@ def get_tables(
                         }
                     )
         elif dialect == "trino" and catalog:
-            # For Trino with catalog only, iterate all schemas in that catalog
-            with engine.connect() as conn:
-                # Get schemas in this catalog
-                schema_result = conn.execute(text(f"SHOW SCHEMAS FROM {catalog}"))
-                schemas = [row[0] for row in schema_result.fetchall()]
-                schemas = [s for s in schemas if s not in ("information_schema",)]
-
-                for schema_name in schemas:
-                    try:
-                        table_result = conn.execute(
-                            text(f"SHOW TABLES FROM {catalog}.{schema_name}")
-                        )
-                        table_names = [row[0] for row in table_result.fetchall()]
-
-                        for name in table_names:
-                            tables.append(
-                                {
-                                    "name": name,
-                                    "schema": schema_name,
-                                    "catalog": catalog,
-                                    "type": "table",
-                                    "full_name": f"{catalog}.{schema_name}.{name}",
-                                }
-                            )
-                    except (OperationalError, ProgrammingError):
-                        # Skip schemas that error
-                        continue
+            # For Trino with catalog only, list every schema's tables in one
+            # information_schema pass, or fan out SHOW TABLES per schema.
+            tables = _get_trino_catalog_tables(engine, catalog, max_workers=max_workers)
         else:
             # Use SQLAlchemy inspector for other databases
             inspector = inspect(engine)
@@ -310,7 +348,8 @@ def get_columns(
                                 "nullable": True,  # Trino DESCRIBE doesn't show nullable
                                 "default": None,
                                 "primary_key": False,
-                                "comment": row[2] if len(row) > 2 else None,
+                                # Column | Type | Extra | Comment
+                                "comment": (row[3] or None) if len(row) > 3 else None,
                             }
                         )
                     return columns
@@ -349,6 +388,85 @@ def get_columns(
         raise DatabaseError(f"Failed to get columns for {table_name}: {e}") from e
 
 
+def get_catalog_columns(
+    catalog: str | None = None,
+    schemas: list[str] | None = None,
+    database_url: str | None = None,
+    *,
+    connect_args: dict | None = None,
+) -> dict[tuple[str, str], list[dict[str, Any]]] | None:
+    """Get columns for every table of a catalog in one catalog-table pass.
+
+    Replaces one DESCRIBE / reflection round-trip per table during discovery.
+    Only dialects whose bulk metadata matches what ``get_columns`` returns
+    take this path: Trino (``system.jdbc.columns`` carries the same type
+    names and comments as DESCRIBE) and ClickHouse (``system.columns``).
+    Elsewhere information_schema types, keys and comments differ from
+    SQLAlchemy reflection, so None is returned.
+
+    Args:
+        catalog: Catalog name (Trino) or None for the connection's database.
+        schemas: Optional schema names to restrict the scan to.
+        database_url: Optional database URL.
+
+    Returns:
+        Mapping of ``(schema, table)`` to column info dicts (same shape as
+        ``get_columns``), or None when callers should introspect table by
+        table.
+    """
+    try:
+        engine = get_engine(database_url, connect_args=connect_args)
+        dialect = engine.dialect.name.lower()
+        params: dict[str, Any] = {}
+        if dialect == "clickhouse":
+            # ClickHouse databases play the role of schemas (see get_schemas).
+            schema_col = "database"
+            select = (
+                "SELECT database, table, name, type, comment FROM system.columns "
+                "WHERE database NOT IN ('system', 'information_schema', 'INFORMATION_SCHEMA')"
+            )
+            order = "database, table, position"
+        elif dialect == "trino" and catalog:
+            schema_col = "table_schem"
+            select = (
+                "SELECT table_schem, table_name, column_name, type_name, remarks "
+                "FROM system.jdbc.columns "
+                "WHERE table_cat = :catalog AND table_schem <> 'information_schema'"
+            )
+            params["catalog"] = catalog
+            order = "table_schem, table_name, ordinal_position"
+        else:
+            return None
+
+        names = [name for name in schemas or [] if name]
+        schema_params = {f"schema_{i}": name for i, name in enumerate(names)}
+        if names:
+            select += f" AND {schema_col} IN ({', '.join(':' + key for key in schema_params)})"
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text(f"{select} ORDER BY {order}"), {**params, **schema_params}
+            ).fetchall()
+    except (OperationalError, ProgrammingError):
+        return None
+    except Exception as e:
+        raise DatabaseError(f"Failed to get columns for catalog {catalog}: {e}") from e
+
+    columns: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for schema_name, table_name, column_name, data_type, comment in rows:
+        columns.setdefault((schema_name, table_name), []).append(
+            {
+                "name": column_name,
+                "type": str(data_type),
+                # Trino DESCRIBE does not report it; ClickHouse puts it in the type.
+                "nullable": True,
+                "default": None,
+                "primary_key": False,
+                "comment": comment or None,
+            }
+        )
+    return columns
+
+
 def get_table_sample(
     table_name: str,
     schema: str | None = None,
@@ -445,15 +563,67 @@ def get_foreign_keys(
         inspector = inspect(engine)
 
         fks = inspector.get_foreign_keys(table_name, schema=schema)
-        return [
-            {
-                "name": fk.get("name"),
-                "columns": fk.get("constrained_columns", []),
-                "referred_schema": fk.get("referred_schema"),
-                "referred_table": fk.get("referred_table"),
-                "referred_columns": fk.get("referred_columns", []),
-            }
-            for fk in fks
-        ]
+        return [_foreign_key_info(fk) for fk in fks]
     except Exception as e:
         raise DatabaseError(f"Failed to get foreign keys for {table_name}: {e}") from e
+
+
+def _foreign_key_info(fk: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "name": fk.get("name"),
+        "columns": fk.get("constrained_columns", []),
+        "referred_schema": fk.get("referred_schema"),
+        "referred_table": fk.get("referred_table"),
+        "referred_columns": fk.get("referred_columns", []),
+    }
+
+
+def get_schema_foreign_keys(
+    schema: str | None = None,
+    database_url: str | None = None,
+    *,
+    catalog: str | None = None,
+    connect_args: dict | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Get foreign key constraints for every table of a schema in one pass.
+
+    Uses the inspector's multi-table reflection where the dialect supports it
+    and falls back to one ``get_foreign_keys`` call per table otherwise.
+    Dialects without declared constraints (Trino, ClickHouse) return ``{}``.
+
+    Args:
+        schema: Schema name. If None, uses default schema.
+        database_url: Optional database URL.
+        catalog: Catalog (database) holding the schema. SQL Server reflects it
+            as ``catalog.schema``; other dialects cannot reflect a catalog other
+            than the connected one and return ``{}`` rather than its keys.
+
+    Returns:
+        Mapping of table name to foreign key info dicts (same shape as
+        ``get_foreign_keys``); tables without foreign keys are omitted.
+    """
+    try:
+        engine = get_engine(database_url, connect_args=connect_args)
+        dialect = engine.dialect.name.lower()
+        if dialect in {"trino", "clickhouse"}:
+            return {}
+        if catalog:
+            if dialect != "mssql":
+                return {}
+            schema = f"{catalog}.{schema or 'dbo'}"
+        inspector = inspect(engine)
+        try:
+            reflected = inspector.get_multi_foreign_keys(schema=schema)
+        except NotImplementedError:
+            reflected = {
+                (schema, name): inspector.get_foreign_keys(name, schema=schema)
+                for name in inspector.get_table_names(schema=schema)
+            }
+        return {
+            table_name: [_foreign_key_info(fk) for fk in fks]
+            for (_, table_name), fks in reflected.items()
+            if fks
+        }
+    except Exception as e:
+        raise DatabaseError(f"Failed to get foreign keys for schema {schema}: {e}") from e
+
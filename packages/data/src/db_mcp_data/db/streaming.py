@@ -0,0 +1,217 @@
+"""Row-batch streams for bounded-memory result consumption.
+
+Connectors that can fetch incrementally (SQLAlchemy server-side cursors,
+DuckDB ``fetchmany``) expose ``stream_sql()`` returning a ``RowStream``.
+Consumers pull batches until they have enough rows and then close the
+stream, which releases the cursor and its pooled connection without
+materialising the rest of the result.
+
+Results are bounded by rows and by (approximate, JSON-encoded) bytes. For SQL
+connections the row bound is also pushed into the statement itself (see
+``push_down_limit``), so drivers that buffer whole results client-side never
+receive more than the bound.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from sqlglot import exp
+from sqlglot import parse as sqlglot_parse
+from sqlglot.errors import SqlglotError
+
+DEFAULT_BATCH_SIZE = 1000
+# Row bound for synchronous results unless ``max_result_rows`` overrides it.
+DEFAULT_MAX_RESULT_ROWS = 100_000
+# Byte bound (JSON-encoded rows) unless ``max_result_bytes`` overrides it.
+DEFAULT_MAX_RESULT_BYTES = 64 * 1024 * 1024
+
+
+class RowStream:
+    """Iterator of row batches (``list[dict]``) with known column names.
+
+    The stream owns the underlying cursor/connection; ``close()`` is
+    idempotent and is called automatically once the batches are exhausted
+    or when used as a context manager.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        batches: Iterable[list[dict[str, Any]]],
+        *,
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        self.columns = list(columns)
+        self._batches = iter(batches)
+        self._on_close = on_close
+        self._closed = False
+
+    def __iter__(self) -> Iterator[list[dict[str, Any]]]:
+        return self
+
+    def __next__(self) -> list[dict[str, Any]]:
+        if self._closed:
+            raise StopIteration
+        try:
+            return next(self._batches)
+        except StopIteration:
+            self.close()
+            raise
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> RowStream:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Release the underlying cursor and connection."""
+        if self._closed:
+            return
+        self._closed = True
+        close_batches = getattr(self._batches, "close", None)
+        if callable(close_batches):
+            close_batches()
+        if self._on_close is not None:
+            self._on_close()
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: list[dict[str, Any]],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> RowStream:
+        """Wrap an already-materialised row list as a stream."""
+        columns = list(rows[0].keys()) if rows else []
+        size = max(1, batch_size)
+        return cls(columns, (rows[i : i + size] for i in range(0, len(rows), size)))
+
+
+def row_bytes(row: dict[str, Any]) -> int:
+    """Approximate payload size of one row, as the JSON the caller receives."""
+    return len(json.dumps(row, default=str))
+
+
+def drain_stream(
+    stream: RowStream,
+    *,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Consume *stream* into a row list, stopping after *max_rows* or *max_bytes*.
+
+    Returns ``(rows, truncated)``. ``truncated`` is True when the stream still
+    had rows after a bound was reached. The row that would cross *max_bytes*
+    is left out, except that the first row is always kept. The stream is
+    always closed.
+    """
+    rows: list[dict[str, Any]] = []
+    size = 0
+    truncated = False
+    try:
+        for batch in stream:
+            if max_rows is not None and len(rows) + len(batch) > max_rows:
+                batch = batch[: max_rows - len(rows)]
+                truncated = True
+            if max_bytes is not None:
+                for index, row in enumerate(batch):
+                    size += row_bytes(row)
+                    if size > max_bytes and (rows or index):
+                        batch = batch[:index]
+                        truncated = True
+                        break
+            rows.extend(batch)
+            if truncated:
+                break
+            if max_rows is not None and len(rows) == max_rows:
+                # Pull one more batch so an exactly-full result is not
+                # reported as truncated.
+                truncated = bool(next(stream, None))
+                break
+    finally:
+        stream.close()
+    return rows, truncated
+
+
+def result_row_limit(capabilities: dict[str, Any] | None) -> int | None:
+    """Row bound for synchronous results from a connection's capabilities.
+
+    ``max_result_rows`` unset means ``DEFAULT_MAX_RESULT_ROWS``; 0 (or a
+    negative value) disables the bound.
+    """
+    configured = (capabilities or {}).get("max_result_rows")
+    if configured is None:
+        return DEFAULT_MAX_RESULT_ROWS
+    limit = int(configured)
+    return limit if limit > 0 else None
+
+
+def result_byte_limit(capabilities: dict[str, Any] | None) -> int | None:
+    """Byte bound for synchronous results from a connection's capabilities.
+
+    ``max_result_bytes`` unset means ``DEFAULT_MAX_RESULT_BYTES``; 0 (or a
+    negative value) disables the bound.
+    """
+    configured = (capabilities or {}).get("max_result_bytes")
+    if configured is None:
+        return DEFAULT_MAX_RESULT_BYTES
+    limit = int(configured)
+    return limit if limit > 0 else None
+
+
+# connection dialect name -> sqlglot dialect, where they differ
+_SQLGLOT_DIALECTS = {"postgresql": "postgres", "mssql": "tsql"}
+# Dialects whose row limit is not a trailing ``LIMIT n`` clause.
+_TRAILING_LIMITS = {"oracle": "FETCH FIRST {n} ROWS ONLY"}
+
+
+def push_down_limit(sql: str, limit: int, dialect: str | None) -> str:
+    """Bound a single read query to *limit* rows in the dialect's own syntax.
+
+    Queries that already carry a row limit, an OFFSET, locks, ``INTO`` or
+    ClickHouse ``SETTINGS``/``FORMAT`` clauses are returned unchanged, as is
+    anything that is not one SELECT (or set operation) sqlglot can parse.
+    Otherwise the SQL text is kept verbatim and a trailing ``LIMIT``
+    (``FETCH FIRST`` on Oracle) is appended; T-SQL gets a ``TOP`` clause
+    instead, regenerated by sqlglot.
+    """
+    if not isinstance(dialect, str) or dialect in ("", "unknown"):
+        return sql
+    read = _SQLGLOT_DIALECTS.get(dialect, dialect)
+    try:
+        statements = [s for s in sqlglot_parse(sql, read=read) if s is not None]
+    except (SqlglotError, ValueError):
+        # ValueError: a dialect sqlglot does not know.
+        return sql
+    if len(statements) != 1:
+        return sql
+    statement = statements[0]
+    if not isinstance(statement, (exp.Select, exp.SetOperation)):
+        return sql
+    # A LIMIT appended after SETTINGS/FORMAT would be a syntax error.
+    trailing = ("limit", "offset", "locks", "into", "settings", "format")
+    if any(statement.args.get(arg) for arg in trailing):
+        return sql
+    if statement.find(exp.Into, exp.Fetch) is not None:
+        return sql
+    if read == "tsql":
+        if not isinstance(statement, exp.Select):
+            return sql
+        try:
+            return statement.limit(limit).sql(dialect=read)
+        except SqlglotError:
+            return sql
+    clause = _TRAILING_LIMITS.get(read, "LIMIT {n}").format(n=int(limit))
+    # A newline keeps a trailing ``--`` comment from swallowing the clause.
+    return f"{sql.rstrip().rstrip(';').rstrip()}\n{clause}"
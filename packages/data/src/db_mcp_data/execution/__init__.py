@@ -1,12 +1,14 @@
 """Execution models and contracts for unified query lifecycle."""
 
 from db_mcp_data.execution.models import (
+    CompactionStats,
     ExecutionError,
     ExecutionErrorCode,
     ExecutionHandle,
     ExecutionRequest,
     ExecutionResult,
     ExecutionState,
+    RetentionPolicy,
 )
 from db_mcp_data.execution.policy import (
     check_protocol_ack_gate,
@@ -17,12 +19,14 @@ from db_mcp_data.execution.policy import (
 )
 
 __all__ = [
+    "CompactionStats",
     "ExecutionError",
     "ExecutionErrorCode",
     "ExecutionHandle",
     "ExecutionRequest",
     "ExecutionResult",
     "ExecutionState",
+    "RetentionPolicy",
     "check_protocol_ack_gate",
     "evaluate_sql_execution_policy",
     "has_fresh_protocol_ack",
@@ -4,21 +4,46 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Any
 
+from db_mcp_data.db.cancellation import TIMED_OUT, CancelScope, cancel_running, cancel_scope
+from db_mcp_data.db.streaming import DEFAULT_BATCH_SIZE, RowStream, drain_stream
 from db_mcp_data.execution.models import (
+    CompactionStats,
     ExecutionError,
     ExecutionErrorCode,
     ExecutionHandle,
     ExecutionRequest,
     ExecutionResult,
+    ExecutionState,
+    RetentionPolicy,
 )
+from db_mcp_data.execution.result_cache import (
+    ResultCache,
+    get_result_cache,
+    is_cacheable_sql,
+    is_read_only_sql,
+    result_cache_key,
+)
+from db_mcp_data.execution.result_files import SPILL_ROW_THRESHOLD
 from db_mcp_data.execution.store import ExecutionStore
 
 _STORE_FILENAME = "executions.sqlite"
 _EXECUTION_STORE_CACHE: dict[Path, ExecutionStore] = {}
+_EXECUTION_STORE_LOCK = threading.Lock()
+_TERMINAL_STATES = frozenset(
+    {
+        ExecutionState.SUCCEEDED,
+        ExecutionState.FAILED,
+        ExecutionState.CANCELLED,
+        ExecutionState.TIMED_OUT,
+    }
+)
 
 
 def _payload_hash(payload: dict | None) -> str | None:
@@ -38,59 +63,202 @@ def _sql_hash(sql: str | None) -> str | None:
     return _payload_hash({"sql": sql})
 
 
+def _cancelled_error() -> ExecutionError:
+    # Matches how cancelled API executions are reported (see _api_async_state).
+    return ExecutionError(code=ExecutionErrorCode.POLICY, message="Execution cancelled by user")
+
+
 def get_execution_store(connection_path: Path) -> ExecutionStore:
     """Return per-connection cached execution store."""
     conn_path = Path(connection_path).resolve()
-    if conn_path not in _EXECUTION_STORE_CACHE:
-        db_path = conn_path / "state" / _STORE_FILENAME
-        _EXECUTION_STORE_CACHE[conn_path] = ExecutionStore(db_path)
-    return _EXECUTION_STORE_CACHE[conn_path]
+    store = _EXECUTION_STORE_CACHE.get(conn_path)
+    if store is not None:
+        return store
+    with _EXECUTION_STORE_LOCK:
+        if conn_path not in _EXECUTION_STORE_CACHE:
+            db_path = conn_path / "state" / _STORE_FILENAME
+            _EXECUTION_STORE_CACHE[conn_path] = ExecutionStore(db_path)
+        return _EXECUTION_STORE_CACHE[conn_path]
+
+
+def compact_execution_stores(policy: RetentionPolicy) -> dict[Path, CompactionStats]:
+    """Apply ``policy`` to every execution store opened by this process."""
+    with _EXECUTION_STORE_LOCK:
+        stores = list(_EXECUTION_STORE_CACHE.items())
+    return {conn_path: store.compact(policy) for conn_path, store in stores}
 
 
 def get_execution_engine(connection_path: Path) -> "ExecutionEngine":
-    """Construct an execution engine for a connection path."""
-    return ExecutionEngine(get_execution_store(connection_path))
+    """Construct an execution engine (with its result cache) for a connection path."""
+    return ExecutionEngine(
+        get_execution_store(connection_path),
+        result_cache=get_result_cache(connection_path),
+    )
 
 
 class ExecutionEngine:
     """State-machine execution coordinator."""
 
-    def __init__(self, store: ExecutionStore):
+    def __init__(self, store: ExecutionStore, *, result_cache: ResultCache | None = None):
         self._store = store
+        self._result_cache = result_cache
+
+    @property
+    def result_cache(self) -> ResultCache | None:
+        """Result cache consulted by ``submit_sync`` (None when caching is off)."""
+        return self._result_cache
 
     def submit_sync(
         self,
         request: ExecutionRequest,
         runner: Any,
+        *,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
     ) -> tuple[ExecutionHandle, ExecutionResult]:
-        """Execute a request synchronously and persist lifecycle transitions."""
+        """Execute a request synchronously and persist lifecycle transitions.
+
+        The runner returns either a materialised ``data`` list or a ``stream``
+        (``RowStream``). Streams are consumed batch by batch and closed once
+        ``max_rows`` rows (or ``max_bytes`` of JSON-encoded rows) have been
+        collected, so the full result never has to be held in memory;
+        ``metadata["truncated"]`` records whether rows were left behind.
+
+        Read-only SQL is served from the engine's ``ResultCache`` when a live
+        entry exists; a cache miss re-runs the query even if an idempotent
+        row for it is already stored, so reuse is bounded by the TTL. Other
+        reads (SHOW, EXPLAIN, DESCRIBE) bypass the cache; writes and DDL also
+        invalidate the connection's entries.
+        """
+        cache_key = self._cache_key(request, max_rows, max_bytes)
+        if cache_key is not None:
+            # Only read results are ever stored, so a hit needs no SQL parse.
+            cached = self._result_cache.get(cache_key)  # type: ignore[union-attr]
+            if cached is not None:
+                return cached
+        is_read = self._result_cache is not None and is_cacheable_sql(request.sql)
+        if not is_read:
+            cache_key = None
+
         ph = _payload_hash(request.payload)
-        handle = self._store.create_submission(request, payload_hash=ph)
-        existing_result = self._store.get_result(handle.execution_id)
-
-        if existing_result is not None and existing_result.state in {
-            existing_result.state.SUCCEEDED,
-            existing_result.state.FAILED,
-            existing_result.state.CANCELLED,
-            existing_result.state.TIMED_OUT,
-        }:
-            return handle, existing_result
-
-        self._store.mark_running(handle.execution_id)
+        # New rows are inserted directly as RUNNING, so a fresh sync execution
+        # costs two writes (start + completion) instead of three.
+        handle, created = self._store.create_or_get_submission(
+            request, payload_hash=ph, start=True
+        )
+        if not created:
+            # State-only probe: avoid reading result rows unless we return them.
+            existing_result = self._store.get_result(handle.execution_id, limit=0)
+
+            if existing_result is not None and existing_result.state in _TERMINAL_STATES:
+                if cache_key is None:
+                    return handle, self._store.get_result(handle.execution_id)  # type: ignore[return-value]
+                # Stale idempotent result: detach it and execute afresh.
+                self._store.release_idempotency_key(handle.execution_id)
+                handle, created = self._store.create_or_get_submission(
+                    request, payload_hash=ph, start=True
+                )
+            if not created:
+                self._store.mark_running(handle.execution_id)
         started = time.time()
 
+        with self.cancellable(
+            handle.execution_id, timeout_seconds=request.timeout_seconds
+        ) as scope:
+            rows = self._run_sync(
+                handle.execution_id,
+                request.payload,
+                runner,
+                scope,
+                started=started,
+                max_rows=max_rows,
+                max_bytes=max_bytes,
+            )
+
+        if rows is None:
+            result = self._store.get_result(handle.execution_id)
+        else:
+            # The rows are already in memory: the stored copy (inline or spilled
+            # to Parquet) only serves later paged reads, so it is not read back.
+            result = self._store.get_result(handle.execution_id, limit=0)
+            if result is not None and result.state == ExecutionState.SUCCEEDED:
+                result = result.model_copy(update={"data": rows})
+            else:
+                result = self._store.get_result(handle.execution_id)
+        if result is None:
+            # Should never happen, but keep deterministic failure semantics.
+            fallback_error = ExecutionError(
+                code=ExecutionErrorCode.TOOLING,
+                message="Execution result missing after submission",
+            )
+            self._store.mark_failed(
+                handle.execution_id,
+                error=fallback_error,
+                duration_ms=None,
+            )
+            result = self._store.get_result(handle.execution_id)
+
+        if self._result_cache is not None and result is not None:
+            if cache_key is not None and result.state == ExecutionState.SUCCEEDED:
+                if result.rows_returned <= SPILL_ROW_THRESHOLD:
+                    self._result_cache.put(
+                        cache_key,
+                        connection=request.connection,
+                        handle=handle,
+                        result=result,
+                        ttl_seconds=request.cache_ttl_seconds,
+                    )
+            elif not is_read and not is_read_only_sql(request.sql):
+                # A write may have changed anything this connection has cached.
+                self._result_cache.invalidate(request.connection)
+
+        # result is guaranteed non-None by the fallback path above
+        return handle, result  # type: ignore[return-value]
+
+    def _run_sync(
+        self,
+        execution_id: str,
+        payload: dict[str, Any],
+        runner: Any,
+        scope: CancelScope,
+        *,
+        started: float,
+        max_rows: int | None,
+        max_bytes: int | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Run ``runner`` for ``submit_sync`` and persist its outcome.
+
+        Returns the result rows when they were materialised in memory, or None
+        for failures and unbounded streams (which the store consumes).
+        """
         try:
-            runner_result = runner(request.payload)
+            runner_result = runner(payload)
             duration_ms = (time.time() - started) * 1000
 
-            data = runner_result.get("data", [])
-            columns = runner_result.get("columns", [])
-            rows_returned = runner_result.get("rows_returned", len(data))
             rows_affected = runner_result.get("rows_affected")
             metadata = runner_result.get("metadata", {})
+            stream = runner_result.get("stream")
+            if stream is not None and max_rows is None and max_bytes is None:
+                # Unbounded stream: the store spills batches to disk as they arrive.
+                data = stream
+                columns = runner_result.get("columns") or stream.columns
+                rows_returned = None
+            elif stream is not None:
+                data, truncated = drain_stream(stream, max_rows=max_rows, max_bytes=max_bytes)
+                columns = runner_result.get("columns") or stream.columns
+                rows_returned = len(data)
+                metadata = {**metadata, "truncated": truncated}
+            else:
+                data = runner_result.get("data", [])
+                columns = runner_result.get("columns", [])
+                rows_returned = runner_result.get("rows_returned", len(data))
+                if max_rows is not None and len(data) > max_rows:
+                    data = data[:max_rows]
+                    rows_returned = max_rows
+                    metadata = {**metadata, "truncated": True}
 
             self._store.mark_succeeded(
-                handle.execution_id,
+                execution_id,
                 data=data,
                 columns=columns,
                 rows_returned=rows_returned,
@@ -98,7 +266,12 @@ class ExecutionEngine:
                 duration_ms=duration_ms,
                 metadata=metadata,
             )
+            return None if isinstance(data, RowStream) else data
         except Exception as exc:
+            if scope.cancelled:
+                # The interrupted driver call raised; the cancel scope has
+                # already recorded the execution as cancelled / timed out.
+                return None
             duration_ms = (time.time() - started) * 1000
             error = ExecutionError(
                 code=ExecutionErrorCode.ENGINE,
@@ -106,39 +279,95 @@ class ExecutionEngine:
                 retryable=False,
             )
             self._store.mark_failed(
-                handle.execution_id,
+                execution_id,
                 error=error,
                 duration_ms=duration_ms,
             )
+            return None
 
-        result = self._store.get_result(handle.execution_id)
-        if result is None:
-            # Should never happen, but keep deterministic failure semantics.
-            fallback_error = ExecutionError(
-                code=ExecutionErrorCode.TOOLING,
-                message="Execution result missing after submission",
-            )
-            self._store.mark_failed(
-                handle.execution_id,
-                error=fallback_error,
-                duration_ms=None,
-            )
-            result = self._store.get_result(handle.execution_id)
+    def _cache_key(
+        self, request: ExecutionRequest, max_rows: int | None, max_bytes: int | None = None
+    ) -> str | None:
+        if self._result_cache is None or request.query_type != "sql" or not request.sql:
+            return None
+        if request.cache_ttl_seconds is not None and request.cache_ttl_seconds <= 0:
+            return None
+        return result_cache_key(request.connection, request.sql, max_rows, max_bytes)
 
-        # result is guaranteed non-None by the fallback path above
-        return handle, result  # type: ignore[return-value]
+    def get_result(
+        self,
+        execution_id: str,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> ExecutionResult | None:
+        """Fetch execution result by ID, optionally a single page of rows."""
+        return self._store.get_result(execution_id, offset=offset, limit=limit)
+
+    def iter_result_batches(
+        self,
+        execution_id: str,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream a stored result in batches (e.g. for exports)."""
+        return self._store.iter_result_batches(execution_id, batch_size=batch_size)
 
-    def get_result(self, execution_id: str) -> ExecutionResult | None:
-        """Fetch execution result by ID."""
-        return self._store.get_result(execution_id)
+    def latest_execution_for_query(self, query_id: str) -> ExecutionHandle | None:
+        """Most recent execution of a validated query (e.g. to cancel it)."""
+        return self._store.latest_for_query(query_id)
 
     def submit_async(self, request: ExecutionRequest) -> ExecutionHandle:
         """Create an async execution submission without running it."""
         return self._store.create_submission(request, payload_hash=_payload_hash(request.payload))
 
-    def mark_running(self, execution_id: str) -> None:
-        """Mark an existing execution as running."""
-        self._store.mark_running(execution_id)
+    def mark_running(self, execution_id: str) -> bool:
+        """Mark an existing execution as running; False if it was already cancelled."""
+        return self._store.mark_running(execution_id)
+
+    def cancellable(
+        self,
+        execution_id: str,
+        *,
+        timeout_seconds: float | None = None,
+    ) -> AbstractContextManager[CancelScope]:
+        """Cancel scope for code that executes ``execution_id`` in this thread.
+
+        Statements sent by connectors inside the scope can be stopped by
+        ``cancel_execution()``; with ``timeout_seconds`` set they are stopped
+        once the deadline passes. Either way the store records the outcome
+        before the interrupted driver call returns.
+        """
+
+        def _record(reason: str) -> None:
+            if reason == TIMED_OUT:
+                self._store.mark_cancelled(
+                    execution_id,
+                    error=ExecutionError(
+                        code=ExecutionErrorCode.TIMEOUT,
+                        message=f"Statement timed out after {timeout_seconds:g}s",
+                        retryable=True,
+                        details={"timeout_seconds": timeout_seconds},
+                    ),
+                    state=ExecutionState.TIMED_OUT,
+                )
+            else:
+                self._store.mark_cancelled(execution_id, error=_cancelled_error())
+
+        return cancel_scope(execution_id, timeout_seconds=timeout_seconds, on_cancel=_record)
+
+    def cancel_execution(self, execution_id: str) -> bool:
+        """Cancel a submitted or running execution.
+
+        A statement running in this process is interrupted with its dialect's
+        native cancellation; an execution that has not started yet (or runs
+        elsewhere) is only marked ``cancelled``. Returns False if the
+        execution does not exist or has already finished.
+        """
+        if cancel_running(execution_id):
+            result = self._store.get_result(execution_id, limit=0)
+            return result is not None and result.state == ExecutionState.CANCELLED
+        return self._store.mark_cancelled(execution_id, error=_cancelled_error())
 
     def update_metadata(
         self,
@@ -154,14 +383,14 @@ class ExecutionEngine:
         self,
         execution_id: str,
         *,
-        data: list[dict[str, Any]],
+        data: list[dict[str, Any]] | RowStream,
         columns: list[str],
-        rows_returned: int,
+        rows_returned: int | None,
         rows_affected: int | None,
         duration_ms: float | None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
-        """Mark an execution as succeeded."""
+        """Mark an execution as succeeded; ``data`` may be a ``RowStream``."""
         self._store.mark_succeeded(
             execution_id,
             data=data,
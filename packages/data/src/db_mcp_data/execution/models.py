@@ -56,6 +56,10 @@ class ExecutionRequest(BaseModel):
     idempotency_key: str | None = None
     confirmed: bool = False
     metadata: dict[str, Any] = Field(default_factory=dict)
+    # Result-cache TTL for this request; None uses the engine default, 0 bypasses it.
+    cache_ttl_seconds: float | None = None
+    # Statement timeout enforced by the engine (None: no timeout).
+    timeout_seconds: float | None = None
 
     @model_validator(mode="before")
     @classmethod
@@ -101,3 +105,23 @@ class ExecutionResult(BaseModel):
     completed_at: datetime | None = None
     error: ExecutionError | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
+
+
+class RetentionPolicy(BaseModel):
+    """Limits enforced on persisted execution history by ``ExecutionStore.compact``.
+
+    ``None`` disables a limit. Only terminal executions are ever deleted.
+    """
+
+    max_age_seconds: float | None = 7 * 24 * 3600
+    max_total_bytes: int | None = 512 * 1024 * 1024
+    max_rows_per_connection: int | None = 10_000
+
+
+class CompactionStats(BaseModel):
+    """Outcome of one compaction pass."""
+
+    rows_deleted: int = 0
+    files_deleted: int = 0
+    bytes_freed: int = 0
+    pages_vacuumed: int = 0
@@ -13,6 +13,7 @@ import asyncio
 import logging
 import time
 import uuid
+from collections.abc import Callable
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -111,6 +112,7 @@ class QueryStore:
         self._lock = asyncio.Lock()
         self._max_queries = max_queries
         self._cleanup_task: asyncio.Task | None = None
+        self._cleanup_hooks: list[Callable[[], Any]] = []
 
     async def register_validated(
         self,
@@ -244,6 +246,18 @@ class QueryStore:
 
         return removed
 
+    def add_cleanup_hook(self, hook: Callable[[], Any]) -> None:
+        """Run ``hook`` (in a worker thread) on every cleanup loop tick."""
+        if hook not in self._cleanup_hooks:
+            self._cleanup_hooks.append(hook)
+
+    async def _run_cleanup_hooks(self) -> None:
+        for hook in list(self._cleanup_hooks):
+            try:
+                await asyncio.to_thread(hook)
+            except Exception as e:
+                logger.exception(f"Cleanup hook {hook!r} failed: {e}")
+
     async def start_cleanup_loop(self, interval_seconds: int = 300) -> None:
         """Start background cleanup loop."""
         if self._cleanup_task is not None:
@@ -254,6 +268,7 @@ class QueryStore:
                 try:
                     await asyncio.sleep(interval_seconds)
                     await self.cleanup_expired()
+                    await self._run_cleanup_hooks()
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
@@ -0,0 +1,179 @@
+"""In-process result cache for read-only SQL executions.
+
+Entries are keyed on ``(connection, normalized SQL, max_rows)`` and hold the
+handle and result of a completed execution, so an agent that re-asks the same
+aggregate within the TTL is answered from memory without touching the
+warehouse or ``executions.sqlite``. The cache is bounded both by entry count
+and by (approximate) payload bytes, evicting least-recently-used entries.
+
+Only plain queries are cached (see ``is_cacheable_sql``), and callers
+invalidate a connection's entries when its data or schema changes
+(``invalidate_result_cache``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from sqlglot import exp
+from sqlglot import parse as sqlglot_parse
+from sqlglot.errors import SqlglotError
+
+from db_mcp_data.execution.models import ExecutionHandle, ExecutionResult
+from db_mcp_data.ttl_cache import TTLCache
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Nodes that make an otherwise SELECT-shaped statement write, lock or call out.
+_NON_CACHEABLE_NODES = (
+    exp.Into,
+    exp.Insert,
+    exp.Update,
+    exp.Delete,
+    exp.Merge,
+    exp.Lock,
+    exp.Command,
+)
+
+# Nodes that make a statement change data or schema.
+_WRITE_NODES = (exp.Into, exp.Insert, exp.Update, exp.Delete, exp.Merge)
+
+# Commands sqlglot cannot parse further that still only read.
+_READ_COMMANDS = frozenset({"SHOW", "EXPLAIN", "DESCRIBE", "DESC"})
+
+
+def result_cache_key(
+    connection: str, sql: str, max_rows: int | None = None, max_bytes: int | None = None
+) -> str:
+    """Deterministic cache key; only whitespace is collapsed, case is significant."""
+    normalized = " ".join(sql.split())
+    bounds = f"{max_rows}" if max_bytes is None else f"{max_rows}/{max_bytes}"
+    return hashlib.sha256(f"{connection}\0{bounds}\0{normalized}".encode()).hexdigest()
+
+
+def is_cacheable_sql(sql: str | None) -> bool:
+    """Return True only for a single plain query (SELECT, WITH ... SELECT, set ops).
+
+    Anything else — including unparseable SQL, CALL, COPY, SELECT ... INTO,
+    SELECT ... FOR UPDATE and data-modifying CTEs — bypasses the cache.
+    """
+    if not sql or not sql.strip():
+        return False
+    try:
+        statements = [statement for statement in sqlglot_parse(sql) if statement is not None]
+    except SqlglotError:
+        return False
+    if len(statements) != 1:
+        return False
+    statement = statements[0]
+    if isinstance(statement, exp.Subquery):
+        statement = statement.unnest()
+    if not isinstance(statement, (exp.Select, exp.SetOperation)):
+        return False
+    return statement.find(*_NON_CACHEABLE_NODES) is None
+
+
+def is_read_only_sql(sql: str | None) -> bool:
+    """Return True when every statement only reads (queries, SHOW, EXPLAIN, DESCRIBE).
+
+    Callers invalidate cached results after anything else; unparseable SQL is
+    treated as a possible write.
+    """
+    if not sql or not sql.strip():
+        return False
+    try:
+        statements = [statement for statement in sqlglot_parse(sql) if statement is not None]
+    except SqlglotError:
+        return False
+    return bool(statements) and all(_is_read_statement(statement) for statement in statements)
+
+
+def _is_read_statement(statement: exp.Expression) -> bool:
+    if isinstance(statement, exp.Subquery):
+        statement = statement.unnest()
+    if isinstance(statement, (exp.Select, exp.SetOperation)):
+        return statement.find(*_WRITE_NODES) is None
+    if isinstance(statement, (exp.Describe, exp.Show)):
+        return True
+    if isinstance(statement, exp.Command):
+        keyword = str(statement.this).upper()
+        rest = statement.expression.name.lstrip().upper() if statement.expression else ""
+        # EXPLAIN ANALYZE runs the statement it explains.
+        return keyword in _READ_COMMANDS and not (
+            keyword == "EXPLAIN" and rest.startswith("ANALYZE")
+        )
+    return False
+
+
+class ResultCache(TTLCache[tuple[ExecutionHandle, ExecutionResult]]):
+    """Thread-safe, size-bounded LRU cache of successful execution results."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries, max_bytes=max_bytes)
+
+    def get(self, key: str) -> tuple[ExecutionHandle, ExecutionResult] | None:
+        """Return a live entry (refreshing its LRU position) or None."""
+        return self.lookup(key)
+
+    def put(
+        self,
+        key: str,
+        *,
+        connection: str,
+        handle: ExecutionHandle,
+        result: ExecutionResult,
+        ttl_seconds: float | None = None,
+    ) -> bool:
+        """Store a result; returns False when it is disabled or too large to cache."""
+        size = len(json.dumps(result.data, default=str))
+        return self.store(
+            key, (handle, result), group=connection, ttl_seconds=ttl_seconds, size=size
+        )
+
+
+_RESULT_CACHES: dict[Path, ResultCache] = {}
+_RESULT_CACHES_LOCK = threading.Lock()
+
+
+def get_result_cache(connection_path: Path) -> ResultCache:
+    """Return the per-connection result cache, creating it on first use."""
+    conn_path = Path(connection_path).resolve()
+    with _RESULT_CACHES_LOCK:
+        cache = _RESULT_CACHES.get(conn_path)
+        if cache is None:
+            cache = _RESULT_CACHES[conn_path] = ResultCache()
+        return cache
+
+
+def invalidate_result_cache(connection_path: Path | None = None) -> int:
+    """Invalidate cached results for one connection directory (or all of them).
+
+    Call after anything that changes what a query would return without going
+    through ``run_sql`` — API syncs, schema rediscovery, file reloads.
+    """
+    with _RESULT_CACHES_LOCK:
+        if connection_path is None:
+            caches = list(_RESULT_CACHES.values())
+        else:
+            cache = _RESULT_CACHES.get(Path(connection_path).resolve())
+            caches = [cache] if cache is not None else []
+    return sum(cache.invalidate() for cache in caches)
+
+
+def result_cache_stats() -> dict[str, dict[str, Any]]:
+    """Stats for every live result cache, keyed by connection directory name."""
+    with _RESULT_CACHES_LOCK:
+        caches = list(_RESULT_CACHES.items())
+    return {conn_path.name: cache.stats() for conn_path, cache in caches}
@@ -0,0 +1,131 @@
+"""Columnar (Parquet) result files for large execution results.
+
+Results above ``SPILL_ROW_THRESHOLD`` rows are written to
+``state/results/<execution_id>.parquet`` instead of the ``data_json`` column
+of ``executions.sqlite``. Each row key becomes a Parquet column holding the
+JSON-encoded value, so reads return exactly what was stored (no type
+inference), while a ``_row`` index column lets page reads skip row groups.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+RESULTS_DIRNAME = "results"
+SPILL_ROW_THRESHOLD = 1000
+_ROW_GROUP_SIZE = 10_000
+_READ_BATCH_SIZE = 1000
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def write_result_file(
+    path: Path,
+    batches: Iterable[list[dict[str, Any]]],
+) -> tuple[list[str], int]:
+    """Write row batches to a Parquet result file.
+
+    Rows are staged as newline-delimited JSON next to the target and then
+    converted by DuckDB, so memory use is bounded by one batch. Returns
+    ``(keys, row_count)`` where ``keys`` lists every row key in first-seen
+    order (the Parquet columns are ``c0..cN`` in the same order).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".staging.jsonl")
+    key_index: dict[str, int] = {}
+    row_count = 0
+    try:
+        with open(staging, "w", encoding="utf-8") as f:
+            for batch in batches:
+                for row in batch:
+                    record: dict[str, Any] = {"_row": row_count}
+                    for key, value in row.items():
+                        idx = key_index.setdefault(key, len(key_index))
+                        record[f"c{idx}"] = json.dumps(value, default=str)
+                    f.write(json.dumps(record))
+                    f.write("\n")
+                    row_count += 1
+
+        column_types = {"_row": "BIGINT"}
+        column_types.update({f"c{i}": "VARCHAR" for i in range(len(key_index))})
+        columns_sql = "{" + ", ".join(
+            f"{_sql_literal(name)}: {_sql_literal(kind)}" for name, kind in column_types.items()
+        ) + "}"
+        tmp_path = path.with_name(path.name + ".tmp")
+        conn = duckdb.connect(":memory:")
+        try:
+            conn.execute(
+                f"COPY (SELECT * FROM read_json({_sql_literal(str(staging))}, "
+                f"format='newline_delimited', columns={columns_sql}) ORDER BY _row) "
+                f"TO {_sql_literal(str(tmp_path))} "
+                f"(FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {_ROW_GROUP_SIZE})"
+            )
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+    finally:
+        staging.unlink(missing_ok=True)
+
+    return list(key_index), row_count
+
+
+def _decode_row(keys: list[str], values: tuple[Any, ...]) -> dict[str, Any]:
+    # values[0] is _row; NULL means the key was absent from the original row.
+    return {
+        keys[i]: json.loads(raw)
+        for i, raw in enumerate(values[1:])
+        if raw is not None
+    }
+
+
+def read_result_page(
+    path: Path,
+    keys: list[str],
+    *,
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Read rows ``[offset, offset + limit)`` from a Parquet result file."""
+    if limit is not None and limit <= 0:
+        return []
+    where = f"_row >= {int(offset)}"
+    if limit is not None:
+        where += f" AND _row < {int(offset) + int(limit)}"
+    conn = duckdb.connect(":memory:")
+    try:
+        rows = conn.execute(
+            f"SELECT * FROM read_parquet({_sql_literal(str(path))}) "
+            f"WHERE {where} ORDER BY _row"
+        ).fetchall()
+    finally:
+        conn.close()
+    return [_decode_row(keys, row) for row in rows]
+
+
+def iter_result_file(
+    path: Path,
+    keys: list[str],
+    *,
+    batch_size: int = _READ_BATCH_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield the rows of a Parquet result file in batches, straight from disk."""
+    conn = duckdb.connect(":memory:")
+    try:
+        result = conn.execute(
+            f"SELECT * FROM read_parquet({_sql_literal(str(path))}) ORDER BY _row"
+        )
+        while True:
+            chunk = result.fetchmany(batch_size)
+            if not chunk:
+                return
+            yield [_decode_row(keys, row) for row in chunk]
+    finally:
+        conn.close()
@@ -2,22 +2,49 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import sqlite3
+import threading
 import time
 import uuid
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from db_mcp_data.db.streaming import DEFAULT_BATCH_SIZE, RowStream
 from db_mcp_data.execution.models import (
+    CompactionStats,
     ExecutionError,
     ExecutionErrorCode,
     ExecutionHandle,
     ExecutionRequest,
     ExecutionResult,
     ExecutionState,
+    RetentionPolicy,
 )
+from db_mcp_data.execution.result_files import (
+    RESULTS_DIRNAME,
+    SPILL_ROW_THRESHOLD,
+    iter_result_file,
+    read_result_page,
+    write_result_file,
+)
+
+_BUSY_TIMEOUT_SECONDS = 5.0
+_STATEMENT_CACHE_SIZE = 64
+_DELETE_CHUNK = 500
+_VACUUM_PAGES_PER_PASS = 2000
+_AUTO_VACUUM_INCREMENTAL = 2
+_TERMINAL_STATES = (
+    ExecutionState.SUCCEEDED,
+    ExecutionState.FAILED,
+    ExecutionState.CANCELLED,
+    ExecutionState.TIMED_OUT,
+)
+# Cancellation is final: later success/failure writes for the row are ignored.
+_STOPPED_STATES = (ExecutionState.CANCELLED.value, ExecutionState.TIMED_OUT.value)
 
 
 def _to_utc(ts: float | None) -> datetime | None:
@@ -35,19 +62,67 @@ def _safe_json_load(value: str | None, fallback: Any) -> Any:
         return fallback
 
 
+def _row_to_handle(row: sqlite3.Row) -> ExecutionHandle:
+    return ExecutionHandle(
+        execution_id=row["execution_id"],
+        connection=row["connection"],
+        state=ExecutionState(row["state"]),
+        submitted_at=_to_utc(row["created_at"]) or datetime.now(UTC),
+        query_id=row["query_id"],
+        sql_hash=row["sql_hash"],
+    )
+
+
 class ExecutionStore:
-    """SQLite-backed execution lifecycle store."""
+    """SQLite-backed execution lifecycle store.
+
+    Each thread reuses one long-lived connection (WAL journal, relaxed
+    ``synchronous``), so lifecycle calls do not pay a connect/close per call
+    and sqlite3's per-connection statement cache keeps the hot statements
+    prepared. Use the connection as a context manager for a transaction.
+    """
 
     def __init__(self, db_path: Path):
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._results_dir = self._db_path.parent / RESULTS_DIRNAME
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
         self._init_db()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=_BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
         conn.row_factory = sqlite3.Row
+        # Must precede the WAL switch, which writes the header of a fresh file;
+        # compact() converts files created before incremental vacuum.
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.conn = conn
+        with self._conns_lock:
+            self._conns.append(conn)
         return conn
 
+    def close(self) -> None:
+        """Close every pooled connection opened by this store."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
     def _init_db(self) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -75,7 +150,10 @@ class ExecutionStore:
                     metadata_json TEXT,
                     query_type TEXT NOT NULL DEFAULT 'sql',
                     payload_json TEXT,
-                    payload_hash TEXT
+                    payload_hash TEXT,
+                    result_path TEXT,
+                    result_keys_json TEXT,
+                    result_bytes INTEGER
                 )
                 """
             )
@@ -87,9 +165,18 @@ class ExecutionStore:
                 """
             )
             self._migrate(conn)
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_executions_connection_created
+                ON executions(connection, created_at)
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_executions_query_id ON executions(query_id)"
+            )
 
     def _migrate(self, conn: sqlite3.Connection) -> None:
-        """Add columns introduced in B2d if the table predates them."""
+        """Add columns introduced after the original schema if the table predates them."""
         existing = {
             row[1] for row in conn.execute("PRAGMA table_info(executions)").fetchall()
         }
@@ -101,6 +188,12 @@ class ExecutionStore:
             conn.execute("ALTER TABLE executions ADD COLUMN payload_json TEXT")
         if "payload_hash" not in existing:
             conn.execute("ALTER TABLE executions ADD COLUMN payload_hash TEXT")
+        if "result_path" not in existing:
+            conn.execute("ALTER TABLE executions ADD COLUMN result_path TEXT")
+        if "result_keys_json" not in existing:
+            conn.execute("ALTER TABLE executions ADD COLUMN result_keys_json TEXT")
+        if "result_bytes" not in existing:
+            conn.execute("ALTER TABLE executions ADD COLUMN result_bytes INTEGER")
 
     def create_submission(
         self,
@@ -110,48 +203,76 @@ class ExecutionStore:
         sql_hash: str | None = None,
     ) -> ExecutionHandle:
         """Create a submission record or return existing one for idempotency key."""
-        resolved_hash = payload_hash or sql_hash
+        handle, _ = self.create_or_get_submission(
+            request, payload_hash=payload_hash or sql_hash
+        )
+        return handle
+
+    def create_or_get_submission(
+        self,
+        request: ExecutionRequest,
+        *,
+        payload_hash: str | None = None,
+        start: bool = False,
+    ) -> tuple[ExecutionHandle, bool]:
+        """Insert a submission in one transaction; return ``(handle, created)``.
+
+        When the idempotency key already exists the stored handle is returned
+        with ``created=False``. ``start=True`` records the row directly as
+        RUNNING (submit + mark_running in a single write) for sync execution.
+        """
         now = time.time()
         execution_id = str(uuid.uuid4())
-
-        if request.idempotency_key:
-            existing = self.get_by_idempotency(request.connection, request.idempotency_key)
-            if existing is not None:
-                return existing
+        state = ExecutionState.RUNNING if start else ExecutionState.SUBMITTED
 
         sql_str = request.sql  # None for non-SQL payloads; kept in deprecated column
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
-                INSERT INTO executions (
+                INSERT OR IGNORE INTO executions (
                     execution_id, connection, query_id, sql, sql_hash,
-                    idempotency_key, state, created_at, metadata_json,
+                    idempotency_key, state, created_at, started_at, metadata_json,
                     query_type, payload_json, payload_hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     execution_id,
                     request.connection,
                     request.query_id,
                     sql_str,
-                    resolved_hash,
+                    payload_hash,
                     request.idempotency_key,
-                    ExecutionState.SUBMITTED.value,
+                    state.value,
                     now,
+                    now if start else None,
                     json.dumps(request.metadata or {}),
                     request.query_type,
                     json.dumps(request.payload) if request.payload else None,
-                    resolved_hash,
+                    payload_hash,
                 ),
             )
+            if cursor.rowcount == 0 and request.idempotency_key:
+                existing = conn.execute(
+                    """
+                    SELECT execution_id, connection, state, created_at, query_id, sql_hash
+                    FROM executions
+                    WHERE connection = ? AND idempotency_key = ?
+                    """,
+                    (request.connection, request.idempotency_key),
+                ).fetchone()
+                if existing is not None:
+                    return _row_to_handle(existing), False
 
-        return ExecutionHandle(
-            execution_id=execution_id,
-            connection=request.connection,
-            state=ExecutionState.SUBMITTED,
-            submitted_at=_to_utc(now) or datetime.now(UTC),
-            query_id=request.query_id,
-            sql_hash=resolved_hash,
+        return (
+            ExecutionHandle(
+                execution_id=execution_id,
+                connection=request.connection,
+                state=ExecutionState.SUBMITTED,
+                submitted_at=_to_utc(now) or datetime.now(UTC),
+                query_id=request.query_id,
+                sql_hash=payload_hash,
+            ),
+            True,
         )
 
     def get_by_idempotency(self, connection: str, idempotency_key: str) -> ExecutionHandle | None:
@@ -166,26 +287,45 @@ class ExecutionStore:
             ).fetchone()
         if row is None:
             return None
+        return _row_to_handle(row)
 
-        return ExecutionHandle(
-            execution_id=row["execution_id"],
-            connection=row["connection"],
-            state=ExecutionState(row["state"]),
-            submitted_at=_to_utc(row["created_at"]) or datetime.now(UTC),
-            query_id=row["query_id"],
-            sql_hash=row["sql_hash"],
-        )
+    def latest_for_query(self, query_id: str) -> ExecutionHandle | None:
+        """Most recent execution recorded for a validated ``query_id``."""
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT execution_id, connection, state, created_at, query_id, sql_hash
+                FROM executions
+                WHERE query_id = ?
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                (query_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return _row_to_handle(row)
 
-    def mark_running(self, execution_id: str) -> None:
+    def release_idempotency_key(self, execution_id: str) -> None:
+        """Detach an execution from its idempotency key so the key can be reused."""
         with self._connect() as conn:
             conn.execute(
+                "UPDATE executions SET idempotency_key = NULL WHERE execution_id = ?",
+                (execution_id,),
+            )
+
+    def mark_running(self, execution_id: str) -> bool:
+        """Move an execution to ``running``; False if it was cancelled first."""
+        with self._connect() as conn:
+            cursor = conn.execute(
                 """
                 UPDATE executions
                 SET state = ?, started_at = ?
-                WHERE execution_id = ?
+                WHERE execution_id = ? AND state NOT IN (?, ?)
                 """,
-                (ExecutionState.RUNNING.value, time.time(), execution_id),
+                (ExecutionState.RUNNING.value, time.time(), execution_id, *_STOPPED_STATES),
             )
+        return cursor.rowcount > 0
 
     def update_metadata(
         self,
@@ -228,21 +368,66 @@ class ExecutionStore:
         self,
         execution_id: str,
         *,
-        data: list[dict[str, Any]],
+        data: list[dict[str, Any]] | RowStream,
         columns: list[str],
-        rows_returned: int,
+        rows_returned: int | None,
         rows_affected: int | None,
         duration_ms: float | None,
         metadata: dict[str, Any] | None = None,
-    ) -> None:
+    ) -> int:
+        """Persist a successful result and return the number of rows stored.
+
+        Results up to ``SPILL_ROW_THRESHOLD`` rows are kept inline in
+        ``data_json``; larger ones (or a ``RowStream`` that exceeds it) are
+        written batch by batch to a Parquet file under ``state/results/``.
+        For streams, ``rows_returned`` is taken from the rows written.
+        """
+        if isinstance(data, RowStream):
+            batches: Iterator[list[dict[str, Any]]] = data
+            columns = columns or data.columns
+        else:
+            batches = iter([data])
+
+        head: list[dict[str, Any]] = []
+        data_json: str | None = None
+        result_path: str | None = None
+        result_keys_json: str | None = None
+        try:
+            spilled = False
+            for batch in batches:
+                head.extend(batch)
+                if len(head) > SPILL_ROW_THRESHOLD:
+                    spilled = True
+                    break
+
+            if spilled:
+                file_name = f"{execution_id}.parquet"
+                keys, row_count = write_result_file(
+                    self._results_dir / file_name,
+                    itertools.chain([head], batches),
+                )
+                result_path = f"{RESULTS_DIRNAME}/{file_name}"
+                result_keys_json = json.dumps(keys)
+                result_bytes = (self._results_dir / file_name).stat().st_size
+            else:
+                row_count = len(head)
+                data_json = json.dumps(head, default=str)
+                result_bytes = len(data_json)
+        finally:
+            if isinstance(data, RowStream):
+                data.close()
+        if isinstance(data, RowStream) or rows_returned is None:
+            rows_returned = row_count
+
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE executions
                 SET state = ?, completed_at = ?, rows_returned = ?,
                     rows_affected = ?, duration_ms = ?, data_json = ?,
-                    columns_json = ?, metadata_json = COALESCE(?, metadata_json)
-                WHERE execution_id = ?
+                    columns_json = ?, metadata_json = COALESCE(?, metadata_json),
+                    result_path = ?, result_keys_json = ?, result_bytes = ?
+                WHERE execution_id = ? AND state NOT IN (?, ?)
                 """,
                 (
                     ExecutionState.SUCCEEDED.value,
@@ -250,12 +435,20 @@ class ExecutionStore:
                     rows_returned,
                     rows_affected,
                     duration_ms,
-                    json.dumps(data),
+                    data_json,
                     json.dumps(columns),
                     json.dumps(metadata) if metadata is not None else None,
+                    result_path,
+                    result_keys_json,
+                    result_bytes,
                     execution_id,
+                    *_STOPPED_STATES,
                 ),
             )
+        if cursor.rowcount == 0 and result_path is not None:
+            # Cancelled while the result was being written; drop the orphan file.
+            (self._results_dir / f"{execution_id}.parquet").unlink(missing_ok=True)
+        return row_count
 
     def mark_failed(
         self,
@@ -264,18 +457,24 @@ class ExecutionStore:
         error: ExecutionError,
         duration_ms: float | None,
         metadata: dict[str, Any] | None = None,
-    ) -> None:
+        state: ExecutionState = ExecutionState.FAILED,
+    ) -> bool:
+        """Record a failed (or cancelled / timed-out) execution.
+
+        Returns False when the execution had already been cancelled, in which
+        case the stored outcome is left untouched.
+        """
         with self._connect() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE executions
                 SET state = ?, completed_at = ?, duration_ms = ?,
                     error_code = ?, error_message = ?, error_retryable = ?,
                     error_details = ?, metadata_json = COALESCE(?, metadata_json)
-                WHERE execution_id = ?
+                WHERE execution_id = ? AND state NOT IN (?, ?)
                 """,
                 (
-                    ExecutionState.FAILED.value,
+                    state.value,
                     time.time(),
                     duration_ms,
                     error.code.value,
@@ -284,13 +483,75 @@ class ExecutionStore:
                     json.dumps(error.details),
                     json.dumps(metadata) if metadata is not None else None,
                     execution_id,
+                    *_STOPPED_STATES,
+                ),
+            )
+        return cursor.rowcount > 0
+
+    def mark_cancelled(
+        self,
+        execution_id: str,
+        *,
+        error: ExecutionError,
+        state: ExecutionState = ExecutionState.CANCELLED,
+    ) -> bool:
+        """Move a not-yet-finished execution to ``cancelled`` / ``timed_out``.
+
+        Returns False if the execution does not exist or already finished.
+        """
+        terminal = tuple(s.value for s in _TERMINAL_STATES)
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"""
+                UPDATE executions
+                SET state = ?, completed_at = ?,
+                    duration_ms = CASE WHEN started_at IS NULL THEN NULL
+                                       ELSE (? - started_at) * 1000 END,
+                    error_code = ?, error_message = ?, error_retryable = ?,
+                    error_details = ?
+                WHERE execution_id = ?
+                  AND state NOT IN ({", ".join("?" for _ in terminal)})
+                """,
+                (
+                    state.value,
+                    now,
+                    now,
+                    error.code.value,
+                    error.message,
+                    1 if error.retryable else 0,
+                    json.dumps(error.details),
+                    execution_id,
+                    *terminal,
                 ),
             )
+        return cursor.rowcount > 0
+
+    def get_result(
+        self,
+        execution_id: str,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> ExecutionResult | None:
+        """Return an execution with rows ``[offset, offset + limit)`` of its result.
 
-    def get_result(self, execution_id: str) -> ExecutionResult | None:
+        ``limit=None`` returns every row from *offset*; ``limit=0`` returns only
+        the lifecycle fields. File-backed results are read page-wise, so the
+        cost is proportional to the page rather than the whole result.
+        ``rows_returned`` always reports the full result size.
+        """
+        fetch_inline = limit is None or limit > 0
         with self._connect() as conn:
             row = conn.execute(
-                "SELECT * FROM executions WHERE execution_id = ?",
+                f"""
+                SELECT execution_id, state, rows_returned, rows_affected, duration_ms,
+                       started_at, completed_at, error_code, error_message,
+                       error_retryable, error_details, columns_json, metadata_json,
+                       result_path, result_keys_json,
+                       {"data_json" if fetch_inline else "NULL AS data_json"}
+                FROM executions WHERE execution_id = ?
+                """,
                 (execution_id,),
             ).fetchone()
         if row is None:
@@ -310,10 +571,25 @@ class ExecutionStore:
                 details=_safe_json_load(row["error_details"], {}),
             )
 
+        if not fetch_inline:
+            data: list[dict[str, Any]] = []
+        elif row["result_path"]:
+            data = read_result_page(
+                self._db_path.parent / row["result_path"],
+                _safe_json_load(row["result_keys_json"], []),
+                offset=offset,
+                limit=limit,
+            )
+        else:
+            data = _safe_json_load(row["data_json"], [])
+            end = None if limit is None else offset + limit
+            if offset or end is not None:
+                data = data[offset:end]
+
         return ExecutionResult(
             execution_id=row["execution_id"],
             state=ExecutionState(row["state"]),
-            data=_safe_json_load(row["data_json"], []),
+            data=data,
             columns=_safe_json_load(row["columns_json"], []),
             rows_returned=row["rows_returned"] or 0,
             rows_affected=row["rows_affected"],
@@ -323,3 +599,132 @@ class ExecutionStore:
             error=error,
             metadata=_safe_json_load(row["metadata_json"], {}),
         )
+
+    def iter_result_batches(
+        self,
+        execution_id: str,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield a stored result in batches without loading it all at once."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT result_path, result_keys_json FROM executions WHERE execution_id = ?",
+                (execution_id,),
+            ).fetchone()
+        if row is None:
+            return
+        if row["result_path"]:
+            yield from iter_result_file(
+                self._db_path.parent / row["result_path"],
+                _safe_json_load(row["result_keys_json"], []),
+                batch_size=batch_size,
+            )
+            return
+        result = self.get_result(execution_id)
+        rows = result.data if result is not None else []
+        for start in range(0, len(rows), batch_size):
+            yield rows[start : start + batch_size]
+
+    def compact(
+        self,
+        policy: RetentionPolicy,
+        *,
+        now: float | None = None,
+        vacuum_pages: int = _VACUUM_PAGES_PER_PASS,
+    ) -> CompactionStats:
+        """Delete terminal executions outside ``policy`` and reclaim space.
+
+        Limits are applied in order: age, rows per connection (newest kept),
+        then total result bytes (oldest dropped first). Spilled result files
+        are removed with their rows and up to ``vacuum_pages`` free pages are
+        returned to the filesystem with an incremental VACUUM.
+        """
+        now = time.time() if now is None else now
+        terminal = tuple(state.value for state in _TERMINAL_STATES)
+        in_terminal = f"state IN ({', '.join('?' * len(terminal))})"
+        victims: dict[str, tuple[str | None, int]] = {}
+
+        def collect(rows: Iterable[sqlite3.Row]) -> None:
+            for row in rows:
+                victims[row["execution_id"]] = (row["result_path"], row["size"])
+
+        columns = (
+            "execution_id, result_path, "
+            "COALESCE(result_bytes, LENGTH(data_json), 0) AS size"
+        )
+        conn = self._connect()
+        if policy.max_age_seconds is not None:
+            collect(
+                conn.execute(
+                    f"SELECT {columns} FROM executions WHERE created_at < ? AND {in_terminal}",
+                    (now - policy.max_age_seconds, *terminal),
+                )
+            )
+        if policy.max_rows_per_connection is not None:
+            connections = [
+                row[0] for row in conn.execute("SELECT DISTINCT connection FROM executions")
+            ]
+            for connection in connections:
+                collect(
+                    conn.execute(
+                        f"""
+                        SELECT {columns} FROM executions
+                        WHERE connection = ? AND {in_terminal}
+                        ORDER BY created_at DESC
+                        LIMIT -1 OFFSET ?
+                        """,
+                        (connection, *terminal, policy.max_rows_per_connection),
+                    )
+                )
+        if policy.max_total_bytes is not None:
+            remaining = conn.execute(
+                "SELECT COALESCE(SUM(COALESCE(result_bytes, LENGTH(data_json), 0)), 0) "
+                "FROM executions"
+            ).fetchone()[0] - sum(size for _, size in victims.values())
+            if remaining > policy.max_total_bytes:
+                oldest = conn.execute(
+                    f"SELECT {columns} FROM executions WHERE {in_terminal} "
+                    "ORDER BY created_at ASC",
+                    terminal,
+                )
+                for row in oldest:
+                    if remaining <= policy.max_total_bytes:
+                        break
+                    if row["execution_id"] in victims:
+                        continue
+                    victims[row["execution_id"]] = (row["result_path"], row["size"])
+                    remaining -= row["size"]
+
+        stats = CompactionStats()
+        ids = list(victims)
+        with conn:
+            for start in range(0, len(ids), _DELETE_CHUNK):
+                chunk = ids[start : start + _DELETE_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                conn.execute(
+                    f"DELETE FROM executions WHERE execution_id IN ({placeholders})", chunk
+                )
+        stats.rows_deleted = len(ids)
+        for result_path, size in victims.values():
+            stats.bytes_freed += size
+            if result_path:
+                try:
+                    (self._db_path.parent / result_path).unlink()
+                    stats.files_deleted += 1
+                except FileNotFoundError:
+                    pass
+
+        stats.pages_vacuumed = self._incremental_vacuum(conn, vacuum_pages)
+        return stats
+
+    def _incremental_vacuum(self, conn: sqlite3.Connection, pages: int) -> int:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != _AUTO_VACUUM_INCREMENTAL:
+            # Pre-existing file: switching modes needs one full VACUUM.
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+            return 0
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if free_before:
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+        return free_before - conn.execute("PRAGMA freelist_count").fetchone()[0]
@@ -0,0 +1,219 @@
+"""Per-connection bounded worker pools for blocking query execution.
+
+Connector calls (SQLAlchemy, DuckDB, HTTP) are synchronous. Running them on
+the event loop thread lets one slow warehouse query stall every other MCP
+tool call, and the loop's default executor is shared by all connections.
+Each connection instead gets its own ``ThreadPoolExecutor`` sized from its
+capabilities, plus a bounded queue: once ``max_concurrent_queries`` calls are
+running and ``max_queued_queries`` are waiting, further calls are rejected
+with ``WorkerPoolFullError`` instead of piling up without limit.
+
+Connectors in this tree only ship synchronous drivers, so threads (rather
+than SQLAlchemy async engines) are the execution backend for every type.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENT_QUERIES = 4
+DEFAULT_MAX_QUEUED_QUERIES = 32
+
+
+class WorkerPoolFullError(RuntimeError):
+    """Raised when a connection's worker pool and queue are both full."""
+
+
+class ConnectionWorkerPool:
+    """Bounded thread pool that runs blocking calls for one connection."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_QUERIES,
+        max_queued: int = DEFAULT_MAX_QUEUED_QUERIES,
+    ):
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.max_queued = max(0, int(max_queued))
+        self._executor: ThreadPoolExecutor | None = self._new_executor()
+        self._lock = threading.Lock()
+        self._retired = False
+        self._pending = 0
+        self._active = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"db-mcp-{self.name}",
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` on this pool and await its result.
+
+        The caller's context variables (e.g. the active tracing span) are
+        propagated to the worker thread.
+        """
+        executor = self._acquire()
+        call = functools.partial(contextvars.copy_context().run, self._invoke, fn, args, kwargs)
+        try:
+            future = executor.submit(call)
+        except BaseException:
+            self._release()
+            raise
+        # The slot is held until the thread finishes, even if the awaiting
+        # coroutine is cancelled first: the blocking call keeps running.
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def _acquire(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queued:
+                self._rejected += 1
+                raise WorkerPoolFullError(
+                    f"Connection '{self.name}' is busy: {self.max_workers} queries running "
+                    f"and {self.max_queued} queued. Retry shortly."
+                )
+            self._pending += 1
+            if self._executor is None:
+                # Retired and drained, but a caller still holds this pool.
+                self._executor = self._new_executor()
+            return self._executor
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            idle_executor = self._take_idle_executor()
+        if idle_executor is not None:
+            idle_executor.shutdown(wait=False)
+
+    def _take_idle_executor(self) -> ThreadPoolExecutor | None:
+        """Detach the executor of a retired pool with no work left; caller holds ``_lock``."""
+        if not self._retired or self._pending:
+            return None
+        executor, self._executor = self._executor, None
+        return executor
+
+    def _invoke(self, fn: Callable[..., T], args: tuple, kwargs: dict) -> T:
+        with self._lock:
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    def stats(self) -> dict[str, int]:
+        """Current load and lifetime counters."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queued": self.max_queued,
+                "active": self._active,
+                "queued": max(0, self._pending - self._active),
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def retire(self) -> None:
+        """Shut the executor down once running and queued calls have finished.
+
+        Used when a resized pool replaces this one: callers still holding it
+        keep working instead of hitting a shut-down executor.
+        """
+        with self._lock:
+            self._retired = True
+            idle_executor = self._take_idle_executor()
+        if idle_executor is not None:
+            idle_executor.shutdown(wait=False)
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        """Stop accepting work; running calls finish in the background unless ``wait``.
+
+        Queued calls are cancelled.
+        """
+        with self._lock:
+            executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_WORKER_POOLS: dict[Path, ConnectionWorkerPool] = {}
+_WORKER_POOLS_LOCK = threading.Lock()
+
+
+def _positive_int(value: Any, default: int) -> int:
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed > 0 else default
+
+
+def get_worker_pool(
+    connection_path: Path,
+    capabilities: dict[str, Any] | None = None,
+) -> ConnectionWorkerPool:
+    """Return the worker pool for a connection, creating it on first use.
+
+    Pool sizes come from the ``max_concurrent_queries`` and
+    ``max_queued_queries`` capabilities (connector.yaml). Callers that pass
+    capabilities whose limits differ from the live pool's replace it; the old
+    pool is retired, so calls running or queued there (and callers still
+    holding it) finish before its threads go away. Callers without
+    capabilities share whatever pool exists.
+    """
+    conn_path = Path(connection_path).resolve()
+    with _WORKER_POOLS_LOCK:
+        pool = _WORKER_POOLS.get(conn_path)
+        if pool is not None and capabilities is not None:
+            if _pool_limits(capabilities) != (pool.max_workers, pool.max_queued):
+                pool.retire()
+                pool = None
+        if pool is None:
+            max_workers, max_queued = _pool_limits(capabilities or {})
+            pool = ConnectionWorkerPool(
+                conn_path.name or "default",
+                max_workers=max_workers,
+                max_queued=max_queued,
+            )
+            _WORKER_POOLS[conn_path] = pool
+        return pool
+
+
+def _pool_limits(capabilities: dict[str, Any]) -> tuple[int, int]:
+    return (
+        _positive_int(
+            capabilities.get("max_concurrent_queries"), DEFAULT_MAX_CONCURRENT_QUERIES
+        ),
+        _positive_int(capabilities.get("max_queued_queries"), DEFAULT_MAX_QUEUED_QUERIES),
+    )
+
+
+def worker_pool_stats() -> dict[str, dict[str, int]]:
+    """Stats for every live worker pool, keyed by connection directory name."""
+    with _WORKER_POOLS_LOCK:
+        pools = list(_WORKER_POOLS.values())
+    return {pool.name: pool.stats() for pool in pools}
+
+
+def shutdown_worker_pools(*, wait: bool = False) -> None:
+    """Shut down every worker pool (server shutdown)."""
+    with _WORKER_POOLS_LOCK:
+        pools = list(_WORKER_POOLS.values())
+        _WORKER_POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
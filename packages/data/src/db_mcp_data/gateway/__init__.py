@@ -8,6 +8,8 @@ Public surface:
     execute(query_id, options)    -> ExecutionResult
     run(request, options)         -> ExecutionResult   (create + execute)
     introspect(connection, scope) -> dict
+    introspect_catalog_columns(catalog, schemas) -> bulk column map | None
+    introspect_foreign_keys(schema, catalog) -> {table: foreign keys} | None
 """
 
 from __future__ import annotations
@@ -23,6 +25,8 @@ __all__ = [
     "execute",
     "get_query",
     "introspect",
+    "introspect_catalog_columns",
+    "introspect_foreign_keys",
     "mark_complete",
     "mark_error",
     "mark_running",
@@ -104,12 +108,15 @@ async def execute(
     """Execute a previously validated query by query_id.
 
     Looks up the query in QueryStore, resolves the connector via connection_path,
-    dispatches to the appropriate adapter, and returns a DataResponse.
+    dispatches to the appropriate adapter, and returns a DataResponse. With
+    ``options.max_rows``/``options.max_bytes`` the adapter streams and stops
+    at the bound; ``DataResponse.truncated`` reports whether rows were left
+    behind.
     """
     from db_mcp_models.gateway import EndpointQuery, SQLQuery
 
     from db_mcp_data.execution.query_store import get_query_store
-    from db_mcp_data.gateway.dispatcher import get_adapter, get_connector
+    from db_mcp_data.gateway.dispatcher import get_adapter, resolve_connector
 
     store = get_query_store()
     query = await store.get(query_id)
@@ -161,14 +168,144 @@ async def execute(
     request = DataRequest(connection=connection, query=data_query)
 
     try:
-        connector = get_connector(connection_path=str(resolved_path))
+        connector = resolve_connector(resolved_path)
         adapter = get_adapter(connector)
     except ValueError as exc:
         return DataResponse(
             status="error", data=[], columns=[], rows_returned=0, error=str(exc)
         )
+    max_rows = options.max_rows if options is not None else None
+    max_bytes = options.max_bytes if options is not None else None
 
-    return adapter.execute(connector, request, connection_path=resolved_path)
+    from db_mcp_data.execution.workers import WorkerPoolFullError, get_worker_pool
+
+    # Adapters block on the driver; keep them off the event loop thread, on a
+    # pool sized from this connection's concurrency capabilities.
+    pool = get_worker_pool(resolved_path, _pool_capabilities(connector))
+    try:
+        if connection_path is None:
+            # No connection directory to record the execution in.
+            return await pool.run(
+                adapter.execute,
+                connector,
+                request,
+                connection_path=resolved_path,
+                max_rows=max_rows,
+                max_bytes=max_bytes,
+            )
+        return await pool.run(
+            _execute_recorded,
+            adapter,
+            connector,
+            request,
+            query_id=query_id,
+            connection_path=resolved_path,
+            options=options,
+        )
+    except WorkerPoolFullError as exc:
+        return DataResponse(
+            status="error", data=[], columns=[], rows_returned=0, error=str(exc)
+        )
+
+
+def _execute_recorded(
+    adapter: Any,
+    connector: Any,
+    request: DataRequest,
+    *,
+    query_id: str,
+    connection_path: Path,
+    options: RunOptions | None,
+) -> DataResponse:
+    """Run a validated query through the connection's ExecutionEngine.
+
+    Each call is a fresh execution recorded under ``query_id``; repeated
+    reads are served from the engine's result cache, and the adapter runs
+    inside a cancel scope, so ``cancel_query`` and ``timeout_seconds`` can
+    stop it.
+    """
+    from db_mcp_models.gateway import ColumnMeta, SQLQuery
+
+    from db_mcp_data.execution import ExecutionRequest, ExecutionState
+    from db_mcp_data.execution.engine import get_execution_engine
+
+    max_rows = options.max_rows if options is not None else None
+    max_bytes = options.max_bytes if options is not None else None
+    if isinstance(request.query, SQLQuery):
+        query_type, payload = "sql", {"sql": request.query.sql}
+    else:
+        query_type = "endpoint"
+        payload = {
+            "endpoint": request.query.endpoint,
+            "params": request.query.params,
+            "method": request.query.method,
+        }
+    exec_request = ExecutionRequest(
+        connection=request.connection,
+        query_type=query_type,
+        payload=payload,
+        query_id=query_id,
+        cache_ttl_seconds=options.cache_ttl_seconds if options is not None else None,
+        timeout_seconds=options.timeout_seconds if options is not None else None,
+    )
+
+    def _runner(_payload: dict[str, Any]) -> dict[str, Any]:
+        response = adapter.execute(
+            connector,
+            request,
+            connection_path=connection_path,
+            max_rows=max_rows,
+            max_bytes=max_bytes,
+        )
+        if not response.is_success:
+            raise RuntimeError(response.error or "Execution failed")
+        return {
+            "data": response.data,
+            "columns": [c.name for c in response.columns],
+            "rows_returned": response.rows_returned,
+            "rows_affected": None,
+            "metadata": {
+                "truncated": response.truncated,
+                "column_types": {c.name: c.type for c in response.columns if c.type},
+            },
+        }
+
+    engine = get_execution_engine(connection_path)
+    handle, result = engine.submit_sync(
+        exec_request, _runner, max_rows=max_rows, max_bytes=max_bytes
+    )
+    if result.state != ExecutionState.SUCCEEDED:
+        return DataResponse(
+            status="error",
+            data=[],
+            columns=[],
+            rows_returned=0,
+            error=result.error.message if result.error else "Execution failed",
+            execution_id=handle.execution_id,
+            state=result.state.value,
+        )
+    column_types = result.metadata.get("column_types") or {}
+    return DataResponse(
+        status="success",
+        data=result.data,
+        columns=[ColumnMeta(name=name, type=column_types.get(name)) for name in result.columns],
+        rows_returned=result.rows_returned,
+        truncated=bool(result.metadata.get("truncated", False)),
+        execution_id=handle.execution_id,
+        state=result.state.value,
+        duration_ms=result.duration_ms,
+    )
+
+
+def _pool_capabilities(connector: Any) -> dict[str, Any] | None:
+    """Capabilities used to size the worker pool, or None to share the live pool."""
+    from db_mcp_data.connectors import get_connector_capabilities
+
+    try:
+        return get_connector_capabilities(connector)
+    except AttributeError:
+        # A connector without a loaded config (e.g. a bare spec'd double).
+        return None
 
 
 async def run(
@@ -214,6 +351,48 @@ def introspect(
     )
 
 
+def introspect_catalog_columns(
+    *,
+    connection_path: Path,
+    catalog: str | None = None,
+    schemas: list[str] | None = None,
+) -> dict[tuple[str, str], list[dict[str, Any]]] | None:
+    """Columns of every table in *catalog* in one pass, keyed by (schema, table).
+
+    Returns None when the connector has no bulk column introspection, in
+    which case callers fall back to introspect(scope="columns") per table.
+    """
+    from db_mcp_data.gateway.dispatcher import resolve_connector
+
+    connector = resolve_connector(connection_path)
+    bulk = getattr(connector, "get_catalog_columns", None)
+    if bulk is None:
+        return None
+    columns = bulk(catalog, schemas)
+    return columns if isinstance(columns, dict) else None
+
+
+def introspect_foreign_keys(
+    *,
+    connection_path: Path,
+    schema: str | None = None,
+    catalog: str | None = None,
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Declared foreign keys of every table in *schema*, keyed by table name.
+
+    Returns None when the connector cannot report foreign keys; callers then
+    rely on name-based join inference alone.
+    """
+    from db_mcp_data.gateway.dispatcher import resolve_connector
+
+    connector = resolve_connector(connection_path)
+    reflect = getattr(connector, "get_schema_foreign_keys", None)
+    if reflect is None:
+        return None
+    foreign_keys = reflect(schema, catalog)
+    return foreign_keys if isinstance(foreign_keys, dict) else None
+
+
 def capabilities(
     connection_path: Path,
 ) -> dict[str, Any]:
@@ -225,9 +404,9 @@ def capabilities(
     point of entry for all connector access.
     """
     from db_mcp_data.connectors import get_connector_capabilities
-    from db_mcp_data.gateway.dispatcher import get_connector as _get_connector
+    from db_mcp_data.gateway.dispatcher import resolve_connector
 
-    connector = _get_connector(connection_path=str(connection_path))
+    connector = resolve_connector(connection_path)
     return get_connector_capabilities(connector)
 
 
@@ -11,9 +11,13 @@ Adapter contract
       Return True if this adapter knows how to drive the given connector.
       Used by the gateway dispatcher (2.07) to route DataRequests.
 
-  execute(connector, request, *, connection_path)  → dict
+  execute(connector, request, *, connection_path, max_rows, max_bytes)  → dict
       Run the request against the connector. Returns a normalised result dict
-      compatible with the existing ExecutionResult shape.
+      compatible with the existing ExecutionResult shape. When max_rows or
+      max_bytes is set, adapters whose connector supports stream_sql() consume
+      row batches and stop at the bound rather than materialising the whole
+      result; SQL adapters also push max_rows into the statement as a
+      dialect-correct LIMIT/TOP. truncated reports rows left behind.
 
   introspect(connector, scope, *, catalog, schema, table) → dict
       Return schema objects for the requested scope:
@@ -47,6 +51,8 @@ class ConnectorAdapter(Protocol):
         request: DataRequest,
         *,
         connection_path: Path,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
     ) -> dict[str, Any]:
         """Execute a DataRequest and return a normalised result dict."""
         ...
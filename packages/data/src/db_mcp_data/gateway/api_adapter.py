@@ -7,9 +7,31 @@ from typing import Any
 
 from db_mcp_models.gateway import ColumnMeta, DataRequest, DataResponse, EndpointQuery, SQLQuery
 
+from db_mcp_data.db.streaming import RowStream, drain_stream
 from db_mcp_data.gateway.adapter import VALID_SCOPES
 
 
+def _cap_rows(
+    response: DataResponse, max_rows: int | None, max_bytes: int | None = None
+) -> DataResponse:
+    if not response.is_success:
+        return response
+    if max_bytes is None and (max_rows is None or len(response.data) <= max_rows):
+        return response
+    rows, truncated = drain_stream(
+        RowStream.from_rows(response.data), max_rows=max_rows, max_bytes=max_bytes
+    )
+    if not truncated:
+        return response
+    return DataResponse(
+        status=response.status,
+        data=rows,
+        columns=response.columns,
+        rows_returned=len(rows),
+        truncated=True,
+    )
+
+
 class APIAdapter:
     """Stateless adapter for APIConnector.
 
@@ -39,12 +61,19 @@ class APIAdapter:
         request: DataRequest,
         *,
         connection_path: Path,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
     ) -> dict[str, Any]:
-        """Dispatch to the appropriate execution path based on query type."""
+        """Dispatch to the appropriate execution path based on query type.
+
+        API responses arrive fully paged in, so *max_rows* and *max_bytes*
+        are applied after the fetch rather than streamed.
+        """
         if isinstance(request.query, EndpointQuery):
-            return self._execute_endpoint(connector, request.query)
+            response = self._execute_endpoint(connector, request.query)
+            return _cap_rows(response, max_rows, max_bytes)
         if isinstance(request.query, SQLQuery):
-            return self._execute_sql(connector, request.query)
+            return _cap_rows(self._execute_sql(connector, request.query), max_rows, max_bytes)
         return DataResponse(
             status="error", data=[], columns=[], rows_returned=0,
             error=f"APIAdapter received unsupported query type: {type(request.query).__name__}",
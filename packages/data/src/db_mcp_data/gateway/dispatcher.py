@@ -8,6 +8,7 @@ from typing import Any
 from db_mcp_models.gateway import DataResponse
 
 from db_mcp_data.connectors import get_connector
+from db_mcp_data.connectors.cache import get_cached_connector
 from db_mcp_data.gateway.adapter import ConnectorAdapter
 from db_mcp_data.gateway.api_adapter import APIAdapter
 from db_mcp_data.gateway.file_adapter import FileAdapter
@@ -34,18 +35,35 @@ def get_adapter(connector: Any) -> ConnectorAdapter:
     )
 
 
+def resolve_connector(connection_path: Path) -> Any:
+    """Warm connector for *connection_path*, shared with ``ConnectionRegistry``."""
+    return get_cached_connector(connection_path, get_connector)
+
+
 def resolve_and_dispatch(
     request: Any,
     *,
     connection_path: Path,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
 ) -> DataResponse:
-    """Resolve connector from connection_path, find adapter, execute request."""
-    connector = get_connector(connection_path=str(connection_path))
+    """Resolve connector from connection_path, find adapter, execute request.
+
+    *max_rows* and *max_bytes* bound the rows fetched (the adapter streams and
+    stops there).
+    """
+    connector = resolve_connector(connection_path)
     try:
         adapter = get_adapter(connector)
     except ValueError as exc:
         return DataResponse(status="error", data=[], columns=[], rows_returned=0, error=str(exc))
-    return adapter.execute(connector, request, connection_path=connection_path)
+    return adapter.execute(
+        connector,
+        request,
+        connection_path=connection_path,
+        max_rows=max_rows,
+        max_bytes=max_bytes,
+    )
 
 
 def resolve_and_introspect(
@@ -58,7 +76,7 @@ def resolve_and_introspect(
     table: str | None = None,
 ) -> dict[str, Any]:
     """Resolve connector from connection_path, find adapter, introspect."""
-    connector = get_connector(connection_path=str(connection_path))
+    connector = resolve_connector(connection_path)
     try:
         adapter = get_adapter(connector)
     except ValueError as exc:
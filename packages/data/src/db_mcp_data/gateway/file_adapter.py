@@ -7,6 +7,7 @@ from typing import Any
 
 from db_mcp_models.gateway import ColumnMeta, DataRequest, DataResponse, SQLQuery
 
+from db_mcp_data.db.streaming import drain_stream
 from db_mcp_data.gateway.adapter import VALID_SCOPES
 
 
@@ -36,6 +37,8 @@ class FileAdapter:
         request: DataRequest,
         *,
         connection_path: Path,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
     ) -> dict[str, Any]:
         """Execute a SQLQuery via DuckDB and return a normalised result dict."""
         if not isinstance(request.query, SQLQuery):
@@ -48,15 +51,27 @@ class FileAdapter:
                 ),
             )
 
+        truncated = False
         try:
-            rows = connector.execute_sql(request.query.sql, None)
+            if max_rows is not None or max_bytes is not None:
+                # Stream batches and stop at the bounds instead of fetching everything.
+                stream = connector.stream_sql(request.query.sql, None)
+                rows, truncated = drain_stream(stream, max_rows=max_rows, max_bytes=max_bytes)
+            else:
+                rows = connector.execute_sql(request.query.sql, None)
         except Exception as exc:
             return DataResponse(
                 status="error", data=[], columns=[], rows_returned=0, error=str(exc)
             )
 
         columns = [ColumnMeta(name=k) for k in (rows[0].keys() if rows else [])]
-        return DataResponse(status="success", data=rows, columns=columns, rows_returned=len(rows))
+        return DataResponse(
+            status="success",
+            data=rows,
+            columns=columns,
+            rows_returned=len(rows),
+            truncated=truncated,
+        )
 
     # ------------------------------------------------------------------
     # Protocol: introspect
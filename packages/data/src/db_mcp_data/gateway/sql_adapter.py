@@ -7,6 +7,7 @@ from typing import Any
 
 from db_mcp_models.gateway import ColumnMeta, DataRequest, DataResponse, SQLQuery
 
+from db_mcp_data.db.streaming import drain_stream, push_down_limit
 from db_mcp_data.gateway.adapter import VALID_SCOPES
 
 
@@ -41,8 +42,15 @@ class SQLAdapter:
         request: DataRequest,
         *,
         connection_path: Path,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
     ) -> dict[str, Any]:
-        """Execute a SQLQuery and return a normalised result dict."""
+        """Execute a SQLQuery and return a normalised result dict.
+
+        With *max_rows* the statement itself is bounded to ``max_rows + 1``
+        rows (the extra row detects truncation) in the connection's dialect,
+        then streamed until *max_rows* rows or *max_bytes* bytes are read.
+        """
         if not isinstance(request.query, SQLQuery):
             return DataResponse(
                 status="error", data=[], columns=[], rows_returned=0,
@@ -53,15 +61,30 @@ class SQLAdapter:
                 ),
             )
 
+        truncated = False
         try:
-            rows = connector.execute_sql(request.query.sql, request.query.params or None)
+            if max_rows is not None or max_bytes is not None:
+                # Stream batches and stop at the bounds instead of fetching everything.
+                sql = request.query.sql
+                if max_rows is not None:
+                    sql = push_down_limit(sql, max_rows + 1, connector.get_dialect())
+                stream = connector.stream_sql(sql, request.query.params or None)
+                rows, truncated = drain_stream(stream, max_rows=max_rows, max_bytes=max_bytes)
+            else:
+                rows = connector.execute_sql(request.query.sql, request.query.params or None)
         except Exception as exc:
             return DataResponse(
                 status="error", data=[], columns=[], rows_returned=0, error=str(exc)
             )
 
         columns = [ColumnMeta(name=k) for k in (rows[0].keys() if rows else [])]
-        return DataResponse(status="success", data=rows, columns=columns, rows_returned=len(rows))
+        return DataResponse(
+            status="success",
+            data=rows,
+            columns=columns,
+            rows_returned=len(rows),
+            truncated=truncated,
+        )
 
     # ------------------------------------------------------------------
     # Protocol: introspect
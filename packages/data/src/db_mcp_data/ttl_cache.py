@@ -0,0 +1,131 @@
+"""Bounded, thread-safe TTL + LRU storage shared by the in-process caches.
+
+``TTLCache`` holds values under string keys, each tagged with a *group* (the
+connection it belongs to) so a whole connection can be invalidated at once.
+Entries expire after a per-entry TTL and the least-recently-used ones are
+evicted when the entry count, or the optional byte budget, is exceeded.
+Hit/miss/eviction counters feed the ``/health`` cache stats.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    group: str
+    expires_at: float
+    size: int
+
+
+class TTLCache(Generic[V]):
+    """LRU cache with per-entry expiry, an entry cap and an optional byte cap."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        max_bytes: int | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry[V]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def lookup(self, key: str) -> V | None:
+        """Return a live value (refreshing its LRU position) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove_locked(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def store(
+        self,
+        key: str,
+        value: V,
+        *,
+        group: str,
+        ttl_seconds: float | None = None,
+        size: int = 0,
+    ) -> bool:
+        """Store a value; returns False when the TTL disables it or it is too large.
+
+        Any previous entry under ``key`` is dropped either way, so a rejected
+        update never leaves the old value being served.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+            if ttl <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+                return False
+            self._entries[key] = _Entry(
+                value=value, group=group, expires_at=time.monotonic() + ttl, size=size
+            )
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._remove_locked(next(iter(self._entries)))
+                self._evictions += 1
+        return True
+
+    def invalidate(self, group: str | None = None) -> int:
+        """Drop every entry (or only those in ``group``); returns the count."""
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if group is None or entry.group == group
+            ]
+            for key in keys:
+                self._remove_locked(key)
+            self._invalidations += len(keys)
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            stats: dict[str, Any] = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+            if self.max_bytes is not None:
+                stats["bytes"] = self._bytes
+                stats["max_bytes"] = self.max_bytes
+            return stats
+
+    def _remove_locked(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
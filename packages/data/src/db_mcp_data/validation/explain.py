@@ -3,6 +3,7 @@
 import os
 import re
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 from opentelemetry import trace
@@ -11,10 +12,16 @@ from sqlalchemy import text
 from sqlglot import parse as sqlglot_parse
 from sqlglot.errors import SqlglotError
 
-from db_mcp_data.connectors import get_connector
+from db_mcp_data.connectors import get_connector, get_connector_capabilities
 from db_mcp_data.connectors.file import FileConnector
 from db_mcp_data.connectors.sql import SQLConnector
 from db_mcp_data.db.connection import DatabaseError
+from db_mcp_data.validation.explain_cache import (
+    connection_cache_id,
+    explain_cache_key,
+    get_explain_cache,
+    schema_version,
+)
 
 tracer = trace.get_tracer("db_mcp.validation")
 
@@ -583,12 +590,21 @@ def explain_sql(
     database_url: str | None = None,
     *,
     connection_path: str | None = None,
+    connector: Any | None = None,
+    use_cache: bool = True,
 ) -> ExplainResult:
     """Validate SQL using EXPLAIN and evaluate cost tier.
 
+    Successful results are cached per (connection, normalized SQL, schema
+    version) for ``explain_cache_ttl_seconds`` (see ``explain_cache``), so a
+    statement whose cost tier was computed recently is not explained again.
+
     Args:
         sql: SQL query to validate
         database_url: Optional database URL
+        connection_path: Connection directory (required for caching)
+        connector: Already-resolved connector for ``connection_path``
+        use_cache: Set False to force a live EXPLAIN
 
     Returns:
         ExplainResult with validation status and cost tier
@@ -597,68 +613,32 @@ def explain_sql(
         "explain_sql",
         attributes={"sql.preview": sql[:200] + "..." if len(sql) > 200 else sql},
     ) as span:
-        try:
-            connector = get_connector(connection_path=connection_path)
-
-            # FileConnector (DuckDB): use DuckDB's own EXPLAIN
-            if isinstance(connector, FileConnector):
-                return _explain_duckdb(connector, sql, span)
+        cache_key = None
+        cache_connection = None
+        if use_cache and connection_path is not None:
+            cache_connection = connection_cache_id(Path(connection_path))
+            cache_key = explain_cache_key(
+                cache_connection, sql, schema_version(Path(connection_path))
+            )
+            cached = get_explain_cache().get(cache_key)
+            span.set_attribute("explain.cache_hit", cached is not None)
+            if cached is not None:
+                span.set_attribute("cost_tier", cached.cost_tier.value)
+                return cached
 
-            # SQLConnector: use SQLAlchemy EXPLAIN
-            if not isinstance(connector, SQLConnector):
-                return ExplainResult(
-                    valid=False,
-                    error=f"EXPLAIN not supported for connector type: {type(connector).__name__}",
-                    cost_tier=CostTier.REJECT,
-                    tier_reason="Unsupported connector",
+        try:
+            if connector is None:
+                connector = get_connector(connection_path=connection_path)
+            result = _explain_with_connector(connector, sql, span)
+            if cache_key is not None and result.valid:
+                ttl = get_connector_capabilities(connector).get("explain_cache_ttl_seconds")
+                get_explain_cache().put(
+                    cache_key,
+                    connection=cache_connection,  # type: ignore[arg-type]
+                    result=result,
+                    ttl_seconds=ttl,
                 )
-
-            engine = connector.get_engine()
-            dialect = connector.get_dialect()
-            explain_cmd = get_explain_command(dialect)
-            span.set_attribute("db.dialect", dialect)
-
-            with tracer.start_as_current_span("db_execute_explain"):
-                with engine.connect() as conn:
-                    result = conn.execute(text(f"{explain_cmd} {sql}"))
-                    columns = result.keys()
-                    rows = [dict(zip(columns, row)) for row in result.fetchall()]
-
-            # Parse estimates based on dialect
-            with tracer.start_as_current_span("parse_estimates") as parse_span:
-                if dialect in ("postgresql", "postgres"):
-                    est_rows, est_cost, est_size = parse_postgresql_estimates(rows)
-                elif dialect == "clickhouse":
-                    est_rows, est_cost, est_size = parse_clickhouse_estimates(rows)
-                elif dialect == "trino":
-                    est_rows, est_cost, est_size = parse_trino_estimates(rows)
-                elif dialect in ("mysql", "mariadb"):
-                    est_rows, est_cost, est_size = parse_mysql_estimates(rows)
-                elif dialect == "sqlite":
-                    est_rows, est_cost, est_size = parse_sqlite_estimates(rows)
-                elif dialect == "mssql":
-                    est_rows, est_cost, est_size = parse_mssql_estimates(rows)
-                else:
-                    est_rows, est_cost, est_size = None, None, None
-
-                if est_rows is not None:
-                    parse_span.set_attribute("estimated_rows", est_rows)
-                if est_cost is not None:
-                    parse_span.set_attribute("estimated_cost", est_cost)
-
-            # Evaluate cost tier
-            cost_tier, tier_reason = evaluate_cost_tier(est_rows, est_cost, est_size)
-            span.set_attribute("cost_tier", cost_tier.value)
-
-            return ExplainResult(
-                valid=True,
-                explanation=rows,
-                estimated_rows=est_rows,
-                estimated_cost=est_cost,
-                estimated_size_gb=est_size,
-                cost_tier=cost_tier,
-                tier_reason=tier_reason,
-            )
+            return result
 
         except DatabaseError as e:
             span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
@@ -687,6 +667,69 @@ def explain_sql(
             )
 
 
+def _explain_with_connector(connector: Any, sql: str, span: Any) -> ExplainResult:
+    """Run EXPLAIN for ``sql`` on a resolved connector and evaluate its cost tier."""
+    # FileConnector (DuckDB): use DuckDB's own EXPLAIN
+    if isinstance(connector, FileConnector):
+        return _explain_duckdb(connector, sql, span)
+
+    # SQLConnector: use SQLAlchemy EXPLAIN
+    if not isinstance(connector, SQLConnector):
+        return ExplainResult(
+            valid=False,
+            error=f"EXPLAIN not supported for connector type: {type(connector).__name__}",
+            cost_tier=CostTier.REJECT,
+            tier_reason="Unsupported connector",
+        )
+
+    engine = connector.get_engine()
+    dialect = connector.get_dialect()
+    explain_cmd = get_explain_command(dialect)
+    span.set_attribute("db.dialect", dialect)
+
+    with tracer.start_as_current_span("db_execute_explain"):
+        with engine.connect() as conn:
+            result = conn.execute(text(f"{explain_cmd} {sql}"))
+            columns = result.keys()
+            rows = [dict(zip(columns, row)) for row in result.fetchall()]
+
+    # Parse estimates based on dialect
+    with tracer.start_as_current_span("parse_estimates") as parse_span:
+        if dialect in ("postgresql", "postgres"):
+            est_rows, est_cost, est_size = parse_postgresql_estimates(rows)
+        elif dialect == "clickhouse":
+            est_rows, est_cost, est_size = parse_clickhouse_estimates(rows)
+        elif dialect == "trino":
+            est_rows, est_cost, est_size = parse_trino_estimates(rows)
+        elif dialect in ("mysql", "mariadb"):
+            est_rows, est_cost, est_size = parse_mysql_estimates(rows)
+        elif dialect == "sqlite":
+            est_rows, est_cost, est_size = parse_sqlite_estimates(rows)
+        elif dialect == "mssql":
+            est_rows, est_cost, est_size = parse_mssql_estimates(rows)
+        else:
+            est_rows, est_cost, est_size = None, None, None
+
+        if est_rows is not None:
+            parse_span.set_attribute("estimated_rows", est_rows)
+        if est_cost is not None:
+            parse_span.set_attribute("estimated_cost", est_cost)
+
+    # Evaluate cost tier
+    cost_tier, tier_reason = evaluate_cost_tier(est_rows, est_cost, est_size)
+    span.set_attribute("cost_tier", cost_tier.value)
+
+    return ExplainResult(
+        valid=True,
+        explanation=rows,
+        estimated_rows=est_rows,
+        estimated_cost=est_cost,
+        estimated_size_gb=est_size,
+        cost_tier=cost_tier,
+        tier_reason=tier_reason,
+    )
+
+
 def validate_read_only(sql: str) -> tuple[bool, str | None]:
     """Validate that SQL is read-only (SELECT only).
 
@@ -0,0 +1,106 @@
+"""In-process cache of EXPLAIN results for ``explain_sql``.
+
+Agents refining a query call ``validate_sql`` on the same statement many
+times; each call used to re-resolve the connector and run a live ``EXPLAIN``
+on the warehouse. Entries here are keyed on ``(connection, normalized SQL,
+schema version)`` so a repeated statement reuses its plan and cost tier until
+the TTL expires or the connection's schema files change.
+
+The schema version is derived from the modification times of the saved
+schema descriptions, discovery fingerprints and ``connector.yaml``, so rediscovery changes the
+key without an explicit flush; ``invalidate_explain_cache`` drops entries
+eagerly as well.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from db_mcp_data.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    from db_mcp_data.validation.explain import ExplainResult
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+
+# Files whose changes mean previously explained SQL may no longer be valid
+# (connector.yaml: the connection may now point at another database).
+_SCHEMA_FILES = (
+    Path("connector.yaml"),
+    Path("schema") / "descriptions.yaml",
+    Path("schema_descriptions.yaml"),
+    Path("state") / "schema_fingerprints.json",
+)
+
+
+def schema_version(connection_path: Path) -> str:
+    """Cheap schema version for a connection: mtimes of its schema files."""
+    parts = []
+    for rel in _SCHEMA_FILES:
+        try:
+            parts.append(str((Path(connection_path) / rel).stat().st_mtime_ns))
+        except OSError:
+            parts.append("-")
+    return ":".join(parts)
+
+
+def explain_cache_key(connection: str, sql: str, version: str) -> str:
+    """Deterministic cache key; only whitespace is collapsed, case is significant."""
+    normalized = " ".join(sql.split())
+    return hashlib.sha256(f"{connection}\0{version}\0{normalized}".encode()).hexdigest()
+
+
+class ExplainCache(TTLCache["ExplainResult"]):
+    """Thread-safe LRU cache of successful ``ExplainResult`` objects."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    def get(self, key: str) -> ExplainResult | None:
+        """Return a copy of a live entry (refreshing its LRU position) or None."""
+        result = self.lookup(key)
+        return result.model_copy() if result is not None else None
+
+    def put(
+        self,
+        key: str,
+        *,
+        connection: str,
+        result: ExplainResult,
+        ttl_seconds: float | None = None,
+    ) -> bool:
+        """Store a result; returns False when caching is disabled for it."""
+        return self.store(key, result.model_copy(), group=connection, ttl_seconds=ttl_seconds)
+
+
+_EXPLAIN_CACHE = ExplainCache()
+
+
+def get_explain_cache() -> ExplainCache:
+    """Return the process-wide explain cache."""
+    return _EXPLAIN_CACHE
+
+
+def connection_cache_id(connection_path: Path) -> str:
+    """Identity of a connection directory inside the cache."""
+    return str(Path(connection_path).resolve())
+
+
+def invalidate_explain_cache(connection_path: Path | None = None) -> int:
+    """Invalidate cached EXPLAIN results for one connection directory (or all)."""
+    if connection_path is None:
+        return _EXPLAIN_CACHE.invalidate()
+    return _EXPLAIN_CACHE.invalidate(connection_cache_id(connection_path))
+
+
+def explain_cache_stats() -> dict[str, Any]:
+    """Stats for the explain cache (reported by ``/health``)."""
+    return _EXPLAIN_CACHE.stats()
@@ -0,0 +1,240 @@
+"""Tests for the API connector's pooled HTTP session and concurrent sync."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from db_mcp_data.connectors.api import APIConnector
+from db_mcp_data.connectors.api_config import (
+    APIConnectorConfig,
+    APIEndpointConfig,
+    APIHTTPConfig,
+    APIPaginationConfig,
+    build_api_connector_config,
+)
+from db_mcp_data.connectors.api_http import TokenBucket, build_session, request_timeout
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):  # noqa: N802
+        self._respond()
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._respond()
+
+    def _respond(self):
+        server = self.server
+        server.hits.append((self.command, self.path, self.client_address[1]))
+        status = server.statuses.pop(0) if server.statuses else 200
+        if server.rows is not None:
+            page = server.page(self.path)
+            body = json.dumps(page if isinstance(page, dict) else {"data": page}).encode()
+        else:
+            body = json.dumps({"data": [{"id": len(server.hits)}]}).encode()
+        self.send_response(status)
+        if status != 200:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.hits = []
+    httpd.statuses = []
+    httpd.rows = None  # set to a list to serve ``offset``/``limit`` pages or ``/<id>``
+    httpd.delay = 0.0
+    httpd.active = httpd.max_active = 0
+    lock = threading.Lock()
+
+    def page(path):
+        with lock:
+            httpd.active += 1
+            httpd.max_active = max(httpd.max_active, httpd.active)
+        time.sleep(httpd.delay)
+        with lock:
+            httpd.active -= 1
+        parsed = urlparse(path)
+        query = parse_qs(parsed.query)
+        if "offset" in query:
+            start = int(query["offset"][0])
+            return httpd.rows[start : start + int(query["limit"][0])]
+        return {"id": parsed.path.rsplit("/", 1)[-1]}
+
+    httpd.page = page
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _connector(tmp_path, server, endpoints=("items",), pagination=None, **http) -> APIConnector:
+    config = APIConnectorConfig(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        endpoints=[APIEndpointConfig(name=name, path=f"/{name}") for name in endpoints],
+        pagination=pagination or APIPaginationConfig(),
+        rate_limit_rps=0,
+        http=APIHTTPConfig(backoff_factor=0, **http),
+    )
+    config.auth.type = "none"
+    return APIConnector(config, data_dir=str(tmp_path / "data"))
+
+
+def test_http_settings_read_from_connector_yaml():
+    config = build_api_connector_config(
+        {"type": "api", "http": {"timeout": 5, "pool_size": 4, "unknown": 1}}
+    )
+
+    assert config.http.timeout == 5
+    assert config.http.pool_size == 4
+    assert config.http.max_retries == APIHTTPConfig().max_retries
+    assert request_timeout(config.http) == (10.0, 5)
+    assert request_timeout(config.http, 60) == (10.0, 60)
+
+
+def test_session_mounts_pooled_adapter():
+    session = build_session(APIHTTPConfig(pool_size=3, max_retries=2))
+    adapter = session.get_adapter("https://api.example.com")
+
+    assert adapter._pool_maxsize == 3
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.is_retry("POST", 429)
+    assert not adapter.max_retries.is_retry("POST", 503)
+    assert adapter.max_retries.is_retry("GET", 503)
+
+
+def test_requests_reuse_one_connection(tmp_path, server):
+    connector = _connector(tmp_path, server)
+
+    for _ in range(3):
+        assert "error" not in connector.query_endpoint("items")
+
+    assert len(server.hits) == 3
+    assert len({port for _, _, port in server.hits}) == 1
+    assert connector.session is connector.session
+
+
+def test_retries_rate_limited_and_unavailable_responses(tmp_path, server):
+    connector = _connector(tmp_path, server)
+    server.statuses = [429, 503]
+
+    result = connector.query_endpoint("items")
+
+    assert result["data"] == [{"id": 3}]
+    assert [method for method, _, _ in server.hits] == ["GET"] * 3
+
+
+def test_gives_up_after_max_retries(tmp_path, server):
+    connector = _connector(tmp_path, server, max_retries=1)
+    server.statuses = [503, 503, 503]
+
+    result = connector.query_endpoint("items")
+
+    assert "503" in result["error"]
+    assert len(server.hits) == 2
+
+
+def test_close_drops_session(tmp_path, server):
+    connector = _connector(tmp_path, server)
+    first = connector.session
+
+    connector.close()
+
+    assert connector.session is not first
+
+
+def test_concurrent_first_use_builds_one_session(tmp_path, server, monkeypatch):
+    connector = _connector(tmp_path, server)
+    built = []
+
+    def slow_build(config):
+        time.sleep(0.05)
+        built.append(build_session(config))
+        return built[-1]
+
+    monkeypatch.setattr("db_mcp_data.connectors.api_http.build_session", slow_build)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        sessions = list(pool.map(lambda _: connector.session, range(4)))
+
+    assert len(built) == 1
+    assert all(session is built[0] for session in sessions)
+
+
+def test_token_bucket_paces_after_burst():
+    now = [0.0]
+    waits: list[float] = []
+    bucket = TokenBucket(2.0, 2, clock=lambda: now[0], sleep=waits.append)
+
+    for _ in range(4):
+        bucket.acquire()
+    assert waits == [0.5, 1.0]  # two free, then one slot every 0.5s
+
+    now[0] = 10.0
+    bucket.acquire()
+    assert waits == [0.5, 1.0]
+
+
+def _offset_connector(tmp_path, server, rows, **kwargs):
+    server.rows = rows
+    pagination = APIPaginationConfig(type="offset", page_size=10)
+    return _connector(tmp_path, server, pagination=pagination, **kwargs)
+
+
+def test_offset_pages_are_prefetched_in_order(tmp_path, server):
+    connector = _offset_connector(tmp_path, server, [{"id": i} for i in range(95)])
+    server.delay = 0.05
+
+    result = connector.sync()
+
+    lines = (connector.data_dir / "items.jsonl").read_text().splitlines()
+    assert result["rows_fetched"] == {"items": 95}
+    assert [json.loads(line)["id"] for line in lines] == list(range(95))
+    # Windows of 1, 2, 4 and 4 pages: one page past the end is fetched and dropped.
+    assert len(server.hits) == 11
+    assert server.max_active == 4
+
+
+def test_offset_prefetch_respects_max_pages(tmp_path, server):
+    connector = _offset_connector(tmp_path, server, [{"id": i} for i in range(95)])
+
+    result = connector.query_endpoint("items", max_pages=3)
+
+    assert result["rows_returned"] == 30
+    assert len(server.hits) == 3
+
+
+def test_endpoints_sync_in_parallel(tmp_path, server):
+    connector = _connector(tmp_path, server, endpoints=("a", "b", "c", "d"))
+    server.rows = []
+    server.delay = 0.1
+
+    result = connector.sync()
+
+    assert result["synced"] == ["a", "b", "c", "d"]
+    assert server.max_active > 1
+
+
+def test_id_lookups_run_concurrently_and_keep_order(tmp_path, server):
+    connector = _connector(tmp_path, server, max_concurrency=2)
+    server.rows = []
+    server.delay = 0.05
+
+    result = connector.query_endpoint("items", id=[str(i) for i in range(8)])
+
+    assert [row["id"] for row in result["data"]] == [str(i) for i in range(8)]
+    assert server.max_active == 2
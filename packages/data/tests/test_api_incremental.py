@@ -0,0 +1,260 @@
+"""Tests for watermark-based incremental API sync into Parquet parts."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from db_mcp_data.connectors import api_incremental
+from db_mcp_data.connectors.api import APIConnector
+from db_mcp_data.connectors.api_config import (
+    APIConnectorConfig,
+    APIEndpointConfig,
+    build_api_connector_config,
+)
+
+
+class _FakeAPI:
+    """Serves ``rows``, filtered to ``updated_at >= since`` when the param is sent."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        params = dict(params or {})
+        self.calls.append(params)
+        since = params.get("since")
+        rows = [r for r in self.rows if since is None or r["updated_at"] >= since]
+        resp = MagicMock()
+        resp.json.return_value = {"data": rows}
+        resp.raise_for_status = MagicMock()
+        return resp
+
+
+@pytest.fixture
+def api():
+    fake = _FakeAPI(
+        [
+            {"id": 1, "name": "a", "updated_at": "2026-01-01"},
+            {"id": 2, "name": "b", "updated_at": "2026-01-02"},
+        ]
+    )
+    with patch("db_mcp_data.connectors.api.requests.Session.get", side_effect=fake.get):
+        yield fake
+
+
+def _connector(tmp_path, incremental_param="since") -> APIConnector:
+    config = APIConnectorConfig(
+        base_url="https://api.example.com",
+        endpoints=[
+            APIEndpointConfig(
+                name="items",
+                path="/items",
+                incremental_field="updated_at",
+                incremental_param=incremental_param,
+            )
+        ],
+        rate_limit_rps=0,
+    )
+    config.auth.type = "none"
+    return APIConnector(config, data_dir=str(tmp_path / "data"))
+
+
+def _rows(connector):
+    return connector._file_connector.execute_sql("SELECT id, name FROM items ORDER BY id")
+
+
+def test_incremental_fields_read_from_connector_yaml():
+    config = build_api_connector_config(
+        {
+            "type": "api",
+            "endpoints": [
+                {"name": "items", "path": "/items", "incremental_field": "updated_at"},
+            ],
+        }
+    )
+
+    endpoint = config.endpoints[0]
+    assert endpoint.incremental_field == "updated_at"
+    assert endpoint.incremental_param == ""
+    assert endpoint.primary_key == "id"
+
+
+def test_first_sync_writes_parquet_part_and_watermark(tmp_path, api):
+    connector = _connector(tmp_path)
+
+    result = connector.sync()
+
+    assert result["rows_fetched"] == {"items": 2}
+    assert result["watermarks"] == {"items": "2026-01-02"}
+    assert api.calls == [{}]
+    parts = api_incremental.list_parts(connector.data_dir / "items")
+    assert [p.name for p in parts] == ["part-000001.parquet"]
+    assert not (connector.data_dir / "items.jsonl").exists()
+    assert _rows(connector) == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+
+def test_later_sync_fetches_delta_and_newest_row_wins(tmp_path, api):
+    connector = _connector(tmp_path)
+    connector.sync()
+    api.rows[0] = {"id": 1, "name": "a2", "updated_at": "2026-01-03"}
+    api.rows.append({"id": 3, "name": "c", "updated_at": "2026-01-04"})
+
+    result = connector.sync()
+
+    assert api.calls[-1] == {"since": "2026-01-02"}
+    # Record 2 sits at the watermark, so it is refetched alongside the changes.
+    assert result["rows_fetched"] == {"items": 3}
+    assert result["watermarks"] == {"items": "2026-01-04"}
+    assert len(api_incremental.list_parts(connector.data_dir / "items")) == 2
+    assert _rows(connector) == [
+        {"id": 1, "name": "a2"},
+        {"id": 2, "name": "b"},
+        {"id": 3, "name": "c"},
+    ]
+
+
+def test_watermark_survives_a_new_connector(tmp_path, api):
+    _connector(tmp_path).sync()
+
+    _connector(tmp_path).sync()
+
+    assert api.calls[-1] == {"since": "2026-01-02"}
+
+
+def test_rows_filtered_client_side_without_param(tmp_path, api):
+    connector = _connector(tmp_path, incremental_param="")
+    connector.sync()
+
+    result = connector.sync()
+
+    assert api.calls == [{}, {}]
+    assert result["rows_fetched"] == {"items": 1}
+
+
+def test_full_sync_resets_watermark_and_parts(tmp_path, api):
+    connector = _connector(tmp_path)
+    connector.sync()
+    connector.sync()
+
+    result = connector.sync(full=True)
+
+    assert api.calls[-1] == {}
+    assert result["rows_fetched"] == {"items": 2}
+    parts = api_incremental.list_parts(connector.data_dir / "items")
+    assert [p.name for p in parts] == ["part-000001.parquet"]
+
+
+def test_parts_compacted_after_threshold(tmp_path, api, monkeypatch):
+    monkeypatch.setattr(api_incremental, "COMPACT_AFTER_PARTS", 3)
+    connector = _connector(tmp_path)
+
+    for _ in range(3):
+        connector.sync()
+
+    parts = api_incremental.list_parts(connector.data_dir / "items")
+    assert [p.name for p in parts] == ["part-000004.parquet"]
+    assert _rows(connector) == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    connector.sync()
+    parts = api_incremental.list_parts(connector.data_dir / "items")
+    assert [p.name for p in parts] == ["part-000004.parquet", "part-000005.parquet"]
+
+
+def test_null_only_part_unions_with_valued_part(tmp_path, api):
+    api.rows[:] = [{"id": 1, "name": None, "updated_at": "2026-01-01"}]
+    connector = _connector(tmp_path)
+    connector.sync()
+    api.rows.append({"id": 2, "name": "b", "updated_at": "2026-01-02", "tags": {"x": 1}})
+
+    connector.sync()
+
+    assert _rows(connector) == [{"id": 1, "name": None}, {"id": 2, "name": "b"}]
+    tags = connector._file_connector.execute_sql("SELECT tags FROM items WHERE id = 2")
+    assert tags == [{"tags": {"x": 1}}]
+    api_incremental.compact(connector.data_dir / "items", 9, "id")
+    connector._file_connector.invalidate_cache()
+    assert _rows(connector) == [{"id": 1, "name": None}, {"id": 2, "name": "b"}]
+
+
+def test_column_types_are_kept_across_parts(tmp_path, api):
+    api.rows[:] = [{"id": 1, "amount": 10.5, "qty": 2, "updated_at": "2026-01-01"}]
+    connector = _connector(tmp_path)
+    connector.sync()
+    api.rows.append({"id": 2, "amount": 9, "qty": 10, "updated_at": "2026-01-02"})
+
+    connector.sync()
+
+    sql = connector._file_connector.execute_sql
+    types = {c["name"]: c["type"] for c in connector._file_connector.get_columns("items")}
+    assert types["amount"] == "DOUBLE"
+    assert types["qty"] == "BIGINT"
+    assert sql("SELECT sum(amount) AS s, max(qty) AS m FROM items") == [{"s": 19.5, "m": 10}]
+
+
+def test_conflicting_column_falls_back_to_varchar_in_every_part(tmp_path, api):
+    api.rows[:] = [{"id": 1, "code": 7, "meta": {"a": 1}, "updated_at": "2026-01-01"}]
+    connector = _connector(tmp_path)
+    connector.sync()
+    api.rows.append({"id": 2, "code": "n/a", "meta": "none", "updated_at": "2026-01-02"})
+
+    connector.sync()
+
+    rows = connector._file_connector.execute_sql("SELECT id, code, meta FROM items ORDER BY id")
+    assert rows == [
+        {"id": 1, "code": "7", "meta": '{"a":1}'},
+        {"id": 2, "code": "n/a", "meta": "none"},
+    ]
+    state = api_incremental.SyncState(connector.data_dir).get("items")
+    assert state["columns"]["code"] == "VARCHAR"
+    assert state["columns"]["id"] == "BIGINT"
+
+
+def test_sequence_continues_past_parts_missing_from_state(tmp_path, api):
+    connector = _connector(tmp_path)
+    connector.sync()
+    # A sync that wrote its part but died before saving state.
+    api_incremental.write_part(connector.data_dir / "items", 2, [{"id": 3}], "id")
+
+    connector.sync()
+
+    parts = api_incremental.list_parts(connector.data_dir / "items")
+    assert [p.name for p in parts] == [
+        "part-000001.parquet",
+        "part-000002.parquet",
+        "part-000003.parquet",
+    ]
+
+
+def test_rows_without_the_field_are_stored_once(tmp_path, api):
+    api.rows.append({"id": None, "name": "orphan", "updated_at": None})
+    connector = _connector(tmp_path, incremental_param="")
+    connector.sync()
+
+    result = connector.sync()
+
+    assert result["rows_fetched"] == {"items": 1}
+    count = connector._file_connector.execute_sql("SELECT count(*) AS n FROM items")
+    assert count == [{"n": 3}]
+
+
+def test_next_watermark_compares_numbers_numerically():
+    rows = [{"id": 9}, {"id": 10}, {"id": None}]
+
+    assert api_incremental.next_watermark(rows, "id") == 10
+    assert api_incremental.next_watermark([{"id": "9"}, {"id": "10"}], "id") == "10"
+    assert api_incremental.next_watermark([], "id", 4) == 4
+    assert api_incremental.next_watermark([], "id") is None
+
+
+@pytest.mark.parametrize(
+    ("value", "watermark"),
+    [
+        ("2026-01-01T10:00:00Z", "2026-01-01T10:00:00+00:00"),
+        ("2026-01-01T09:30:00Z", "2026-01-01T10:00:00+01:00"),
+        ("2026-01-02", "2026-01-01T23:59:59"),
+        ("10", "9"),
+    ],
+)
+def test_at_or_after_parses_timestamps_and_numeric_strings(value, watermark):
+    assert api_incremental.at_or_after(value, watermark)
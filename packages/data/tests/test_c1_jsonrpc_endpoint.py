@@ -78,7 +78,7 @@ def test_send_non_get_jsonrpc_posts_correct_envelope(tmp_path):
         mock_resp.raise_for_status = MagicMock()
         return mock_resp
 
-    with patch("requests.post", side_effect=fake_post):
+    with patch("requests.Session.post", side_effect=fake_post):
         connector._send_non_get(
             "https://rpc.example.com/rpc",
             {},
@@ -115,7 +115,7 @@ def test_send_non_get_jsonrpc_returns_result_field(tmp_path):
     }
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("requests.post", return_value=mock_resp):
+    with patch("requests.Session.post", return_value=mock_resp):
         result = connector._send_non_get(
             "https://rpc.example.com/rpc",
             {},
@@ -147,7 +147,7 @@ def test_send_non_get_jsonrpc_raises_on_error_field(tmp_path):
     }
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("requests.post", return_value=mock_resp):
+    with patch("requests.Session.post", return_value=mock_resp):
         try:
             connector._send_non_get(
                 "https://rpc.example.com/rpc",
@@ -199,7 +199,7 @@ def test_query_endpoint_jsonrpc_returns_rows(tmp_path):
     }
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("requests.post", return_value=mock_resp):
+    with patch("requests.Session.post", return_value=mock_resp):
         result = connector.query_endpoint("get_ledger", {"slot": "12345"})
 
     assert result["rows_returned"] == 1
@@ -0,0 +1,126 @@
+"""Tests for the shared live-connector cache."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from db_mcp_data.connectors.cache import ConnectorCache, connector_fingerprint
+from db_mcp_data.connectors.file import FileConnector, FileConnectorConfig
+from db_mcp_data.gateway import dispatcher
+
+
+def _bump(path, content):
+    stat = path.stat() if path.exists() else None
+    path.write_text(content)
+    if stat is not None:
+        # Same-size rewrites within one mtime tick must still look different.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestConnectorCache:
+    def test_reuses_connector_until_config_changes(self, tmp_path):
+        (tmp_path / "connector.yaml").write_text("type: sql\n")
+        factory = MagicMock(side_effect=[object(), object()])
+        cache = ConnectorCache()
+
+        first = cache.get(tmp_path, factory)
+        assert cache.get(str(tmp_path), factory) is first
+        assert factory.call_count == 1
+
+        _bump(tmp_path / ".env", "DATABASE_URL=sqlite://\n")
+        assert cache.get(tmp_path, factory) is not first
+        assert factory.call_count == 2
+
+    def test_fingerprint_tracks_env_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "sqlite://")
+        before = connector_fingerprint(tmp_path)
+        monkeypatch.setenv("DATABASE_URL", "sqlite:///other.db")
+        assert connector_fingerprint(tmp_path) != before
+
+    def test_other_factory_rebuilds(self, tmp_path):
+        cache = ConnectorCache()
+        first = cache.get(tmp_path, lambda connection_path: object())
+
+        assert cache.get(tmp_path, lambda connection_path: "other") == "other"
+        assert cache.get(tmp_path, lambda connection_path: first) is first
+
+    def test_invalidate(self, tmp_path):
+        cache = ConnectorCache()
+        factory = MagicMock(side_effect=lambda connection_path: object())
+        cache.get(tmp_path / "a", factory)
+        cache.get(tmp_path / "b", factory)
+
+        assert cache.invalidate(tmp_path / "a") is True
+        assert cache.invalidate(tmp_path / "a") is False
+        assert tmp_path / "b" in cache
+        assert cache.invalidate() is True
+        assert len(cache) == 0
+
+    def test_replaced_and_invalidated_connectors_are_closed(self, tmp_path):
+        (tmp_path / "connector.yaml").write_text("type: api\n")
+        built = []
+
+        def factory(connection_path):
+            built.append(MagicMock())
+            return built[-1]
+
+        cache = ConnectorCache()
+        first = cache.get(tmp_path, factory)
+        assert cache.get(tmp_path, factory) is first
+        first.close.assert_not_called()
+
+        _bump(tmp_path / "connector.yaml", "type: api\nbase_url: x\n")
+        second = cache.get(tmp_path, factory)
+        first.close.assert_called_once_with()
+
+        second.close.side_effect = RuntimeError("already closed")
+        assert cache.invalidate(tmp_path) is True  # a failing close is only logged
+        second.close.assert_called_once_with()
+
+    def test_watched_directory_expands_user(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / "files").mkdir()
+        connector = FileConnector(FileConnectorConfig(directory="~/files"))
+        cache = ConnectorCache()
+        cache.get(tmp_path / "conn", lambda connection_path: connector)
+
+        entry = cache._entries[str((tmp_path / "conn").resolve())]
+        assert entry.directory == tmp_path / "files"
+        assert entry.directory_stamp is not None
+
+    def test_new_files_refresh_sources_without_rebuilding(self, tmp_path):
+        data_dir = tmp_path / "files"
+        data_dir.mkdir()
+        (data_dir / "a.csv").write_text("x\n1\n")
+        connector = FileConnector(FileConnectorConfig(directory=str(data_dir)))
+        cache = ConnectorCache()
+        factory = MagicMock(return_value=connector)
+
+        assert [t["name"] for t in cache.get(tmp_path, factory).get_tables()] == ["a"]
+
+        (data_dir / "b.csv").write_text("y\n2\n")
+        stat = data_dir.stat()
+        os.utime(data_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get(tmp_path, factory) is connector
+        assert factory.call_count == 1
+        assert {t["name"] for t in connector.get_tables()} == {"a", "b"}
+
+
+class TestDispatcherUsesCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        from db_mcp_data.connectors.cache import invalidate_connector_cache
+
+        invalidate_connector_cache()
+        yield
+        invalidate_connector_cache()
+
+    def test_connector_built_once_per_connection(self, tmp_path):
+        connector = MagicMock(spec=FileConnector)
+        with patch.object(dispatcher, "get_connector", return_value=connector) as factory:
+            resolved = {id(dispatcher.resolve_connector(tmp_path)) for _ in range(3)}
+
+        assert resolved == {id(connector)}
+        assert factory.call_count == 1
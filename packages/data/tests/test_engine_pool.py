@@ -0,0 +1,116 @@
+"""Tests for the fingerprinted SQLAlchemy engine cache and pool stats."""
+
+from pathlib import Path
+
+import pytest
+
+from db_mcp_data.connectors.sql import SQLConnector, SQLConnectorConfig
+from db_mcp_data.db.connection import (
+    dispose_engine,
+    dispose_engines,
+    engine_fingerprint,
+    engine_pool_stats,
+    get_engine,
+    resolve_pool_options,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_engines():
+    dispose_engines()
+    yield
+    dispose_engines()
+
+
+def _url(tmp_path: Path) -> str:
+    return f"sqlite:///{tmp_path / 'pool.db'}"
+
+
+def test_engines_are_cached_per_url_and_connect_args(tmp_path: Path):
+    url = _url(tmp_path)
+
+    plain = get_engine(url)
+    assert get_engine(url) is plain
+
+    with_args = get_engine(url, connect_args={"timeout": 5})
+    assert with_args is not plain
+    assert get_engine(url, connect_args={"timeout": 5}) is with_args
+    assert engine_fingerprint(url, {"timeout": 5}) != engine_fingerprint(url, None)
+
+
+def test_pool_options_are_part_of_the_cache_key(tmp_path: Path):
+    url = _url(tmp_path)
+
+    engine = get_engine(url, pool_options={"pool_size": 2})
+    assert engine.pool.size() == 2
+    # Callers without options (introspection) share the configured engine.
+    assert get_engine(url) is engine
+
+    resized = get_engine(url, pool_options={"pool_size": 3})
+    assert resized is not engine
+    assert resized.pool.size() == 3
+    assert get_engine(url) is resized
+
+    # Alternating callers keep their own engines rather than disposing each other's.
+    assert get_engine(url, pool_options={"pool_size": 2}) is engine
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT 1").scalar() == 1
+    assert len(engine_pool_stats()) == 2
+    assert engine_fingerprint(url, None, {"pool_size": 2}) != engine_fingerprint(url, None)
+
+
+def test_connector_close_disposes_only_its_engine(tmp_path: Path):
+    url = _url(tmp_path)
+    connector = SQLConnector(SQLConnectorConfig(database_url=url, capabilities={"pool_size": 2}))
+    engine = connector.get_engine()
+    other = get_engine(url, pool_options={"pool_size": 3})
+
+    connector.close()
+
+    assert len(engine_pool_stats()) == 1
+    assert get_engine(url, pool_options={"pool_size": 3}) is other
+    reopened = connector.get_engine()
+    assert reopened is not engine
+    with reopened.connect() as conn:
+        assert conn.exec_driver_sql("SELECT 1").scalar() == 1
+    assert dispose_engine(url, pool_options={"pool_size": 9}) is False
+
+
+def test_resolve_pool_options_from_capabilities():
+    options = resolve_pool_options(
+        {
+            "pool_size": "8",
+            "max_overflow": 0,
+            "pool_recycle_seconds": 600,
+            "pool_pre_ping": False,
+            "pool_timeout_seconds": None,
+            "connect_args": {"x": 1},
+        }
+    )
+
+    assert options == {
+        "pool_size": 8,
+        "max_overflow": 0,
+        "pool_recycle": 600,
+        "pool_pre_ping": False,
+    }
+    assert resolve_pool_options(None) == {}
+
+
+def test_connector_queries_record_pool_stats(tmp_path: Path):
+    connector = SQLConnector(
+        SQLConnectorConfig(database_url=_url(tmp_path), capabilities={"pool_size": 2})
+    )
+
+    assert connector.execute_sql("SELECT 1 AS x") == [{"x": 1}]
+    stream = connector.stream_sql("SELECT 2 AS y")
+    assert [row for batch in stream for row in batch] == [{"y": 2}]
+    stream.close()
+
+    stats = list(engine_pool_stats().values())
+    assert len(stats) == 1
+    assert stats[0]["size"] == 2
+    assert stats[0]["checkouts"] == 2
+    assert stats[0]["checked_out"] == 0
+    assert stats[0]["connects"] >= 1
+    assert stats[0]["wait_ms_max"] >= 0.0
@@ -0,0 +1,160 @@
+"""Tests for execution cancellation and engine-enforced statement timeouts."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import NullPool, QueuePool
+
+from db_mcp_data.db.cancellation import (
+    _canceller_engine,
+    _side_statement,
+    cancel_running,
+    cancel_scope,
+    prepare_cancellable_statement,
+)
+from db_mcp_data.db.duckdb import DuckDBExecutor
+from db_mcp_data.execution import ExecutionErrorCode, ExecutionRequest, ExecutionState
+from db_mcp_data.execution.engine import ExecutionEngine
+from db_mcp_data.execution.store import ExecutionStore
+
+_SLOW_SQL = "SELECT count(*) AS n FROM range(100000000000) a"
+
+
+def _engine(tmp_path: Path) -> ExecutionEngine:
+    return ExecutionEngine(ExecutionStore(tmp_path / "executions.sqlite"))
+
+
+def _duckdb_runner(executor: DuckDBExecutor):
+    def runner(payload: dict):
+        rows = executor.execute_sql(payload["sql"])
+        return {"data": rows, "columns": list(rows[0].keys()) if rows else []}
+
+    return runner
+
+
+def test_timeout_interrupts_duckdb_statement(tmp_path: Path):
+    engine = _engine(tmp_path)
+    executor = DuckDBExecutor(lambda: [])
+    request = ExecutionRequest(connection="files", sql=_SLOW_SQL, timeout_seconds=0.2)
+
+    started = time.time()
+    _, result = engine.submit_sync(request, _duckdb_runner(executor))
+
+    assert time.time() - started < 10
+    assert result.state == ExecutionState.TIMED_OUT
+    assert result.error is not None
+    assert result.error.code == ExecutionErrorCode.TIMEOUT
+
+
+def test_cancel_execution_interrupts_running_statement(tmp_path: Path):
+    engine = _engine(tmp_path)
+    executor = DuckDBExecutor(lambda: [])
+    request = ExecutionRequest(connection="files", sql=_SLOW_SQL, idempotency_key="slow")
+    outcome: dict = {}
+
+    def _run() -> None:
+        outcome["handle"], outcome["result"] = engine.submit_sync(
+            request, _duckdb_runner(executor)
+        )
+
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    worker = threading.Thread(target=_run)
+    worker.start()
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        handle = store.get_by_idempotency("files", "slow")
+        if handle is not None and engine.cancel_execution(handle.execution_id):
+            break
+        time.sleep(0.05)
+    worker.join(timeout=10)
+
+    assert not worker.is_alive()
+    assert outcome["result"].state == ExecutionState.CANCELLED
+
+
+def test_cancel_submitted_execution_prevents_start(tmp_path: Path):
+    engine = _engine(tmp_path)
+    handle = engine.submit_async(ExecutionRequest(connection="c", sql="SELECT 1"))
+
+    assert engine.cancel_execution(handle.execution_id) is True
+    assert engine.mark_running(handle.execution_id) is False
+
+    engine.mark_succeeded(
+        handle.execution_id,
+        data=[{"x": 1}],
+        columns=["x"],
+        rows_returned=1,
+        rows_affected=None,
+        duration_ms=1.0,
+    )
+    result = engine.get_result(handle.execution_id)
+    assert result is not None
+    assert result.state == ExecutionState.CANCELLED
+
+
+def test_cancel_finished_or_unknown_execution_returns_false(tmp_path: Path):
+    engine = _engine(tmp_path)
+    handle, result = engine.submit_sync(
+        ExecutionRequest(connection="c", sql="SELECT 1"),
+        lambda payload: {"data": [{"x": 1}], "columns": ["x"]},
+    )
+
+    assert result.state == ExecutionState.SUCCEEDED
+    assert engine.cancel_execution(handle.execution_id) is False
+    assert engine.cancel_execution("missing") is False
+
+
+def test_canceller_added_after_cancel_runs_immediately():
+    calls: list[str] = []
+    with cancel_scope("exec-1") as scope:
+        assert cancel_running("exec-1") is True
+        scope.add_canceller(lambda: calls.append("late"))
+
+    assert calls == ["late"]
+    assert cancel_running("exec-1") is False
+
+
+class _FakePostgresConnection:
+    def __init__(self, info: dict, engine):
+        self.dialect = type("Dialect", (), {"name": "postgresql"})()
+        self.connection = type("Proxied", (), {"info": info})()
+        self.engine = engine
+        self.queries: list[str] = []
+
+    def exec_driver_sql(self, sql: str):
+        self.queries.append(sql)
+        return type("Result", (), {"scalar": lambda _self: 4242})()
+
+
+def test_backend_pid_is_queried_once_per_dbapi_connection(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'c.db'}")
+    info: dict = {}
+    first = _FakePostgresConnection(info, engine)
+    second = _FakePostgresConnection(info, engine)  # same DBAPI connection, new checkout
+
+    prepare_cancellable_statement(first, "SELECT 1")
+    sql, canceller = prepare_cancellable_statement(second, "SELECT 2")
+
+    assert first.queries == ["SELECT pg_backend_pid()"]
+    assert second.queries == []
+    assert sql == "SELECT 2" and canceller is not None
+    engine.dispose()
+
+
+def test_side_statement_uses_unpooled_connection(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'c.db'}", poolclass=QueuePool)
+    checkouts: list[object] = []
+    event.listen(engine, "checkout", lambda *args: checkouts.append(args))
+
+    canceller = _side_statement(engine, "SELECT 1")
+    canceller()
+    canceller()
+
+    assert checkouts == []
+    assert isinstance(_canceller_engine(engine).pool, NullPool)
+    assert _canceller_engine(engine) is _canceller_engine(engine)
+    engine.dispose()
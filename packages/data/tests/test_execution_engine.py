@@ -99,3 +99,156 @@ def test_execution_engine_idempotency_returns_existing_execution(tmp_path: Path)
     assert handle_2.execution_id == handle_1.execution_id
     assert result_2.execution_id == result_1.execution_id
     assert result_2.data == [{"value": 1}]
+
+
+def _succeed(store: ExecutionStore, rows: list[dict], **kwargs) -> str:
+    handle = store.create_submission(ExecutionRequest(connection="c", sql="SELECT 1"))
+    store.mark_succeeded(
+        handle.execution_id,
+        data=rows,
+        columns=list(rows[0].keys()) if rows else [],
+        rows_returned=len(rows),
+        rows_affected=None,
+        duration_ms=None,
+        **kwargs,
+    )
+    return handle.execution_id
+
+
+def test_large_result_spills_to_parquet_and_reads_pages(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "state" / "executions.sqlite")
+    rows = [{"id": i, "name": f"n{i}", "tags": ["a", i], "maybe": None} for i in range(2500)]
+    execution_id = _succeed(store, rows)
+
+    result_file = tmp_path / "state" / "results" / f"{execution_id}.parquet"
+    assert result_file.exists()
+
+    page = store.get_result(execution_id, offset=1200, limit=3)
+    assert page is not None
+    assert page.rows_returned == 2500
+    assert page.data == rows[1200:1203]
+
+    full = store.get_result(execution_id)
+    assert full is not None
+    assert full.data == rows
+
+
+def test_small_result_stays_inline_and_pages(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    rows = [{"x": i} for i in range(10)]
+    execution_id = _succeed(store, rows)
+
+    assert not (tmp_path / "results").exists()
+    page = store.get_result(execution_id, offset=4, limit=2)
+    assert page is not None
+    assert page.data == [{"x": 4}, {"x": 5}]
+    assert store.get_result(execution_id, limit=0).data == []
+
+
+def test_spilled_result_preserves_heterogeneous_keys(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    rows = [{"a": i} if i % 2 else {"a": i, "b": str(i)} for i in range(1500)]
+    execution_id = _succeed(store, rows)
+
+    batches = list(store.iter_result_batches(execution_id, batch_size=400))
+    assert [len(b) for b in batches] == [400, 400, 400, 300]
+    assert [row for batch in batches for row in batch] == rows
+
+
+def test_large_sync_result_is_returned_without_reading_the_spill(tmp_path: Path, monkeypatch):
+    from datetime import date
+
+    from db_mcp_data.execution import store as store_module
+
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    engine = ExecutionEngine(store)
+    rows = [{"v": i, "day": date(2026, 1, 1)} for i in range(1500)]
+
+    def fail_read(*args, **kwargs):
+        raise AssertionError("sync result was read back from disk")
+
+    monkeypatch.setattr(store_module, "read_result_page", fail_read)
+    handle, result = engine.submit_sync(
+        ExecutionRequest(connection="c", sql="SELECT v"),
+        lambda payload: {"data": rows, "columns": ["v", "day"]},
+    )
+
+    assert result.state == ExecutionState.SUCCEEDED
+    assert result.rows_returned == 1500
+    assert result.data == rows
+    assert (tmp_path / "results" / f"{handle.execution_id}.parquet").exists()
+    monkeypatch.undo()
+    page = engine.get_result(handle.execution_id, offset=1499, limit=1)
+    assert page.data == [{"v": 1499, "day": "2026-01-01"}]
+
+
+def test_engine_streams_unbounded_runner_result_to_disk(tmp_path: Path):
+    from db_mcp_data.db.streaming import RowStream
+
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    engine = ExecutionEngine(store)
+    rows = [{"v": i} for i in range(3000)]
+
+    def runner(payload: dict):
+        return {"stream": RowStream.from_rows(rows, batch_size=500)}
+
+    handle, result = engine.submit_sync(ExecutionRequest(connection="c", sql="SELECT v"), runner)
+
+    assert result.state == ExecutionState.SUCCEEDED
+    assert result.rows_returned == 3000
+    assert result.columns == ["v"]
+    assert (tmp_path / "results" / f"{handle.execution_id}.parquet").exists()
+    assert engine.get_result(handle.execution_id, offset=2999, limit=5).data == [{"v": 2999}]
+
+
+def test_execution_store_uses_wal_and_reuses_connection(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+
+    conn = store._connect()
+    assert conn is store._connect()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    store.close()
+    assert store._connect() is not conn
+
+
+def test_submit_sync_inserts_running_row_in_one_write(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    engine = ExecutionEngine(store)
+    seen_states = []
+
+    def runner(payload: dict):
+        handle = store.get_by_idempotency("c", "k1")
+        seen_states.append(store.get_result(handle.execution_id, limit=0).state)
+        return {"data": [{"x": 1}], "columns": ["x"]}
+
+    request = ExecutionRequest(connection="c", sql="SELECT 1", idempotency_key="k1")
+    engine.submit_sync(request, runner)
+
+    assert seen_states == [ExecutionState.RUNNING]
+
+
+def test_submit_sync_from_concurrent_threads(tmp_path: Path):
+    import threading
+
+    engine = ExecutionEngine(ExecutionStore(tmp_path / "executions.sqlite"))
+    results = []
+
+    def runner(payload: dict):
+        return {"data": [{"sql": payload["sql"]}], "columns": ["sql"]}
+
+    def worker(n: int) -> None:
+        for i in range(20):
+            request = ExecutionRequest(connection="c", sql=f"SELECT {n}, {i}")
+            _, result = engine.submit_sync(request, runner)
+            results.append(result)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 120
+    assert all(r.state == ExecutionState.SUCCEEDED for r in results)
+    assert len({r.execution_id for r in results}) == 120
@@ -0,0 +1,132 @@
+"""Tests for execution history retention and compaction."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+
+from db_mcp_data.execution import ExecutionRequest, RetentionPolicy
+from db_mcp_data.execution.query_store import QueryStore
+from db_mcp_data.execution.store import ExecutionStore
+
+_NO_LIMITS = RetentionPolicy(
+    max_age_seconds=None, max_total_bytes=None, max_rows_per_connection=None
+)
+
+
+def _add(store: ExecutionStore, connection: str, rows: list[dict], created_at: float) -> str:
+    handle = store.create_submission(ExecutionRequest(connection=connection, sql="SELECT 1"))
+    store.mark_succeeded(
+        handle.execution_id,
+        data=rows,
+        columns=["x"],
+        rows_returned=len(rows),
+        rows_affected=None,
+        duration_ms=None,
+    )
+    with store._connect() as conn:
+        conn.execute(
+            "UPDATE executions SET created_at = ? WHERE execution_id = ?",
+            (created_at, handle.execution_id),
+        )
+    return handle.execution_id
+
+
+def test_compact_drops_rows_older_than_max_age(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    now = time.time()
+    old = _add(store, "c", [{"x": 1}], now - 3600)
+    fresh = _add(store, "c", [{"x": 2}], now)
+
+    stats = store.compact(_NO_LIMITS.model_copy(update={"max_age_seconds": 60}), now=now)
+
+    assert stats.rows_deleted == 1
+    assert store.get_result(old) is None
+    assert store.get_result(fresh) is not None
+
+
+def test_compact_keeps_newest_rows_per_connection(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    ids = [_add(store, "a", [{"x": i}], 1000 + i) for i in range(5)]
+    other = _add(store, "b", [{"x": 0}], 1000)
+
+    stats = store.compact(_NO_LIMITS.model_copy(update={"max_rows_per_connection": 2}))
+
+    assert stats.rows_deleted == 3
+    assert [store.get_result(i) is not None for i in ids] == [False, False, False, True, True]
+    assert store.get_result(other) is not None
+
+
+def test_compact_enforces_byte_cap_and_removes_result_files(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    big = _add(store, "c", [{"x": i} for i in range(3000)], 1000)
+    small = _add(store, "c", [{"x": 1}], 2000)
+    result_file = tmp_path / "results" / f"{big}.parquet"
+    assert result_file.exists()
+
+    stats = store.compact(_NO_LIMITS.model_copy(update={"max_total_bytes": 1000}))
+
+    assert stats.rows_deleted == 1
+    assert stats.files_deleted == 1
+    assert not result_file.exists()
+    assert store.get_result(small) is not None
+
+
+def test_compact_never_deletes_running_executions(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    handle = store.create_submission(ExecutionRequest(connection="c", sql="SELECT 1"))
+    store.mark_running(handle.execution_id)
+
+    stats = store.compact(
+        RetentionPolicy(max_age_seconds=0, max_total_bytes=0, max_rows_per_connection=0),
+        now=time.time() + 10,
+    )
+
+    assert stats.rows_deleted == 0
+    assert store.get_result(handle.execution_id) is not None
+
+
+def test_store_uses_incremental_vacuum_and_history_indexes(tmp_path: Path):
+    store = ExecutionStore(tmp_path / "executions.sqlite")
+    for i in range(50):
+        _add(store, "c", [{"payload": "x" * 2000, "i": i}], 1000 + i)
+
+    stats = store.compact(_NO_LIMITS.model_copy(update={"max_rows_per_connection": 1}))
+
+    conn = store._connect()
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert stats.rows_deleted == 49
+    assert stats.pages_vacuumed > 0
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(executions)")}
+    assert {"idx_executions_connection_created", "idx_executions_query_id"} <= indexes
+
+
+def test_compact_converts_legacy_database_to_incremental_vacuum(tmp_path: Path):
+    db_path = tmp_path / "executions.sqlite"
+    legacy = sqlite3.connect(db_path)
+    legacy.execute("CREATE TABLE unrelated (x INTEGER)")
+    legacy.close()
+
+    store = ExecutionStore(db_path)
+    assert store._connect().execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    store.compact(_NO_LIMITS)
+    assert store._connect().execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_query_store_cleanup_loop_runs_hooks():
+    async def scenario() -> list[str]:
+        calls: list[str] = []
+        store = QueryStore()
+        hook = lambda: calls.append("compact")  # noqa: E731
+        store.add_cleanup_hook(hook)
+        store.add_cleanup_hook(hook)
+        await store.start_cleanup_loop(interval_seconds=0)
+        await asyncio.sleep(0.05)
+        await store.stop_cleanup_loop()
+        return calls
+
+    calls = asyncio.run(scenario())
+    assert calls
+    assert set(calls) == {"compact"}
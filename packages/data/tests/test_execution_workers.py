@@ -0,0 +1,175 @@
+"""Tests for per-connection bounded worker pools."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from db_mcp_data.connectors.file import FileConnector, FileConnectorConfig, FileSourceConfig
+from db_mcp_data.execution.workers import (
+    ConnectionWorkerPool,
+    WorkerPoolFullError,
+    get_worker_pool,
+)
+
+
+def test_pool_limits_concurrency_and_keeps_event_loop_responsive():
+    pool = ConnectionWorkerPool("slow", max_workers=2, max_queued=10)
+    peak = 0
+    running = 0
+    lock = threading.Lock()
+
+    def slow_query() -> str:
+        nonlocal peak, running
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return threading.current_thread().name
+
+    async def scenario() -> tuple[list[str], float]:
+        queries = asyncio.gather(*(pool.run(slow_query) for _ in range(4)))
+        started = time.perf_counter()
+        await asyncio.sleep(0)  # the loop is free while queries run
+        loop_latency = time.perf_counter() - started
+        return await queries, loop_latency
+
+    names, loop_latency = asyncio.run(scenario())
+
+    assert peak == 2
+    assert loop_latency < 0.05
+    assert all(name.startswith("db-mcp-slow") for name in names)
+    assert pool.stats()["completed"] == 4
+    pool.shutdown()
+
+
+def test_pool_rejects_when_queue_is_full():
+    pool = ConnectionWorkerPool("busy", max_workers=1, max_queued=1)
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.ensure_future(pool.run(release.wait))
+        second = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.01)
+        with pytest.raises(WorkerPoolFullError):
+            await pool.run(release.wait)
+        release.set()
+        await asyncio.gather(first, second)
+
+    asyncio.run(scenario())
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+    assert stats["queued"] == 0
+    pool.shutdown()
+
+
+def test_cancelled_caller_keeps_slot_until_thread_finishes():
+    pool = ConnectionWorkerPool("cancel", max_workers=1, max_queued=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking() -> None:
+        started.set()
+        release.wait()
+
+    async def scenario():
+        task = asyncio.ensure_future(pool.run(blocking))
+        await asyncio.to_thread(started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The statement is still running on the only worker, so no slot is free.
+        with pytest.raises(WorkerPoolFullError):
+            await pool.run(lambda: None)
+        release.set()
+        for _ in range(100):
+            if pool.stats()["completed"]:
+                break
+            await asyncio.sleep(0.01)
+        await pool.run(lambda: None)
+
+    asyncio.run(scenario())
+    stats = pool.stats()
+    assert stats["completed"] == 2
+    assert stats["queued"] == 0
+    pool.shutdown()
+
+
+def test_pool_propagates_context_variables():
+    var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="unset")
+    pool = ConnectionWorkerPool("ctx", max_workers=1)
+
+    async def scenario() -> str:
+        var.set("request-42")
+        return await pool.run(var.get)
+
+    assert asyncio.run(scenario()) == "request-42"
+    pool.shutdown()
+
+
+def test_get_worker_pool_is_per_connection_and_sized_from_capabilities(tmp_path: Path):
+    pool_a = get_worker_pool(tmp_path / "a", {"max_concurrent_queries": 3})
+    pool_b = get_worker_pool(tmp_path / "b")
+
+    assert pool_a is get_worker_pool(tmp_path / "a")
+    assert pool_a is not pool_b
+    assert pool_a.max_workers == 3
+    assert pool_b.max_workers == 4
+
+
+def test_get_worker_pool_resizes_when_capabilities_change(tmp_path: Path):
+    first = get_worker_pool(tmp_path / "c")
+    assert first.max_workers == 4
+
+    resized = get_worker_pool(tmp_path / "c", {"max_concurrent_queries": 2})
+    assert resized is not first
+    assert (resized.max_workers, resized.max_queued) == (2, 32)
+    assert get_worker_pool(tmp_path / "c", {"max_concurrent_queries": 2}) is resized
+    assert get_worker_pool(tmp_path / "c") is resized
+
+
+def test_resized_pool_keeps_serving_callers_that_hold_the_old_one(tmp_path: Path):
+    old = get_worker_pool(tmp_path / "d")
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(old.run(release.wait))
+        await asyncio.sleep(0.01)
+        resized = get_worker_pool(tmp_path / "d", {"max_concurrent_queries": 1})
+        assert resized is not old
+        assert await old.run(lambda: "queued after resize") == "queued after resize"
+        release.set()
+        await running
+        await asyncio.sleep(0.01)
+        assert old._executor is None  # drained, so its threads were released
+        return await old.run(lambda: "stale holder")
+
+    assert asyncio.run(scenario()) == "stale holder"
+    old.shutdown()
+
+
+def test_file_connector_runs_concurrent_queries_from_pool(tmp_path: Path):
+    jsonl = tmp_path / "events.jsonl"
+    jsonl.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(100)))
+    connector = FileConnector(
+        FileConnectorConfig(sources=[FileSourceConfig(name="events", path=str(jsonl))])
+    )
+    pool = ConnectionWorkerPool("files", max_workers=4)
+
+    sql = "SELECT count(*) AS n FROM events"
+
+    async def scenario():
+        return await asyncio.gather(*(pool.run(connector.execute_sql, sql) for _ in range(8)))
+
+    results = asyncio.run(scenario())
+    assert all(rows == [{"n": 100}] for rows in results)
+    pool.shutdown()
@@ -0,0 +1,131 @@
+"""Tests for the EXPLAIN result cache used by explain_sql."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from db_mcp_data.connectors.sql import SQLConnector, SQLConnectorConfig
+from db_mcp_data.validation.explain import explain_sql
+from db_mcp_data.validation.explain_cache import (
+    get_explain_cache,
+    invalidate_explain_cache,
+    schema_version,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    invalidate_explain_cache()
+    yield
+    invalidate_explain_cache()
+
+
+@pytest.fixture
+def connection(tmp_path: Path) -> tuple[Path, SQLConnector]:
+    db_path = tmp_path / "test.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE users (id INTEGER, name TEXT)")
+    conn_path = tmp_path / "conn"
+    conn_path.mkdir()
+    return conn_path, SQLConnector(SQLConnectorConfig(database_url=f"sqlite:///{db_path}"))
+
+
+def _counting_explain(connector: SQLConnector, monkeypatch) -> list[str]:
+    calls: list[str] = []
+    original = connector.get_engine
+
+    def get_engine():
+        calls.append("explain")
+        return original()
+
+    monkeypatch.setattr(connector, "get_engine", get_engine)
+    return calls
+
+
+def test_repeated_statement_is_served_from_cache(connection, monkeypatch):
+    conn_path, connector = connection
+    calls = _counting_explain(connector, monkeypatch)
+
+    first = explain_sql("SELECT * FROM users", connection_path=conn_path, connector=connector)
+    second = explain_sql("SELECT *\n  FROM users", connection_path=conn_path, connector=connector)
+
+    assert first.valid and second.valid
+    assert second.cost_tier == first.cost_tier
+    assert calls == ["explain"]
+    assert get_explain_cache().stats()["hits"] >= 1
+
+
+def test_case_differences_are_not_shared(connection, monkeypatch):
+    conn_path, connector = connection
+    calls = _counting_explain(connector, monkeypatch)
+
+    for name in ("Alice", "alice"):
+        explain_sql(
+            f"SELECT * FROM users WHERE name = '{name}'",
+            connection_path=conn_path,
+            connector=connector,
+        )
+
+    assert calls == ["explain"] * 2
+
+
+def test_cache_hit_does_not_resolve_connector(connection, monkeypatch):
+    conn_path, connector = connection
+    explain_sql("SELECT id FROM users", connection_path=conn_path, connector=connector)
+
+    def _fail(**kwargs):
+        raise AssertionError("connector should not be resolved on a cache hit")
+
+    monkeypatch.setattr("db_mcp_data.validation.explain.get_connector", _fail)
+    assert explain_sql("SELECT id FROM users", connection_path=conn_path).valid
+
+
+def test_use_cache_false_and_invalid_sql_always_run_explain(connection, monkeypatch):
+    conn_path, connector = connection
+    calls = _counting_explain(connector, monkeypatch)
+
+    explain_sql("SELECT * FROM users", connection_path=conn_path, connector=connector)
+    explain_sql(
+        "SELECT * FROM users", connection_path=conn_path, connector=connector, use_cache=False
+    )
+    for _ in range(2):
+        result = explain_sql(
+            "SELECT * FROM missing", connection_path=conn_path, connector=connector
+        )
+        assert not result.valid
+
+    assert calls == ["explain"] * 4
+
+
+def test_schema_change_and_invalidation_miss(connection, monkeypatch):
+    conn_path, connector = connection
+    calls = _counting_explain(connector, monkeypatch)
+
+    explain_sql("SELECT * FROM users", connection_path=conn_path, connector=connector)
+    before = schema_version(conn_path)
+    (conn_path / "schema").mkdir()
+    (conn_path / "schema" / "descriptions.yaml").write_text("tables: []\n")
+    assert schema_version(conn_path) != before
+    explain_sql("SELECT * FROM users", connection_path=conn_path, connector=connector)
+
+    assert invalidate_explain_cache(conn_path) == 2
+    explain_sql("SELECT * FROM users", connection_path=conn_path, connector=connector)
+
+    (conn_path / "connector.yaml").write_text("type: sql\n")
+    explain_sql("SELECT * FROM users", connection_path=conn_path, connector=connector)
+
+    assert calls == ["explain"] * 4
+
+
+def test_ttl_capability_zero_disables_cache(connection, monkeypatch):
+    conn_path, connector = connection
+    connector.config.capabilities = {"explain_cache_ttl_seconds": 0}
+    calls = _counting_explain(connector, monkeypatch)
+
+    for _ in range(2):
+        explain_sql("SELECT * FROM users", connection_path=conn_path, connector=connector)
+
+    assert calls == ["explain"] * 2
@@ -1,11 +1,14 @@
 """Tests for gateway.execute() — retrieve a ValidatedQuery and dispatch it."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
-from db_mcp_models.gateway import DataRequest, DataResponse, SQLQuery
+from db_mcp_models.gateway import DataRequest, DataResponse, RunOptions, SQLQuery
 
 import db_mcp_data.gateway as gateway
+from db_mcp_data.db.cancellation import register_canceller
+from db_mcp_data.execution.engine import get_execution_engine
 
 
 def _sql_connector(rows=None):
@@ -74,15 +77,63 @@ async def test_execute_same_query_id_twice_runs_twice(tmp_path):
     request = DataRequest(connection="prod", query=SQLQuery(sql="SELECT 1 AS n"))
     vq = await gateway.create(request, connection_path=tmp_path)
 
+    options = RunOptions(cache_ttl_seconds=0)
     with patch("db_mcp_data.gateway.dispatcher.get_connector", return_value=connector):
-        r1 = await gateway.execute(vq.query_id, connection_path=tmp_path)
-        r2 = await gateway.execute(vq.query_id, connection_path=tmp_path)
+        r1 = await gateway.execute(vq.query_id, connection_path=tmp_path, options=options)
+        r2 = await gateway.execute(vq.query_id, connection_path=tmp_path, options=options)
 
     assert r1.is_success
     assert r2.is_success
+    assert r1.execution_id != r2.execution_id
     assert connector.execute_sql.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_execute_records_execution_and_serves_repeat_reads_from_cache(tmp_path):
+    """Executions go through the connection's ExecutionEngine and its result cache."""
+    connector = _sql_connector(rows=[{"n": 1}])
+    request = DataRequest(connection="prod", query=SQLQuery(sql="SELECT 1 AS n"))
+    vq = await gateway.create(request, connection_path=tmp_path)
+
+    with patch("db_mcp_data.gateway.dispatcher.get_connector", return_value=connector):
+        r1 = await gateway.execute(vq.query_id, connection_path=tmp_path)
+        r2 = await gateway.execute(vq.query_id, connection_path=tmp_path)
+
+    assert r1.data == r2.data == [{"n": 1}]
+    assert r1.state == "succeeded"
+    assert r2.execution_id == r1.execution_id
+    assert connector.execute_sql.call_count == 1
+    latest = get_execution_engine(tmp_path).latest_execution_for_query(vq.query_id)
+    assert latest is not None and latest.execution_id == r1.execution_id
+
+
+@pytest.mark.asyncio
+async def test_execute_enforces_statement_timeout(tmp_path):
+    """RunOptions.timeout_seconds stops the statement through the engine's cancel scope."""
+    connector = _sql_connector(rows=[])
+    interrupted = threading.Event()
+
+    def _slow_statement(sql, params=None):
+        # Stands in for a driver call that the dialect canceller interrupts.
+        register_canceller(interrupted.set)
+        interrupted.wait(5)
+        raise RuntimeError("canceling statement due to user request")
+
+    connector.execute_sql.side_effect = _slow_statement
+    request = DataRequest(connection="prod", query=SQLQuery(sql="SELECT pg_sleep(60)"))
+    vq = await gateway.create(request, connection_path=tmp_path)
+
+    with patch("db_mcp_data.gateway.dispatcher.get_connector", return_value=connector):
+        response = await gateway.execute(
+            vq.query_id,
+            connection_path=tmp_path,
+            options=RunOptions(timeout_seconds=0.1),
+        )
+
+    assert not response.is_success
+    assert response.state == "timed_out"
+
+
 # ---------------------------------------------------------------------------
 # gateway.run() uses create() + execute() internally
 # ---------------------------------------------------------------------------
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from db_mcp_data.db.introspection import get_tables
+from db_mcp_data.db.introspection import get_schema_foreign_keys, get_tables
 
 
 class TestGetTables:
@@ -46,32 +46,69 @@ class TestGetTables:
             # Verify execute was called (SQL is wrapped in TextClause)
             mock_conn.execute.assert_called_once()
 
-    def test_trino_with_catalog_only(self, mock_trino_engine):
-        """Test Trino table discovery with catalog only (iterates schemas)."""
+    @staticmethod
+    def _route_trino_sql(mock_conn, responses):
+        """Answer conn.execute() by SQL prefix (per-schema calls run concurrently)."""
+
+        def execute(clause, *args, **kwargs):
+            sql = str(clause)
+            for prefix, response in responses.items():
+                if sql.startswith(prefix):
+                    if isinstance(response, Exception):
+                        raise response
+                    result = MagicMock()
+                    result.fetchall.return_value = response
+                    return result
+            raise AssertionError(f"unexpected SQL: {sql}")
+
+        mock_conn.execute.side_effect = execute
+
+    def test_trino_with_catalog_only_uses_information_schema(self, mock_trino_engine):
+        """Catalog-only discovery lists every schema's tables in one query."""
         with patch("db_mcp_data.db.introspection.get_engine", return_value=mock_trino_engine):
             mock_conn = MagicMock()
+            self._route_trino_sql(
+                mock_conn,
+                {
+                    "SELECT table_schema, table_name, table_type FROM dwh.information_schema": [
+                        ("analytics", "events", "BASE TABLE"),
+                        ("public", "user_stats", "VIEW"),
+                        ("public", "users", "BASE TABLE"),
+                    ],
+                },
+            )
+            mock_trino_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
+            mock_trino_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
 
-            # First call: SHOW SCHEMAS FROM dwh
-            schema_result = MagicMock()
-            schema_result.fetchall.return_value = [
-                ("public",),
-                ("analytics",),
-                ("information_schema",),  # Should be filtered out
-            ]
+            tables = get_tables(catalog="dwh")
 
-            # Second call: SHOW TABLES FROM dwh.public
-            public_tables_result = MagicMock()
-            public_tables_result.fetchall.return_value = [("users",), ("orders",)]
+            assert [t["full_name"] for t in tables] == [
+                "dwh.analytics.events",
+                "dwh.public.user_stats",
+                "dwh.public.users",
+            ]
+            assert {t["name"]: t["type"] for t in tables}["user_stats"] == "view"
+            mock_conn.execute.assert_called_once()
 
-            # Third call: SHOW TABLES FROM dwh.analytics
-            analytics_tables_result = MagicMock()
-            analytics_tables_result.fetchall.return_value = [("events",), ("metrics",)]
+    def test_trino_with_catalog_only(self, mock_trino_engine):
+        """Without information_schema access, SHOW TABLES runs per schema."""
+        from sqlalchemy.exc import ProgrammingError as _PE
 
-            mock_conn.execute.side_effect = [
-                schema_result,
-                public_tables_result,
-                analytics_tables_result,
-            ]
+        with patch("db_mcp_data.db.introspection.get_engine", return_value=mock_trino_engine):
+            mock_conn = MagicMock()
+            self._route_trino_sql(
+                mock_conn,
+                {
+                    "SELECT table_schema": _PE("information_schema", {}, Exception("denied")),
+                    "SHOW SCHEMAS FROM dwh": [
+                        ("public",),
+                        ("analytics",),
+                        ("information_schema",),  # Should be filtered out
+                    ],
+                    "SHOW TABLES FROM dwh.public": [("users",), ("orders",)],
+                    "SHOW TABLES FROM dwh.analytics": [("events",), ("metrics",)],
+                },
+            )
 
             mock_trino_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
             mock_trino_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
@@ -96,25 +133,21 @@ class TestGetTables:
 
     def test_trino_catalog_only_handles_schema_errors(self, mock_trino_engine):
         """Test that catalog-only discovery continues when a schema errors."""
+        from sqlalchemy.exc import ProgrammingError as _PE
+
         with patch("db_mcp_data.db.introspection.get_engine", return_value=mock_trino_engine):
             mock_conn = MagicMock()
-
-            # First call: SHOW SCHEMAS FROM dwh
-            schema_result = MagicMock()
-            schema_result.fetchall.return_value = [("public",), ("broken_schema",)]
-
-            # Second call: SHOW TABLES FROM dwh.public - succeeds
-            public_tables_result = MagicMock()
-            public_tables_result.fetchall.return_value = [("users",)]
-
-            # Third call: SHOW TABLES FROM dwh.broken_schema - throws exception
-            from sqlalchemy.exc import ProgrammingError as _PE
-
-            mock_conn.execute.side_effect = [
-                schema_result,
-                public_tables_result,
-                _PE("SHOW TABLES", {}, Exception("Permission denied")),
-            ]
+            self._route_trino_sql(
+                mock_conn,
+                {
+                    "SELECT table_schema": _PE("information_schema", {}, Exception("denied")),
+                    "SHOW SCHEMAS FROM dwh": [("public",), ("broken_schema",)],
+                    "SHOW TABLES FROM dwh.public": [("users",)],
+                    "SHOW TABLES FROM dwh.broken_schema": _PE(
+                        "SHOW TABLES", {}, Exception("Permission denied")
+                    ),
+                },
+            )
 
             mock_trino_engine.connect.return_value.__enter__ = MagicMock(return_value=mock_conn)
             mock_trino_engine.connect.return_value.__exit__ = MagicMock(return_value=False)
@@ -185,3 +218,47 @@ class TestGetTables:
 
             assert len(tables) == 1
             assert tables[0]["full_name"] == "test"  # No prefix when no schema/catalog
+
+
+class TestGetSchemaForeignKeys:
+    """Tests for get_schema_foreign_keys catalog handling."""
+
+    @staticmethod
+    def _engine(dialect):
+        engine = MagicMock()
+        engine.dialect.name = dialect
+        return engine
+
+    def test_mssql_reflects_catalog_qualified_schema(self):
+        inspector = MagicMock()
+        inspector.get_multi_foreign_keys.return_value = {
+            ("sales.dbo", "orders"): [
+                {
+                    "name": "fk_customer",
+                    "constrained_columns": ["customer_id"],
+                    "referred_schema": "dbo",
+                    "referred_table": "customers",
+                    "referred_columns": ["id"],
+                }
+            ],
+        }
+        with (
+            patch("db_mcp_data.db.introspection.get_engine", return_value=self._engine("mssql")),
+            patch("db_mcp_data.db.introspection.inspect", return_value=inspector),
+        ):
+            foreign_keys = get_schema_foreign_keys(catalog="sales")
+
+        inspector.get_multi_foreign_keys.assert_called_once_with(schema="sales.dbo")
+        assert foreign_keys["orders"][0]["referred_table"] == "customers"
+
+    def test_other_catalog_is_not_read_from_the_default_one(self):
+        with (
+            patch(
+                "db_mcp_data.db.introspection.get_engine",
+                return_value=self._engine("postgresql"),
+            ),
+            patch("db_mcp_data.db.introspection.inspect") as inspect,
+        ):
+            assert get_schema_foreign_keys("public", catalog="other") == {}
+
+        inspect.assert_not_called()
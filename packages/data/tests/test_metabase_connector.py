@@ -50,7 +50,7 @@ class TestMetabasePluginConnection:
         user_resp.status_code = 200
         user_resp.json.return_value = {"id": 1, "email": "demo@example.com"}
 
-        with patch("db_mcp_data.connectors.api.requests.request", return_value=user_resp):
+        with patch("db_mcp_data.connectors.api.requests.Session.request", return_value=user_resp):
             result = metabase_connector.test_connection()
 
         assert result["connected"] is True
@@ -91,7 +91,7 @@ class TestMetabasePluginSchema:
                 return schema_resp
             raise AssertionError(f"Unexpected GET url: {url}")
 
-        with patch("db_mcp_data.connectors.api.requests.get", side_effect=get_side_effect):
+        with patch("db_mcp_data.connectors.api.requests.Session.get", side_effect=get_side_effect):
             assert metabase_connector.get_catalogs() == ["analytics"]
             assert metabase_connector.get_schemas(catalog="analytics") == ["public"]
 
@@ -111,7 +111,7 @@ class TestMetabasePluginSchema:
                 return schema_resp
             raise AssertionError(f"Unexpected GET url: {url}")
 
-        with patch("db_mcp_data.connectors.api.requests.get", side_effect=get_side_effect):
+        with patch("db_mcp_data.connectors.api.requests.Session.get", side_effect=get_side_effect):
             tables = metabase_connector.get_tables(schema="public", catalog="analytics")
             columns = metabase_connector.get_columns(
                 "users",
@@ -181,8 +181,10 @@ def test_metabase_plugin_executes_sql_without_body_template(tmp_path, env_file):
     dataset_resp.json.return_value = {"data": {"cols": [{"name": "value"}], "rows": [[1]]}}
 
     with (
-        patch("db_mcp_data.connectors.api.requests.get", return_value=db_list_resp),
-        patch("db_mcp_data.connectors.api.requests.post", return_value=dataset_resp) as mock_post,
+        patch("db_mcp_data.connectors.api.requests.Session.get", return_value=db_list_resp),
+        patch(
+            "db_mcp_data.connectors.api.requests.Session.post", return_value=dataset_resp
+        ) as mock_post,
     ):
         rows = connector.execute_sql("SELECT 1")
 
@@ -0,0 +1,193 @@
+"""Tests for the engine-level result cache."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from db_mcp_data.execution import ExecutionRequest, ExecutionResult, ExecutionState
+from db_mcp_data.execution.engine import ExecutionEngine
+from db_mcp_data.execution.models import ExecutionHandle
+from db_mcp_data.execution.result_cache import (
+    ResultCache,
+    get_result_cache,
+    invalidate_result_cache,
+    is_cacheable_sql,
+    is_read_only_sql,
+    result_cache_key,
+)
+from db_mcp_data.execution.store import ExecutionStore
+
+
+class _CountingRunner:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, payload: dict) -> dict:
+        self.calls += 1
+        return {"data": [{"n": self.calls}], "columns": ["n"], "rows_returned": 1}
+
+
+def _engine(tmp_path: Path, **cache_kwargs) -> ExecutionEngine:
+    return ExecutionEngine(
+        ExecutionStore(tmp_path / "executions.sqlite"),
+        result_cache=ResultCache(**cache_kwargs),
+    )
+
+
+def _request(sql: str, **kwargs) -> ExecutionRequest:
+    return ExecutionRequest(connection="c", sql=sql, idempotency_key=sql, **kwargs)
+
+
+def _entry(n: int) -> tuple[ExecutionHandle, ExecutionResult]:
+    handle = ExecutionHandle(execution_id=f"e{n}", connection="c", state=ExecutionState.SUBMITTED)
+    result = ExecutionResult(
+        execution_id=f"e{n}", state=ExecutionState.SUCCEEDED, data=[{"v": "x" * 50}]
+    )
+    return handle, result
+
+
+def test_repeated_read_is_served_from_cache(tmp_path: Path):
+    engine = _engine(tmp_path)
+    runner = _CountingRunner()
+
+    handle_1, result_1 = engine.submit_sync(_request("SELECT count(*) FROM t"), runner)
+    handle_2, result_2 = engine.submit_sync(_request("SELECT  count(*)\nFROM t"), runner)
+
+    assert runner.calls == 1
+    assert handle_2.execution_id == handle_1.execution_id
+    assert result_2.data == result_1.data == [{"n": 1}]
+    assert engine.result_cache.stats()["hits"] == 1
+
+
+def test_case_differences_are_distinct_keys(tmp_path: Path):
+    engine = _engine(tmp_path)
+    runner = _CountingRunner()
+
+    _, alice = engine.submit_sync(_request("SELECT * FROM t WHERE name = 'Alice'"), runner)
+    _, lower = engine.submit_sync(_request("SELECT * FROM t WHERE name = 'alice'"), runner)
+    engine.submit_sync(_request('SELECT "Name" FROM t'), runner)
+    engine.submit_sync(_request('SELECT "name" FROM t'), runner)
+
+    assert runner.calls == 4
+    assert lower.data != alice.data
+    assert result_cache_key("c", "SELECT 'A'") != result_cache_key("c", "select 'a'")
+
+
+def test_only_plain_queries_are_cacheable():
+    assert is_cacheable_sql("SELECT 1")
+    assert is_cacheable_sql("WITH a AS (SELECT 1 AS x) SELECT x FROM a")
+    assert is_cacheable_sql("SELECT 1 UNION ALL SELECT 2")
+    for sql in (
+        "",
+        "CALL refresh_totals()",
+        "SELECT * INTO t2 FROM t",
+        "COPY t TO '/tmp/t.csv'",
+        "WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d",
+        "SELECT * FROM t FOR UPDATE",
+        "SELECT 1; DROP TABLE t",
+        "SHOW TABLES",
+        "SELEC broken FROM",
+    ):
+        assert not is_cacheable_sql(sql), sql
+
+
+def test_expired_entry_reexecutes_despite_idempotency_key(tmp_path: Path):
+    engine = _engine(tmp_path, ttl_seconds=0.01)
+    runner = _CountingRunner()
+
+    _, first = engine.submit_sync(_request("SELECT 1"), runner)
+    time.sleep(0.02)
+    _, second = engine.submit_sync(_request("SELECT 1"), runner)
+
+    assert runner.calls == 2
+    assert second.execution_id != first.execution_id
+    assert second.data == [{"n": 2}]
+
+
+def test_write_bypasses_cache_and_invalidates_connection(tmp_path: Path):
+    engine = _engine(tmp_path)
+    runner = _CountingRunner()
+
+    engine.submit_sync(_request("SELECT * FROM t"), runner)
+    engine.submit_sync(_request("INSERT INTO t VALUES (1)"), runner)
+    engine.submit_sync(_request("INSERT INTO t VALUES (1)"), runner)
+    assert runner.calls == 2  # idempotent write is not re-run, and never cached
+
+    engine.submit_sync(ExecutionRequest(connection="c", sql="SELECT * FROM t"), runner)
+    assert runner.calls == 3
+    assert engine.result_cache.stats()["invalidations"] == 1
+
+
+def test_non_cacheable_read_keeps_connection_entries(tmp_path: Path):
+    engine = _engine(tmp_path)
+    runner = _CountingRunner()
+
+    engine.submit_sync(_request("SELECT * FROM t"), runner)
+    for sql in ("SHOW TABLES", "EXPLAIN SELECT * FROM t", "DESCRIBE t"):
+        engine.submit_sync(_request(sql), runner)
+    engine.submit_sync(ExecutionRequest(connection="c", sql="SELECT * FROM t"), runner)
+
+    assert runner.calls == 4  # the three reads ran, the repeated SELECT was a hit
+    assert engine.result_cache.stats()["invalidations"] == 0
+
+
+def test_read_only_sql_classification():
+    for sql in ("SELECT 1", "SHOW TABLES", "EXPLAIN SELECT 1", "DESC t", "SELECT 1 FOR UPDATE"):
+        assert is_read_only_sql(sql), sql
+    for sql in (
+        "",
+        "INSERT INTO t VALUES (1)",
+        "CREATE TABLE t (x INT)",
+        "SELECT * INTO t2 FROM t",
+        "EXPLAIN ANALYZE DELETE FROM t",
+        "CALL refresh_totals()",
+        "SELECT 1; DROP TABLE t",
+        "SELEC broken FROM",
+    ):
+        assert not is_read_only_sql(sql), sql
+
+
+def test_request_ttl_zero_disables_cache(tmp_path: Path):
+    engine = _engine(tmp_path)
+    runner = _CountingRunner()
+
+    request = ExecutionRequest(connection="c", sql="SELECT 1", cache_ttl_seconds=0)
+    for _ in range(2):
+        engine.submit_sync(request, runner)
+
+    assert runner.calls == 2
+    assert engine.result_cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResultCache(max_entries=2)
+    for n in range(3):
+        handle, result = _entry(n)
+        cache.put(f"k{n}", connection="c", handle=handle, result=result)
+    assert cache.get("k0") is None
+    assert cache.get("k2") is not None
+
+    small = ResultCache(max_bytes=150)
+    for n in range(3):
+        handle, result = _entry(n)
+        small.put(f"k{n}", connection="c", handle=handle, result=result)
+    small.get("k1")
+    handle, result = _entry(3)
+    small.put("k3", connection="c", handle=handle, result=result)
+
+    stats = small.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= 150
+    assert small.get("k1") is not None
+    assert small.get("k2") is None
+
+
+def test_invalidate_result_cache_by_connection_path(tmp_path: Path):
+    cache = get_result_cache(tmp_path)
+    handle, result = _entry(1)
+    key = result_cache_key("c", "SELECT 1")
+    cache.put(key, connection="c", handle=handle, result=result)
+
+    assert invalidate_result_cache(tmp_path) == 1
+    assert cache.get(key) is None
@@ -0,0 +1,308 @@
+"""Tests for the streaming, bounded-memory result path."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import duckdb
+import pytest
+from db_mcp_models.gateway import DataRequest, SQLQuery
+
+from db_mcp_data.connectors.file import FileConnector, FileConnectorConfig, FileSourceConfig
+from db_mcp_data.connectors.sql import SQLConnector, SQLConnectorConfig
+from db_mcp_data.db.cancellation import cancel_scope
+from db_mcp_data.db.connection import DatabaseError
+from db_mcp_data.db.duckdb import DuckDBExecutor
+from db_mcp_data.db.streaming import (
+    DEFAULT_MAX_RESULT_BYTES,
+    DEFAULT_MAX_RESULT_ROWS,
+    RowStream,
+    drain_stream,
+    push_down_limit,
+    result_byte_limit,
+    result_row_limit,
+    row_bytes,
+)
+from db_mcp_data.execution import ExecutionRequest, ExecutionState
+from db_mcp_data.execution.engine import ExecutionEngine
+from db_mcp_data.execution.store import ExecutionStore
+from db_mcp_data.gateway.file_adapter import FileAdapter
+from db_mcp_data.gateway.sql_adapter import SQLAdapter
+
+
+def _sqlite_connector(tmp_path: Path, rows: int) -> SQLConnector:
+    db_path = tmp_path / "stream.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER, label TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(i, f"row-{i}") for i in range(rows)])
+    conn.commit()
+    conn.close()
+    return SQLConnector(SQLConnectorConfig(database_url=f"sqlite:///{db_path}"))
+
+
+def _file_connector(tmp_path: Path, rows: int) -> FileConnector:
+    jsonl = tmp_path / "events.jsonl"
+    jsonl.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(rows)))
+    return FileConnector(
+        FileConnectorConfig(sources=[FileSourceConfig(name="events", path=str(jsonl))])
+    )
+
+
+# ---------------------------------------------------------------------------
+# drain_stream
+# ---------------------------------------------------------------------------
+
+
+def test_drain_stream_stops_at_max_rows_and_closes():
+    closed = []
+    pulled = []
+
+    def batches():
+        for i in range(100):
+            pulled.append(i)
+            yield [{"i": i * 10 + j} for j in range(10)]
+
+    stream = RowStream(["i"], batches(), on_close=lambda: closed.append(True))
+    rows, truncated = drain_stream(stream, max_rows=25)
+
+    assert len(rows) == 25
+    assert truncated is True
+    assert closed == [True]
+    assert len(pulled) == 3
+
+
+def test_drain_stream_exact_fit_is_not_truncated():
+    stream = RowStream.from_rows([{"x": i} for i in range(10)], batch_size=5)
+    rows, truncated = drain_stream(stream, max_rows=10)
+
+    assert len(rows) == 10
+    assert truncated is False
+
+
+def test_row_stream_close_is_idempotent():
+    calls = []
+    stream = RowStream(["x"], iter([[{"x": 1}]]), on_close=lambda: calls.append(1))
+    stream.close()
+    stream.close()
+    assert calls == [1]
+    assert list(stream) == []
+
+
+# ---------------------------------------------------------------------------
+# Connector streams
+# ---------------------------------------------------------------------------
+
+
+def test_sql_connector_stream_sql_yields_batches(tmp_path: Path):
+    connector = _sqlite_connector(tmp_path, rows=25)
+
+    with connector.stream_sql("SELECT id, label FROM t ORDER BY id", batch_size=10) as stream:
+        assert stream.columns == ["id", "label"]
+        batches = list(stream)
+
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert batches[0][0] == {"id": 0, "label": "row-0"}
+
+
+def test_sql_connector_stream_sql_early_close_releases_connection(tmp_path: Path):
+    connector = _sqlite_connector(tmp_path, rows=50)
+    pool = connector.get_engine().pool
+
+    stream = connector.stream_sql("SELECT id FROM t", batch_size=5)
+    next(stream)
+    assert pool.checkedout() == 1
+    stream.close()
+    assert pool.checkedout() == 0
+
+
+def test_file_connector_stream_sql_uses_fetchmany(tmp_path: Path):
+    connector = _file_connector(tmp_path, rows=12)
+
+    stream = connector.stream_sql("SELECT id FROM events ORDER BY id", batch_size=5)
+    rows, truncated = drain_stream(stream, max_rows=7)
+
+    assert [r["id"] for r in rows] == list(range(7))
+    assert truncated is True
+
+
+def test_duckdb_stream_sql_releases_canceller_on_runtime_error():
+    executor = DuckDBExecutor(lambda: [])
+
+    with cancel_scope("stream-error") as scope:
+        with pytest.raises(duckdb.ConversionException):
+            executor.stream_sql("SELECT CAST('x' AS INTEGER)")
+        assert scope._cancellers == []
+
+
+# ---------------------------------------------------------------------------
+# Engine and adapters
+# ---------------------------------------------------------------------------
+
+
+def test_engine_submit_sync_consumes_stream_up_to_max_rows(tmp_path: Path):
+    engine = ExecutionEngine(ExecutionStore(tmp_path / "executions.sqlite"))
+    connector = _sqlite_connector(tmp_path, rows=40)
+    request = ExecutionRequest(connection="c", sql="SELECT id FROM t ORDER BY id")
+
+    def runner(payload: dict) -> dict:
+        return {"stream": connector.stream_sql(payload["sql"], batch_size=8)}
+
+    _, result = engine.submit_sync(request, runner, max_rows=20)
+
+    assert result.state == ExecutionState.SUCCEEDED
+    assert result.rows_returned == 20
+    assert result.columns == ["id"]
+    assert result.metadata["truncated"] is True
+    assert connector.get_engine().pool.checkedout() == 0
+
+
+def test_sql_adapter_execute_with_max_rows_streams(tmp_path: Path):
+    connector = _sqlite_connector(tmp_path, rows=30)
+    request = DataRequest(connection="c", query=SQLQuery(sql="SELECT id FROM t"))
+
+    resp = SQLAdapter().execute(connector, request, connection_path=tmp_path, max_rows=5)
+
+    assert resp.is_success
+    assert resp.rows_returned == 5
+    assert resp.truncated is True
+    full = SQLAdapter().execute(connector, request, connection_path=tmp_path, max_rows=30)
+    assert full.truncated is False
+
+
+def test_file_adapter_execute_with_max_rows_streams(tmp_path: Path):
+    connector = _file_connector(tmp_path, rows=30)
+    request = DataRequest(connection="c", query=SQLQuery(sql="SELECT id FROM events"))
+
+    resp = FileAdapter().execute(connector, request, connection_path=tmp_path, max_rows=4)
+
+    assert resp.is_success
+    assert resp.rows_returned == 4
+    assert resp.truncated is True
+
+
+def test_result_row_limit_from_capabilities():
+    assert result_row_limit({}) == DEFAULT_MAX_RESULT_ROWS
+    assert result_row_limit({"max_result_rows": 250}) == 250
+    assert result_row_limit({"max_result_rows": 0}) is None
+
+
+# ---------------------------------------------------------------------------
+# Byte bounds and LIMIT push-down
+# ---------------------------------------------------------------------------
+
+
+def test_drain_stream_stops_at_max_bytes():
+    rows = [{"id": i, "label": "x" * 10} for i in range(10)]
+    budget = row_bytes(rows[0]) * 3
+
+    drained, truncated = drain_stream(RowStream.from_rows(rows, batch_size=4), max_bytes=budget)
+
+    assert drained == rows[:3]
+    assert truncated is True
+    single, truncated = drain_stream(RowStream.from_rows(rows), max_bytes=1)
+    assert single == rows[:1]
+    assert truncated is True
+    everything, truncated = drain_stream(RowStream.from_rows(rows), max_bytes=10**6)
+    assert everything == rows
+    assert truncated is False
+
+
+def test_result_byte_limit_from_capabilities():
+    assert result_byte_limit(None) == DEFAULT_MAX_RESULT_BYTES
+    assert result_byte_limit({"max_result_bytes": 1024}) == 1024
+    assert result_byte_limit({"max_result_bytes": -1}) is None
+
+
+@pytest.mark.parametrize(
+    ("sql", "dialect", "expected"),
+    [
+        ("SELECT id FROM t;", "postgresql", "SELECT id FROM t\nLIMIT 11"),
+        ("SELECT id FROM t -- note", "sqlite", "SELECT id FROM t -- note\nLIMIT 11"),
+        (
+            "SELECT a FROM t UNION SELECT b FROM u",
+            "duckdb",
+            "SELECT a FROM t UNION SELECT b FROM u\nLIMIT 11",
+        ),
+        ("SELECT id FROM t", "oracle", "SELECT id FROM t\nFETCH FIRST 11 ROWS ONLY"),
+        ("SELECT id FROM t", "mssql", "SELECT TOP 11 id FROM t"),
+        ("SELECT id FROM t", "unknown", "SELECT id FROM t"),
+    ],
+)
+def test_push_down_limit_uses_dialect_syntax(sql, dialect, expected):
+    assert push_down_limit(sql, 11, dialect) == expected
+
+
+@pytest.mark.parametrize(
+    ("sql", "dialect"),
+    [
+        ("SELECT id FROM t LIMIT 5", "postgresql"),
+        ("SELECT id FROM t LIMIT 50", "postgresql"),
+        ("SELECT id FROM t OFFSET 10", "postgresql"),
+        ("SELECT id FROM t FOR UPDATE", "postgresql"),
+        ("INSERT INTO t VALUES (1)", "postgresql"),
+        ("SELECT 1; SELECT 2", "postgresql"),
+        ("not sql at all (", "postgresql"),
+        ("SELECT id FROM t SETTINGS max_threads=1", "clickhouse"),
+        ("SELECT id FROM t FORMAT JSON", "clickhouse"),
+        ("SELECT id FROM t LIMIT 1 BY id", "clickhouse"),
+    ],
+)
+def test_push_down_limit_leaves_other_statements_alone(sql, dialect):
+    assert push_down_limit(sql, 11, dialect) == sql
+
+
+def test_sql_adapter_pushes_limit_into_statement(tmp_path: Path, monkeypatch):
+    connector = _sqlite_connector(tmp_path, rows=30)
+    executed: list[str] = []
+    original = connector.stream_sql
+
+    def _stream_sql(sql, params=None, **kwargs):
+        executed.append(sql)
+        return original(sql, params, **kwargs)
+
+    monkeypatch.setattr(connector, "stream_sql", _stream_sql)
+    request = DataRequest(connection="c", query=SQLQuery(sql="SELECT id FROM t ORDER BY id"))
+
+    resp = SQLAdapter().execute(connector, request, connection_path=tmp_path, max_rows=5)
+
+    assert executed == ["SELECT id FROM t ORDER BY id\nLIMIT 6"]
+    assert [row["id"] for row in resp.data] == [0, 1, 2, 3, 4]
+    assert resp.truncated is True
+
+
+def test_adapters_stop_at_max_bytes(tmp_path: Path):
+    request = DataRequest(connection="c", query=SQLQuery(sql="SELECT id FROM events"))
+    connector = _file_connector(tmp_path, rows=30)
+
+    resp = FileAdapter().execute(
+        connector, request, connection_path=tmp_path, max_bytes=row_bytes({"id": 10}) * 4
+    )
+
+    assert resp.rows_returned == 4
+    assert resp.truncated is True
+
+
+def test_sql_connector_stream_sql_wraps_fetch_errors(tmp_path: Path, monkeypatch):
+    connector = _sqlite_connector(tmp_path, rows=3)
+
+    class _FailingResult:
+        def keys(self):
+            return ["id"]
+
+        def partitions(self, size):
+            raise RuntimeError("connection reset")
+            yield  # pragma: no cover
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(
+        connector, "_execute", lambda conn, sql, params, **kw: (_FailingResult(), lambda: None)
+    )
+    stream = connector.stream_sql("SELECT id FROM t")
+
+    with pytest.raises(DatabaseError, match="connection reset"):
+        drain_stream(stream)
+    assert stream.closed
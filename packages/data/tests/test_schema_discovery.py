@@ -0,0 +1,195 @@
+"""Tests for parallel, incremental table discovery."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from db_mcp_data.db import get_catalog_columns
+from db_mcp_data.db.discovery import (
+    discover_tables,
+    load_schema_fingerprints,
+    save_schema_fingerprints,
+    schema_fingerprint,
+    schema_key,
+)
+
+_TABLES = {
+    "public": [
+        {"name": "users", "full_name": "public.users"},
+        {"name": "orders", "full_name": "public.orders"},
+    ],
+    "analytics": [{"name": "events", "full_name": "analytics.events"}],
+}
+
+
+def _list_tables(schema, catalog):
+    return list(_TABLES[schema])
+
+
+def _schemas():
+    return [{"catalog": None, "schema": "public"}, {"catalog": None, "schema": "analytics"}]
+
+
+def test_discovery_fetches_columns_per_table_and_keeps_schema_order():
+    calls: list[str] = []
+
+    def list_columns(table, schema, catalog):
+        calls.append(f"{schema}.{table}")
+        return [{"name": "id", "type": "INTEGER"}]
+
+    result = discover_tables(_schemas(), list_tables=_list_tables, list_columns=list_columns)
+
+    assert [t["full_name"] for t in result.tables] == [
+        "public.users",
+        "public.orders",
+        "analytics.events",
+    ]
+    assert sorted(calls) == ["analytics.events", "public.orders", "public.users"]
+    assert all(t["columns"] == [{"name": "id", "type": "INTEGER"}] for t in result.tables)
+    assert result.changed_schemas == [".public", ".analytics"]
+    assert result.fingerprints[".public"] == schema_fingerprint(_TABLES["public"])
+
+
+def test_bulk_columns_are_used_and_missing_tables_fall_back():
+    calls: list[str] = []
+
+    def list_columns(table, schema, catalog):
+        calls.append(f"{schema}.{table}")
+        return [{"name": "fallback", "type": "TEXT"}]
+
+    def list_catalog_columns(catalog, schemas):
+        assert schemas == ["analytics", "public"]
+        return {
+            ("public", "users"): [{"name": "id", "type": "INTEGER"}],
+            ("analytics", "events"): [{"name": "ts", "type": "TIMESTAMP"}],
+        }
+
+    result = discover_tables(
+        _schemas(),
+        list_tables=_list_tables,
+        list_columns=list_columns,
+        list_catalog_columns=list_catalog_columns,
+    )
+
+    columns = {t["full_name"]: t["columns"] for t in result.tables}
+    assert columns["public.users"] == [{"name": "id", "type": "INTEGER"}]
+    assert columns["analytics.events"] == [{"name": "ts", "type": "TIMESTAMP"}]
+    assert calls == ["public.orders"]
+
+
+def test_unchanged_schema_reuses_known_columns():
+    previous = {".public": schema_fingerprint(_TABLES["public"]), ".analytics": "stale"}
+    known = {
+        "public.users": [{"name": "id", "type": "INTEGER"}],
+        "public.orders": [{"name": "total", "type": "NUMERIC"}],
+    }
+    calls: list[str] = []
+
+    def list_columns(table, schema, catalog):
+        calls.append(f"{schema}.{table}")
+        return []
+
+    result = discover_tables(
+        _schemas(),
+        list_tables=_list_tables,
+        list_columns=list_columns,
+        previous_fingerprints=previous,
+        known_columns=known,
+    )
+
+    assert result.reused_schemas == [".public"]
+    assert result.changed_schemas == [".analytics"]
+    assert calls == ["analytics.events"]
+    columns = {t["full_name"]: t["columns"] for t in result.tables}
+    assert columns["public.orders"] == [{"name": "total", "type": "NUMERIC"}]
+
+
+def test_table_filter_and_listing_errors():
+    def list_tables(schema, catalog):
+        if schema == "analytics":
+            raise RuntimeError("permission denied")
+        return _list_tables(schema, catalog)
+
+    progress: list[tuple[int, int]] = []
+    result = discover_tables(
+        _schemas(),
+        list_tables=list_tables,
+        list_columns=lambda table, schema, catalog: [],
+        table_filter=lambda tables: [t for t in tables if t["name"] != "orders"],
+        on_progress=lambda schemas, tables: progress.append((schemas, tables)),
+    )
+
+    assert [t["full_name"] for t in result.tables] == ["public.users"]
+    assert progress[-1] == (2, 1)
+
+
+def test_per_table_column_failures_are_logged(caplog):
+    def list_columns(table, schema, catalog):
+        raise RuntimeError("access denied")
+
+    with caplog.at_level(logging.WARNING, logger="db_mcp_data.db.discovery"):
+        result = discover_tables(
+            _schemas()[:1], list_tables=_list_tables, list_columns=list_columns
+        )
+
+    assert all(t["columns"] == [] for t in result.tables)
+    assert "public.users" in caplog.text
+    assert "access denied" in caplog.text
+
+
+def test_fingerprints_round_trip(tmp_path: Path):
+    assert load_schema_fingerprints(tmp_path) == {}
+
+    fingerprints = {schema_key("dwh", "public"): "abc"}
+    save_schema_fingerprints(tmp_path, fingerprints)
+
+    assert load_schema_fingerprints(tmp_path) == {"dwh.public": "abc"}
+
+    (tmp_path / "state" / "schema_fingerprints.json").write_text("not json")
+    assert load_schema_fingerprints(tmp_path) == {}
+
+
+def test_catalog_columns_unsupported_dialect_returns_none(tmp_path: Path):
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    assert get_catalog_columns(database_url=url) is None
+
+
+def _engine(dialect: str, rows: list[tuple]) -> MagicMock:
+    engine = MagicMock()
+    engine.dialect.name = dialect
+    conn = engine.connect.return_value.__enter__.return_value
+    conn.execute.return_value.fetchall.return_value = rows
+    return engine
+
+
+def test_catalog_columns_skip_information_schema_dialects():
+    # information_schema types, keys and comments differ from reflection.
+    engine = _engine("postgresql", [])
+    with patch("db_mcp_data.db.introspection.get_engine", return_value=engine):
+        assert get_catalog_columns(schemas=["public"]) is None
+    engine.connect.assert_not_called()
+
+
+def test_trino_catalog_columns_match_describe_shape():
+    engine = _engine("trino", [("sales", "orders", "id", "bigint", "order key")])
+    with patch("db_mcp_data.db.introspection.get_engine", return_value=engine):
+        columns = get_catalog_columns("dwh", ["sales"])
+
+    assert columns == {
+        ("sales", "orders"): [
+            {
+                "name": "id",
+                "type": "bigint",
+                "nullable": True,
+                "default": None,
+                "primary_key": False,
+                "comment": "order key",
+            }
+        ]
+    }
+    conn = engine.connect.return_value.__enter__.return_value
+    clause, params = conn.execute.call_args.args
+    assert "system.jdbc.columns" in str(clause)
+    assert params == {"catalog": "dwh", "schema_0": "sales"}
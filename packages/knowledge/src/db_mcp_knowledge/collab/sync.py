@@ -17,6 +17,7 @@ from pathlib import Path
 from db_mcp_knowledge.collab.classify import classify_files
 from db_mcp_knowledge.collab.github import gh_available, open_pr
 from db_mcp_knowledge.git_utils import git
+from db_mcp_knowledge.vault.record_log import compact_connection_logs
 
 logger = logging.getLogger(__name__)
 
@@ -86,7 +87,8 @@ def collaborator_push(connection_path: Path, user_name: str) -> SyncResult:
     # Ensure we're on our branch (create if needed)
     _ensure_branch(connection_path, branch)
 
-    # Stage and commit any local changes
+    # Stage and commit any local changes, with pending record-log updates folded in
+    compact_connection_logs(connection_path)
     changed_locally = git.status(connection_path)
     if not changed_locally:
         return result
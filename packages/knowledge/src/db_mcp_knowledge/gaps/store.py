@@ -1,7 +1,9 @@
 """Knowledge gaps persistence — load, save, merge, resolve.
 
 Follows the same pattern as training/store.py for consistency.
-Gaps are stored in a single YAML file per connection.
+Gaps are stored in a single YAML file per connection; additions and status
+changes are appended to its record log (see vault/record_log.py) and folded
+into the YAML periodically.
 """
 
 import logging
@@ -17,6 +19,7 @@ from db_mcp_knowledge.vault.paths import (
     KNOWLEDGE_GAPS_FILE,
     business_rules_path,
 )
+from db_mcp_knowledge.vault.record_log import RecordLog, get_record_log
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +34,35 @@ def get_gaps_file_path(provider_id: str) -> Path:
     return _get_connection_dir(provider_id) / KNOWLEDGE_GAPS_FILE
 
 
+def _gaps_log(gaps_file: Path, provider_id: str) -> RecordLog:
+    header = KnowledgeGaps(provider_id=provider_id).model_dump(mode="json", exclude={"gaps"})
+    return get_record_log(gaps_file, "gaps", header)
+
+
+def _read_gaps(gaps_file: Path, provider_id: str) -> KnowledgeGaps | None:
+    try:
+        data = _gaps_log(gaps_file, provider_id).payload()
+        return KnowledgeGaps.model_validate(data) if data is not None else None
+    except Exception:
+        return None
+
+
+def _append_gaps(provider_id: str, gaps: list[KnowledgeGap]) -> bool:
+    """Persist new or changed gaps without rewriting the YAML file."""
+    if not gaps:
+        return True
+    try:
+        _gaps_log(get_gaps_file_path(provider_id), provider_id).append(
+            gap.model_dump(mode="json") for gap in gaps
+        )
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to save knowledge gaps for {provider_id}: {e}")
+        return False
+
+
 def load_gaps(provider_id: str) -> KnowledgeGaps:
-    """Load knowledge gaps from YAML file.
+    """Load knowledge gaps from YAML file and its record log.
 
     Args:
         provider_id: Provider identifier
@@ -40,21 +70,12 @@ def load_gaps(provider_id: str) -> KnowledgeGaps:
     Returns:
         KnowledgeGaps (empty if file doesn't exist)
     """
-    gaps_file = get_gaps_file_path(provider_id)
-
-    if not gaps_file.exists():
-        return KnowledgeGaps(provider_id=provider_id)
-
-    try:
-        with open(gaps_file) as f:
-            data = yaml.safe_load(f)
-        return KnowledgeGaps.model_validate(data)
-    except Exception:
-        return KnowledgeGaps(provider_id=provider_id)
+    gaps = _read_gaps(get_gaps_file_path(provider_id), provider_id)
+    return gaps if gaps is not None else KnowledgeGaps(provider_id=provider_id)
 
 
 def save_gaps(gaps: KnowledgeGaps) -> dict:
-    """Save knowledge gaps to YAML file.
+    """Replace the whole knowledge gaps file (and its pending record log).
 
     Args:
         gaps: KnowledgeGaps to save
@@ -64,18 +85,7 @@ def save_gaps(gaps: KnowledgeGaps) -> dict:
     """
     try:
         gaps_file = get_gaps_file_path(gaps.provider_id)
-        gaps_file.parent.mkdir(parents=True, exist_ok=True)
-
-        gaps_dict = gaps.model_dump(mode="json")
-
-        with open(gaps_file, "w") as f:
-            yaml.dump(
-                gaps_dict,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-            )
+        _gaps_log(gaps_file, gaps.provider_id).replace(gaps.model_dump(mode="json"))
 
         return {"saved": True, "file_path": str(gaps_file), "error": None}
     except Exception as e:
@@ -91,9 +101,13 @@ def add_gap(
     suggested_rule: str | None = None,
 ) -> KnowledgeGap | None:
     """Add a single gap, deduplicating by term. Returns the gap or None if duplicate."""
-    gaps = load_gaps(provider_id)
-
-    if gaps.has_term(term):
+    term_lower = term.lower()
+    log = _gaps_log(get_gaps_file_path(provider_id), provider_id)
+    try:
+        known = any(str(g.get("term", "")).lower() == term_lower for g in log.records())
+    except Exception:
+        known = False  # unreadable file; _append_gaps logs the failure below
+    if known:
         return None
 
     gap = KnowledgeGap(
@@ -104,8 +118,7 @@ def add_gap(
         related_columns=related_columns or [],
         suggested_rule=suggested_rule,
     )
-    gaps.add_gap(gap)
-    save_gaps(gaps)
+    _append_gaps(provider_id, [gap])
     return gap
 
 
@@ -129,18 +142,18 @@ def resolve_gap(provider_id: str, gap_id: str, resolved_by: str) -> dict:
         }
 
     # Resolve the target and all siblings in the same group
-    resolved_count = 0
+    resolved: list[KnowledgeGap] = []
     if target.group_id:
         for g in gaps.gaps:
             if g.group_id == target.group_id and g.status == GapStatus.OPEN:
                 gaps.resolve(g.id, resolved_by)
-                resolved_count += 1
+                resolved.append(g)
     else:
         gaps.resolve(gap_id, resolved_by)
-        resolved_count = 1
+        resolved.append(target)
 
-    save_gaps(gaps)
-    return {"resolved": True, "gap_id": gap_id, "count": resolved_count}
+    _append_gaps(provider_id, resolved)
+    return {"resolved": True, "gap_id": gap_id, "count": len(resolved)}
 
 
 def dismiss_gap(provider_id: str, gap_id: str, reason: str | None = None) -> dict:
@@ -166,18 +179,18 @@ def dismiss_gap(provider_id: str, gap_id: str, reason: str | None = None) -> dic
         }
 
     # Dismiss the target and all siblings in the same group
-    dismissed_count = 0
+    dismissed: list[KnowledgeGap] = []
     if target.group_id:
         for g in gaps.gaps:
             if g.group_id == target.group_id and g.status == GapStatus.OPEN:
                 gaps.dismiss(g.id, reason)
-                dismissed_count += 1
+                dismissed.append(g)
     else:
         gaps.dismiss(gap_id, reason)
-        dismissed_count = 1
+        dismissed.append(target)
 
-    save_gaps(gaps)
-    return {"dismissed": True, "gap_id": gap_id, "count": dismissed_count}
+    _append_gaps(provider_id, dismissed)
+    return {"dismissed": True, "gap_id": gap_id, "count": len(dismissed)}
 
 
 def merge_trace_gaps(provider_id: str, trace_gaps: list[dict]) -> int:
@@ -195,6 +208,8 @@ def merge_trace_gaps(provider_id: str, trace_gaps: list[dict]) -> int:
         Count of new gaps added
     """
     gaps = load_gaps(provider_id)
+    by_term = {g.term.lower(): g for g in gaps.gaps}
+    changed: dict[str, KnowledgeGap] = {}
     added = 0
 
     for group in trace_gaps:
@@ -214,23 +229,21 @@ def merge_trace_gaps(provider_id: str, trace_gaps: list[dict]) -> int:
             # Check if any existing gap already has a group_id for a term in this group
             grp_id = None
             for term_info in terms_in_group:
-                for existing in gaps.gaps:
-                    if existing.term.lower() == term_info["term"].lower() and existing.group_id:
-                        grp_id = existing.group_id
-                        break
-                if grp_id:
+                existing = by_term.get(term_info["term"].lower())
+                if existing and existing.group_id:
+                    grp_id = existing.group_id
                     break
             if not grp_id:
                 grp_id = str(uuid.uuid4())[:8]
 
         for term_info in terms_in_group:
             term = term_info["term"]
-            if gaps.has_term(term):
+            existing = by_term.get(term.lower())
+            if existing is not None:
                 # Update group_id on existing gap if it was ungrouped
-                if grp_id:
-                    for existing in gaps.gaps:
-                        if existing.term.lower() == term.lower() and not existing.group_id:
-                            existing.group_id = grp_id
+                if grp_id and not existing.group_id:
+                    existing.group_id = grp_id
+                    changed[existing.id] = existing
                 continue
 
             gap = KnowledgeGap(
@@ -243,11 +256,13 @@ def merge_trace_gaps(provider_id: str, trace_gaps: list[dict]) -> int:
                 related_columns=related_columns,
                 suggested_rule=suggested_rule,
             )
-            gaps.add_gap(gap)
+            by_term[term.lower()] = gap
+            changed[gap.id] = gap
             added += 1
 
+    if changed:
+        _append_gaps(provider_id, list(changed.values()))
     if added > 0:
-        save_gaps(gaps)
         logger.info(f"Merged {added} new knowledge gaps from traces")
 
     return added
@@ -284,7 +299,7 @@ def auto_resolve_gaps(provider_id: str) -> int:
     # Build a lowercase version of all rules for matching
     rules_text = "\n".join(str(r).lower() for r in rules)
 
-    resolved_count = 0
+    resolved: list[KnowledgeGap] = []
     for gap in open_gaps:
         term_lower = gap.term.lower()
         # Check if the term appears in any business rule
@@ -292,13 +307,13 @@ def auto_resolve_gaps(provider_id: str) -> int:
             gap.status = GapStatus.RESOLVED
             gap.resolved_at = datetime.now(UTC)
             gap.resolved_by = "business_rules"
-            resolved_count += 1
+            resolved.append(gap)
 
-    if resolved_count > 0:
-        save_gaps(gaps)
-        logger.info(f"Auto-resolved {resolved_count} knowledge gaps")
+    if resolved:
+        _append_gaps(provider_id, resolved)
+        logger.info(f"Auto-resolved {len(resolved)} knowledge gaps")
 
-    return resolved_count
+    return len(resolved)
 
 
 def load_gaps_from_path(connection_path: Path) -> KnowledgeGaps:
@@ -306,13 +321,5 @@ def load_gaps_from_path(connection_path: Path) -> KnowledgeGaps:
 
     Used by BICP agent which has the path but not necessarily the provider_id.
     """
-    gaps_file = connection_path / KNOWLEDGE_GAPS_FILE
-    if not gaps_file.exists():
-        return KnowledgeGaps(provider_id="unknown")
-
-    try:
-        with open(gaps_file) as f:
-            data = yaml.safe_load(f)
-        return KnowledgeGaps.model_validate(data)
-    except Exception:
-        return KnowledgeGaps(provider_id="unknown")
+    gaps = _read_gaps(connection_path / KNOWLEDGE_GAPS_FILE, connection_path.name)
+    return gaps if gaps is not None else KnowledgeGaps(provider_id="unknown")
@@ -15,6 +15,7 @@ from db_mcp_models import (
     Metric,
 )
 
+from db_mcp_knowledge.retrieval import KIND_DIMENSION, KIND_METRIC
 from db_mcp_knowledge.semantic.core_loader import ConnectionSemanticCore
 
 _TOKEN_RE = re.compile(r"[a-z0-9_]+")
@@ -41,6 +42,18 @@ def _match_alias_score(intent_norm: str, alias: str) -> int:
     return 10 + overlap
 
 
+def _alias_candidates(
+    intent: str, intent_norm: str, semantic_core: ConnectionSemanticCore, kind: str
+) -> set[str]:
+    """Names whose aliases share at least one term with the intent.
+
+    Any alias with a positive ``_match_alias_score`` shares a term, so scoring
+    only these candidates gives the same result as scanning every alias.
+    """
+    hits = semantic_core.alias_index().search(f"{intent} {intent_norm}", kinds=(kind,), limit=None)
+    return {str(hit.payload["name"]) for hit in hits}
+
+
 @dataclass(slots=True)
 class MetricMatch:
     """Resolved metric plus metadata about the lexical match."""
@@ -54,12 +67,13 @@ def resolve_metric(intent: str, semantic_core: ConnectionSemanticCore) -> Metric
     """Resolve one approved metric from intent using deterministic lexical rules."""
     intent_norm = _normalize(intent)
     best: MetricMatch | None = None
+    candidates = _alias_candidates(intent, intent_norm, semantic_core, KIND_METRIC)
 
-    for metric in semantic_core.metrics:
-        aliases = [metric.name]
-        if metric.display_name:
-            aliases.append(metric.display_name)
-        for alias in aliases:
+    for name in sorted(candidates):
+        metric = semantic_core.get_metric(name)
+        if metric is None:
+            continue
+        for alias in semantic_core.aliases(KIND_METRIC, name):
             score = _match_alias_score(intent_norm, alias)
             if score <= 0:
                 continue
@@ -75,12 +89,13 @@ def detect_dimensions(intent: str, semantic_core: ConnectionSemanticCore) -> lis
     """Detect mentioned dimensions without attempting SQL compilation yet."""
     intent_norm = _normalize(intent)
     matched: list[Dimension] = []
+    candidates = _alias_candidates(intent, intent_norm, semantic_core, KIND_DIMENSION)
 
-    for dimension in semantic_core.dimensions:
-        aliases = [dimension.name]
-        if dimension.display_name:
-            aliases.append(dimension.display_name)
-        aliases.extend(dimension.synonyms)
+    for name in candidates:
+        dimension = semantic_core.get_dimension(name)
+        if dimension is None:
+            continue
+        aliases = semantic_core.aliases(KIND_DIMENSION, name)
         if any(_match_alias_score(intent_norm, alias) >= 80 for alias in aliases):
             matched.append(dimension)
 
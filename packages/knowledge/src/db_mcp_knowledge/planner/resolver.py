@@ -109,10 +109,7 @@ def resolve_metric_execution_plan(
     if meta_query.filters:
         predicates: list[str] = []
         for meta_filter in meta_query.filters:
-            dimension = next(
-                (item for item in semantic_core.dimensions if item.name == meta_filter.field),
-                None,
-            )
+            dimension = semantic_core.get_dimension(meta_filter.field)
             if dimension is None:
                 raise ValueError(f"Resolved filter field '{meta_filter.field}' is not available.")
 
@@ -145,10 +142,7 @@ def resolve_metric_execution_plan(
             raise ValueError("The first slice supports at most one metric dimension.")
 
         meta_dimension = meta_query.dimensions[0]
-        dimension = next(
-            (item for item in semantic_core.dimensions if item.name == meta_dimension.name),
-            None,
-        )
+        dimension = semantic_core.get_dimension(meta_dimension.name)
         if dimension is None:
             raise ValueError(f"Resolved dimension '{meta_dimension.name}' is not available.")
         if metric.dimensions and dimension.name not in metric.dimensions:
@@ -0,0 +1,35 @@
+"""Ranked retrieval over vault knowledge (BM25)."""
+
+from db_mcp_knowledge.retrieval.bm25 import (
+    BM25Index,
+    RetrievalDocument,
+    RetrievalHit,
+    normalize_text,
+    tokenize,
+)
+from db_mcp_knowledge.retrieval.vault_index import (
+    KIND_DIMENSION,
+    KIND_EXAMPLE,
+    KIND_METRIC,
+    KIND_RULE,
+    VaultRetrievalIndex,
+    clear_vault_indexes,
+    get_vault_index,
+    search_vault,
+)
+
+__all__ = [
+    "BM25Index",
+    "KIND_DIMENSION",
+    "KIND_EXAMPLE",
+    "KIND_METRIC",
+    "KIND_RULE",
+    "RetrievalDocument",
+    "RetrievalHit",
+    "VaultRetrievalIndex",
+    "clear_vault_indexes",
+    "get_vault_index",
+    "normalize_text",
+    "search_vault",
+    "tokenize",
+]
@@ -0,0 +1,210 @@
+"""Okapi BM25 index over small text documents.
+
+Documents carry a ``kind`` (table, column, example, ...), the ``source`` file
+they were extracted from and an arbitrary JSON payload returned with each hit.
+Postings are kept per term so a query only touches documents that share a
+term with it, and documents can be added or dropped per source without
+rebuilding the rest of the index.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+_CAMEL_RE = re.compile(r"([a-z0-9])([A-Z])")
+_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_text(value: object) -> str:
+    """Lowercase, split camelCase and collapse non-alphanumerics to single spaces."""
+    text_value = _CAMEL_RE.sub(r"\1 \2", str(value or ""))
+    return " ".join(part for part in _SPLIT_RE.split(text_value.lower()) if part)
+
+
+def tokenize(value: object) -> list[str]:
+    """Index terms for a value; plural forms also emit their singular."""
+    tokens: list[str] = []
+    for token in normalize_text(value).split():
+        tokens.append(token)
+        if token.endswith("s") and len(token) > 3:
+            tokens.append(token[:-1])
+    return tokens
+
+
+@dataclass(slots=True)
+class RetrievalDocument:
+    """One indexed document."""
+
+    doc_id: str
+    kind: str
+    source: str
+    terms: dict[str, int]
+    length: int
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class RetrievalHit:
+    """A ranked search result."""
+
+    doc_id: str
+    kind: str
+    score: float
+    payload: dict[str, Any]
+
+
+class BM25Index:
+    """Incrementally updatable BM25 index with top-k search."""
+
+    def __init__(self, *, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        self.k1 = k1
+        self.b = b
+        self._documents: dict[str, RetrievalDocument] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._by_source: dict[str, set[str]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(
+        self,
+        doc_id: str,
+        text: str | Iterable[object],
+        *,
+        kind: str,
+        source: str = "",
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        """Index ``text`` (a string or several field values) under ``doc_id``."""
+        values = [text] if isinstance(text, str) else list(text)
+        terms = Counter(token for value in values for token in tokenize(value))
+        self._insert(
+            RetrievalDocument(
+                doc_id=doc_id,
+                kind=kind,
+                source=source,
+                terms=dict(terms),
+                length=sum(terms.values()),
+                payload=payload or {},
+            )
+        )
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop one document; returns False when it was not indexed."""
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return False
+        for term in document.terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        source_ids = self._by_source.get(document.source)
+        if source_ids is not None:
+            source_ids.discard(doc_id)
+            if not source_ids:
+                del self._by_source[document.source]
+        self._total_length -= document.length
+        return True
+
+    def remove_source(self, source: str) -> int:
+        """Drop every document extracted from ``source``; returns the count."""
+        doc_ids = list(self._by_source.get(source, ()))
+        for doc_id in doc_ids:
+            self.remove(doc_id)
+        return len(doc_ids)
+
+    def sources(self) -> set[str]:
+        return set(self._by_source)
+
+    def search(
+        self,
+        query: str,
+        *,
+        kinds: Iterable[str] | None = None,
+        limit: int | None = 10,
+    ) -> list[RetrievalHit]:
+        """Top ``limit`` documents for ``query`` (all matches when ``limit`` is None)."""
+        query_terms = set(tokenize(query))
+        if not query_terms or not self._documents:
+            return []
+        allowed = set(kinds) if kinds is not None else None
+        count = len(self._documents)
+        average_length = self._total_length / count or 1.0
+        scores: dict[str, float] = {}
+        for term in query_terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                document = self._documents[doc_id]
+                if allowed is not None and document.kind not in allowed:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * document.length / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                    frequency * (self.k1 + 1) / (frequency + norm)
+                )
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [
+            RetrievalHit(
+                doc_id=doc_id,
+                kind=self._documents[doc_id].kind,
+                score=round(score, 4),
+                payload=self._documents[doc_id].payload,
+            )
+            for doc_id, score in ranked
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "documents": [
+                {
+                    "id": document.doc_id,
+                    "kind": document.kind,
+                    "source": document.source,
+                    "terms": document.terms,
+                    "payload": document.payload,
+                }
+                for document in self._documents.values()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> BM25Index:
+        index = cls(k1=float(payload.get("k1", DEFAULT_K1)), b=float(payload.get("b", DEFAULT_B)))
+        for row in payload.get("documents", []):
+            terms = {str(term): int(count) for term, count in row["terms"].items()}
+            index._insert(
+                RetrievalDocument(
+                    doc_id=str(row["id"]),
+                    kind=str(row["kind"]),
+                    source=str(row.get("source", "")),
+                    terms=terms,
+                    length=sum(terms.values()),
+                    payload=row.get("payload") or {},
+                )
+            )
+        return index
+
+    def _insert(self, document: RetrievalDocument) -> None:
+        self.remove(document.doc_id)
+        self._documents[document.doc_id] = document
+        for term, frequency in document.terms.items():
+            self._postings.setdefault(term, {})[document.doc_id] = frequency
+        self._by_source.setdefault(document.source, set()).add(document.doc_id)
+        self._total_length += document.length
@@ -0,0 +1,247 @@
+"""Persisted BM25 index over a connection vault.
+
+Indexes the knowledge ``relevant_examples`` and ``relevant_rules`` rank: query
+examples, and business rules plus learnings. Table and column lookups use the
+runtime's schema index instead, so ``schema/descriptions.yaml`` is not
+re-indexed on every schema change. Every source file is
+stamped with its ``(mtime_ns, size)``; ``refresh`` re-extracts only the files
+whose stamp changed, drops documents of deleted files and rewrites
+``state/retrieval_index.json`` so the next process starts from the saved
+index instead of re-reading the whole vault.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from db_mcp_knowledge.business_rules import extract_business_rule_texts
+from db_mcp_knowledge.retrieval.bm25 import BM25Index, RetrievalHit
+from db_mcp_knowledge.vault.paths import (
+    BUSINESS_RULES_FILE,
+    EXAMPLES_DIR,
+    LEARNINGS_DIR,
+    retrieval_index_path,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+
+KIND_EXAMPLE = "example"
+KIND_RULE = "rule"
+# Kinds of the semantic core's in-memory alias index; not stored here.
+KIND_METRIC = "metric"
+KIND_DIMENSION = "dimension"
+
+_Document = tuple[str, str, list[object], dict[str, Any]]
+_Extractor = Callable[[Path, str], Iterator[_Document]]
+
+
+def _read_yaml(path: Path) -> Any:
+    try:
+        return yaml.safe_load(path.read_text()) or {}
+    except (OSError, yaml.YAMLError):
+        return {}
+
+
+def _json_payload(value: dict[str, Any]) -> dict[str, Any]:
+    """Round-trip through JSON so fresh and reloaded payloads look the same."""
+    return json.loads(json.dumps(value, default=str))
+
+
+def _example_documents(path: Path, source: str) -> Iterator[_Document]:
+    example = _read_yaml(path)
+    if not isinstance(example, dict):
+        return
+    payload = {**example, "id": example.get("id", path.stem)}
+    yield (
+        f"{KIND_EXAMPLE}:{source}",
+        KIND_EXAMPLE,
+        [
+            payload["id"],
+            example.get("intent"),
+            example.get("notes"),
+            " ".join(str(value) for value in example.get("tables", []) or []),
+            " ".join(str(value) for value in example.get("keywords", []) or []),
+            example.get("sql"),
+        ],
+        payload,
+    )
+
+
+def _rule_document(source: str, position: int, text_value: str) -> _Document:
+    return (
+        f"{KIND_RULE}:{source}:{position}",
+        KIND_RULE,
+        [text_value, source],
+        {"source": source, "text": text_value},
+    )
+
+
+def _business_rule_documents(path: Path, source: str) -> Iterator[_Document]:
+    payload = _read_yaml(path)
+    texts = extract_business_rule_texts(payload)
+    if isinstance(payload, dict):
+        texts.extend(extract_business_rule_texts(payload.get("candidate_rules", [])))
+    for position, text_value in enumerate(texts):
+        yield _rule_document(source, position, str(text_value))
+
+
+def _learning_documents(path: Path, source: str) -> Iterator[_Document]:
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return
+    position = 0
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("- "):
+            yield _rule_document(source, position, stripped[2:].strip())
+            position += 1
+
+
+_FILE_SOURCES: dict[str, _Extractor] = {
+    BUSINESS_RULES_FILE: _business_rule_documents,
+}
+_GLOB_SOURCES: tuple[tuple[str, str, _Extractor], ...] = (
+    (EXAMPLES_DIR, "*.yaml", _example_documents),
+    (LEARNINGS_DIR, "*.md", _learning_documents),
+)
+
+
+class VaultRetrievalIndex:
+    """BM25 index for one connection directory, kept in step with its files."""
+
+    def __init__(self, connection_path: Path):
+        self.connection_path = Path(connection_path)
+        self.index = BM25Index()
+        self._stamps: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def refresh(self) -> bool:
+        """Re-index changed source files; returns True when anything changed."""
+        with self._lock:
+            current = dict(self._current_sources())
+            changed = False
+            for source in set(self._stamps) - set(current):
+                self.index.remove_source(source)
+                del self._stamps[source]
+                changed = True
+            for source, (stamp, extract) in current.items():
+                if self._stamps.get(source) == stamp:
+                    continue
+                self.index.remove_source(source)
+                for doc_id, kind, fields, payload in extract(
+                    self.connection_path / source, source
+                ):
+                    self.index.add(
+                        doc_id, fields, kind=kind, source=source, payload=_json_payload(payload)
+                    )
+                self._stamps[source] = stamp
+                changed = True
+            if changed:
+                self._save()
+            return changed
+
+    def search(
+        self,
+        query: str,
+        *,
+        kinds: Iterable[str] | None = None,
+        limit: int | None = 10,
+    ) -> list[RetrievalHit]:
+        """Top-k documents for ``query``, optionally restricted to some kinds."""
+        with self._lock:
+            return self.index.search(query, kinds=kinds, limit=limit)
+
+    def _current_sources(self) -> Iterator[tuple[str, tuple[list[int], _Extractor]]]:
+        for source, extract in _FILE_SOURCES.items():
+            stamp = self._stamp(self.connection_path / source)
+            if stamp is not None:
+                yield source, (stamp, extract)
+        for directory, pattern, extract in _GLOB_SOURCES:
+            root = self.connection_path / directory
+            if not root.is_dir():
+                continue
+            for path in sorted(root.glob(pattern)):
+                stamp = self._stamp(path)
+                if stamp is not None:
+                    yield path.relative_to(self.connection_path).as_posix(), (stamp, extract)
+
+    @staticmethod
+    def _stamp(path: Path) -> list[int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load(self) -> None:
+        path = retrieval_index_path(self.connection_path)
+        try:
+            payload = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+            return
+        try:
+            index = BM25Index.from_dict(payload["index"])
+            stamps = {str(key): list(value) for key, value in payload["stamps"].items()}
+        except (KeyError, TypeError, ValueError, AttributeError):
+            logger.debug("Ignoring unreadable retrieval index at %s", path)
+            return
+        self.index = index
+        self._stamps = stamps
+
+    def _save(self) -> None:
+        path = retrieval_index_path(self.connection_path)
+        payload = {"version": INDEX_VERSION, "stamps": self._stamps, "index": self.index.to_dict()}
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug("Could not persist retrieval index at %s: %s", path, exc)
+            tmp_path.unlink(missing_ok=True)
+
+
+_indexes: dict[Path, VaultRetrievalIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_vault_index(connection_path: Path) -> VaultRetrievalIndex:
+    """Process-wide index for a connection, refreshed against its files."""
+    key = Path(connection_path).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = VaultRetrievalIndex(key)
+    index.refresh()
+    return index
+
+
+def search_vault(
+    connection_path: Path,
+    query: str,
+    *,
+    kinds: Iterable[str] | None = None,
+    limit: int | None = 10,
+) -> list[RetrievalHit]:
+    """Convenience wrapper: refresh the connection's index and search it."""
+    return get_vault_index(connection_path).search(query, kinds=kinds, limit=limit)
+
+
+def clear_vault_indexes() -> None:
+    """Forget the in-process indexes (the persisted files are left alone)."""
+    with _indexes_lock:
+        _indexes.clear()
@@ -2,5 +2,6 @@
 
 __all__ = [
     "ConnectionSemanticCore",
+    "clear_semantic_cores",
     "load_connection_semantic_core",
 ]
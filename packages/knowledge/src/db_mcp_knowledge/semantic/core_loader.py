@@ -3,10 +3,16 @@
 The full V1 design calls for an org/domain semantic core above connections.
 The first slice intentionally bootstraps from the connection-local approved
 metrics and dimensions that already exist in the vault.
+
+Loaded cores are cached per connection and reused until one of the source
+files (metrics catalog, dimensions, bindings, business rules) changes its
+``(mtime_ns, size)`` stamp, so serving an intent does not re-read and
+re-validate the YAML each time.
 """
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -14,7 +20,15 @@ import yaml
 from db_mcp_models import Dimension, Metric, MetricBinding, SemanticPolicy
 
 from db_mcp_knowledge.business_rules import compile_semantic_policy
-from db_mcp_knowledge.metrics.store import load_dimensions, load_metric_bindings, load_metrics
+from db_mcp_knowledge.metrics.store import (
+    get_bindings_file_path,
+    get_catalog_file_path,
+    get_dimensions_file_path,
+    load_dimensions,
+    load_metric_bindings,
+    load_metrics,
+)
+from db_mcp_knowledge.retrieval import KIND_DIMENSION, KIND_METRIC, BM25Index
 from db_mcp_knowledge.vault.paths import business_rules_path
 
 
@@ -29,16 +43,83 @@ class ConnectionSemanticCore:
     policy: SemanticPolicy = field(
         default_factory=lambda: SemanticPolicy(provider_id="unknown")
     )
+    _alias_index: BM25Index | None = field(default=None, init=False, repr=False, compare=False)
+    _metrics_by_name: dict[str, Metric] = field(init=False, repr=False, compare=False)
+    _dimensions_by_name: dict[str, Dimension] = field(init=False, repr=False, compare=False)
+    _aliases: dict[tuple[str, str], list[str]] = field(init=False, repr=False, compare=False)
 
-    def get_metric(self, name: str) -> Metric | None:
+    def __post_init__(self) -> None:
+        self._metrics_by_name = {}
+        self._dimensions_by_name = {}
+        self._aliases = {}
         for metric in self.metrics:
-            if metric.name == name:
-                return metric
-        return None
+            if self._metrics_by_name.setdefault(metric.name, metric) is metric:
+                self._aliases[(KIND_METRIC, metric.name)] = [
+                    alias for alias in (metric.name, metric.display_name) if alias
+                ]
+        for dimension in self.dimensions:
+            if self._dimensions_by_name.setdefault(dimension.name, dimension) is dimension:
+                self._aliases[(KIND_DIMENSION, dimension.name)] = [
+                    alias
+                    for alias in (dimension.name, dimension.display_name, *dimension.synonyms)
+                    if alias
+                ]
+
+    def get_metric(self, name: str) -> Metric | None:
+        return self._metrics_by_name.get(name)
+
+    def get_dimension(self, name: str) -> Dimension | None:
+        return self._dimensions_by_name.get(name)
+
+    def aliases(self, kind: str, name: str) -> list[str]:
+        """Non-empty aliases of a metric or dimension: name, display name, synonyms."""
+        return self._aliases.get((kind, name), [])
 
     def get_metric_binding(self, metric_name: str) -> MetricBinding | None:
         return self.metric_bindings.get(metric_name)
 
+    def alias_index(self) -> BM25Index:
+        """BM25 index over metric and dimension aliases, built on first use.
+
+        Aliases are indexed both as written and lowercased, so camelCase and
+        snake_case spellings share terms with the planner's normalized intent.
+        """
+        if self._alias_index is None:
+            index = BM25Index()
+            for (kind, name), aliases in self._aliases.items():
+                index.add(
+                    f"{kind}:{name}",
+                    [*aliases, *(alias.lower() for alias in aliases)],
+                    kind=kind,
+                    payload={"name": name},
+                )
+            self._alias_index = index
+        return self._alias_index
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _source_stamps(provider_id: str, connection_root: Path) -> tuple[tuple[int, int] | None, ...]:
+    return tuple(
+        _stamp(path)
+        for path in (
+            get_catalog_file_path(provider_id, connection_path=connection_root),
+            get_dimensions_file_path(provider_id, connection_path=connection_root),
+            get_bindings_file_path(provider_id, connection_path=connection_root),
+            business_rules_path(connection_root),
+        )
+    )
+
+
+_cores: dict[tuple[Path, str], tuple[tuple, ConnectionSemanticCore]] = {}
+_cores_lock = threading.Lock()
+
 
 def load_connection_semantic_core(
     provider_id: str,
@@ -47,9 +128,31 @@ def load_connection_semantic_core(
 ) -> ConnectionSemanticCore:
     """Load approved metrics and dimensions for serving.
 
-    The serving path ignores candidate items by default.
+    The serving path ignores candidate items by default. The returned core is
+    shared between callers until its source files change; treat it as
+    read-only.
     """
-    connection_root = Path(connection_path)
+    connection_root = Path(connection_path).resolve()
+    key = (connection_root, provider_id)
+    stamps = _source_stamps(provider_id, connection_root)
+    with _cores_lock:
+        cached = _cores.get(key)
+    if cached is not None and cached[0] == stamps:
+        return cached[1]
+
+    core = _read_semantic_core(provider_id, connection_root)
+    with _cores_lock:
+        _cores[key] = (stamps, core)
+    return core
+
+
+def clear_semantic_cores() -> None:
+    """Forget the cached semantic cores (e.g. after editing files in place in tests)."""
+    with _cores_lock:
+        _cores.clear()
+
+
+def _read_semantic_core(provider_id: str, connection_root: Path) -> ConnectionSemanticCore:
     metrics_catalog = load_metrics(provider_id, connection_path=connection_root)
     dimensions_catalog = load_dimensions(provider_id, connection_path=connection_root)
     bindings_catalog = load_metric_bindings(provider_id, connection_path=connection_root)
@@ -0,0 +1,571 @@
+"""Join graph between the tables of a connection.
+
+Edges come from declared foreign keys (recorded during discovery) and from
+column-name inference (``join_score``). Columns are bucketed by normalized
+name, so inference only scores column pairs that can match at all instead of
+comparing every column of every pair of tables. The graph is persisted to
+``state/join_graph.json`` and kept in step with ``schema/descriptions.yaml``:
+when the schema changes, only tables whose column list changed have their
+edges recomputed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from db_mcp_knowledge.retrieval.bm25 import normalize_text
+from db_mcp_knowledge.vault.paths import descriptions_path, join_graph_path
+
+logger = logging.getLogger(__name__)
+
+GRAPH_VERSION = 1
+FOREIGN_KEY_SCORE = 100
+SOURCE_FOREIGN_KEY = "foreign_key"
+SOURCE_INFERRED = "inferred"
+
+# Column names present in more tables than this (tenant_id, chain_id, ...) say
+# nothing about which tables belong together and would add O(T^2) edges.
+MAX_SHARED_NAME_TABLES = 64
+
+_IDENTIFIER_NAMES = frozenset({"address", "mint", "symbol"})
+_ADDRESS_NAMES = ("mint", "address")
+
+
+def join_score(left_col: str, right_col: str, right_table: str) -> tuple[int, str] | None:
+    """Score joining ``left_col`` to ``right_col`` of ``right_table`` by name alone."""
+    left_norm = normalize_text(left_col)
+    right_norm = normalize_text(right_col)
+    right_table_norm = normalize_text(right_table.split(".")[-1])
+    if not left_norm or not right_norm:
+        return None
+    if left_norm == right_norm and (left_norm.endswith("id") or left_norm in _IDENTIFIER_NAMES):
+        return 80, "matching identifier columns"
+    if right_table_norm and left_norm == f"{right_table_norm}id" and right_norm.endswith("id"):
+        return 90, "foreign-key style id match"
+    if left_norm.endswith("mint") and right_norm in {"mint", "address"}:
+        return 85, "token mint/address match"
+    if left_norm.endswith("address") and right_norm in {"address", "mint"}:
+        return 75, "address-style identifier match"
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class JoinEdge:
+    """A join between two tables, oriented as ``left_table.left_column = right...``."""
+
+    left_table: str
+    left_column: str
+    right_table: str
+    right_column: str
+    reason: str
+    score: int
+    source: str = SOURCE_INFERRED
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "left_table": self.left_table,
+            "left_column": self.left_column,
+            "right_table": self.right_table,
+            "right_column": self.right_column,
+            "reason": self.reason,
+            "score": self.score,
+            "source": self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> JoinEdge:
+        return cls(
+            left_table=str(data["left_table"]),
+            left_column=str(data["left_column"]),
+            right_table=str(data["right_table"]),
+            right_column=str(data["right_column"]),
+            reason=str(data.get("reason") or ""),
+            score=int(data["score"]),
+            source=str(data.get("source") or SOURCE_INFERRED),
+        )
+
+    def _sort_key(self) -> tuple[int, str, str, str, str]:
+        return (
+            -self.score,
+            self.left_table,
+            self.right_table,
+            self.left_column,
+            self.right_column,
+        )
+
+
+def _table_short_name(table: str) -> str:
+    return table.split(".")[-1]
+
+
+def _table_schema(table: str) -> str | None:
+    parts = table.split(".")
+    return parts[-2].lower() if len(parts) > 1 else None
+
+
+class JoinGraph:
+    """Adjacency map of the best join between every pair of joinable tables."""
+
+    def __init__(self) -> None:
+        self._columns: dict[str, list[str]] = {}
+        self._foreign_keys: dict[str, list[dict[str, Any]]] = {}
+        self._edges: dict[str, dict[str, JoinEdge]] = {}
+        # Derived lookups, rebuilt from _columns/_foreign_keys and never persisted.
+        self._by_norm: dict[str, dict[str, list[str]]] = {}
+        self._by_suffix: dict[str, dict[str, list[str]]] = {name: {} for name in _ADDRESS_NAMES}
+        self._by_id_key: dict[str, set[str]] = {}
+        self._by_short: dict[str, set[str]] = {}
+        self._referrers: dict[str, set[str]] = {}
+
+    @property
+    def tables(self) -> list[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return sum(len(neighbors) for neighbors in self._edges.values()) // 2
+
+    # -- updates -----------------------------------------------------------
+
+    def sync_tables(self, tables: Mapping[str, Sequence[str]]) -> bool:
+        """Make the graph cover exactly ``tables`` (identifier -> column names).
+
+        Returns True when any table was added, removed or changed columns.
+        """
+        wanted = {
+            str(table): [str(column) for column in columns] for table, columns in tables.items()
+        }
+        removed = [table for table in self._columns if table not in wanted]
+        changed = [
+            table for table, columns in wanted.items() if self._columns.get(table) != columns
+        ]
+        if not removed and not changed:
+            return False
+        touched = {
+            normalize_text(column)
+            for table in [*removed, *changed]
+            for column in [*self._columns.get(table, []), *wanted.get(table, [])]
+        }
+        shared_before = {norm: self._is_shared_name(norm) for norm in touched}
+        for table in removed:
+            self._remove_table(table)
+        for table in changed:
+            self._remove_table(table)
+            self._add_table(table, wanted[table])
+        # A name becoming (or ceasing to be) too common changes edges of untouched tables.
+        relink = set(changed)
+        for norm, was_shared in shared_before.items():
+            if self._is_shared_name(norm) != was_shared:
+                relink.update(self._by_norm.get(norm, {}))
+        self._refresh_edges(sorted(relink))
+        return True
+
+    def set_foreign_keys(self, foreign_keys: Mapping[str, Sequence[Mapping[str, Any]]]) -> bool:
+        """Record declared foreign keys per source table (an empty list clears them)."""
+        changed = []
+        for table, fks in foreign_keys.items():
+            normalized = [
+                {
+                    "columns": [str(column) for column in fk.get("columns") or []],
+                    "referred_schema": fk.get("referred_schema"),
+                    "referred_table": str(fk.get("referred_table") or ""),
+                    "referred_columns": [
+                        str(column) for column in fk.get("referred_columns") or []
+                    ],
+                }
+                for fk in fks
+                if fk.get("referred_table") and fk.get("columns")
+            ]
+            if self._foreign_keys.get(table, []) == normalized:
+                continue
+            self._index_referrers(table, add=False)
+            if normalized:
+                self._foreign_keys[table] = normalized
+            else:
+                self._foreign_keys.pop(table, None)
+            self._index_referrers(table, add=True)
+            changed.append(table)
+        self._refresh_edges([table for table in changed if table in self._columns])
+        return bool(changed)
+
+    # -- queries -----------------------------------------------------------
+
+    def edge(self, left: str, right: str) -> JoinEdge | None:
+        return self._edges.get(left, {}).get(right)
+
+    def neighbors(self, table: str) -> list[JoinEdge]:
+        """Edges touching ``table``, best first."""
+        return sorted(self._edges.get(table, {}).values(), key=JoinEdge._sort_key)
+
+    def joins_among(self, tables: Iterable[str], limit: int | None = None) -> list[JoinEdge]:
+        """Direct edges between members of ``tables``, best first."""
+        members = set(tables)
+        edges = {
+            edge
+            for table in members
+            for other, edge in self._edges.get(table, {}).items()
+            if other in members
+        }
+        ranked = sorted(edges, key=JoinEdge._sort_key)
+        return ranked if limit is None else ranked[:limit]
+
+    def shortest_path(self, source: str, target: str, max_hops: int = 3) -> list[JoinEdge] | None:
+        """Fewest-hop chain of edges from ``source`` to ``target`` (None if unreachable).
+
+        Ties between equally short paths go to the higher-scoring edges.
+        """
+        if source not in self._edges or target not in self._edges:
+            return None
+        if source == target:
+            return []
+        previous: dict[str, tuple[str, JoinEdge]] = {}
+        seen = {source}
+        queue: deque[tuple[str, int]] = deque([(source, 0)])
+        while queue:
+            table, depth = queue.popleft()
+            if depth >= max_hops:
+                continue
+            for edge in self.neighbors(table):
+                other = edge.right_table if edge.left_table == table else edge.left_table
+                if other in seen:
+                    continue
+                seen.add(other)
+                previous[other] = (table, edge)
+                if other == target:
+                    path = []
+                    while other != source:
+                        other, step = previous[other]
+                        path.append(step)
+                    return path[::-1]
+                queue.append((other, depth + 1))
+        return None
+
+    # -- persistence -------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "tables": self._columns,
+            "foreign_keys": self._foreign_keys,
+            "edges": [edge.to_dict() for edge in self.joins_among(self._columns)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> JoinGraph:
+        graph = cls()
+        for table, columns in data["tables"].items():
+            graph._add_table(str(table), [str(column) for column in columns])
+        for table, fks in data.get("foreign_keys", {}).items():
+            graph._foreign_keys[str(table)] = list(fks)
+            graph._index_referrers(str(table), add=True)
+        for payload in data.get("edges", []):
+            graph._link(JoinEdge.from_dict(payload))
+        return graph
+
+    # -- internals ---------------------------------------------------------
+
+    def _add_table(self, table: str, columns: list[str]) -> None:
+        self._columns[table] = columns
+        self._by_short.setdefault(_table_short_name(table).lower(), set()).add(table)
+        table_norm = normalize_text(_table_short_name(table))
+        if table_norm:
+            self._by_id_key.setdefault(f"{table_norm}id", set()).add(table)
+        for column in columns:
+            norm = normalize_text(column)
+            if not norm:
+                continue
+            self._by_norm.setdefault(norm, {}).setdefault(table, []).append(column)
+            for suffix in _ADDRESS_NAMES:
+                if norm.endswith(suffix):
+                    self._by_suffix[suffix].setdefault(table, []).append(column)
+
+    def _remove_table(self, table: str) -> None:
+        columns = self._columns.pop(table, None)
+        if columns is None:
+            return
+        self._unlink(table)
+        _discard(self._by_short, _table_short_name(table).lower(), table)
+        table_norm = normalize_text(_table_short_name(table))
+        if table_norm:
+            _discard(self._by_id_key, f"{table_norm}id", table)
+        for norm in {normalize_text(column) for column in columns}:
+            bucket = self._by_norm.get(norm)
+            if bucket is not None:
+                bucket.pop(table, None)
+                if not bucket:
+                    del self._by_norm[norm]
+        for bucket in self._by_suffix.values():
+            bucket.pop(table, None)
+
+    def _unlink(self, table: str) -> None:
+        for other in self._edges.pop(table, {}):
+            neighbors = self._edges.get(other)
+            if neighbors is not None:
+                neighbors.pop(table, None)
+                if not neighbors:
+                    del self._edges[other]
+
+    def _link(self, edge: JoinEdge) -> None:
+        current = self.edge(edge.left_table, edge.right_table)
+        if current is not None and current._sort_key() <= edge._sort_key():
+            return
+        self._edges.setdefault(edge.left_table, {})[edge.right_table] = edge
+        self._edges.setdefault(edge.right_table, {})[edge.left_table] = edge
+
+    def _refresh_edges(self, tables: list[str]) -> None:
+        for table in tables:
+            self._unlink(table)
+        for table in tables:
+            for edge in self._foreign_key_edges(table):
+                self._link(edge)
+            for edge in self._inferred_edges(table):
+                self._link(edge)
+
+    def _is_shared_name(self, norm: str) -> bool:
+        return len(self._by_norm.get(norm, ())) > MAX_SHARED_NAME_TABLES
+
+    def _index_referrers(self, table: str, *, add: bool) -> None:
+        for fk in self._foreign_keys.get(table, []):
+            key = str(fk["referred_table"]).lower()
+            if add:
+                self._referrers.setdefault(key, set()).add(table)
+            else:
+                _discard(self._referrers, key, table)
+
+    def _resolve_table(self, name: str, schema: str | None, source: str) -> str | None:
+        candidates = sorted(self._by_short.get(name.lower(), ()))
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+        preferred = (schema or "").lower() or _table_schema(source)
+        for candidate in candidates:
+            if _table_schema(candidate) == preferred:
+                return candidate
+        return candidates[0]
+
+    def _foreign_key_edges(self, table: str) -> Iterable[JoinEdge]:
+        """Declared foreign keys from ``table`` and from tables referring to it."""
+        sources = {table} | {
+            referrer
+            for referrer in self._referrers.get(_table_short_name(table).lower(), ())
+            if referrer in self._columns
+        }
+        for source in sorted(sources):
+            for fk in self._foreign_keys.get(source, []):
+                target = self._resolve_table(
+                    fk["referred_table"], fk.get("referred_schema"), source
+                )
+                if target is None or target == source or table not in {source, target}:
+                    continue
+                yield JoinEdge(
+                    left_table=source,
+                    left_column=", ".join(fk["columns"]),
+                    right_table=target,
+                    right_column=", ".join(fk["referred_columns"]),
+                    reason="declared foreign key",
+                    score=FOREIGN_KEY_SCORE,
+                    source=SOURCE_FOREIGN_KEY,
+                )
+
+    def _candidate_columns(self, table: str) -> Iterable[tuple[str, str, str]]:
+        """(column of ``table``, other table, column of other table) pairs worth scoring.
+
+        Covers every pair ``join_score`` can accept in either orientation:
+        equal identifier names, ``<table>id`` columns, and mint/address columns,
+        except pairs hinging on a bare ``id`` or on a name shared by too many
+        tables to be a useful join hint.
+        """
+        table_norm = normalize_text(_table_short_name(table))
+        id_key = f"{table_norm}id" if table_norm else None
+        own_id_columns = [
+            column for column in self._columns[table] if normalize_text(column).endswith("id")
+        ]
+        for column in self._columns[table]:
+            norm = normalize_text(column)
+            if not norm:
+                continue
+            if (norm.endswith("id") or norm in _IDENTIFIER_NAMES) and norm != "id":
+                if not self._is_shared_name(norm):
+                    yield from _pairs(column, self._by_norm.get(norm, {}))
+            for other in self._by_id_key.get(norm, ()):
+                for other_column in self._columns[other]:
+                    if normalize_text(other_column).endswith("id"):
+                        yield column, other, other_column
+            if norm.endswith(_ADDRESS_NAMES):
+                for name in _ADDRESS_NAMES:
+                    if not self._is_shared_name(name):
+                        yield from _pairs(column, self._by_norm.get(name, {}))
+            if norm in _ADDRESS_NAMES and not self._is_shared_name(norm):
+                for suffix in _ADDRESS_NAMES:
+                    yield from _pairs(column, self._by_suffix[suffix])
+        if id_key:
+            for other, other_columns in self._by_norm.get(id_key, {}).items():
+                for other_column in other_columns:
+                    for column in own_id_columns:
+                        yield column, other, other_column
+
+    def _inferred_edges(self, table: str) -> Iterable[JoinEdge]:
+        best: dict[str, JoinEdge] = {}
+        for column, other, other_column in self._candidate_columns(table):
+            if other == table:
+                continue
+            scored = join_score(column, other_column, other)
+            if scored is not None:
+                edge = JoinEdge(table, column, other, other_column, scored[1], scored[0])
+            else:
+                scored = join_score(other_column, column, table)
+                if scored is None:
+                    continue
+                edge = JoinEdge(other, other_column, table, column, scored[1], scored[0])
+            current = best.get(other)
+            if current is None or edge._sort_key() < current._sort_key():
+                best[other] = edge
+        return best.values()
+
+
+def _pairs(column: str, bucket: Mapping[str, list[str]]) -> Iterable[tuple[str, str, str]]:
+    for other, other_columns in bucket.items():
+        for other_column in other_columns:
+            yield column, other, other_column
+
+
+def _discard(index: dict[str, set[str]], key: str, value: str) -> None:
+    values = index.get(key)
+    if values is not None:
+        values.discard(value)
+        if not values:
+            del index[key]
+
+
+def schema_table_columns(schema: Any) -> dict[str, list[str]]:
+    """Table identifier -> column names from a parsed ``descriptions.yaml``."""
+    tables = schema.get("tables", []) if isinstance(schema, dict) else []
+    if isinstance(tables, dict):
+        tables = [
+            {**payload, "name": payload.get("name", name)}
+            if isinstance(payload, dict)
+            else {"name": name}
+            for name, payload in tables.items()
+        ]
+    result: dict[str, list[str]] = {}
+    for table in tables if isinstance(tables, list) else []:
+        if not isinstance(table, dict):
+            continue
+        identifier = str(
+            table.get("full_name") or table.get("name") or table.get("table_name") or ""
+        )
+        if not identifier:
+            continue
+        result[identifier] = [
+            str(column.get("name"))
+            for column in table.get("columns", []) or []
+            if isinstance(column, dict) and column.get("name")
+        ]
+    return result
+
+
+class ConnectionJoinGraph:
+    """Join graph for one connection directory, kept in step with its schema file."""
+
+    def __init__(self, connection_path: Path):
+        self.connection_path = Path(connection_path)
+        self.graph = JoinGraph()
+        self._stamp: list[int] | None = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def refresh(self) -> bool:
+        """Re-sync with ``schema/descriptions.yaml``; returns True when edges may have changed."""
+        with self._lock:
+            stamp = _stamp(descriptions_path(self.connection_path))
+            if stamp == self._stamp:
+                return False
+            try:
+                schema = yaml.safe_load(descriptions_path(self.connection_path).read_text())
+            except (OSError, yaml.YAMLError):
+                schema = {}
+            changed = self.graph.sync_tables(schema_table_columns(schema))
+            self._stamp = stamp
+            self._save()
+            return changed
+
+    def record_foreign_keys(self, foreign_keys: Mapping[str, Sequence[Mapping[str, Any]]]) -> bool:
+        """Merge declared foreign keys (table identifier -> fk dicts) and persist."""
+        with self._lock:
+            changed = self.graph.set_foreign_keys(foreign_keys)
+            if changed:
+                self._save()
+            return changed
+
+    def joins_among(self, tables: Iterable[str], limit: int | None = None) -> list[JoinEdge]:
+        with self._lock:
+            return self.graph.joins_among(tables, limit=limit)
+
+    def shortest_path(self, source: str, target: str, max_hops: int = 3) -> list[JoinEdge] | None:
+        with self._lock:
+            return self.graph.shortest_path(source, target, max_hops=max_hops)
+
+    def _load(self) -> None:
+        path = join_graph_path(self.connection_path)
+        try:
+            payload = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != GRAPH_VERSION:
+            return
+        try:
+            graph = JoinGraph.from_dict(payload["graph"])
+            stamp = payload.get("stamp")
+        except (KeyError, TypeError, ValueError, AttributeError):
+            logger.debug("Ignoring unreadable join graph at %s", path)
+            return
+        self.graph = graph
+        self._stamp = list(stamp) if stamp is not None else None
+
+    def _save(self) -> None:
+        path = join_graph_path(self.connection_path)
+        payload = {"version": GRAPH_VERSION, "stamp": self._stamp, "graph": self.graph.to_dict()}
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug("Could not persist join graph at %s: %s", path, exc)
+            tmp_path.unlink(missing_ok=True)
+
+
+def _stamp(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+_graphs: dict[Path, ConnectionJoinGraph] = {}
+_graphs_lock = threading.Lock()
+
+
+def get_join_graph(connection_path: Path) -> ConnectionJoinGraph:
+    """Process-wide join graph for a connection, refreshed against its schema."""
+    key = Path(connection_path).resolve()
+    with _graphs_lock:
+        graph = _graphs.get(key)
+        if graph is None:
+            graph = _graphs[key] = ConnectionJoinGraph(key)
+    graph.refresh()
+    return graph
+
+
+def clear_join_graphs() -> None:
+    """Forget the in-process graphs (the persisted files are left alone)."""
+    with _graphs_lock:
+        _graphs.clear()
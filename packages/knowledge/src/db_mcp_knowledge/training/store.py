@@ -2,6 +2,8 @@
 
 Examples are stored as individual YAML files in the examples/ folder.
 This makes git diffs cleaner and allows per-example management.
+New feedback is appended to the feedback log's record log (see
+vault/record_log.py) instead of rewriting feedback_log.yaml each time.
 """
 
 import uuid
@@ -25,6 +27,7 @@ from db_mcp_knowledge.vault.paths import (
     EXAMPLES_DIR,
     FEEDBACK_LOG_FILE,
 )
+from db_mcp_knowledge.vault.record_log import RecordLog, get_record_log
 
 
 def get_examples_dir(provider_id: str) -> Path:
@@ -259,8 +262,13 @@ def save_examples(examples: QueryExamples) -> dict:
 # =============================================================================
 
 
+def _feedback_log(provider_id: str) -> RecordLog:
+    header = FeedbackLog(provider_id=provider_id).model_dump(mode="json", exclude={"feedback"})
+    return get_record_log(get_feedback_file_path(provider_id), "feedback", header)
+
+
 def load_feedback(provider_id: str) -> FeedbackLog:
-    """Load feedback log from YAML file.
+    """Load feedback log from YAML file and its record log.
 
     Args:
         provider_id: Provider identifier
@@ -268,21 +276,17 @@ def load_feedback(provider_id: str) -> FeedbackLog:
     Returns:
         FeedbackLog (empty if file doesn't exist)
     """
-    feedback_file = get_feedback_file_path(provider_id)
-
-    if not feedback_file.exists():
-        return FeedbackLog(provider_id=provider_id)
-
     try:
-        with open(feedback_file) as f:
-            data = yaml.safe_load(f)
+        data = _feedback_log(provider_id).payload()
+        if data is None:
+            return FeedbackLog(provider_id=provider_id)
         return FeedbackLog.model_validate(data)
     except Exception:
         return FeedbackLog(provider_id=provider_id)
 
 
 def save_feedback(feedback_log: FeedbackLog) -> dict:
-    """Save feedback log to YAML file.
+    """Replace the whole feedback log file (and its pending record log).
 
     Args:
         feedback_log: FeedbackLog to save
@@ -291,21 +295,9 @@ def save_feedback(feedback_log: FeedbackLog) -> dict:
         Dict with save status
     """
     try:
-        provider_dir = get_provider_dir(feedback_log.provider_id)
-        provider_dir.mkdir(parents=True, exist_ok=True)
-
-        feedback_dict = feedback_log.model_dump(mode="json")
+        _feedback_log(feedback_log.provider_id).replace(feedback_log.model_dump(mode="json"))
 
         feedback_file = get_feedback_file_path(feedback_log.provider_id)
-        with open(feedback_file, "w") as f:
-            yaml.dump(
-                feedback_dict,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-            )
-
         return {"saved": True, "file_path": str(feedback_file), "error": None}
     except Exception as e:
         return {"saved": False, "file_path": None, "error": str(e)}
@@ -334,8 +326,6 @@ def add_feedback(
     Returns:
         Dict with feedback ID and status
     """
-    feedback_log = load_feedback(provider_id)
-
     fb = QueryFeedback(
         id=str(uuid.uuid4())[:8],
         natural_language=natural_language,
@@ -347,18 +337,17 @@ def add_feedback(
         created_at=datetime.now(UTC),
     )
 
-    feedback_log.add_feedback(fb)
-    result = save_feedback(feedback_log)
+    try:
+        total = _feedback_log(provider_id).append([fb.model_dump(mode="json")])
+    except Exception as e:
+        return {"added": False, "error": str(e)}
 
-    if result["saved"]:
-        return {
-            "added": True,
-            "feedback_id": fb.id,
-            "feedback_type": feedback_type.value,
-            "total_feedback": len(feedback_log.feedback),
-        }
-    else:
-        return {"added": False, "error": result["error"]}
+    return {
+        "added": True,
+        "feedback_id": fb.id,
+        "feedback_type": feedback_type.value,
+        "total_feedback": total,
+    }
 
 
 # =============================================================================
@@ -28,6 +28,7 @@ connection/
 ├── connector.yaml           # Connector config (sql/api/file) — absent = SQL
 ├── state.yaml               # Onboarding state
 ├── knowledge_gaps.yaml      # Tracked vocabulary gaps (auto-detected + manually added)
+├── knowledge_gaps.jsonl     # Recent gap updates, one JSON line each, not yet folded in
 ├── schema/
 │   └── descriptions.yaml    # Cached schema with table/column descriptions
 ├── domain/
@@ -435,8 +436,8 @@ grep -ri "search term" .
 # Recent failures
 ls -lt learnings/failures/*.yaml | head -10
 
-# Check knowledge gaps file directly
-cat knowledge_gaps.yaml 2>/dev/null
+# Check knowledge gaps file directly (recent updates are appended to the .jsonl)
+cat knowledge_gaps.yaml knowledge_gaps.jsonl 2>/dev/null
 ```
 
 ## Multi-Connection Queries
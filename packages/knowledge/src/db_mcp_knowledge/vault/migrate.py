@@ -34,6 +34,7 @@ from db_mcp_knowledge.vault.paths import (
 from db_mcp_knowledge.vault.paths import (
     learnings_dir as _learnings_dir,
 )
+from db_mcp_knowledge.vault.record_log import get_record_log
 
 logger = logging.getLogger(__name__)
 
@@ -442,14 +443,16 @@ def _migrate_feedback_log(src_path: Path, connection_path: Path) -> int:
         Number of failures migrated
     """
     legacy_file = src_path / FEEDBACK_LOG_FILE
-    if not legacy_file.exists():
+    # Read through the record log so feedback still pending in its segment is kept.
+    legacy_log = get_record_log(legacy_file, "feedback")
+    if not legacy_log.exists():
         return 0
 
     failures_dir = _learnings_dir(connection_path) / "failures"
     failures_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        data = yaml.safe_load(legacy_file.read_text())
+        data = legacy_log.payload() or {}
     except Exception as e:
         logger.error(f"Failed to parse {legacy_file}: {e}")
         return 0
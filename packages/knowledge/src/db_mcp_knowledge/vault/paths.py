@@ -35,6 +35,10 @@ METRICS_BINDINGS_FILE = "metrics/bindings.yaml"
 KNOWLEDGE_GAPS_FILE = "knowledge_gaps.yaml"
 FEEDBACK_LOG_FILE = "feedback_log.yaml"
 
+# Derived, regenerable state
+RETRIEVAL_INDEX_FILE = "state/retrieval_index.json"
+JOIN_GRAPH_FILE = "state/join_graph.json"
+
 # ---------------------------------------------------------------------------
 # Directory constants
 # ---------------------------------------------------------------------------
@@ -94,3 +98,11 @@ def examples_dir(conn_path: Path) -> Path:
 
 def learnings_dir(conn_path: Path) -> Path:
     return conn_path / LEARNINGS_DIR
+
+
+def retrieval_index_path(conn_path: Path) -> Path:
+    return conn_path / RETRIEVAL_INDEX_FILE
+
+
+def join_graph_path(conn_path: Path) -> Path:
+    return conn_path / JOIN_GRAPH_FILE
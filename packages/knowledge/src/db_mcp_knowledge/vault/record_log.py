@@ -0,0 +1,315 @@
+"""Append-only record logs behind the feedback and knowledge-gap files.
+
+``feedback_log.yaml`` and ``knowledge_gaps.yaml`` remain the reviewable
+snapshots, but adding or updating a record no longer rewrites them. Each
+write appends the full record as one JSON line to a segment file next to the
+snapshot (``feedback_log.jsonl``); readers overlay the segment on the
+snapshot, last line per ``id`` wins. The merged records are kept in memory
+keyed by id, so later reads only parse lines appended since the previous one.
+Once the segment holds ``compact_every`` lines it is folded back into the
+YAML snapshot, which keeps git diffs small and the snapshot current.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from db_mcp_knowledge.vault.paths import FEEDBACK_LOG_FILE, KNOWLEDGE_GAPS_FILE
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".jsonl"
+DEFAULT_COMPACT_EVERY = 200
+
+# Snapshots in a connection directory that are backed by a record log.
+CONNECTION_RECORD_LOGS = ((KNOWLEDGE_GAPS_FILE, "gaps"), (FEEDBACK_LOG_FILE, "feedback"))
+
+
+def segment_path(snapshot_path: Path) -> Path:
+    """Append-only segment that accompanies a YAML snapshot."""
+    return snapshot_path.with_suffix(SEGMENT_SUFFIX)
+
+
+def _stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _dump_yaml(path: Path, payload: dict[str, Any]) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            yaml.dump(
+                payload,
+                f,
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+            )
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class RecordLog:
+    """A YAML snapshot of ``{<header>..., <collection>: [records]}`` plus its segment.
+
+    Records are dicts with a string ``id``. ``header`` supplies the top-level
+    fields written when the snapshot does not exist yet.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        collection: str,
+        header: dict[str, Any] | None = None,
+        *,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
+        self.snapshot_path = Path(snapshot_path)
+        self.segment_path = segment_path(self.snapshot_path)
+        self.collection = collection
+        self.compact_every = compact_every
+        self._default_header = dict(header or {})
+        self._lock = threading.RLock()
+        self._header: dict[str, Any] = {}
+        self._records: dict[str, dict[str, Any]] = {}
+        self._snapshot_stamp: tuple[int, int, int] | None = None
+        self._segment_stamp: tuple[int, int, int] | None = None
+        self._offset = 0
+        self._pending = 0
+        self._loaded = False
+
+    # -- reads ---------------------------------------------------------------
+
+    def exists(self) -> bool:
+        return self.snapshot_path.exists() or self.segment_path.exists()
+
+    def refresh(self) -> None:
+        """Bring the in-memory records up to date with the files on disk.
+
+        Raises whatever the snapshot's YAML parser raises when it is corrupt.
+        """
+        with self._lock:
+            segment = _stamp(self.segment_path)
+            if (
+                not self._loaded
+                or _stamp(self.snapshot_path) != self._snapshot_stamp
+                or self._segment_replaced(segment)
+            ):
+                self._reload()
+            elif segment is not None and segment[2] > self._offset:
+                self._read_segment(self.segment_path)
+
+    def payload(self) -> dict[str, Any] | None:
+        """Merged snapshot + segment contents, or None when neither file exists."""
+        with self._lock:
+            self.refresh()
+            if not self.exists():
+                return None
+            return self._snapshot_payload()
+
+    def get(self, record_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            self.refresh()
+            return self._records.get(record_id)
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        with self._lock:
+            self.refresh()
+            return iter(list(self._records.values()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.refresh()
+            return len(self._records)
+
+    # -- writes --------------------------------------------------------------
+
+    def append(self, records: Iterable[dict[str, Any]]) -> int:
+        """Append (or update, by id) records without rewriting the snapshot.
+
+        Returns the number of records in the log afterwards.
+        """
+        lines = [json.dumps(record, default=str, ensure_ascii=False) + "\n" for record in records]
+        with self._lock:
+            self.refresh()
+            if lines:
+                self.segment_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.segment_path, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+                # Re-read rather than apply locally, so lines appended by other
+                # processes since the last refresh are picked up in order too.
+                self.refresh()
+                if self._pending >= self.compact_every:
+                    self.compact()
+            return len(self._records)
+
+    def compact(self) -> bool:
+        """Fold the segment into the YAML snapshot. Returns False if there was none."""
+        with self._lock:
+            self.refresh()
+            if not self.segment_path.exists():
+                return False
+            # Move the segment aside first: writers that append from now on
+            # start a fresh segment instead of racing the snapshot rewrite.
+            folding = self.segment_path.with_name(f".{self.segment_path.name}.{os.getpid()}")
+            os.replace(self.segment_path, folding)
+            try:
+                self._read_segment(folding)
+                _dump_yaml(self.snapshot_path, self._snapshot_payload())
+            except BaseException:
+                # Put the lines back in front of anything appended meanwhile.
+                self._restore_segment(folding)
+                self._loaded = False
+                raise
+            folding.unlink(missing_ok=True)
+            self._snapshot_stamp = _stamp(self.snapshot_path)
+            self._segment_stamp = None
+            self._offset = 0
+            self._pending = 0
+            return True
+
+    def replace(self, payload: dict[str, Any]) -> None:
+        """Overwrite the whole log with ``payload`` and drop the segment."""
+        with self._lock:
+            _dump_yaml(self.snapshot_path, payload)
+            self.segment_path.unlink(missing_ok=True)
+            self._loaded = False
+
+    def discard_segment(self) -> None:
+        """Forget pending lines after the snapshot was rewritten wholesale elsewhere."""
+        with self._lock:
+            self.segment_path.unlink(missing_ok=True)
+            self._loaded = False
+
+    # -- internals -----------------------------------------------------------
+
+    def _snapshot_payload(self) -> dict[str, Any]:
+        return {
+            **self._default_header,
+            **self._header,
+            self.collection: list(self._records.values()),
+        }
+
+    def _segment_replaced(self, segment: tuple[int, int, int] | None) -> bool:
+        if self._segment_stamp is None:
+            return False
+        if segment is None or segment[0] != self._segment_stamp[0]:
+            return True
+        # Appends only grow the file; anything else means it was rewritten.
+        return segment[2] < self._offset or (
+            segment[2] == self._offset and segment != self._segment_stamp
+        )
+
+    def _reload(self) -> None:
+        self._header = {}
+        self._records = {}
+        self._segment_stamp = None
+        self._offset = 0
+        self._pending = 0
+        self._snapshot_stamp = _stamp(self.snapshot_path)
+        if self._snapshot_stamp is not None:
+            with open(self.snapshot_path) as f:
+                data = yaml.safe_load(f) or {}
+            if isinstance(data, dict):
+                items = data.get(self.collection) or []
+                self._header = {k: v for k, v in data.items() if k != self.collection}
+                for record in items:
+                    if isinstance(record, dict) and record.get("id") is not None:
+                        self._records[str(record["id"])] = record
+        self._loaded = True
+        if self.segment_path.exists():
+            self._read_segment(self.segment_path)
+
+    def _read_segment(self, path: Path) -> None:
+        try:
+            with open(path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if self._segment_stamp is None or stat.st_ino != self._segment_stamp[0]:
+                    self._offset = 0
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # A line without its newline is still being written; leave it for later.
+        end = data.rfind(b"\n") + 1
+        for raw in data[:end].splitlines():
+            self._pending += 1
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                logger.warning("Skipping unreadable line in %s", path)
+                continue
+            if isinstance(record, dict) and record.get("id") is not None:
+                self._records[str(record["id"])] = record
+        self._offset += end
+        self._segment_stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _restore_segment(self, folding: Path) -> None:
+        try:
+            newer = self.segment_path.read_bytes() if self.segment_path.exists() else b""
+            if newer:
+                with open(folding, "ab") as f:
+                    f.write(newer)
+            os.replace(folding, self.segment_path)
+        except OSError as exc:
+            logger.warning("Could not restore record log segment %s: %s", folding, exc)
+
+
+_logs: dict[tuple[Path, str], RecordLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_record_log(
+    snapshot_path: Path, collection: str, header: dict[str, Any] | None = None
+) -> RecordLog:
+    """Process-wide record log for ``snapshot_path``, so the id index is shared."""
+    key = (Path(snapshot_path).resolve(), collection)
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            log = _logs[key] = RecordLog(key[0], collection, header)
+        elif header and not log._default_header:
+            log._default_header = dict(header)
+    return log
+
+
+def clear_record_logs() -> None:
+    """Forget the in-process logs (the files on disk are left alone)."""
+    with _logs_lock:
+        _logs.clear()
+
+
+def compact_connection_logs(connection_path: Path) -> list[str]:
+    """Fold the connection's pending record-log segments into their YAML snapshots.
+
+    Called before the connection directory is committed, so the reviewable
+    snapshots are current. Returns the snapshot file names that were rewritten.
+    """
+    connection_path = Path(connection_path)
+    header = {"version": "1.0.0", "provider_id": connection_path.name}
+    compacted = []
+    for filename, collection in CONNECTION_RECORD_LOGS:
+        snapshot = connection_path / filename
+        if not segment_path(snapshot).exists():
+            continue
+        try:
+            if get_record_log(snapshot, collection, header).compact():
+                compacted.append(filename)
+        except Exception as exc:
+            # The segment is kept, so nothing is lost; it is folded next time.
+            logger.warning("Could not compact %s: %s", snapshot, exc)
+    return compacted
@@ -0,0 +1,202 @@
+"""Tests for the persisted join graph."""
+
+import itertools
+import random
+
+import yaml
+
+from db_mcp_knowledge.semantic import join_graph as join_graph_module
+from db_mcp_knowledge.semantic.join_graph import (
+    SOURCE_FOREIGN_KEY,
+    ConnectionJoinGraph,
+    JoinGraph,
+    clear_join_graphs,
+    get_join_graph,
+    join_score,
+)
+from db_mcp_knowledge.vault.paths import join_graph_path
+
+TABLES = {
+    "public.users": ["id", "email", "org_id"],
+    "public.orders": ["id", "user_id", "usersid", "total"],
+    "public.orgs": ["org_id", "name"],
+    "public.tokens": ["mint", "symbol"],
+    "public.transfers": ["token_mint", "from_address", "amount"],
+    "public.wallets": ["address", "label"],
+}
+
+
+def _pairs(edges):
+    return {frozenset((edge.left_table, edge.right_table)) for edge in edges}
+
+
+def _brute_force(tables):
+    """The old quadratic scan: best name-based join for every pair of tables."""
+    best = {}
+    for left, right in itertools.combinations(tables, 2):
+        for left_col, right_col in itertools.product(tables[left], tables[right]):
+            for a, a_col, b, b_col in (
+                (left, left_col, right, right_col),
+                (right, right_col, left, left_col),
+            ):
+                scored = join_score(a_col, b_col, b)
+                if scored is None or join_graph_module.normalize_text(a_col) == "id":
+                    continue
+                pair = frozenset((left, right))
+                best[pair] = max(best.get(pair, 0), scored[0])
+    return best
+
+
+class TestInference:
+    def test_name_based_edges(self):
+        graph = JoinGraph()
+        graph.sync_tables(TABLES)
+
+        users_orgs = graph.edge("public.users", "public.orgs")
+        assert (users_orgs.left_column, users_orgs.right_column) == ("org_id", "org_id")
+        orders_users = graph.edge("public.orders", "public.users")
+        assert orders_users.score == 90
+        assert orders_users.left_column == "usersid"
+        assert graph.edge("public.transfers", "public.tokens").reason == "token mint/address match"
+        assert graph.edge("public.transfers", "public.wallets").score == 85
+
+    def test_bare_id_columns_do_not_join(self):
+        graph = JoinGraph()
+        graph.sync_tables({"a": ["id"], "b": ["id"]})
+
+        assert graph.edge("a", "b") is None
+
+    def test_matches_pairwise_scan(self):
+        rng = random.Random(7)
+        vocabulary = ["user_id", "org_id", "mint", "address", "token_mint", "symbol", "name", "ts"]
+        tables = {
+            f"s.t{i}": rng.sample(vocabulary, 3) + ([f"t{(i + 1) % 12}id"] if i % 3 == 0 else [])
+            for i in range(12)
+        }
+        graph = JoinGraph()
+        graph.sync_tables(tables)
+
+        expected = _brute_force(tables)
+        edges = graph.joins_among(tables)
+        assert {frozenset((e.left_table, e.right_table)): e.score for e in edges} == expected
+
+    def test_common_names_are_skipped(self, monkeypatch):
+        monkeypatch.setattr(join_graph_module, "MAX_SHARED_NAME_TABLES", 2)
+        graph = JoinGraph()
+        graph.sync_tables({"a": ["tenant_id"], "b": ["tenant_id"]})
+        assert graph.edge("a", "b") is not None
+
+        graph.sync_tables({"a": ["tenant_id"], "b": ["tenant_id"], "c": ["tenant_id"]})
+        assert len(graph) == 0
+
+        graph.sync_tables({"a": ["tenant_id"], "b": ["tenant_id"]})
+        assert graph.edge("a", "b") is not None
+
+
+class TestIncrementalUpdates:
+    def test_changed_and_removed_tables(self):
+        graph = JoinGraph()
+        graph.sync_tables(TABLES)
+        assert not graph.sync_tables(TABLES)
+
+        updated = {**TABLES, "public.orgs": ["name"]}
+        del updated["public.wallets"]
+        assert graph.sync_tables(updated)
+
+        assert graph.edge("public.users", "public.orgs") is None
+        assert graph.edge("public.transfers", "public.wallets") is None
+        fresh = JoinGraph()
+        fresh.sync_tables(updated)
+        assert graph.to_dict() == fresh.to_dict()
+
+    def test_foreign_keys_override_inference(self):
+        graph = JoinGraph()
+        graph.sync_tables({"sales.orders": ["buyer", "user_id"], "crm.users": ["id", "user_id"]})
+        fk = {"columns": ["buyer"], "referred_table": "users", "referred_columns": ["id"]}
+
+        assert graph.set_foreign_keys({"sales.orders": [fk]})
+        edge = graph.edge("sales.orders", "crm.users")
+        assert edge.source == SOURCE_FOREIGN_KEY
+        assert (edge.left_column, edge.right_column) == ("buyer", "id")
+
+        graph.set_foreign_keys({"sales.orders": []})
+        assert graph.edge("sales.orders", "crm.users").left_column == "user_id"
+
+    def test_foreign_key_target_added_later(self):
+        graph = JoinGraph()
+        graph.sync_tables({"orders": ["buyer"]})
+        fk = {"columns": ["buyer"], "referred_table": "users", "referred_columns": ["pk"]}
+        graph.set_foreign_keys({"orders": [fk]})
+        assert graph.neighbors("orders") == []
+
+        graph.sync_tables({"orders": ["buyer"], "users": ["pk"]})
+        assert graph.edge("orders", "users").source == SOURCE_FOREIGN_KEY
+
+
+class TestQueries:
+    def test_shortest_path_bridges_tables(self):
+        graph = JoinGraph()
+        graph.sync_tables(TABLES)
+
+        path = graph.shortest_path("public.orders", "public.orgs")
+
+        assert [(e.left_column, e.right_column) for e in path] == [
+            ("usersid", "id"),
+            ("org_id", "org_id"),
+        ]
+        assert graph.shortest_path("public.orders", "public.orgs", max_hops=1) is None
+        assert graph.shortest_path("public.orders", "public.tokens") is None
+
+    def test_joins_among_limit_and_order(self):
+        graph = JoinGraph()
+        graph.sync_tables(TABLES)
+
+        joins = graph.joins_among(["public.orders", "public.users", "public.orgs"], limit=1)
+
+        assert _pairs(joins) == {frozenset(("public.orders", "public.users"))}
+
+
+def _write_schema(vault, tables):
+    path = vault / "schema" / "descriptions.yaml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "tables": [
+                    {
+                        "name": name.split(".")[-1],
+                        "full_name": name,
+                        "columns": [{"name": column} for column in columns],
+                    }
+                    for name, columns in tables.items()
+                ]
+            }
+        )
+    )
+
+
+class TestPersistence:
+    def test_graph_follows_schema_file_and_reloads(self, tmp_path):
+        clear_join_graphs()
+        _write_schema(tmp_path, TABLES)
+
+        graph = get_join_graph(tmp_path)
+        graph.record_foreign_keys(
+            {
+                "public.wallets": [
+                    {"columns": ["label"], "referred_table": "orgs", "referred_columns": ["name"]}
+                ]
+            }
+        )
+        assert join_graph_path(tmp_path).exists()
+
+        reloaded = ConnectionJoinGraph(tmp_path)
+        assert not reloaded.refresh()
+        assert reloaded.graph.to_dict() == graph.graph.to_dict()
+        assert reloaded.joins_among(["public.wallets", "public.orgs"])[0].source == (
+            SOURCE_FOREIGN_KEY
+        )
+
+        _write_schema(tmp_path, {**TABLES, "public.orgs": ["name", "extra"]})
+        assert get_join_graph(tmp_path).joins_among(["public.users", "public.orgs"]) == []
+        clear_join_graphs()
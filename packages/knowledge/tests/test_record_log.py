@@ -0,0 +1,199 @@
+"""Tests for the append-only feedback and knowledge-gap logs."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import yaml
+from db_mcp_models import FeedbackType, GapSource, GapStatus
+
+from db_mcp_knowledge.gaps import store as gaps_store
+from db_mcp_knowledge.training import store as training_store
+from db_mcp_knowledge.vault.migrate import _migrate_feedback_log
+from db_mcp_knowledge.vault.record_log import (
+    RecordLog,
+    clear_record_logs,
+    compact_connection_logs,
+    get_record_log,
+    segment_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_logs():
+    clear_record_logs()
+    yield
+    clear_record_logs()
+
+
+def _log(tmp_path, **kwargs):
+    return RecordLog(tmp_path / "items.yaml", "items", {"version": "1.0.0"}, **kwargs)
+
+
+class TestRecordLog:
+    def test_append_does_not_touch_snapshot(self, tmp_path):
+        log = _log(tmp_path)
+
+        assert log.payload() is None
+        assert log.append([{"id": "a", "n": 1}, {"id": "b", "n": 2}]) == 2
+
+        assert not log.snapshot_path.exists()
+        assert log.payload() == {
+            "version": "1.0.0",
+            "items": [{"id": "a", "n": 1}, {"id": "b", "n": 2}],
+        }
+
+    def test_segment_overlays_snapshot_by_id(self, tmp_path):
+        (tmp_path / "items.yaml").write_text(
+            yaml.safe_dump({"version": "2.0.0", "items": [{"id": "a", "n": 1}, {"id": "b"}]})
+        )
+        log = _log(tmp_path)
+
+        log.append([{"id": "a", "n": 5}, {"id": "c"}])
+
+        payload = log.payload()
+        assert payload["version"] == "2.0.0"
+        assert payload["items"] == [{"id": "a", "n": 5}, {"id": "b"}, {"id": "c"}]
+        assert log.get("a") == {"id": "a", "n": 5}
+
+    def test_picks_up_lines_from_other_writers(self, tmp_path):
+        reader = _log(tmp_path)
+        writer = _log(tmp_path)
+        reader.append([{"id": "a"}])
+
+        writer.append([{"id": "b"}])
+        with open(segment_path(tmp_path / "items.yaml"), "a") as f:
+            f.write('{"id": "c"}\nnot json\n{"id": "d"')
+
+        assert [r["id"] for r in reader.records()] == ["a", "b", "c"]
+        with open(segment_path(tmp_path / "items.yaml"), "a") as f:
+            f.write("}\n")
+        assert [r["id"] for r in reader.records()] == ["a", "b", "c", "d"]
+
+    def test_compacts_into_snapshot(self, tmp_path):
+        log = _log(tmp_path, compact_every=3)
+        log.append([{"id": "a"}, {"id": "b"}])
+        assert log.segment_path.exists()
+
+        log.append([{"id": "a", "done": True}])
+
+        assert not log.segment_path.exists()
+        snapshot = yaml.safe_load(log.snapshot_path.read_text())
+        assert snapshot == {"version": "1.0.0", "items": [{"id": "a", "done": True}, {"id": "b"}]}
+        assert _log(tmp_path).payload() == snapshot
+        assert log.compact() is False
+
+    def test_external_rewrites_are_noticed(self, tmp_path):
+        log = _log(tmp_path)
+        log.append([{"id": "a"}])
+        log.compact()
+
+        log.snapshot_path.write_text(yaml.safe_dump({"items": [{"id": "z"}]}))
+        assert [r["id"] for r in log.records()] == ["z"]
+
+        log.append([{"id": "y"}])
+        log.segment_path.unlink()
+        log.segment_path.write_text('{"id": "x"}\n')
+        assert [r["id"] for r in log.records()] == ["z", "x"]
+
+    def test_replace_drops_pending_lines(self, tmp_path):
+        log = _log(tmp_path)
+        log.append([{"id": "a"}])
+
+        log.replace({"version": "1.0.0", "items": [{"id": "b"}]})
+
+        assert not log.segment_path.exists()
+        assert [r["id"] for r in log.records()] == ["b"]
+
+    def test_shared_instance_per_path(self, tmp_path):
+        first = get_record_log(tmp_path / "items.yaml", "items")
+        second = get_record_log(tmp_path / "items.yaml", "items", {"version": "1.0.0"})
+
+        assert first is second
+        first.append([{"id": "a"}])
+        assert first.payload()["version"] == "1.0.0"
+
+
+class TestFeedbackStore:
+    def test_add_feedback_appends(self, tmp_path):
+        with patch.object(training_store, "get_provider_dir", return_value=tmp_path):
+            first = training_store.add_feedback(
+                "test", "count users", "SELECT 1", FeedbackType.APPROVED
+            )
+            second = training_store.add_feedback(
+                "test", "count orders", "SELECT 2", FeedbackType.REJECTED
+            )
+            log = training_store.load_feedback("test")
+
+            assert compact_connection_logs(tmp_path) == ["feedback_log.yaml"]
+            snapshot = yaml.safe_load((tmp_path / "feedback_log.yaml").read_text())
+
+        assert second["total_feedback"] == 2
+        assert [fb.id for fb in log.feedback] == [first["feedback_id"], second["feedback_id"]]
+        assert log.provider_id == "test"
+        assert snapshot["provider_id"] == "test"
+        assert [fb["natural_language"] for fb in snapshot["feedback"]] == [
+            "count users",
+            "count orders",
+        ]
+
+
+class TestGapsStore:
+    def test_status_changes_are_appended(self, tmp_path):
+        with patch.object(gaps_store, "_get_connection_dir", return_value=tmp_path):
+            gap = gaps_store.add_gap("test", "MRR", GapSource.TRACES)
+            assert gaps_store.add_gap("test", "mrr", GapSource.SCHEMA_SCAN) is None
+            gaps_store.add_gap("test", "ARR", GapSource.TRACES)
+
+            result = gaps_store.dismiss_gap("test", gap.id, "noise")
+            gaps = gaps_store.load_gaps("test")
+
+        assert result == {"dismissed": True, "gap_id": gap.id, "count": 1}
+        assert not (tmp_path / "knowledge_gaps.yaml").exists()
+        assert [(g.term, g.status) for g in gaps.gaps] == [
+            ("MRR", GapStatus.DISMISSED),
+            ("ARR", GapStatus.OPEN),
+        ]
+        assert gaps_store.load_gaps_from_path(tmp_path).stats()["dismissed"] == 1
+
+    def test_merge_trace_gaps_groups_existing_terms(self, tmp_path):
+        group = {
+            "terms": [
+                {"term": "mrr", "searchCount": 2, "session": "s1", "timestamp": 0},
+                {"term": "recurring", "searchCount": 1, "session": "s1", "timestamp": 0},
+            ],
+            "schemaMatches": [{"type": "column", "table": "subs", "name": "amount"}],
+        }
+        with patch.object(gaps_store, "_get_connection_dir", return_value=tmp_path):
+            gaps_store.add_gap("test", "MRR", GapSource.TRACES)
+
+            assert gaps_store.merge_trace_gaps("test", [group]) == 1
+            assert gaps_store.merge_trace_gaps("test", [group]) == 0
+            gaps = gaps_store.load_gaps("test")
+
+        assert len(gaps.gaps) == 2
+        assert gaps.gaps[0].group_id is not None
+        assert gaps.gaps[0].group_id == gaps.gaps[1].group_id
+        assert gaps.gaps[1].related_columns == ["subs.amount"]
+
+
+class TestConnectionLogs:
+    def test_compact_folds_pending_segments(self, tmp_path):
+        snapshot = tmp_path / "knowledge_gaps.yaml"
+        segment_path(snapshot).write_text(json.dumps({"id": "g1", "term": "ARR"}) + "\n")
+
+        assert compact_connection_logs(tmp_path) == ["knowledge_gaps.yaml"]
+        assert compact_connection_logs(tmp_path) == []
+
+        data = yaml.safe_load(snapshot.read_text())
+        assert data["provider_id"] == tmp_path.name
+        assert [g["id"] for g in data["gaps"]] == ["g1"]
+        assert not segment_path(snapshot).exists()
+
+    def test_migration_reads_pending_feedback(self, tmp_path):
+        legacy = tmp_path / "legacy"
+        with patch.object(training_store, "get_provider_dir", return_value=legacy):
+            training_store.add_feedback("test", "count users", "SELECT 1", FeedbackType.REJECTED)
+        assert not (legacy / "feedback_log.yaml").exists()
+
+        assert _migrate_feedback_log(legacy, tmp_path / "connection") == 1
@@ -0,0 +1,184 @@
+"""Tests for the BM25 retrieval engine and the persisted vault index."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+from db_mcp_models import Dimension, Metric
+
+from db_mcp_knowledge.planner.meta_query import detect_dimensions, resolve_metric
+from db_mcp_knowledge.retrieval import (
+    KIND_EXAMPLE,
+    KIND_RULE,
+    BM25Index,
+    VaultRetrievalIndex,
+    clear_vault_indexes,
+    search_vault,
+    tokenize,
+)
+from db_mcp_knowledge.semantic.core_loader import ConnectionSemanticCore
+from db_mcp_knowledge.vault.paths import retrieval_index_path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    clear_vault_indexes()
+    yield
+    clear_vault_indexes()
+
+
+def _write_yaml(path: Path, payload: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(payload, sort_keys=False))
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture()
+def vault(tmp_path: Path) -> Path:
+    _write_yaml(
+        tmp_path / "schema" / "descriptions.yaml",
+        {
+            "tables": [
+                {
+                    "name": "orders",
+                    "full_name": "sales.orders",
+                    "description": "Customer orders placed in the web shop",
+                    "columns": [
+                        {"name": "order_id", "type": "INTEGER"},
+                        {"name": "totalAmount", "type": "NUMERIC", "description": "Order value"},
+                    ],
+                },
+                {
+                    "name": "customers",
+                    "full_name": "sales.customers",
+                    "description": "People who bought something",
+                    "columns": [{"name": "region", "type": "TEXT"}],
+                },
+            ]
+        },
+    )
+    _write_yaml(
+        tmp_path / "examples" / "revenue.yaml",
+        {"intent": "Total revenue by region", "sql": "SELECT 1", "tables": ["orders"]},
+    )
+    _write_yaml(tmp_path / "instructions" / "business_rules.yaml", {"rules": ["Revenue is net."]})
+    (tmp_path / "learnings").mkdir()
+    (tmp_path / "learnings" / "notes.md").write_text("# Notes\n\n- Regions are ISO codes.\n")
+    _write_yaml(
+        tmp_path / "metrics" / "catalog.yaml",
+        {"metrics": [{"name": "net_revenue", "display_name": "Net revenue"}]},
+    )
+    return tmp_path
+
+
+def test_tokenize_splits_camel_case_and_adds_singulars():
+    assert tokenize("totalAmount of Orders") == ["total", "amount", "of", "orders", "order"]
+
+
+def test_bm25_prefers_rarer_terms_and_shorter_documents():
+    index = BM25Index()
+    index.add("a", "orders orders", kind="text")
+    index.add("b", "orders customers region", kind="text")
+    index.add("c", "customers", kind="text")
+
+    ranked = [hit.doc_id for hit in index.search("orders region")]
+
+    assert ranked == ["b", "a"]
+    assert index.search("nothing here") == []
+
+
+def test_bm25_remove_source_and_round_trip():
+    index = BM25Index()
+    index.add("a", ["orders", "Customer orders"], kind="text", source="one.yaml")
+    index.add("b", "order lines", kind="text", source="two.yaml", payload={"x": 1})
+
+    restored = BM25Index.from_dict(json.loads(json.dumps(index.to_dict())))
+    assert [(hit.doc_id, hit.score) for hit in restored.search("order")] == [
+        (hit.doc_id, hit.score) for hit in index.search("order")
+    ]
+
+    assert restored.remove_source("one.yaml") == 1
+    assert [hit.doc_id for hit in restored.search("order")] == ["b"]
+    assert restored.search("order")[0].payload == {"x": 1}
+
+
+def test_vault_index_covers_examples_and_rules_only(vault):
+    kinds = {hit.kind for hit in search_vault(vault, "revenue region orders", limit=None)}
+    assert kinds == {KIND_EXAMPLE, KIND_RULE}
+
+    (example,) = search_vault(vault, "total revenue", kinds=(KIND_EXAMPLE,), limit=1)
+    assert example.payload["id"] == "revenue"
+    rules = search_vault(vault, "region codes", kinds=(KIND_RULE,))
+    assert rules[0].payload == {"source": "learnings/notes.md", "text": "Regions are ISO codes."}
+    stamps = json.loads(retrieval_index_path(vault).read_text())["stamps"]
+    assert "schema/descriptions.yaml" not in stamps
+
+
+def test_vault_index_is_persisted_and_updated_incrementally(vault, monkeypatch):
+    index = VaultRetrievalIndex(vault)
+    assert index.refresh() is True
+    assert retrieval_index_path(vault).exists()
+    assert index.refresh() is False
+
+    reloaded = VaultRetrievalIndex(vault)
+    extracted: list[str] = []
+    original_add = reloaded.index.add
+
+    def counting_add(doc_id, *args, **kwargs):
+        extracted.append(doc_id)
+        return original_add(doc_id, *args, **kwargs)
+
+    monkeypatch.setattr(reloaded.index, "add", counting_add)
+    assert reloaded.refresh() is False
+    assert extracted == []
+
+    rules_path = vault / "instructions" / "business_rules.yaml"
+    _write_yaml(rules_path, {"rules": ["Revenue excludes refunds."]})
+    _touch(rules_path)
+    (vault / "examples" / "revenue.yaml").unlink()
+
+    assert reloaded.refresh() is True
+    assert extracted == ["rule:instructions/business_rules.yaml:0"]
+    assert reloaded.search("refunds", kinds=(KIND_RULE,))[0].payload["text"] == (
+        "Revenue excludes refunds."
+    )
+    assert reloaded.search("revenue", kinds=(KIND_EXAMPLE,)) == []
+
+
+def test_corrupt_persisted_index_is_rebuilt(vault):
+    path = retrieval_index_path(vault)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{not json")
+
+    assert search_vault(vault, "revenue", kinds=(KIND_EXAMPLE,))[0].payload["id"] == "revenue"
+    assert json.loads(path.read_text())["version"] == 2
+
+
+def test_planner_matches_through_alias_index():
+    core = ConnectionSemanticCore(
+        provider_id="demo",
+        metrics=[
+            Metric(name="netRevenue", display_name="Net revenue", description="", sql="SELECT 1"),
+            Metric(name="order_count", display_name="Orders", description="", sql="SELECT 1"),
+        ],
+        dimensions=[
+            Dimension(name="region", display_name="Region", column="c.region", synonyms=["area"])
+        ],
+        metric_bindings={},
+    )
+
+    assert resolve_metric("netrevenue", core).metric.name == "netRevenue"
+    assert resolve_metric("order_count by area", core).metric.name == "order_count"
+    assert resolve_metric("weather", core) is None
+    assert [dimension.name for dimension in detect_dimensions("orders by area", core)] == [
+        "region"
+    ]
+    assert core.alias_index() is core.alias_index()
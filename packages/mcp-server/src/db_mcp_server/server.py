@@ -10,7 +10,13 @@ from pathlib import Path
 from db_mcp.config import get_settings
 from db_mcp.exec_runtime import shutdown_exec_session_manager
 from db_mcp.insider import start_insider_supervisor, stop_insider_supervisor
+from db_mcp_data.db.connection import dispose_engines, engine_pool_stats
+from db_mcp_data.execution import RetentionPolicy
+from db_mcp_data.execution.engine import compact_execution_stores
 from db_mcp_data.execution.query_store import get_query_store
+from db_mcp_data.execution.result_cache import result_cache_stats
+from db_mcp_data.execution.workers import shutdown_worker_pools, worker_pool_stats
+from db_mcp_data.validation.explain_cache import explain_cache_stats
 from db_mcp_knowledge.vault import ensure_connection_structure, migrate_to_connection_structure
 from db_mcp_knowledge.vault.migrate import migrate_namespace
 from fastmcp import FastMCP
@@ -93,6 +99,33 @@ def _get_auth_provider():
     return None
 
 
+def _execution_retention_policy() -> RetentionPolicy:
+    """Build the execution history retention policy from settings (0 disables a limit)."""
+    settings = get_settings()
+    days = settings.execution_retention_days
+    max_mb = settings.execution_max_total_mb
+    max_rows = settings.execution_max_rows_per_connection
+    return RetentionPolicy(
+        max_age_seconds=days * 86400 if days > 0 else None,
+        max_total_bytes=max_mb * 1024 * 1024 if max_mb > 0 else None,
+        max_rows_per_connection=max_rows if max_rows > 0 else None,
+    )
+
+
+def _compact_execution_history() -> None:
+    """Cleanup-loop hook: enforce retention on open execution stores."""
+    logger = logging.getLogger(__name__)
+    for conn_path, stats in compact_execution_stores(_execution_retention_policy()).items():
+        if stats.rows_deleted:
+            logger.info(
+                "Compacted execution history for %s: %d rows, %d files, %d bytes",
+                conn_path,
+                stats.rows_deleted,
+                stats.files_deleted,
+                stats.bytes_freed,
+            )
+
+
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
     """Server lifespan for startup/shutdown tasks."""
@@ -100,6 +133,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
 
     # Startup: Start background task cleanup loop
     task_store = get_query_store()
+    task_store.add_cleanup_hook(_compact_execution_history)
     await task_store.start_cleanup_loop(interval_seconds=300)  # Every 5 minutes
     logger.info("Task store cleanup loop started")
 
@@ -141,6 +175,8 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
         if insider_supervisor is not None:
             await stop_insider_supervisor()
         shutdown_exec_session_manager()
+        shutdown_worker_pools()
+        dispose_engines()
         # Shutdown: Push collab changes (session mode — push-on-stop)
         if collab_user_name and collab_connection_path:
             try:
@@ -449,6 +485,10 @@ def create_mcp_server() -> FastMCP:
                 "connection": settings.connection_name,
                 "tool_mode": settings.tool_mode,
                 "tool_profile": tool_profile,
+                "result_cache": result_cache_stats(),
+                "explain_cache": explain_cache_stats(),
+                "worker_pools": worker_pool_stats(),
+                "sql_pools": engine_pool_stats(),
             }
         )
 
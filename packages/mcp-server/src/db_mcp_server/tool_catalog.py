@@ -46,6 +46,7 @@ def _infer_category(name: str) -> str:
         "run_sql",
         "validate_sql",
         "get_result",
+        "cancel_query",
         "get_data",
         "export_results",
     }:
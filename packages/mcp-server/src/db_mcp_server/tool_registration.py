@@ -46,6 +46,7 @@ def register_query_tools(
     from db_mcp.tools.intent import _answer_intent
 
     from db_mcp_server.tools.generation import (
+        _cancel_query,
         _export_results,
         _get_result,
         _run_sql,
@@ -58,6 +59,7 @@ def register_query_tools(
     mcp.tool(name="run_sql")(_run_sql)
     if supports_async_jobs:
         mcp.tool(name="get_result")(_get_result)
+        mcp.tool(name="cancel_query")(_cancel_query)
     mcp.tool(name="export_results")(_export_results)
 
 
@@ -3,7 +3,8 @@
 Calls db_mcp.services.query directly for validate_sql and run_sql.
 _get_data is an MCP-specific tool (uses MCPSamplingModel and ctx.elicit)
 implemented here with context building via db_mcp.services.context.
-_get_result and _export_results use the execution engine and connectors directly.
+_get_result and _export_results use the execution engine and connectors directly;
+exports of a stored result stream it in batches via iter_result_batches.
 
 No import from db_mcp.tools.generation.
 
@@ -18,9 +19,12 @@ import asyncio
 import csv
 import hashlib
 import io
+import json
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import batched
 from pathlib import Path
 from typing import Any
 
@@ -34,9 +38,10 @@ from db_mcp.services.query import run_sql as svc_run_sql
 from db_mcp.services.query import validate_sql as svc_validate_sql
 from db_mcp_data.connectors import get_connector, get_connector_capabilities
 from db_mcp_data.connectors.sql import SQLConnector
-from db_mcp_data.execution import ExecutionState
+from db_mcp_data.execution import ExecutionErrorCode, ExecutionState
 from db_mcp_data.execution.engine import get_execution_engine
 from db_mcp_data.execution.query_store import get_query_store
+from db_mcp_data.execution.workers import WorkerPoolFullError, get_worker_pool
 from db_mcp_data.validation.explain import (
     explain_sql,
     get_write_policy,
@@ -57,6 +62,13 @@ logger = logging.getLogger(__name__)
 tracer = trace.get_tracer("db_mcp.query")
 
 ASYNC_ROW_THRESHOLD = 50_000
+# Rows per get_result page when the caller does not pass a limit.
+DEFAULT_RESULT_PAGE_SIZE = 1000
+# Rows per batch when streaming results into an export.
+EXPORT_BATCH_SIZE = 5000
+_STOPPED_STATES = frozenset(
+    {ExecutionState.FAILED, ExecutionState.CANCELLED, ExecutionState.TIMED_OUT}
+)
 
 
 # ---------------------------------------------------------------------------
@@ -144,6 +156,62 @@ def _make_query_id(sql: str) -> str:
     return str(uuid.uuid5(uuid.NAMESPACE_URL, sql))
 
 
+def _run_query_to_store(
+    sql: str,
+    *,
+    connector: Any,
+    execution_engine: Any,
+    execution_id: str,
+    timeout_seconds: float | None = None,
+) -> None:
+    """Blocking body of a background query: run SQL and record the outcome.
+
+    Runs inside the execution's cancel scope so ``cancel_query`` and the
+    connection's ``statement_timeout_seconds`` can stop the statement.
+    """
+    if not execution_engine.mark_running(execution_id):
+        return  # Cancelled while queued.
+    with execution_engine.cancellable(execution_id, timeout_seconds=timeout_seconds) as scope:
+        try:
+            _stream_query_to_store(sql, connector, execution_engine, execution_id)
+        except Exception as exc:
+            if scope.cancelled:
+                return  # Outcome already recorded as cancelled / timed out.
+            execution_engine.mark_failed(
+                execution_id,
+                message=str(exc),
+                code=ExecutionErrorCode.ENGINE,
+                duration_ms=None,
+            )
+
+
+def _stream_query_to_store(
+    sql: str,
+    connector: Any,
+    execution_engine: Any,
+    execution_id: str,
+) -> None:
+    if hasattr(connector, "stream_sql"):
+        # Batches are spilled to the execution store's result files as they
+        # arrive, so large async results never sit in memory in full.
+        data = connector.stream_sql(sql)
+        columns = data.columns
+    elif hasattr(connector, "execute_sql"):
+        data = connector.execute_sql(sql)
+        columns = list(data[0].keys()) if data else []
+    else:
+        data, columns = [], []
+
+    execution_engine.mark_succeeded(
+        execution_id,
+        data=data,
+        columns=columns,
+        rows_returned=None,
+        rows_affected=None,
+        duration_ms=None,
+    )
+
+
 async def _execute_query_background(
     query_id: str,
     sql: str,
@@ -151,41 +219,26 @@ async def _execute_query_background(
     connection: str,
     execution_id: str,
 ) -> None:
-    """Background task: run SQL and update the execution store."""
+    """Background task: run SQL on the connection's worker pool and update the store."""
     connection_path = Path(_resolve_connection_path(connection))
     execution_engine = get_execution_engine(connection_path)
     connector = get_connector(connection_path=str(connection_path))
-    get_connector_capabilities(connector)  # validate connector capabilities
+    capabilities = get_connector_capabilities(connector)
     try:
-        if isinstance(connector, SQLConnector):
-            from sqlalchemy import text as sa_text
-
-            engine_obj = connector.get_engine()
-            with engine_obj.connect() as conn:
-                result = conn.execute(sa_text(sql))
-                rows = [dict(r._mapping) for r in result]
-                columns = list(result.keys()) if result.keys() else []
-        elif hasattr(connector, "execute_sql"):
-            rows = connector.execute_sql(sql)
-            columns = list(rows[0].keys()) if rows else []
-        else:
-            rows, columns = [], []
-
-        execution_engine.mark_succeeded(
-            execution_id,
-            data=rows,
-            columns=columns,
-            rows_returned=len(rows),
-            rows_affected=None,
-            duration_ms=None,
+        await get_worker_pool(connection_path, capabilities).run(
+            _run_query_to_store,
+            sql,
+            connector=connector,
+            execution_engine=execution_engine,
+            execution_id=execution_id,
+            timeout_seconds=capabilities.get("statement_timeout_seconds"),
         )
-    except Exception as exc:
-        from db_mcp_data.execution import ExecutionErrorCode
-
+    except WorkerPoolFullError as exc:
         execution_engine.mark_failed(
             execution_id,
             message=str(exc),
             code=ExecutionErrorCode.ENGINE,
+            retryable=True,
             duration_ms=None,
         )
 
@@ -351,25 +404,53 @@ async def _get_data(
 # _get_result — poll async query results from the execution engine
 # ---------------------------------------------------------------------------
 
-async def _get_result(query_id: str, connection: str) -> object:
-    """Get status and results for a query. Poll until status is 'complete' or 'error'."""
+def _page_fields(offset: int, limit: int, data: list, rows_returned: int) -> dict[str, Any]:
+    """Paging metadata for a get_result page; next_offset is None on the last page."""
+    end = offset + len(data)
+    return {
+        "offset": offset,
+        "limit": limit,
+        "next_offset": end if end < rows_returned else None,
+    }
+
+
+async def _get_result(
+    query_id: str,
+    connection: str,
+    offset: int = 0,
+    limit: int | None = None,
+) -> object:
+    """Get status and results for a query. Poll until status is 'complete' or 'error'.
+
+    Results are returned one page at a time (limit defaults to 1000 rows);
+    rows_returned always reports the total row count and next_offset is the
+    offset of the following page, or null on the last one.
+    """
     store = get_query_store()
     query = await store.get(query_id)
 
     connection_path = Path(_resolve_connection_path(connection))
     execution_engine = get_execution_engine(connection_path)
+    if limit is None:
+        limit = DEFAULT_RESULT_PAGE_SIZE
+    offset = max(offset, 0)
 
     if query is not None:
         from db_mcp_data.execution.query_store import QueryStatus  # local import
 
         if query.status == QueryStatus.COMPLETE:
-            exec_result = execution_engine.get_result(query.execution_id or query_id)
+            exec_result = execution_engine.get_result(
+                query.execution_id or query_id, offset=offset, limit=limit
+            )
+            data = exec_result.data if exec_result else []
+            rows_returned = exec_result.rows_returned if exec_result else query.rows_returned
             return inject_protocol({
                 "status": "complete",
                 "query_id": query_id,
-                "data": exec_result.data if exec_result else [],
+                "data": data,
                 "columns": exec_result.columns if exec_result else [],
-                "rows_returned": exec_result.rows_returned if exec_result else query.rows_returned,
+                "rows_returned": rows_returned,
+                **_page_fields(offset, limit, data, rows_returned or 0),
             })
         if query.status == QueryStatus.ERROR:
             return inject_protocol({
@@ -377,6 +458,14 @@ async def _get_result(query_id: str, connection: str) -> object:
                 "query_id": query_id,
                 "error": query.error or "Query failed",
             })
+        stopped = execution_engine.get_result(query.execution_id or query_id, limit=0)
+        if stopped is not None and stopped.state in _STOPPED_STATES:
+            return inject_protocol({
+                "status": "error",
+                "query_id": query_id,
+                "state": stopped.state.value,
+                "error": stopped.error.message if stopped.error else "Execution failed",
+            })
         return inject_protocol({
             "status": "running",
             "query_id": query_id,
@@ -384,7 +473,7 @@ async def _get_result(query_id: str, connection: str) -> object:
         })
 
     # Fall back to unified execution store
-    execution_result = execution_engine.get_result(query_id)
+    execution_result = execution_engine.get_result(query_id, offset=offset, limit=limit)
 
     if execution_result is None:
         return inject_protocol({
@@ -394,20 +483,26 @@ async def _get_result(query_id: str, connection: str) -> object:
         })
 
     if execution_result.state == ExecutionState.SUCCEEDED:
+        data = execution_result.data or []
+        rows_returned = execution_result.rows_returned or 0
         return inject_protocol({
             "status": "complete",
             "query_id": query_id,
-            "data": execution_result.data or [],
+            "data": data,
             "columns": execution_result.columns or [],
-            "rows_returned": execution_result.rows_returned or 0,
+            "rows_returned": rows_returned,
             "duration_ms": execution_result.duration_ms,
+            **_page_fields(offset, limit, data, rows_returned),
         })
 
-    if execution_result.state == ExecutionState.FAILED:
+    if execution_result.state in _STOPPED_STATES:
         return inject_protocol({
             "status": "error",
             "query_id": query_id,
-            "error": execution_result.error or "Execution failed",
+            "state": execution_result.state.value,
+            "error": (
+                execution_result.error.message if execution_result.error else "Execution failed"
+            ),
         })
 
     return inject_protocol({
@@ -419,81 +514,175 @@ async def _get_result(query_id: str, connection: str) -> object:
 
 
 # ---------------------------------------------------------------------------
-# _export_results — execute SQL and return formatted output
+# _cancel_query — stop a submitted or running query
+# ---------------------------------------------------------------------------
+
+async def _cancel_query(query_id: str, connection: str) -> object:
+    """Cancel a running or queued query started by run_sql.
+
+    The statement is stopped on the database (e.g. pg_cancel_backend, KILL
+    QUERY, Trino query DELETE, DuckDB interrupt) and get_result then reports
+    state 'cancelled'.
+    """
+    store = get_query_store()
+    query = await store.get(query_id)
+    connection_path = Path(_resolve_connection_path(connection))
+    execution_engine = get_execution_engine(connection_path)
+
+    execution_id = query.execution_id if query is not None else None
+    if execution_id is None:
+        # Synchronous run_sql(query_id) executions are recorded under the query id.
+        latest = execution_engine.latest_execution_for_query(query_id)
+        execution_id = latest.execution_id if latest is not None else query_id
+    if not execution_engine.cancel_execution(execution_id):
+        existing = execution_engine.get_result(execution_id, limit=0)
+        if existing is None:
+            error = f"Query '{query_id}' not found. It may have expired."
+        else:
+            error = f"Query '{query_id}' is not running (state: {existing.state.value})."
+        return inject_protocol({"status": "error", "query_id": query_id, "error": error})
+
+    if query is not None:
+        from db_mcp_data.execution.query_store import QueryStatus  # local import
+
+        await store.update_status(query_id, QueryStatus.ERROR, error="Query cancelled")
+    return inject_protocol({
+        "status": "cancelled",
+        "query_id": query_id,
+        "execution_id": execution_id,
+        "state": ExecutionState.CANCELLED.value,
+    })
+
+
+# ---------------------------------------------------------------------------
+# _export_results — execute SQL (or read a stored result) and return formatted output
 # ---------------------------------------------------------------------------
 
+_EXPORT_FORMATS = {
+    "csv": ("csv", "text/csv"),
+    "json": ("json", "application/json"),
+    "markdown": ("md", "text/markdown"),
+}
+
+
+def _render_export(
+    columns: list[str], batches: Iterable[list[dict]], format: str
+) -> tuple[str, int]:
+    """Render row batches as CSV, JSON or Markdown; returns (content, row_count)."""
+    output = io.StringIO()
+    count = 0
+    if format == "csv":
+        writer = csv.DictWriter(output, fieldnames=columns)
+        writer.writeheader()
+        for batch in batches:
+            writer.writerows(batch)
+            count += len(batch)
+    elif format == "json":
+        output.write("[")
+        for batch in batches:
+            for row in batch:
+                output.write(",\n  " if count else "\n  ")
+                output.write(json.dumps(row, default=str))
+                count += 1
+        output.write("\n]" if count else "]")
+    else:
+        output.write("| " + " | ".join(columns) + " |\n")
+        output.write("| " + " | ".join(["---"] * len(columns)) + " |")
+        for batch in batches:
+            for row in batch:
+                output.write("\n| " + " | ".join(str(row.get(c, "")) for c in columns) + " |")
+                count += 1
+        if not count:
+            return "No data returned.", 0
+    return output.getvalue(), count
+
+
+async def _export_stored_result(
+    query_id: str, connection_path: Path, format: str
+) -> tuple[str, int] | dict:
+    """Render a completed run_sql result by streaming it from the execution store."""
+    query = await get_query_store().get(query_id)
+    execution_id = (query.execution_id if query is not None else None) or query_id
+    execution_engine = get_execution_engine(connection_path)
+    existing = execution_engine.get_result(execution_id, limit=0)
+    if existing is None:
+        return {"status": "error", "error": f"Query '{query_id}' not found. It may have expired."}
+    if existing.state != ExecutionState.SUCCEEDED:
+        return {
+            "status": "error",
+            "error": (
+                f"Query '{query_id}' has no result to export "
+                f"(state: {existing.state.value})."
+            ),
+        }
+    batches = execution_engine.iter_result_batches(execution_id, batch_size=EXPORT_BATCH_SIZE)
+    return _render_export(existing.columns or [], batches, format)
+
+
 async def _export_results(
-    sql: str,
+    sql: str | None,
     connection: str,
     format: str = "csv",
     filename: str | None = None,
+    query_id: str | None = None,
     *,
     ctx: Any = None,
 ) -> dict:
-    """Export query results as CSV, JSON, or Markdown."""
-    is_read_only, error = validate_read_only(sql)
-    if not is_read_only:
-        return {"status": "rejected", "error": error}
+    """Export query results as CSV, JSON, or Markdown.
+
+    Pass query_id from run_sql/get_result to export an already computed result
+    (streamed from the result store, no re-execution); otherwise sql is run.
+    """
+    if format not in _EXPORT_FORMATS:
+        return {"status": "error", "error": f"Unsupported format: '{format}'."}
+    if query_id is None:
+        if not sql:
+            return {"status": "error", "error": "Provide sql or query_id to export."}
+        is_read_only, error = validate_read_only(sql)
+        if not is_read_only:
+            return {"status": "rejected", "error": error}
 
     connection_path = Path(_resolve_connection_path(connection))
-    connector = get_connector(connection_path=str(connection_path))
 
-    try:
-        if isinstance(connector, SQLConnector):
-            from sqlalchemy import text as sa_text
-
-            engine_obj = connector.get_engine()
-            with engine_obj.connect() as conn:
-                result = conn.execute(sa_text(sql))
-                columns = list(result.keys())
-                data = [dict(r._mapping) for r in result]
-        elif hasattr(connector, "execute_sql"):
-            data = connector.execute_sql(sql)
-            columns = list(data[0].keys()) if data else []
-        else:
-            return {"status": "error", "error": "Connector does not support SQL execution."}
-    except Exception as exc:
-        return {"status": "error", "error": f"Query execution failed: {exc}"}
+    if query_id is not None:
+        rendered = await _export_stored_result(query_id, connection_path, format)
+        if isinstance(rendered, dict):
+            return rendered
+    else:
+        connector = get_connector(connection_path=str(connection_path))
+        try:
+            if isinstance(connector, SQLConnector):
+                from sqlalchemy import text as sa_text
+
+                engine_obj = connector.get_engine()
+                with engine_obj.connect() as conn:
+                    result = conn.execute(sa_text(sql))
+                    columns = list(result.keys())
+                    rows = (dict(r._mapping) for r in result)
+                    rendered = _render_export(
+                        columns, (list(b) for b in batched(rows, EXPORT_BATCH_SIZE)), format
+                    )
+            elif hasattr(connector, "execute_sql"):
+                data = connector.execute_sql(sql)
+                columns = list(data[0].keys()) if data else []
+                rendered = _render_export(columns, [data], format)
+            else:
+                return {"status": "error", "error": "Connector does not support SQL execution."}
+        except Exception as exc:
+            return {"status": "error", "error": f"Query execution failed: {exc}"}
 
+    content, rows_exported = rendered
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if not filename:
-        query_hash = hashlib.sha256(sql.encode()).hexdigest()[:8]
+        query_hash = hashlib.sha256((sql or query_id or "").encode()).hexdigest()[:8]
         filename = f"export_{query_hash}_{timestamp}"
-
-    if format == "csv":
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=columns)
-        writer.writeheader()
-        writer.writerows(data)
-        content = output.getvalue()
-        ext = "csv"
-        mime = "text/csv"
-    elif format == "json":
-        import json
-        content = json.dumps(data, indent=2, default=str)
-        ext = "json"
-        mime = "application/json"
-    elif format == "markdown":
-        if not data:
-            content = "No data returned."
-        else:
-            header = "| " + " | ".join(columns) + " |"
-            separator = "| " + " | ".join(["---"] * len(columns)) + " |"
-            rows_md = [
-                "| " + " | ".join(str(row.get(c, "")) for c in columns) + " |"
-                for row in data
-            ]
-            content = "\n".join([header, separator] + rows_md)
-        ext = "md"
-        mime = "text/markdown"
-    else:
-        return {"status": "error", "error": f"Unsupported format: '{format}'."}
+    ext, mime = _EXPORT_FORMATS[format]
 
     return {
         "status": "complete",
         "format": format,
         "filename": f"{filename}.{ext}",
         "mime_type": mime,
-        "rows_exported": len(data),
+        "rows_exported": rows_exported,
         "content": content,
     }
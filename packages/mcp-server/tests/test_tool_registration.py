@@ -52,6 +52,7 @@ class TestRegisterQueryTools:
         assert "validate_sql" in registered
         assert "run_sql" in registered
         assert "get_result" in registered
+        assert "cancel_query" in registered
         assert "export_results" in registered
 
     def test_skips_validate_when_not_supported(self):
@@ -63,6 +64,7 @@ class TestRegisterQueryTools:
         )
         assert "validate_sql" not in registered
         assert "get_result" not in registered
+        assert "cancel_query" not in registered
         assert "run_sql" in registered
 
     def test_no_tools_when_sql_not_supported(self):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -265,4 +266,117 @@ async def test_get_result_from_execution_engine(_patch_inject):
     assert result["status"] == "complete"
     assert result["data"] == [{"b": 2}]
     assert result["rows_returned"] == 1
-    mock_engine.get_result.assert_called_once_with("q2")
+    assert result["next_offset"] is None
+    mock_engine.get_result.assert_called_once_with("q2", offset=0, limit=1000)
+
+
+def _stored_engine(tmp_path, rows):
+    from db_mcp_data.execution import ExecutionRequest
+    from db_mcp_data.execution.engine import ExecutionEngine
+    from db_mcp_data.execution.store import ExecutionStore
+
+    engine = ExecutionEngine(ExecutionStore(tmp_path / "executions.sqlite"))
+    request = ExecutionRequest(connection="mydb", payload={"sql": "SELECT n FROM t"})
+    handle, _ = engine.submit_sync(
+        request,
+        lambda payload: {
+            "data": rows,
+            "columns": ["n"],
+            "rows_returned": len(rows),
+            "rows_affected": None,
+        },
+    )
+    return engine, handle.execution_id
+
+
+@pytest.mark.asyncio
+async def test_get_result_pages_by_default(_patch_inject, tmp_path):
+    engine, execution_id = _stored_engine(tmp_path, [{"n": i} for i in range(1500)])
+    mock_store = MagicMock()
+    mock_store.get = AsyncMock(return_value=None)
+
+    with (
+        patch("db_mcp_server.tools.generation.get_query_store", return_value=mock_store),
+        patch(
+            "db_mcp_server.tools.generation._resolve_connection_path",
+            return_value=str(tmp_path),
+        ),
+        patch("db_mcp_server.tools.generation.get_execution_engine", return_value=engine),
+    ):
+        from db_mcp_server.tools.generation import _get_result
+
+        first = await _get_result(query_id=execution_id, connection="mydb")
+        second = await _get_result(
+            query_id=execution_id, connection="mydb", offset=first["next_offset"]
+        )
+
+    assert len(first["data"]) == 1000
+    assert first["rows_returned"] == 1500
+    assert first["next_offset"] == 1000
+    assert second["data"][0] == {"n": 1000}
+    assert len(second["data"]) == 500
+    assert second["next_offset"] is None
+
+
+@pytest.mark.asyncio
+async def test_export_results_streams_stored_result(tmp_path):
+    engine, execution_id = _stored_engine(tmp_path, [{"n": i} for i in range(12)])
+    mock_store = MagicMock()
+    mock_store.get = AsyncMock(return_value=None)
+
+    with (
+        patch("db_mcp_server.tools.generation.get_query_store", return_value=mock_store),
+        patch(
+            "db_mcp_server.tools.generation._resolve_connection_path",
+            return_value=str(tmp_path),
+        ),
+        patch("db_mcp_server.tools.generation.get_execution_engine", return_value=engine),
+        patch("db_mcp_server.tools.generation.EXPORT_BATCH_SIZE", 5),
+        patch("db_mcp_server.tools.generation.get_connector") as mock_get_connector,
+    ):
+        from db_mcp_server.tools.generation import _export_results
+
+        csv_result = await _export_results(
+            sql=None, connection="mydb", format="csv", query_id=execution_id
+        )
+        json_result = await _export_results(
+            sql=None, connection="mydb", format="json", query_id=execution_id
+        )
+        missing = await _export_results(sql=None, connection="mydb", query_id="nope")
+
+    mock_get_connector.assert_not_called()
+    assert csv_result["status"] == "complete"
+    assert csv_result["rows_exported"] == 12
+    assert csv_result["content"].splitlines() == ["n"] + [str(i) for i in range(12)]
+    assert json.loads(json_result["content"]) == [{"n": i} for i in range(12)]
+    assert missing["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_cancel_query_finds_synchronous_execution_by_query_id(_patch_inject):
+    mock_query = MagicMock()
+    mock_query.execution_id = None
+    mock_store = MagicMock()
+    mock_store.get = AsyncMock(return_value=mock_query)
+    mock_store.update_status = AsyncMock()
+
+    mock_engine = MagicMock()
+    mock_engine.latest_execution_for_query.return_value = MagicMock(execution_id="exec-9")
+    mock_engine.cancel_execution.return_value = True
+
+    with (
+        patch("db_mcp_server.tools.generation.get_query_store", return_value=mock_store),
+        patch(
+            "db_mcp_server.tools.generation._resolve_connection_path",
+            return_value="/tmp/conn",
+        ),
+        patch("db_mcp_server.tools.generation.get_execution_engine", return_value=mock_engine),
+    ):
+        from db_mcp_server.tools.generation import _cancel_query
+
+        result = await _cancel_query(query_id="q-sync", connection="mydb")
+
+    assert result["status"] == "cancelled"
+    assert result["execution_id"] == "exec-9"
+    mock_engine.latest_execution_for_query.assert_called_once_with("q-sync")
+    mock_engine.cancel_execution.assert_called_once_with("exec-9")
@@ -63,6 +63,7 @@ class ConnectorContractV1(_StrictModel):
     pagination: dict[str, Any] = Field(default_factory=dict)
     rate_limit: dict[str, Any] = Field(default_factory=dict)
     rate_limit_rps: float | None = None
+    http: dict[str, Any] = Field(default_factory=dict)
     api_title: str = ""
     api_description: str = ""
 
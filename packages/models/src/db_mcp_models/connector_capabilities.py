@@ -20,6 +20,23 @@ BASE_CAPABILITIES: dict[str, Any] = {
     "supports_sync": False,
     "supports_file_scan": False,
     "supports_dashboard_api": False,
+    # Seconds a read-only query result may be reused (None: engine default, 0: never).
+    "result_cache_ttl_seconds": None,
+    # Seconds an EXPLAIN result / cost tier may be reused (None: default, 0: never).
+    "explain_cache_ttl_seconds": None,
+    # Per-connection worker pool sizing (None: engine defaults).
+    "max_concurrent_queries": None,
+    "max_queued_queries": None,
+    # Rows a synchronous query returns before it is truncated (None: default, 0: no limit).
+    "max_result_rows": None,
+    # Seconds before the engine cancels a running statement (None: no timeout).
+    "statement_timeout_seconds": None,
+    # SQLAlchemy engine pool tuning for SQL connectors (None: engine defaults).
+    "pool_size": None,
+    "max_overflow": None,
+    "pool_recycle_seconds": None,
+    "pool_pre_ping": None,
+    "pool_timeout_seconds": None,
 }
 
 # Type-specific defaults (overlaid on top of BASE_CAPABILITIES).
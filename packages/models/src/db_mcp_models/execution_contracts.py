@@ -29,6 +29,7 @@ class RunSqlSyncSuccessContract(_StrictModel):
     statement_type: str
     is_write: bool
     rows_affected: int | None
+    truncated: bool = False
 
 
 class RunSqlAsyncSubmittedContract(_StrictModel):
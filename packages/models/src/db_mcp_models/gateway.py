@@ -46,7 +46,10 @@ class RunOptions:
     """
 
     confirmed: bool = False
-    timeout_seconds: int | None = None
+    timeout_seconds: float | None = None  # statement timeout enforced by the engine
+    max_rows: int | None = None  # None: fetch the full result
+    max_bytes: int | None = None  # JSON-encoded result size bound; None: unbounded
+    cache_ttl_seconds: float | None = None  # None: engine default, 0: bypass the cache
 
 
 @dataclass(frozen=True)
@@ -97,6 +100,11 @@ class DataResponse:
     columns: list[ColumnMeta]
     rows_returned: int
     error: str | None = None
+    truncated: bool = False  # rows were left behind after a max_rows bound
+    # Set when the execution was recorded by the ExecutionEngine.
+    execution_id: str | None = None
+    state: str | None = None
+    duration_ms: float | None = None
 
     @property
     def is_success(self) -> bool:
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for code-mode per-snippet latency.
+
+Runs a small ``dbmcp.scalar`` snippet repeatedly against a throwaway SQLite
+connection using the local process sandbox and reports the latency of each
+snippet. By default snippets go to the session's warm interpreter worker;
+``--cold`` reproduces the previous behaviour of writing a wrapper script and
+starting a fresh ``python3`` for every snippet, so the two modes can be
+compared on the same machine.
+
+Usage:
+    uv run python scripts/bench_code_mode.py [--snippets 50] [--cold]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+from db_mcp.code_runtime.backend import CodeSession, _run_as_script, _run_in_worker
+from db_mcp.exec_runtime import ExecSandboxSpec, ExecSessionManager, ProcessExecSandboxBackend
+
+_SNIPPET = "print(dbmcp.scalar('SELECT COUNT(*) FROM items'))"
+
+
+def _make_connection(root: Path) -> ExecSandboxSpec:
+    db_path = root / "bench.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE items(id INTEGER PRIMARY KEY, amount INTEGER)")
+        conn.executemany("INSERT INTO items(amount) VALUES (?)", [(n,) for n in range(100)])
+    connection_path = root / "bench"
+    connection_path.mkdir()
+    database_url = f"sqlite:///{db_path}"
+    (connection_path / "connector.yaml").write_text(
+        yaml.safe_dump({"type": "sql", "database_url": database_url}, sort_keys=False)
+    )
+    return ExecSandboxSpec(
+        session_id="bench",
+        connection="bench",
+        connection_path=connection_path,
+        allowed_endpoint=None,
+        environment={"DATABASE_URL": database_url, "CONNECTION_NAME": "bench"},
+    )
+
+
+def run(snippets: int, cold: bool) -> list[float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        spec = _make_connection(Path(tmp))
+        session = CodeSession(session_id="bench", connection="bench", spec=spec)
+        manager = ExecSessionManager(backend=ProcessExecSandboxBackend())
+        run_snippet = _run_as_script if cold else _run_in_worker
+        latencies: list[float] = []
+        try:
+            for _ in range(snippets):
+                started = time.perf_counter()
+                result = run_snippet(
+                    session, _SNIPPET, timeout_seconds=30, confirmed=False, manager=manager
+                )
+                latencies.append((time.perf_counter() - started) * 1000)
+                if result["exit_code"] != 0:
+                    raise SystemExit(f"snippet failed: {result['stderr']}")
+        finally:
+            manager.close_all()
+        return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snippets", type=int, default=50)
+    parser.add_argument("--cold", action="store_true", help="fresh interpreter per snippet")
+    args = parser.parse_args()
+
+    latencies = run(args.snippets, args.cold)
+    first, rest = latencies[0], sorted(latencies[1:]) or [latencies[0]]
+
+    mode = "cold (process per snippet)" if args.cold else "warm (persistent worker)"
+    print(f"mode:        {mode}")
+    print(f"snippets:    {len(latencies)}")
+    print(f"first:       {first:.1f} ms")
+    print(f"mean:        {statistics.fmean(rest):.1f} ms")
+    print(f"p50:         {rest[len(rest) // 2]:.1f} ms")
+    print(f"p99:         {rest[int(len(rest) * 0.99)]:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
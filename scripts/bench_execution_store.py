@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for ExecutionStore per-query overhead.
+
+Runs ``ExecutionEngine.submit_sync`` with a trivial in-memory runner from
+several threads at once (simulating concurrent tool calls) and reports the
+store overhead per query. ``--legacy`` reproduces the previous behaviour of
+opening a fresh rollback-journal connection for every store call, so the two
+modes can be compared on the same machine.
+
+Usage:
+    uv run python scripts/bench_execution_store.py [--threads 8] [--queries 500] [--legacy]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from db_mcp_data.execution import ExecutionRequest
+from db_mcp_data.execution.engine import ExecutionEngine
+from db_mcp_data.execution.store import ExecutionStore
+
+
+class LegacyExecutionStore(ExecutionStore):
+    """Store variant that opens a new connection per call (pre-pooling behaviour)."""
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+def _runner(payload: dict) -> dict:
+    return {"data": [{"ok": 1}], "columns": ["ok"], "rows_returned": 1}
+
+
+def run(threads: int, queries: int, legacy: bool) -> list[float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        store_cls = LegacyExecutionStore if legacy else ExecutionStore
+        engine = ExecutionEngine(store_cls(Path(tmp) / "executions.sqlite"))
+        latencies: list[float] = []
+        lock = threading.Lock()
+
+        def worker(worker_id: int) -> None:
+            local: list[float] = []
+            for i in range(queries):
+                request = ExecutionRequest(connection="bench", sql=f"SELECT {worker_id}, {i}")
+                started = time.perf_counter()
+                engine.submit_sync(request, _runner)
+                local.append((time.perf_counter() - started) * 1000)
+            with lock:
+                latencies.extend(local)
+
+        pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=500, help="queries per thread")
+    parser.add_argument("--legacy", action="store_true", help="per-call connections")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    latencies = run(args.threads, args.queries, args.legacy)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    mode = "legacy (connection per call)" if args.legacy else "pooled (WAL)"
+    print(f"mode:        {mode}")
+    print(f"queries:     {len(latencies)} ({args.threads} threads)")
+    print(f"throughput:  {len(latencies) / elapsed:,.0f} queries/s")
+    print(f"mean:        {statistics.fmean(latencies):.3f} ms")
+    print(f"p50:         {latencies[len(latencies) // 2]:.3f} ms")
+    print(f"p99:         {latencies[int(len(latencies) * 0.99)]:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -149,6 +149,7 @@ def get_expected_tools_for_config(
         tools.add("run_sql")
         if supports_async_jobs:
             tools.add("get_result")
+            tools.add("cancel_query")
         tools.add("export_results")
 
     # API connector tools